@@ -10,614 +10,654 @@
 # @formatter:off
 from __future__ import annotations
 
-from zepben.ewb.auth.client.zepben_token_fetcher import *
-from zepben.ewb.auth.common.auth_exception import *
-from zepben.ewb.auth.common.auth_method import *
-from zepben.ewb.dataclass_descriptors.dataclass_base import *
-from zepben.ewb.dataclass_descriptors.descriptor_fix import *
-from zepben.ewb.util import *
-
-#############
-# CIM MODEL #
-#############
-
-# We need to import SinglePhaseKind before anything uses PhaseCode to prevent cyclic dependencies.
-from zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind import *
-
-from zepben.ewb.model.cim.extensions.iec61968.assetinfo.relay_info import *
-
-from zepben.ewb.model.cim.extensions.iec61968.common.contact_details import *
-from zepben.ewb.model.cim.extensions.iec61968.common.contact_method_type import *
-
-from zepben.ewb.model.cim.extensions.iec61968.metering.pan_demand_reponse_function import *
-
-from zepben.ewb.model.cim.extensions.iec61970.base.core.hv_customer import *
-from zepben.ewb.model.cim.extensions.iec61970.base.core.site import *
-
-from zepben.ewb.model.cim.extensions.iec61970.base.feeder.loop import *
-from zepben.ewb.model.cim.extensions.iec61970.base.feeder.lv_feeder import *
-from zepben.ewb.model.cim.extensions.iec61970.base.feeder.lv_substation import *
-
-from zepben.ewb.model.cim.extensions.iec61970.base.generation.production.ev_charging_unit import *
-
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.directional_current_relay import *
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.distance_relay import *
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.polarizing_quantity_type import *
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.power_direction_kind import *
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_kind import *
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_relay_function import *
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_relay_scheme import *
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_relay_system import *
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.relay_setting import *
-from zepben.ewb.model.cim.extensions.iec61970.base.protection.voltage_relay import *
-
-from zepben.ewb.model.cim.extensions.iec61970.base.wires.battery_control import *
-from zepben.ewb.model.cim.extensions.iec61970.base.wires.battery_control_mode import *
-from zepben.ewb.model.cim.extensions.iec61970.base.wires.transformer_cooling_type import *
-from zepben.ewb.model.cim.extensions.iec61970.base.wires.transformer_end_rated_s import *
-from zepben.ewb.model.cim.extensions.iec61970.base.wires.vector_group import *
-
-from zepben.ewb.model.cim.iec61968.assetinfo.cable_info import *
-from zepben.ewb.model.cim.iec61968.assetinfo.no_load_test import *
-from zepben.ewb.model.cim.iec61968.assetinfo.open_circuit_test import *
-from zepben.ewb.model.cim.iec61968.assetinfo.overhead_wire_info import *
-from zepben.ewb.model.cim.iec61968.assetinfo.power_transformer_info import *
-from zepben.ewb.model.cim.iec61968.assetinfo.short_circuit_test import *
-from zepben.ewb.model.cim.iec61968.assetinfo.shunt_compensator_info import *
-from zepben.ewb.model.cim.iec61968.assetinfo.switch_info import *
-from zepben.ewb.model.cim.iec61968.assetinfo.transformer_end_info import *
-from zepben.ewb.model.cim.iec61968.assetinfo.transformer_tank_info import *
-from zepben.ewb.model.cim.iec61968.assetinfo.transformer_test import *
-from zepben.ewb.model.cim.iec61968.assetinfo.wire_info import *
-from zepben.ewb.model.cim.iec61968.assetinfo.wire_insulation_kind import *
-from zepben.ewb.model.cim.iec61968.assetinfo.wire_material_kind import *
-
-from zepben.ewb.model.cim.iec61968.assets.asset import *
-from zepben.ewb.model.cim.iec61968.assets.asset_container import *
-from zepben.ewb.model.cim.iec61968.assets.asset_function import *
-from zepben.ewb.model.cim.iec61968.assets.asset_info import *
-from zepben.ewb.model.cim.iec61968.assets.asset_organisation_role import *
-from zepben.ewb.model.cim.iec61968.assets.asset_owner import *
-from zepben.ewb.model.cim.iec61968.assets.streetlight import *
-from zepben.ewb.model.cim.iec61968.assets.structure import *
-
-from zepben.ewb.model.cim.iec61968.common.agreement import *
-from zepben.ewb.model.cim.iec61968.common.document import *
-from zepben.ewb.model.cim.iec61968.common.electronic_address import *
-from zepben.ewb.model.cim.iec61968.common.location import *
-from zepben.ewb.model.cim.iec61968.common.organisation import *
-from zepben.ewb.model.cim.iec61968.common.organisation_role import *
-from zepben.ewb.model.cim.iec61968.common.position_point import *
-from zepben.ewb.model.cim.iec61968.common.street_address import *
-from zepben.ewb.model.cim.iec61968.common.street_detail import *
-from zepben.ewb.model.cim.iec61968.common.telephone_number import *
-from zepben.ewb.model.cim.iec61968.common.town_detail import *
-
-from zepben.ewb.model.cim.iec61968.customers.customer import *
-from zepben.ewb.model.cim.iec61968.customers.customer_agreement import *
-from zepben.ewb.model.cim.iec61968.customers.customer_kind import *
-from zepben.ewb.model.cim.iec61968.customers.pricing_structure import *
-from zepben.ewb.model.cim.iec61968.customers.tariff import *
-
-from zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.current_transformer_info import *
-from zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.potential_transformer_info import *
-from zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.transformer_construction_kind import *
-from zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.transformer_function_kind import *
-
-from zepben.ewb.model.cim.iec61968.infiec61968.infassets.pole import *
-from zepben.ewb.model.cim.iec61968.infiec61968.infassets.streetlight_lamp_kind import *
-
-from zepben.ewb.model.cim.iec61968.infiec61968.infcommon.ratio import *
-
-from zepben.ewb.model.cim.iec61968.metering.controlled_appliance import *
-from zepben.ewb.model.cim.iec61968.metering.end_device import *
-from zepben.ewb.model.cim.iec61968.metering.end_device_function import *
-from zepben.ewb.model.cim.iec61968.metering.end_device_function_kind import *
-from zepben.ewb.model.cim.iec61968.metering.meter import *
-from zepben.ewb.model.cim.iec61968.metering.usage_point import *
-
-from zepben.ewb.model.cim.iec61968.operations.operational_restriction import *
-
-from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.auxiliary_equipment import *
-from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.current_transformer import *
-from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.fault_indicator import *
-from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.potential_transformer import *
-from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.potential_transformer_kind import *
-from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.sensor import *
-
-from zepben.ewb.model.cim.iec61970.base.core.ac_dc_terminal import *
-from zepben.ewb.model.cim.iec61970.base.core.base_voltage import *
-from zepben.ewb.model.cim.iec61970.base.core.conducting_equipment import *
-from zepben.ewb.model.cim.iec61970.base.core.connectivity_node import *
-from zepben.ewb.model.cim.iec61970.base.core.connectivity_node_container import *
-from zepben.ewb.model.cim.iec61970.base.core.curve import *
-from zepben.ewb.model.cim.iec61970.base.core.curve_data import *
-from zepben.ewb.model.cim.iec61970.base.core.equipment import *
-from zepben.ewb.model.cim.iec61970.base.core.equipment_container import *
-from zepben.ewb.model.cim.iec61970.base.core.feeder import *
-from zepben.ewb.model.cim.iec61970.base.core.geographical_region import *
-from zepben.ewb.model.cim.iec61970.base.core.identifiable import *
-from zepben.ewb.model.cim.iec61970.base.core.identified_object import *
-from zepben.ewb.model.cim.iec61970.base.core.name import *
-from zepben.ewb.model.cim.iec61970.base.core.name_type import *
-from zepben.ewb.model.cim.iec61970.base.core.phase_code import *
-from zepben.ewb.model.cim.iec61970.base.core.power_system_resource import *
-from zepben.ewb.model.cim.iec61970.base.core.sub_geographical_region import *
-from zepben.ewb.model.cim.iec61970.base.core.substation import *
-from zepben.ewb.model.cim.iec61970.base.core.terminal import *
-
-from zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram import *
-from zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram_object import *
-from zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram_object_point import *
-from zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram_style import *
-from zepben.ewb.model.cim.iec61970.base.diagramlayout.orientation_kind import *
-
-from zepben.ewb.model.cim.iec61970.base.domain.unit_symbol import *
-
-from zepben.ewb.model.cim.iec61970.base.equivalents.equivalent_branch import *
-from zepben.ewb.model.cim.iec61970.base.equivalents.equivalent_equipment import *
-
-from zepben.ewb.model.cim.iec61970.base.generation.production.battery_state_kind import *
-from zepben.ewb.model.cim.iec61970.base.generation.production.battery_unit import *
-from zepben.ewb.model.cim.iec61970.base.generation.production.photo_voltaic_unit import *
-from zepben.ewb.model.cim.iec61970.base.generation.production.power_electronics_unit import *
-from zepben.ewb.model.cim.iec61970.base.generation.production.power_electronics_wind_unit import *
-
-from zepben.ewb.model.cim.iec61970.base.meas.accumulator import *
-from zepben.ewb.model.cim.iec61970.base.meas.accumulator_value import *
-from zepben.ewb.model.cim.iec61970.base.meas.analog import *
-from zepben.ewb.model.cim.iec61970.base.meas.analog_value import *
-from zepben.ewb.model.cim.iec61970.base.meas.control import *
-from zepben.ewb.model.cim.iec61970.base.meas.discrete import *
-from zepben.ewb.model.cim.iec61970.base.meas.discrete_value import *
-from zepben.ewb.model.cim.iec61970.base.meas.iopoint import *
-from zepben.ewb.model.cim.iec61970.base.meas.measurement import *
-from zepben.ewb.model.cim.iec61970.base.meas.measurement_value import *
-
-from zepben.ewb.model.cim.iec61970.base.protection.current_relay import *
-
-from zepben.ewb.model.cim.iec61970.base.scada.remote_control import *
-from zepben.ewb.model.cim.iec61970.base.scada.remote_point import *
-from zepben.ewb.model.cim.iec61970.base.scada.remote_source import *
-
-from zepben.ewb.model.cim.iec61970.base.wires.ac_line_segment import *
-from zepben.ewb.model.cim.iec61970.base.wires.ac_line_segment_phase import *
-from zepben.ewb.model.cim.iec61970.base.wires.breaker import *
-from zepben.ewb.model.cim.iec61970.base.wires.busbar_section import *
-from zepben.ewb.model.cim.iec61970.base.wires.clamp import *
-from zepben.ewb.model.cim.iec61970.base.wires.conductor import *
-from zepben.ewb.model.cim.iec61970.base.wires.connector import *
-from zepben.ewb.model.cim.iec61970.base.wires.cut import *
-from zepben.ewb.model.cim.iec61970.base.wires.disconnector import *
-from zepben.ewb.model.cim.iec61970.base.wires.earth_fault_compensator import *
-from zepben.ewb.model.cim.iec61970.base.wires.energy_connection import *
-from zepben.ewb.model.cim.iec61970.base.wires.energy_consumer import *
-from zepben.ewb.model.cim.iec61970.base.wires.energy_consumer_phase import *
-from zepben.ewb.model.cim.iec61970.base.wires.energy_source import *
-from zepben.ewb.model.cim.iec61970.base.wires.energy_source_phase import *
-from zepben.ewb.model.cim.iec61970.base.wires.fuse import *
-from zepben.ewb.model.cim.iec61970.base.wires.ground import *
-from zepben.ewb.model.cim.iec61970.base.wires.ground_disconnector import *
-from zepben.ewb.model.cim.iec61970.base.wires.grounding_impedance import *
-from zepben.ewb.model.cim.iec61970.base.wires.jumper import *
-from zepben.ewb.model.cim.iec61970.base.wires.junction import *
-from zepben.ewb.model.cim.iec61970.base.wires.line import *
-from zepben.ewb.model.cim.iec61970.base.wires.linear_shunt_compensator import *
-from zepben.ewb.model.cim.iec61970.base.wires.load_break_switch import *
-from zepben.ewb.model.cim.iec61970.base.wires.per_length_impedance import *
-from zepben.ewb.model.cim.iec61970.base.wires.per_length_line_parameter import *
-from zepben.ewb.model.cim.iec61970.base.wires.per_length_phase_impedance import *
-from zepben.ewb.model.cim.iec61970.base.wires.per_length_sequence_impedance import *
-from zepben.ewb.model.cim.iec61970.base.wires.petersen_coil import *
-from zepben.ewb.model.cim.iec61970.base.wires.phase_impedance_data import *
-from zepben.ewb.model.cim.iec61970.base.wires.phase_shunt_connection_kind import *
-from zepben.ewb.model.cim.iec61970.base.wires.power_electronics_connection import *
-from zepben.ewb.model.cim.iec61970.base.wires.power_electronics_connection_phase import *
-from zepben.ewb.model.cim.iec61970.base.wires.power_transformer import *
-from zepben.ewb.model.cim.iec61970.base.wires.power_transformer_end import *
-from zepben.ewb.model.cim.iec61970.base.wires.protected_switch import *
-from zepben.ewb.model.cim.iec61970.base.wires.ratio_tap_changer import *
-from zepben.ewb.model.cim.iec61970.base.wires.reactive_capability_curve import *
-from zepben.ewb.model.cim.iec61970.base.wires.recloser import *
-from zepben.ewb.model.cim.iec61970.base.wires.regulating_cond_eq import *
-from zepben.ewb.model.cim.iec61970.base.wires.regulating_control import *
-from zepben.ewb.model.cim.iec61970.base.wires.regulating_control_mode_kind import *
-from zepben.ewb.model.cim.iec61970.base.wires.rotating_machine import *
-from zepben.ewb.model.cim.iec61970.base.wires.series_compensator import *
-from zepben.ewb.model.cim.iec61970.base.wires.shunt_compensator import *
-# This is at the top, see note there: from zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind import *
-from zepben.ewb.model.cim.iec61970.base.wires.static_var_compensator import *
-from zepben.ewb.model.cim.iec61970.base.wires.svc_control_mode import *
-from zepben.ewb.model.cim.iec61970.base.wires.switch import *
-from zepben.ewb.model.cim.iec61970.base.wires.synchronous_machine import *
-from zepben.ewb.model.cim.iec61970.base.wires.synchronous_machine_kind import *
-from zepben.ewb.model.cim.iec61970.base.wires.tap_changer import *
-from zepben.ewb.model.cim.iec61970.base.wires.tap_changer_control import *
-from zepben.ewb.model.cim.iec61970.base.wires.transformer_end import *
-from zepben.ewb.model.cim.iec61970.base.wires.transformer_star_impedance import *
-from zepben.ewb.model.cim.iec61970.base.wires.winding_connection import *
-
-from zepben.ewb.model.cim.iec61970.infiec61970.feeder.circuit import *
-
-#################
-# END CIM MODEL #
-#################
-
-from zepben.ewb.model.resistance_reactance import *
-
-from zepben.ewb.services.network.tracing.feeder.assign_to_feeders import *
-from zepben.ewb.services.network.translator.network_proto2cim import *
-from zepben.ewb.services.network.translator.network_cim2proto import *
-from zepben.ewb.services.network.network_service import *
-
-from zepben.ewb.services.network.network_state import *
-from zepben.ewb.services.network.tracing.busbranch_trace import *
-from zepben.ewb.services.network.tracing.networktrace.network_trace import *
-from zepben.ewb.services.network.tracing.networktrace.network_trace_action_type import *
-from zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next import *
-from zepben.ewb.services.network.tracing.networktrace.network_trace_step import *
-from zepben.ewb.services.network.tracing.networktrace.network_trace_step_path_provider import *
-from zepben.ewb.services.network.tracing.networktrace.network_trace_tracker import *
-from zepben.ewb.services.network.tracing.connectivity.connectivity_result import *
-from zepben.ewb.services.network.tracing.connectivity.nominal_phase_path import *
-from zepben.ewb.services.network.tracing.connectivity.phase_paths import *
-from zepben.ewb.services.network.tracing.connectivity.terminal_connectivity_connected import *
-from zepben.ewb.services.network.tracing.connectivity.terminal_connectivity_internal import *
-from zepben.ewb.services.network.tracing.connectivity.transformer_phase_paths import *
-from zepben.ewb.services.network.tracing.connectivity.xy_candidate_phase_paths import *
-from zepben.ewb.services.network.tracing.connectivity.xy_phase_step import *
-
-from zepben.ewb.services.network.tracing.feeder.assign_to_feeders import *
-from zepben.ewb.services.network.tracing.feeder.assign_to_lv_feeders import *
-from zepben.ewb.services.network.tracing.feeder.clear_direction import *
-from zepben.ewb.services.network.tracing.feeder.direction_status import *
-from zepben.ewb.services.network.tracing.feeder.feeder_direction import *
-from zepben.ewb.services.network.tracing.feeder.set_direction import *
-
-from zepben.ewb.services.network.tracing.networktrace.actions.equipment_tree_builder import *
-from zepben.ewb.services.network.tracing.networktrace.actions.tree_node import *
-from zepben.ewb.services.network.tracing.networktrace.conditions.conditions import *
-from zepben.ewb.services.network.tracing.networktrace.conditions.direction_condition import *
-from zepben.ewb.services.network.tracing.networktrace.conditions.equipment_step_limit_condition import *
-from zepben.ewb.services.network.tracing.networktrace.conditions.equipment_type_step_limit_condition import *
-from zepben.ewb.services.network.tracing.networktrace.conditions.network_trace_stop_condition import *
-from zepben.ewb.services.network.tracing.networktrace.conditions.network_trace_queue_condition import *
-from zepben.ewb.services.network.tracing.networktrace.conditions.open_condition import *
-from zepben.ewb.services.network.tracing.networktrace.operators.equipment_container_state_operators import *
-from zepben.ewb.services.network.tracing.networktrace.operators.feeder_direction_state_operations import *
-from zepben.ewb.services.network.tracing.networktrace.operators.in_service_state_operators import *
-from zepben.ewb.services.network.tracing.networktrace.operators.network_state_operators import *
-from zepben.ewb.services.network.tracing.networktrace.operators.open_state_operators import *
-from zepben.ewb.services.network.tracing.networktrace.operators.phase_state_operators import *
-from zepben.ewb.services.network.tracing.networktrace.compute_data import *
-
-from zepben.ewb.services.network.tracing.phases.phase_status import *
-from zepben.ewb.services.network.tracing.phases.phase_inferrer import *
-from zepben.ewb.services.network.tracing.phases.remove_phases import *
-from zepben.ewb.services.network.tracing.phases.set_phases import *
-
-from zepben.ewb.services.network.tracing.traversal.context_value_computer import *
-from zepben.ewb.services.network.tracing.traversal.queue import *
-from zepben.ewb.services.network.tracing.traversal.queue_condition import *
-from zepben.ewb.services.network.tracing.traversal.step_action import *
-from zepben.ewb.services.network.tracing.traversal.step_context import *
-from zepben.ewb.services.network.tracing.traversal.stop_condition import *
-from zepben.ewb.services.network.tracing.traversal.traversal import *
-from zepben.ewb.services.network.tracing.traversal.traversal_condition import *
-from zepben.ewb.services.network.tracing.traversal.weighted_priority_queue import *
-
-from zepben.ewb.services.network.tracing.traversal.debug_logging import DebugLoggingWrapper  # noqa: F401
-
-from zepben.ewb.services.network.tracing.find_swer_equipment import *
-
-from zepben.ewb.services.common.meta.data_source import *
-from zepben.ewb.services.common.meta.metadata_collection import *
-from zepben.ewb.services.common.meta.service_info import *
-from zepben.ewb.services.common.meta.metadata_translations import *
-from zepben.ewb.services.common.translator.base_proto2cim import *
-from zepben.ewb.services.common.base_service import *
-from zepben.ewb.services.common.reference_resolvers import BoundReferenceResolver, ReferenceResolver, UnresolvedReference  # noqa: F401
-from zepben.ewb.services.common import resolver  # noqa: F401
-
-from zepben.ewb.services.diagram.translator.diagram_proto2cim import *
-from zepben.ewb.services.diagram.translator.diagram_cim2proto import *
-from zepben.ewb.services.diagram.diagrams import *
-
-from zepben.ewb.services.customer.translator.customer_cim2proto import *
-from zepben.ewb.services.customer.translator.customer_proto2cim import *
-from zepben.ewb.services.customer.customers import *
-from zepben.ewb.services.measurement.translator.measurement_cim2proto import *
-from zepben.ewb.services.measurement.translator.measurement_proto2cim import *
-from zepben.ewb.services.measurement.measurements import *
-
-from zepben.ewb.streaming.exceptions import *
-from zepben.ewb.streaming.get.hierarchy.data import *
-from zepben.ewb.streaming.get.consumer import *
-from zepben.ewb.streaming.get.customer_consumer import *
-from zepben.ewb.streaming.get.diagram_consumer import *
-from zepben.ewb.streaming.get.network_consumer import *
-from zepben.ewb.streaming.grpc.auth_token_plugin import *
-from zepben.ewb.streaming.grpc.grpc import *
-from zepben.ewb.streaming.grpc.grpc_channel_builder import *
-from zepben.ewb.streaming.grpc.connect import *
-from zepben.ewb.streaming.data.current_state_event import *
-from zepben.ewb.streaming.data.current_state_event_batch import *
-from zepben.ewb.streaming.data.set_current_states_status import *
-from zepben.ewb.streaming.get.included_energized_containers import *
-from zepben.ewb.streaming.get.included_energizing_containers import *
-from zepben.ewb.streaming.get.query_network_state_service import *
-from zepben.ewb.streaming.get.query_network_state_client import *
-from zepben.ewb.streaming.mutations.update_network_state_service import *
-from zepben.ewb.streaming.mutations.update_network_state_client import *
-
-
-from zepben.ewb.services.network.network_extensions import *
-from zepben.ewb.model.busbranch.bus_branch import *
-
-from zepben.ewb.services.common.difference import *
-from zepben.ewb.services.common.translator.service_differences import *
-
-from zepben.ewb.services.common.base_service_comparator import BaseServiceComparator  # noqa: F401
-from zepben.ewb.services.network.network_service_comparator import NetworkServiceComparator  # noqa: F401
-from zepben.ewb.services.customer.customer_service_comparator import CustomerServiceComparator  # noqa: F401
-from zepben.ewb.services.diagram.diagram_service_comparator import DiagramServiceComparator  # noqa: F401
-
-from zepben.ewb.database.paths.database_type import *
-from zepben.ewb.database.paths.ewb_data_file_paths import *
-from zepben.ewb.database.paths.local_ewb_data_file_paths import *
-
-from zepben.ewb.database.sql.column import *
-from zepben.ewb.database.sqlite.tables.sqlite_table import *
-from zepben.ewb.database.sqlite.tables.table_metadata_data_sources import *
-from zepben.ewb.database.sqlite.tables.table_version import *
-
-####################
-# CIM MODEL TABLES #
-####################
-
-from zepben.ewb.database.sqlite.tables.associations.loop_substation_relationship import *
-from zepben.ewb.database.sqlite.tables.associations.table_asset_organisation_roles_assets import *
-from zepben.ewb.database.sqlite.tables.associations.table_assets_power_system_resources import *
-from zepben.ewb.database.sqlite.tables.associations.table_battery_units_battery_controls import *
-from zepben.ewb.database.sqlite.tables.associations.table_end_devices_end_device_functions import *
-from zepben.ewb.database.sqlite.tables.associations.table_circuits_substations import *
-from zepben.ewb.database.sqlite.tables.associations.table_circuits_terminals import *
-from zepben.ewb.database.sqlite.tables.associations.table_customer_agreements_pricing_structures import *
-from zepben.ewb.database.sqlite.tables.associations.table_equipment_equipment_containers import *
-from zepben.ewb.database.sqlite.tables.associations.table_equipment_operational_restrictions import *
-from zepben.ewb.database.sqlite.tables.associations.table_equipment_usage_points import *
-from zepben.ewb.database.sqlite.tables.associations.table_loops_substations import *
-from zepben.ewb.database.sqlite.tables.associations.table_pricing_structures_tariffs import *
-from zepben.ewb.database.sqlite.tables.associations.table_protection_relay_functions_protected_switches import *
-from zepben.ewb.database.sqlite.tables.associations.table_protection_relay_functions_sensors import *
-from zepben.ewb.database.sqlite.tables.associations.table_protection_relay_schemes_protection_relay_functions import *
-from zepben.ewb.database.sqlite.tables.associations.table_synchronous_machines_reactive_capability_curves import *
-from zepben.ewb.database.sqlite.tables.associations.table_usage_points_end_devices import *
-
-from zepben.ewb.database.sqlite.tables.extensions.iec61968.assetinfo.table_reclose_delays import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61968.assetinfo.table_relay_info import *
-
-from zepben.ewb.database.sqlite.tables.extensions.iec61968.metering.table_pan_demand_response_functions import *
-
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_hv_customers import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_sites import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_lv_substations import *
-
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.feeder.table_loops import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.feeder.table_lv_feeders import *
-
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.generation.production.table_ev_charging_units import *
-
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_distance_relays import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_function_thresholds import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_function_time_limits import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_functions import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_schemes import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_systems import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_voltage_relays import *
-
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.wires.table_battery_controls import *
-from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.wires.table_power_transformer_end_ratings import *
-
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_cable_info import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_no_load_tests import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_open_circuit_tests import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_overhead_wire_info import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_power_transformer_info import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_short_circuit_tests import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_shunt_compensator_info import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_switch_info import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_end_info import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_tank_info import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_test import *
-from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_wire_info import *
-
-from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_containers import *
-from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_functions import *
-from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_info import *
-from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_organisation_roles import *
-from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_owners import *
-from zepben.ewb.database.sqlite.tables.iec61968.assets.table_assets import *
-from zepben.ewb.database.sqlite.tables.iec61968.assets.table_streetlights import *
-from zepben.ewb.database.sqlite.tables.iec61968.assets.table_structures import *
-
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_agreements import *
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_documents import *
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_location_street_address_field import *
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_location_street_addresses import *
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_locations import *
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_organisation_roles import *
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_organisations import *
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_position_points import *
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_street_addresses import *
-from zepben.ewb.database.sqlite.tables.iec61968.common.table_town_details import *
-
-from zepben.ewb.database.sqlite.tables.iec61968.customers.table_customer_agreements import *
-from zepben.ewb.database.sqlite.tables.iec61968.customers.table_customers import *
-from zepben.ewb.database.sqlite.tables.iec61968.customers.table_pricing_structures import *
-from zepben.ewb.database.sqlite.tables.iec61968.customers.table_tariffs import *
-
-from zepben.ewb.database.sqlite.tables.iec61968.infiec61968.infassetinfo.table_current_transformer_info import *
-from zepben.ewb.database.sqlite.tables.iec61968.infiec61968.infassetinfo.table_potential_transformer_info import *
-
-from zepben.ewb.database.sqlite.tables.iec61968.infiec61968.infassets.table_poles import *
-
-from zepben.ewb.database.sqlite.tables.iec61968.metering.table_end_device_functions import *
-from zepben.ewb.database.sqlite.tables.iec61968.metering.table_end_devices import *
-from zepben.ewb.database.sqlite.tables.iec61968.metering.table_meters import *
-from zepben.ewb.database.sqlite.tables.iec61968.metering.table_usage_points import *
-
-from zepben.ewb.database.sqlite.tables.iec61968.operations.table_operational_restrictions import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_auxiliary_equipment import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_current_transformers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_fault_indicators import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_potential_transformers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_sensors import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_ac_dc_terminals import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_base_voltages import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_conducting_equipment import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_connectivity_node_containers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_connectivity_nodes import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_curve_data import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_curves import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_equipment import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_equipment_containers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_feeders import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_geographical_regions import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_identified_objects import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_name_types import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_names import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_power_system_resources import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_sub_geographical_regions import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_substations import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_terminals import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.base.diagramlayout.table_diagram_object_points import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.diagramlayout.table_diagram_objects import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.diagramlayout.table_diagrams import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.base.equivalents.table_equivalent_branches import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.equivalents.table_equivalent_equipment import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_battery_units import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_photo_voltaic_units import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_power_electronics_units import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_power_electronics_wind_units import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_accumulators import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_analogs import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_controls import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_discretes import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_io_points import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_measurements import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.base.protection.table_current_relays import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.base.scada.table_remote_controls import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.scada.table_remote_points import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.scada.table_remote_sources import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ac_line_segments import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ac_line_segment_phases import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_breakers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_busbar_sections import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_clamps import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_conductors import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_connectors import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_cuts import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_disconnectors import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_earth_fault_compensators import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_connections import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_consumer_phases import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_consumers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_source_phases import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_sources import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_fuses import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ground_disconnectors import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_grounding_impedances import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_grounds import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_jumpers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_junctions import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_linear_shunt_compensators import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_lines import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_load_break_switches import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_impedances import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_line_parameters import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_phase_impedances import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_sequence_impedances import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_petersen_coils import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_phase_impedance_data import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_electronics_connection_phases import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_electronics_connections import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_transformer_ends import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_transformers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_protected_switches import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ratio_tap_changers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_reactive_capability_curves import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_reclosers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_regulating_cond_eq import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_regulating_controls import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_rotating_machines import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_series_compensators import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_shunt_compensators import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_static_var_compensator import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_switches import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_synchronous_machines import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_tap_changer_controls import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_tap_changers import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_transformer_ends import *
-from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_transformer_star_impedances import *
-
-from zepben.ewb.database.sqlite.tables.iec61970.infiec61970.feeder.table_circuits import *
-
-########################
-# END CIM MODEL TABLES #
-########################
-
-from zepben.ewb.database.sqlite.customer.customer_database_tables import *
-from zepben.ewb.database.sqlite.diagram.diagram_database_tables import *
-from zepben.ewb.database.sqlite.network.network_database_tables import *
-from zepben.ewb.database.sqlite.extensions.prepared_statement import *
-from zepben.ewb.database.sqlite.tables.exceptions import *
-from zepben.ewb.database.sqlite.common.base_cim_reader import *
-from zepben.ewb.database.sqlite.common.base_cim_writer import *
-from zepben.ewb.database.sqlite.common.base_collection_reader import *
-from zepben.ewb.database.sqlite.common.base_collection_writer import *
-from zepben.ewb.database.sqlite.common.base_entry_writer import *
-from zepben.ewb.database.sqlite.common.base_service_reader import *
-from zepben.ewb.database.sqlite.common.base_service_writer import *
-from zepben.ewb.database.sqlite.common.metadata_collection_writer import *
-from zepben.ewb.database.sqlite.common.metadata_entry_writer import *
-from zepben.ewb.database.sqlite.common.reader_exceptions import *
-from zepben.ewb.database.sqlite.customer.customer_cim_writer import *
-from zepben.ewb.database.sqlite.customer.customer_database_tables import *
-from zepben.ewb.database.sqlite.customer.customer_database_writer import *
-from zepben.ewb.database.sqlite.customer.customer_service_writer import *
-from zepben.ewb.database.sqlite.diagram.diagram_cim_writer import *
-from zepben.ewb.database.sqlite.diagram.diagram_database_tables import *
-from zepben.ewb.database.sqlite.diagram.diagram_database_writer import *
-from zepben.ewb.database.sqlite.diagram.diagram_service_writer import *
-from zepben.ewb.database.sqlite.network.network_cim_writer import *
-from zepben.ewb.database.sqlite.network.network_database_tables import *
-from zepben.ewb.database.sqlite.network.network_database_writer import *
-from zepben.ewb.database.sqlite.network.network_service_writer import *
-from zepben.ewb.database.sqlite.extensions.result_set import ResultSet  # noqa: F401
-from zepben.ewb.database.sqlite.common.metadata_collection_reader import *
-from zepben.ewb.database.sqlite.common.metadata_entry_reader import *
-from zepben.ewb.database.sqlite.customer.customer_cim_reader import *
-from zepben.ewb.database.sqlite.customer.customer_database_reader import *
-from zepben.ewb.database.sqlite.customer.customer_service_reader import *
-from zepben.ewb.database.sqlite.diagram.diagram_cim_reader import *
-from zepben.ewb.database.sqlite.diagram.diagram_database_reader import *
-from zepben.ewb.database.sqlite.diagram.diagram_service_reader import *
-from zepben.ewb.database.sqlite.network.network_cim_reader import *
-from zepben.ewb.database.sqlite.network.network_database_reader import *
-from zepben.ewb.database.sqlite.network.network_service_reader import *
-
-from zepben.ewb.testing.test_network_builder import *
-from zepben.ewb.exceptions import *
-from zepben.ewb.types import *
+from importlib import import_module
+from typing import TYPE_CHECKING, List
+
+from zepben.ewb._exports import EXPORTS
+
+# The imports are only run by type checkers and IDEs. At runtime, each name is imported from the module listed in `EXPORTS` the first time it is used, so
+# importing `zepben.ewb` only loads the modules that are actually needed. Run `python -m zepben.ewb._generate_exports` after changing these imports.
+if TYPE_CHECKING:
+    from zepben.ewb.auth.client.zepben_token_fetcher import *
+    from zepben.ewb.auth.common.auth_exception import *
+    from zepben.ewb.auth.common.auth_method import *
+    from zepben.ewb.dataclass_descriptors.dataclass_base import *
+    from zepben.ewb.dataclass_descriptors.descriptor_fix import *
+    from zepben.ewb.util import *
+
+    #############
+    # CIM MODEL #
+    #############
+
+    # We need to import SinglePhaseKind before anything uses PhaseCode to prevent cyclic dependencies.
+    from zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind import *
+
+    from zepben.ewb.model.cim.extensions.iec61968.assetinfo.relay_info import *
+
+    from zepben.ewb.model.cim.extensions.iec61968.common.contact_details import *
+    from zepben.ewb.model.cim.extensions.iec61968.common.contact_method_type import *
+
+    from zepben.ewb.model.cim.extensions.iec61968.metering.pan_demand_reponse_function import *
+
+    from zepben.ewb.model.cim.extensions.iec61970.base.core.hv_customer import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.core.site import *
+
+    from zepben.ewb.model.cim.extensions.iec61970.base.feeder.loop import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.feeder.lv_feeder import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.feeder.lv_substation import *
+
+    from zepben.ewb.model.cim.extensions.iec61970.base.generation.production.ev_charging_unit import *
+
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.directional_current_relay import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.distance_relay import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.polarizing_quantity_type import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.power_direction_kind import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_kind import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_relay_function import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_relay_scheme import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_relay_system import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.relay_setting import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.protection.voltage_relay import *
+
+    from zepben.ewb.model.cim.extensions.iec61970.base.wires.battery_control import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.wires.battery_control_mode import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.wires.transformer_cooling_type import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.wires.transformer_end_rated_s import *
+    from zepben.ewb.model.cim.extensions.iec61970.base.wires.vector_group import *
+
+    from zepben.ewb.model.cim.iec61968.assetinfo.cable_info import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.no_load_test import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.open_circuit_test import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.overhead_wire_info import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.power_transformer_info import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.short_circuit_test import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.shunt_compensator_info import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.switch_info import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.transformer_end_info import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.transformer_tank_info import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.transformer_test import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.wire_info import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.wire_insulation_kind import *
+    from zepben.ewb.model.cim.iec61968.assetinfo.wire_material_kind import *
+
+    from zepben.ewb.model.cim.iec61968.assets.asset import *
+    from zepben.ewb.model.cim.iec61968.assets.asset_container import *
+    from zepben.ewb.model.cim.iec61968.assets.asset_function import *
+    from zepben.ewb.model.cim.iec61968.assets.asset_info import *
+    from zepben.ewb.model.cim.iec61968.assets.asset_organisation_role import *
+    from zepben.ewb.model.cim.iec61968.assets.asset_owner import *
+    from zepben.ewb.model.cim.iec61968.assets.streetlight import *
+    from zepben.ewb.model.cim.iec61968.assets.structure import *
+
+    from zepben.ewb.model.cim.iec61968.common.agreement import *
+    from zepben.ewb.model.cim.iec61968.common.document import *
+    from zepben.ewb.model.cim.iec61968.common.electronic_address import *
+    from zepben.ewb.model.cim.iec61968.common.location import *
+    from zepben.ewb.model.cim.iec61968.common.organisation import *
+    from zepben.ewb.model.cim.iec61968.common.organisation_role import *
+    from zepben.ewb.model.cim.iec61968.common.position_point import *
+    from zepben.ewb.model.cim.iec61968.common.street_address import *
+    from zepben.ewb.model.cim.iec61968.common.street_detail import *
+    from zepben.ewb.model.cim.iec61968.common.telephone_number import *
+    from zepben.ewb.model.cim.iec61968.common.town_detail import *
+
+    from zepben.ewb.model.cim.iec61968.customers.customer import *
+    from zepben.ewb.model.cim.iec61968.customers.customer_agreement import *
+    from zepben.ewb.model.cim.iec61968.customers.customer_kind import *
+    from zepben.ewb.model.cim.iec61968.customers.pricing_structure import *
+    from zepben.ewb.model.cim.iec61968.customers.tariff import *
+
+    from zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.current_transformer_info import *
+    from zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.potential_transformer_info import *
+    from zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.transformer_construction_kind import *
+    from zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.transformer_function_kind import *
+
+    from zepben.ewb.model.cim.iec61968.infiec61968.infassets.pole import *
+    from zepben.ewb.model.cim.iec61968.infiec61968.infassets.streetlight_lamp_kind import *
+
+    from zepben.ewb.model.cim.iec61968.infiec61968.infcommon.ratio import *
+
+    from zepben.ewb.model.cim.iec61968.metering.controlled_appliance import *
+    from zepben.ewb.model.cim.iec61968.metering.end_device import *
+    from zepben.ewb.model.cim.iec61968.metering.end_device_function import *
+    from zepben.ewb.model.cim.iec61968.metering.end_device_function_kind import *
+    from zepben.ewb.model.cim.iec61968.metering.meter import *
+    from zepben.ewb.model.cim.iec61968.metering.usage_point import *
+
+    from zepben.ewb.model.cim.iec61968.operations.operational_restriction import *
+
+    from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.auxiliary_equipment import *
+    from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.current_transformer import *
+    from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.fault_indicator import *
+    from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.potential_transformer import *
+    from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.potential_transformer_kind import *
+    from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.sensor import *
+
+    from zepben.ewb.model.cim.iec61970.base.core.ac_dc_terminal import *
+    from zepben.ewb.model.cim.iec61970.base.core.base_voltage import *
+    from zepben.ewb.model.cim.iec61970.base.core.conducting_equipment import *
+    from zepben.ewb.model.cim.iec61970.base.core.connectivity_node import *
+    from zepben.ewb.model.cim.iec61970.base.core.connectivity_node_container import *
+    from zepben.ewb.model.cim.iec61970.base.core.curve import *
+    from zepben.ewb.model.cim.iec61970.base.core.curve_data import *
+    from zepben.ewb.model.cim.iec61970.base.core.equipment import *
+    from zepben.ewb.model.cim.iec61970.base.core.equipment_container import *
+    from zepben.ewb.model.cim.iec61970.base.core.feeder import *
+    from zepben.ewb.model.cim.iec61970.base.core.geographical_region import *
+    from zepben.ewb.model.cim.iec61970.base.core.identifiable import *
+    from zepben.ewb.model.cim.iec61970.base.core.identified_object import *
+    from zepben.ewb.model.cim.iec61970.base.core.name import *
+    from zepben.ewb.model.cim.iec61970.base.core.name_type import *
+    from zepben.ewb.model.cim.iec61970.base.core.phase_code import *
+    from zepben.ewb.model.cim.iec61970.base.core.power_system_resource import *
+    from zepben.ewb.model.cim.iec61970.base.core.sub_geographical_region import *
+    from zepben.ewb.model.cim.iec61970.base.core.substation import *
+    from zepben.ewb.model.cim.iec61970.base.core.terminal import *
+
+    from zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram import *
+    from zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram_object import *
+    from zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram_object_point import *
+    from zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram_style import *
+    from zepben.ewb.model.cim.iec61970.base.diagramlayout.orientation_kind import *
+
+    from zepben.ewb.model.cim.iec61970.base.domain.unit_symbol import *
+
+    from zepben.ewb.model.cim.iec61970.base.equivalents.equivalent_branch import *
+    from zepben.ewb.model.cim.iec61970.base.equivalents.equivalent_equipment import *
+
+    from zepben.ewb.model.cim.iec61970.base.generation.production.battery_state_kind import *
+    from zepben.ewb.model.cim.iec61970.base.generation.production.battery_unit import *
+    from zepben.ewb.model.cim.iec61970.base.generation.production.photo_voltaic_unit import *
+    from zepben.ewb.model.cim.iec61970.base.generation.production.power_electronics_unit import *
+    from zepben.ewb.model.cim.iec61970.base.generation.production.power_electronics_wind_unit import *
+
+    from zepben.ewb.model.cim.iec61970.base.meas.accumulator import *
+    from zepben.ewb.model.cim.iec61970.base.meas.accumulator_value import *
+    from zepben.ewb.model.cim.iec61970.base.meas.analog import *
+    from zepben.ewb.model.cim.iec61970.base.meas.analog_value import *
+    from zepben.ewb.model.cim.iec61970.base.meas.control import *
+    from zepben.ewb.model.cim.iec61970.base.meas.discrete import *
+    from zepben.ewb.model.cim.iec61970.base.meas.discrete_value import *
+    from zepben.ewb.model.cim.iec61970.base.meas.iopoint import *
+    from zepben.ewb.model.cim.iec61970.base.meas.measurement import *
+    from zepben.ewb.model.cim.iec61970.base.meas.measurement_value import *
+
+    from zepben.ewb.model.cim.iec61970.base.protection.current_relay import *
+
+    from zepben.ewb.model.cim.iec61970.base.scada.remote_control import *
+    from zepben.ewb.model.cim.iec61970.base.scada.remote_point import *
+    from zepben.ewb.model.cim.iec61970.base.scada.remote_source import *
+
+    from zepben.ewb.model.cim.iec61970.base.wires.ac_line_segment import *
+    from zepben.ewb.model.cim.iec61970.base.wires.ac_line_segment_phase import *
+    from zepben.ewb.model.cim.iec61970.base.wires.breaker import *
+    from zepben.ewb.model.cim.iec61970.base.wires.busbar_section import *
+    from zepben.ewb.model.cim.iec61970.base.wires.clamp import *
+    from zepben.ewb.model.cim.iec61970.base.wires.conductor import *
+    from zepben.ewb.model.cim.iec61970.base.wires.connector import *
+    from zepben.ewb.model.cim.iec61970.base.wires.cut import *
+    from zepben.ewb.model.cim.iec61970.base.wires.disconnector import *
+    from zepben.ewb.model.cim.iec61970.base.wires.earth_fault_compensator import *
+    from zepben.ewb.model.cim.iec61970.base.wires.energy_connection import *
+    from zepben.ewb.model.cim.iec61970.base.wires.energy_consumer import *
+    from zepben.ewb.model.cim.iec61970.base.wires.energy_consumer_phase import *
+    from zepben.ewb.model.cim.iec61970.base.wires.energy_source import *
+    from zepben.ewb.model.cim.iec61970.base.wires.energy_source_phase import *
+    from zepben.ewb.model.cim.iec61970.base.wires.fuse import *
+    from zepben.ewb.model.cim.iec61970.base.wires.ground import *
+    from zepben.ewb.model.cim.iec61970.base.wires.ground_disconnector import *
+    from zepben.ewb.model.cim.iec61970.base.wires.grounding_impedance import *
+    from zepben.ewb.model.cim.iec61970.base.wires.jumper import *
+    from zepben.ewb.model.cim.iec61970.base.wires.junction import *
+    from zepben.ewb.model.cim.iec61970.base.wires.line import *
+    from zepben.ewb.model.cim.iec61970.base.wires.linear_shunt_compensator import *
+    from zepben.ewb.model.cim.iec61970.base.wires.load_break_switch import *
+    from zepben.ewb.model.cim.iec61970.base.wires.per_length_impedance import *
+    from zepben.ewb.model.cim.iec61970.base.wires.per_length_line_parameter import *
+    from zepben.ewb.model.cim.iec61970.base.wires.per_length_phase_impedance import *
+    from zepben.ewb.model.cim.iec61970.base.wires.per_length_sequence_impedance import *
+    from zepben.ewb.model.cim.iec61970.base.wires.petersen_coil import *
+    from zepben.ewb.model.cim.iec61970.base.wires.phase_impedance_data import *
+    from zepben.ewb.model.cim.iec61970.base.wires.phase_shunt_connection_kind import *
+    from zepben.ewb.model.cim.iec61970.base.wires.power_electronics_connection import *
+    from zepben.ewb.model.cim.iec61970.base.wires.power_electronics_connection_phase import *
+    from zepben.ewb.model.cim.iec61970.base.wires.power_transformer import *
+    from zepben.ewb.model.cim.iec61970.base.wires.power_transformer_end import *
+    from zepben.ewb.model.cim.iec61970.base.wires.protected_switch import *
+    from zepben.ewb.model.cim.iec61970.base.wires.ratio_tap_changer import *
+    from zepben.ewb.model.cim.iec61970.base.wires.reactive_capability_curve import *
+    from zepben.ewb.model.cim.iec61970.base.wires.recloser import *
+    from zepben.ewb.model.cim.iec61970.base.wires.regulating_cond_eq import *
+    from zepben.ewb.model.cim.iec61970.base.wires.regulating_control import *
+    from zepben.ewb.model.cim.iec61970.base.wires.regulating_control_mode_kind import *
+    from zepben.ewb.model.cim.iec61970.base.wires.rotating_machine import *
+    from zepben.ewb.model.cim.iec61970.base.wires.series_compensator import *
+    from zepben.ewb.model.cim.iec61970.base.wires.shunt_compensator import *
+    # This is at the top, see note there: from zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind import *
+    from zepben.ewb.model.cim.iec61970.base.wires.static_var_compensator import *
+    from zepben.ewb.model.cim.iec61970.base.wires.svc_control_mode import *
+    from zepben.ewb.model.cim.iec61970.base.wires.switch import *
+    from zepben.ewb.model.cim.iec61970.base.wires.synchronous_machine import *
+    from zepben.ewb.model.cim.iec61970.base.wires.synchronous_machine_kind import *
+    from zepben.ewb.model.cim.iec61970.base.wires.tap_changer import *
+    from zepben.ewb.model.cim.iec61970.base.wires.tap_changer_control import *
+    from zepben.ewb.model.cim.iec61970.base.wires.transformer_end import *
+    from zepben.ewb.model.cim.iec61970.base.wires.transformer_star_impedance import *
+    from zepben.ewb.model.cim.iec61970.base.wires.winding_connection import *
+
+    from zepben.ewb.model.cim.iec61970.infiec61970.feeder.circuit import *
+
+    #################
+    # END CIM MODEL #
+    #################
+
+    from zepben.ewb.model.resistance_reactance import *
+
+    from zepben.ewb.services.network.tracing.feeder.assign_to_feeders import *
+    from zepben.ewb.services.network.translator.network_proto2cim import *
+    from zepben.ewb.services.network.translator.network_cim2proto import *
+    from zepben.ewb.services.network.network_service import *
+
+    from zepben.ewb.services.network.network_state import *
+    from zepben.ewb.services.network.tracing.busbranch_trace import *
+    from zepben.ewb.services.network.tracing.networktrace.network_trace import *
+    from zepben.ewb.services.network.tracing.networktrace.network_trace_action_type import *
+    from zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next import *
+    from zepben.ewb.services.network.tracing.networktrace.network_trace_step import *
+    from zepben.ewb.services.network.tracing.networktrace.network_trace_step_path_provider import *
+    from zepben.ewb.services.network.tracing.networktrace.network_trace_tracker import *
+    from zepben.ewb.services.network.tracing.connectivity.connectivity_result import *
+    from zepben.ewb.services.network.tracing.connectivity.nominal_phase_path import *
+    from zepben.ewb.services.network.tracing.connectivity.phase_path_lookup import *
+    from zepben.ewb.services.network.tracing.connectivity.phase_paths import *
+    from zepben.ewb.services.network.tracing.connectivity.terminal_connectivity_connected import *
+    from zepben.ewb.services.network.tracing.connectivity.terminal_connectivity_internal import *
+    from zepben.ewb.services.network.tracing.connectivity.transformer_phase_paths import *
+    from zepben.ewb.services.network.tracing.connectivity.xy_candidate_phase_paths import *
+    from zepben.ewb.services.network.tracing.connectivity.xy_phase_step import *
+
+    from zepben.ewb.services.network.tracing.feeder.assign_to_feeders import *
+    from zepben.ewb.services.network.tracing.feeder.assign_to_lv_feeders import *
+    from zepben.ewb.services.network.tracing.feeder.clear_direction import *
+    from zepben.ewb.services.network.tracing.feeder.direction_status import *
+    from zepben.ewb.services.network.tracing.feeder.feeder_direction import *
+    from zepben.ewb.services.network.tracing.feeder.set_direction import *
+
+    from zepben.ewb.services.network.tracing.networktrace.actions.equipment_tree_builder import *
+    from zepben.ewb.services.network.tracing.networktrace.actions.tree_node import *
+    from zepben.ewb.services.network.tracing.networktrace.conditions.conditions import *
+    from zepben.ewb.services.network.tracing.networktrace.conditions.direction_condition import *
+    from zepben.ewb.services.network.tracing.networktrace.conditions.equipment_step_limit_condition import *
+    from zepben.ewb.services.network.tracing.networktrace.conditions.equipment_type_step_limit_condition import *
+    from zepben.ewb.services.network.tracing.networktrace.conditions.network_trace_stop_condition import *
+    from zepben.ewb.services.network.tracing.networktrace.conditions.network_trace_queue_condition import *
+    from zepben.ewb.services.network.tracing.networktrace.conditions.open_condition import *
+    from zepben.ewb.services.network.tracing.networktrace.operators.equipment_container_state_operators import *
+    from zepben.ewb.services.network.tracing.networktrace.operators.feeder_direction_state_operations import *
+    from zepben.ewb.services.network.tracing.networktrace.operators.in_service_state_operators import *
+    from zepben.ewb.services.network.tracing.networktrace.operators.network_state_operators import *
+    from zepben.ewb.services.network.tracing.networktrace.operators.open_state_operators import *
+    from zepben.ewb.services.network.tracing.networktrace.operators.phase_state_operators import *
+    from zepben.ewb.services.network.tracing.networktrace.compute_data import *
+
+    from zepben.ewb.services.network.tracing.phases.phase_status import *
+    from zepben.ewb.services.network.tracing.terminal_state_store import *
+    from zepben.ewb.services.network.tracing.phases.phase_inferrer import *
+    from zepben.ewb.services.network.tracing.phases.remove_phases import *
+    from zepben.ewb.services.network.tracing.phases.set_phases import *
+
+    from zepben.ewb.services.network.tracing.traversal.context_value_computer import *
+    from zepben.ewb.services.network.tracing.traversal.queue import *
+    from zepben.ewb.services.network.tracing.traversal.queue_condition import *
+    from zepben.ewb.services.network.tracing.traversal.step_action import *
+    from zepben.ewb.services.network.tracing.traversal.step_context import *
+    from zepben.ewb.services.network.tracing.traversal.stop_condition import *
+    from zepben.ewb.services.network.tracing.traversal.traversal import *
+    from zepben.ewb.services.network.tracing.traversal.traversal_condition import *
+    from zepben.ewb.services.network.tracing.traversal.weighted_priority_queue import *
+
+    from zepben.ewb.services.network.tracing.traversal.debug_logging import DebugLoggingWrapper  # noqa: F401
+
+    from zepben.ewb.services.network.tracing.find_swer_equipment import *
+
+    from zepben.ewb.services.common.meta.data_source import *
+    from zepben.ewb.services.common.meta.metadata_collection import *
+    from zepben.ewb.services.common.meta.service_info import *
+    from zepben.ewb.services.common.meta.metadata_translations import *
+    from zepben.ewb.services.common.translator.base_proto2cim import *
+    from zepben.ewb.services.common.base_service import *
+    from zepben.ewb.services.common.pending_references import *
+    from zepben.ewb.services.common.reference_resolvers import BoundReferenceResolver, ReferenceResolver, UnresolvedReference  # noqa: F401
+    from zepben.ewb.services.common import resolver  # noqa: F401
+
+    from zepben.ewb.services.diagram.translator.diagram_proto2cim import *
+    from zepben.ewb.services.diagram.translator.diagram_cim2proto import *
+    from zepben.ewb.services.diagram.diagrams import *
+
+    from zepben.ewb.services.customer.translator.customer_cim2proto import *
+    from zepben.ewb.services.customer.translator.customer_proto2cim import *
+    from zepben.ewb.services.customer.customers import *
+    from zepben.ewb.services.measurement.translator.measurement_cim2proto import *
+    from zepben.ewb.services.measurement.translator.measurement_proto2cim import *
+    from zepben.ewb.services.measurement.measurements import *
+
+    from zepben.ewb.streaming.exceptions import *
+    from zepben.ewb.streaming.get.hierarchy.data import *
+    from zepben.ewb.streaming.get.consumer import *
+    from zepben.ewb.streaming.get.customer_consumer import *
+    from zepben.ewb.streaming.get.diagram_consumer import *
+    from zepben.ewb.streaming.get.network_consumer import *
+    from zepben.ewb.streaming.grpc.auth_token_plugin import *
+    from zepben.ewb.streaming.grpc.grpc import *
+    from zepben.ewb.streaming.grpc.grpc_channel_builder import *
+    from zepben.ewb.streaming.grpc.connect import *
+    from zepben.ewb.streaming.data.current_state_event import *
+    from zepben.ewb.streaming.data.current_state_event_batch import *
+    from zepben.ewb.streaming.data.set_current_states_status import *
+
+    from zepben.ewb.services.network.tracing.apply_current_state_events import *
+    from zepben.ewb.streaming.get.included_energized_containers import *
+    from zepben.ewb.streaming.get.included_energizing_containers import *
+    from zepben.ewb.streaming.get.query_network_state_service import *
+    from zepben.ewb.streaming.get.query_network_state_client import *
+    from zepben.ewb.streaming.mutations.update_network_state_service import *
+    from zepben.ewb.streaming.mutations.update_network_state_client import *
+
+
+    from zepben.ewb.services.network.network_extensions import *
+    from zepben.ewb.model.busbranch.bus_branch import *
+
+    from zepben.ewb.services.common.difference import *
+    from zepben.ewb.services.common.translator.service_differences import *
+
+    from zepben.ewb.services.common.base_service_comparator import BaseServiceComparator  # noqa: F401
+    from zepben.ewb.services.common.content_fingerprint import *
+    from zepben.ewb.services.network.network_service_comparator import NetworkServiceComparator  # noqa: F401
+    from zepben.ewb.services.customer.customer_service_comparator import CustomerServiceComparator  # noqa: F401
+    from zepben.ewb.services.diagram.diagram_service_comparator import DiagramServiceComparator  # noqa: F401
+
+    from zepben.ewb.database.paths.database_type import *
+    from zepben.ewb.database.paths.ewb_data_file_paths import *
+    from zepben.ewb.database.paths.local_ewb_data_file_paths import *
+
+    from zepben.ewb.database.sql.column import *
+    from zepben.ewb.database.sqlite.tables.sqlite_table import *
+    from zepben.ewb.database.sqlite.tables.table_metadata_data_sources import *
+    from zepben.ewb.database.sqlite.tables.table_version import *
+
+    ####################
+    # CIM MODEL TABLES #
+    ####################
+
+    from zepben.ewb.database.sqlite.tables.associations.loop_substation_relationship import *
+    from zepben.ewb.database.sqlite.tables.associations.table_asset_organisation_roles_assets import *
+    from zepben.ewb.database.sqlite.tables.associations.table_assets_power_system_resources import *
+    from zepben.ewb.database.sqlite.tables.associations.table_battery_units_battery_controls import *
+    from zepben.ewb.database.sqlite.tables.associations.table_end_devices_end_device_functions import *
+    from zepben.ewb.database.sqlite.tables.associations.table_circuits_substations import *
+    from zepben.ewb.database.sqlite.tables.associations.table_circuits_terminals import *
+    from zepben.ewb.database.sqlite.tables.associations.table_customer_agreements_pricing_structures import *
+    from zepben.ewb.database.sqlite.tables.associations.table_equipment_equipment_containers import *
+    from zepben.ewb.database.sqlite.tables.associations.table_equipment_operational_restrictions import *
+    from zepben.ewb.database.sqlite.tables.associations.table_equipment_usage_points import *
+    from zepben.ewb.database.sqlite.tables.associations.table_loops_substations import *
+    from zepben.ewb.database.sqlite.tables.associations.table_pricing_structures_tariffs import *
+    from zepben.ewb.database.sqlite.tables.associations.table_protection_relay_functions_protected_switches import *
+    from zepben.ewb.database.sqlite.tables.associations.table_protection_relay_functions_sensors import *
+    from zepben.ewb.database.sqlite.tables.associations.table_protection_relay_schemes_protection_relay_functions import *
+    from zepben.ewb.database.sqlite.tables.associations.table_synchronous_machines_reactive_capability_curves import *
+    from zepben.ewb.database.sqlite.tables.associations.table_usage_points_end_devices import *
+
+    from zepben.ewb.database.sqlite.tables.extensions.iec61968.assetinfo.table_reclose_delays import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61968.assetinfo.table_relay_info import *
+
+    from zepben.ewb.database.sqlite.tables.extensions.iec61968.metering.table_pan_demand_response_functions import *
+
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_hv_customers import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_sites import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_lv_substations import *
+
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.feeder.table_loops import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.feeder.table_lv_feeders import *
+
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.generation.production.table_ev_charging_units import *
+
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_distance_relays import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_function_thresholds import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_function_time_limits import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_functions import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_schemes import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_systems import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_voltage_relays import *
+
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.wires.table_battery_controls import *
+    from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.wires.table_power_transformer_end_ratings import *
+
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_cable_info import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_no_load_tests import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_open_circuit_tests import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_overhead_wire_info import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_power_transformer_info import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_short_circuit_tests import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_shunt_compensator_info import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_switch_info import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_end_info import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_tank_info import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_test import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_wire_info import *
+
+    from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_containers import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_functions import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_info import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_organisation_roles import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_owners import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assets.table_assets import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assets.table_streetlights import *
+    from zepben.ewb.database.sqlite.tables.iec61968.assets.table_structures import *
+
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_agreements import *
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_documents import *
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_location_street_address_field import *
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_location_street_addresses import *
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_locations import *
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_organisation_roles import *
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_organisations import *
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_position_points import *
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_street_addresses import *
+    from zepben.ewb.database.sqlite.tables.iec61968.common.table_town_details import *
+
+    from zepben.ewb.database.sqlite.tables.iec61968.customers.table_customer_agreements import *
+    from zepben.ewb.database.sqlite.tables.iec61968.customers.table_customers import *
+    from zepben.ewb.database.sqlite.tables.iec61968.customers.table_pricing_structures import *
+    from zepben.ewb.database.sqlite.tables.iec61968.customers.table_tariffs import *
+
+    from zepben.ewb.database.sqlite.tables.iec61968.infiec61968.infassetinfo.table_current_transformer_info import *
+    from zepben.ewb.database.sqlite.tables.iec61968.infiec61968.infassetinfo.table_potential_transformer_info import *
+
+    from zepben.ewb.database.sqlite.tables.iec61968.infiec61968.infassets.table_poles import *
+
+    from zepben.ewb.database.sqlite.tables.iec61968.metering.table_end_device_functions import *
+    from zepben.ewb.database.sqlite.tables.iec61968.metering.table_end_devices import *
+    from zepben.ewb.database.sqlite.tables.iec61968.metering.table_meters import *
+    from zepben.ewb.database.sqlite.tables.iec61968.metering.table_usage_points import *
+
+    from zepben.ewb.database.sqlite.tables.iec61968.operations.table_operational_restrictions import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_auxiliary_equipment import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_current_transformers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_fault_indicators import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_potential_transformers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_sensors import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_ac_dc_terminals import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_base_voltages import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_conducting_equipment import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_connectivity_node_containers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_connectivity_nodes import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_curve_data import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_curves import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_equipment import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_equipment_containers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_feeders import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_geographical_regions import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_identified_objects import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_name_types import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_names import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_power_system_resources import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_sub_geographical_regions import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_substations import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_terminals import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.base.diagramlayout.table_diagram_object_points import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.diagramlayout.table_diagram_objects import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.diagramlayout.table_diagrams import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.base.equivalents.table_equivalent_branches import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.equivalents.table_equivalent_equipment import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_battery_units import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_photo_voltaic_units import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_power_electronics_units import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_power_electronics_wind_units import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_accumulators import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_analogs import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_controls import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_discretes import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_io_points import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_measurements import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.base.protection.table_current_relays import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.base.scada.table_remote_controls import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.scada.table_remote_points import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.scada.table_remote_sources import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ac_line_segments import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ac_line_segment_phases import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_breakers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_busbar_sections import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_clamps import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_conductors import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_connectors import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_cuts import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_disconnectors import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_earth_fault_compensators import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_connections import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_consumer_phases import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_consumers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_source_phases import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_sources import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_fuses import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ground_disconnectors import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_grounding_impedances import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_grounds import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_jumpers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_junctions import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_linear_shunt_compensators import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_lines import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_load_break_switches import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_impedances import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_line_parameters import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_phase_impedances import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_sequence_impedances import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_petersen_coils import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_phase_impedance_data import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_electronics_connection_phases import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_electronics_connections import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_transformer_ends import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_transformers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_protected_switches import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ratio_tap_changers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_reactive_capability_curves import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_reclosers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_regulating_cond_eq import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_regulating_controls import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_rotating_machines import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_series_compensators import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_shunt_compensators import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_static_var_compensator import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_switches import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_synchronous_machines import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_tap_changer_controls import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_tap_changers import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_transformer_ends import *
+    from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_transformer_star_impedances import *
+
+    from zepben.ewb.database.sqlite.tables.iec61970.infiec61970.feeder.table_circuits import *
+
+    ########################
+    # END CIM MODEL TABLES #
+    ########################
+
+    from zepben.ewb.database.sqlite.customer.customer_database_tables import *
+    from zepben.ewb.database.sqlite.diagram.diagram_database_tables import *
+    from zepben.ewb.database.sqlite.network.network_database_tables import *
+    from zepben.ewb.database.sqlite.extensions.prepared_statement import *
+    from zepben.ewb.database.sqlite.tables.exceptions import *
+    from zepben.ewb.database.sqlite.common.base_cim_reader import *
+    from zepben.ewb.database.sqlite.common.base_cim_writer import *
+    from zepben.ewb.database.sqlite.common.base_collection_reader import *
+    from zepben.ewb.database.sqlite.common.base_collection_writer import *
+    from zepben.ewb.database.sqlite.common.base_entry_writer import *
+    from zepben.ewb.database.sqlite.common.base_service_reader import *
+    from zepben.ewb.database.sqlite.common.base_service_writer import *
+    from zepben.ewb.database.sqlite.common.metadata_collection_writer import *
+    from zepben.ewb.database.sqlite.common.metadata_entry_writer import *
+    from zepben.ewb.database.sqlite.common.reader_exceptions import *
+    from zepben.ewb.database.sqlite.customer.customer_cim_writer import *
+    from zepben.ewb.database.sqlite.customer.customer_database_tables import *
+    from zepben.ewb.database.sqlite.customer.customer_database_writer import *
+    from zepben.ewb.database.sqlite.customer.customer_service_writer import *
+    from zepben.ewb.database.sqlite.diagram.diagram_cim_writer import *
+    from zepben.ewb.database.sqlite.diagram.diagram_database_tables import *
+    from zepben.ewb.database.sqlite.diagram.diagram_database_writer import *
+    from zepben.ewb.database.sqlite.diagram.diagram_service_writer import *
+    from zepben.ewb.database.sqlite.network.network_cim_writer import *
+    from zepben.ewb.database.sqlite.network.network_database_tables import *
+    from zepben.ewb.database.sqlite.network.network_database_writer import *
+    from zepben.ewb.database.sqlite.network.network_service_writer import *
+    from zepben.ewb.database.sqlite.extensions.result_set import ResultSet  # noqa: F401
+    from zepben.ewb.database.sqlite.common.metadata_collection_reader import *
+    from zepben.ewb.database.sqlite.common.metadata_entry_reader import *
+    from zepben.ewb.database.sqlite.customer.customer_cim_reader import *
+    from zepben.ewb.database.sqlite.customer.customer_database_reader import *
+    from zepben.ewb.database.sqlite.customer.customer_service_reader import *
+    from zepben.ewb.database.sqlite.diagram.diagram_cim_reader import *
+    from zepben.ewb.database.sqlite.diagram.diagram_database_reader import *
+    from zepben.ewb.database.sqlite.diagram.diagram_service_reader import *
+    from zepben.ewb.database.sqlite.network.network_cim_reader import *
+    from zepben.ewb.database.sqlite.network.network_container_scope import *
+    from zepben.ewb.database.sqlite.network.network_database_reader import *
+    from zepben.ewb.database.sqlite.network.network_snapshot import *
+    from zepben.ewb.database.sqlite.network.network_service_reader import *
+
+    from zepben.ewb.testing.test_network_builder import *
+    from zepben.ewb.exceptions import *
+    from zepben.ewb.types import *
 
 # @formatter:on
+
+__all__ = list(EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module_name = EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = import_module(module_name)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        # Submodules of a package are only attributes of the package once they have been imported.
+        value = import_module(f"{module_name}.{name}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *EXPORTS})
+
@@ -0,0 +1,985 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+# NOTE: This file is generated by `python -m zepben.ewb._generate_exports` from the imports in `zepben/ewb/__init__.py`. Do not edit it by hand.
+
+from typing import Dict
+
+EXPORTS: Dict[str, str] = {
+    "ZepbenTokenFetcher": "zepben.ewb.auth.client.zepben_token_fetcher",
+    "TokenRefreshStats": "zepben.ewb.auth.client.zepben_token_fetcher",
+    "create_token_fetcher": "zepben.ewb.auth.client.zepben_token_fetcher",
+    "get_token_fetcher": "zepben.ewb.auth.client.zepben_token_fetcher",
+    "create_token_fetcher_managed_identity": "zepben.ewb.auth.client.zepben_token_fetcher",
+    "AuthException": "zepben.ewb.auth.common.auth_exception",
+    "AuthMethod": "zepben.ewb.auth.common.auth_method",
+    "dataclass": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "fields": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "MISSING": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "Any": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "Callable": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "Dict": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "Optional": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "Tuple": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "DataclassBase": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "zb_dataclass": "zepben.ewb.dataclass_descriptors.dataclass_base",
+    "annotations": "zepben.ewb.dataclass_descriptors.descriptor_fix",
+    "Field": "zepben.ewb.dataclass_descriptors.descriptor_fix",
+    "TypeVar": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "T": "zepben.ewb.services.common.difference",
+    "BackedDescriptor": "zepben.ewb.dataclass_descriptors.descriptor_fix",
+    "remove_descriptor_annotations": "zepben.ewb.dataclass_descriptors.descriptor_fix",
+    "get_by_mrid": "zepben.ewb.util",
+    "contains_mrid": "zepben.ewb.util",
+    "safe_remove": "zepben.ewb.util",
+    "safe_remove_by_id": "zepben.ewb.util",
+    "nlen": "zepben.ewb.util",
+    "ngen": "zepben.ewb.util",
+    "is_none_or_empty": "zepben.ewb.util",
+    "require": "zepben.ewb.util",
+    "pb_or_none": "zepben.ewb.util",
+    "generate_id": "zepben.ewb.util",
+    "datetime_to_timestamp": "zepben.ewb.util",
+    "none": "zepben.ewb.util",
+    "classproperty": "zepben.ewb.util",
+    "unique": "zepben.ewb.util",
+    "SinglePhaseKind": "zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind",
+    "single_phase_kind_by_id": "zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind",
+    "SINGLE_PHASE_KIND_VALUES": "zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind",
+    "RelayInfo": "zepben.ewb.model.cim.extensions.iec61968.assetinfo.relay_info",
+    "ContactDetails": "zepben.ewb.model.cim.extensions.iec61968.common.contact_details",
+    "ContactMethodType": "zepben.ewb.model.cim.extensions.iec61968.common.contact_method_type",
+    "PanDemandResponseFunction": "zepben.ewb.model.cim.extensions.iec61968.metering.pan_demand_reponse_function",
+    "HvCustomer": "zepben.ewb.model.cim.extensions.iec61970.base.core.hv_customer",
+    "Site": "zepben.ewb.model.cim.extensions.iec61970.base.core.site",
+    "Loop": "zepben.ewb.model.cim.extensions.iec61970.base.feeder.loop",
+    "LvFeeder": "zepben.ewb.model.cim.extensions.iec61970.base.feeder.lv_feeder",
+    "LvSubstation": "zepben.ewb.model.cim.extensions.iec61970.base.feeder.lv_substation",
+    "EvChargingUnit": "zepben.ewb.model.cim.extensions.iec61970.base.generation.production.ev_charging_unit",
+    "DirectionalCurrentRelay": "zepben.ewb.model.cim.extensions.iec61970.base.protection.directional_current_relay",
+    "DistanceRelay": "zepben.ewb.model.cim.extensions.iec61970.base.protection.distance_relay",
+    "PolarizingQuantityType": "zepben.ewb.model.cim.extensions.iec61970.base.protection.polarizing_quantity_type",
+    "PowerDirectionKind": "zepben.ewb.model.cim.extensions.iec61970.base.protection.power_direction_kind",
+    "ProtectionKind": "zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_kind",
+    "ProtectionRelayFunction": "zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_relay_function",
+    "ProtectionRelayScheme": "zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_relay_scheme",
+    "ProtectionRelaySystem": "zepben.ewb.model.cim.extensions.iec61970.base.protection.protection_relay_system",
+    "RelaySetting": "zepben.ewb.model.cim.extensions.iec61970.base.protection.relay_setting",
+    "VoltageRelay": "zepben.ewb.model.cim.extensions.iec61970.base.protection.voltage_relay",
+    "BatteryControl": "zepben.ewb.model.cim.extensions.iec61970.base.wires.battery_control",
+    "BatteryControlMode": "zepben.ewb.model.cim.extensions.iec61970.base.wires.battery_control_mode",
+    "TransformerCoolingType": "zepben.ewb.model.cim.extensions.iec61970.base.wires.transformer_cooling_type",
+    "TransformerEndRatedS": "zepben.ewb.model.cim.extensions.iec61970.base.wires.transformer_end_rated_s",
+    "VectorGroup": "zepben.ewb.model.cim.extensions.iec61970.base.wires.vector_group",
+    "CableInfo": "zepben.ewb.model.cim.iec61968.assetinfo.cable_info",
+    "NoLoadTest": "zepben.ewb.model.cim.iec61968.assetinfo.no_load_test",
+    "OpenCircuitTest": "zepben.ewb.model.cim.iec61968.assetinfo.open_circuit_test",
+    "OverheadWireInfo": "zepben.ewb.model.cim.iec61968.assetinfo.overhead_wire_info",
+    "PowerTransformerInfo": "zepben.ewb.model.cim.iec61968.assetinfo.power_transformer_info",
+    "ShortCircuitTest": "zepben.ewb.model.cim.iec61968.assetinfo.short_circuit_test",
+    "ShuntCompensatorInfo": "zepben.ewb.model.cim.iec61968.assetinfo.shunt_compensator_info",
+    "SwitchInfo": "zepben.ewb.model.cim.iec61968.assetinfo.switch_info",
+    "TransformerEndInfo": "zepben.ewb.model.cim.iec61968.assetinfo.transformer_end_info",
+    "TransformerTankInfo": "zepben.ewb.model.cim.iec61968.assetinfo.transformer_tank_info",
+    "TransformerTest": "zepben.ewb.model.cim.iec61968.assetinfo.transformer_test",
+    "WireInfo": "zepben.ewb.model.cim.iec61968.assetinfo.wire_info",
+    "Enum": "zepben.ewb.model.cim.iec61968.assetinfo.wire_insulation_kind",
+    "WireInsulationKind": "zepben.ewb.model.cim.iec61968.assetinfo.wire_insulation_kind",
+    "WireMaterialKind": "zepben.ewb.model.cim.iec61968.assetinfo.wire_material_kind",
+    "Asset": "zepben.ewb.model.cim.iec61968.assets.asset",
+    "AssetContainer": "zepben.ewb.model.cim.iec61968.assets.asset_container",
+    "AssetFunction": "zepben.ewb.model.cim.iec61968.assets.asset_function",
+    "AssetInfo": "zepben.ewb.model.cim.iec61968.assets.asset_info",
+    "AssetOrganisationRole": "zepben.ewb.model.cim.iec61968.assets.asset_organisation_role",
+    "AssetOwner": "zepben.ewb.model.cim.iec61968.assets.asset_owner",
+    "Streetlight": "zepben.ewb.model.cim.iec61968.assets.streetlight",
+    "Structure": "zepben.ewb.model.cim.iec61968.assets.structure",
+    "Agreement": "zepben.ewb.model.cim.iec61968.common.agreement",
+    "Document": "zepben.ewb.model.cim.iec61968.common.document",
+    "ElectronicAddress": "zepben.ewb.model.cim.iec61968.common.electronic_address",
+    "Location": "zepben.ewb.model.cim.iec61968.common.location",
+    "Organisation": "zepben.ewb.model.cim.iec61968.common.organisation",
+    "OrganisationRole": "zepben.ewb.model.cim.iec61968.common.organisation_role",
+    "PositionPoint": "zepben.ewb.model.cim.iec61968.common.position_point",
+    "StreetAddress": "zepben.ewb.model.cim.iec61968.common.street_address",
+    "StreetDetail": "zepben.ewb.model.cim.iec61968.common.street_detail",
+    "TelephoneNumber": "zepben.ewb.model.cim.iec61968.common.telephone_number",
+    "TownDetail": "zepben.ewb.model.cim.iec61968.common.town_detail",
+    "Customer": "zepben.ewb.model.cim.iec61968.customers.customer",
+    "CustomerAgreement": "zepben.ewb.model.cim.iec61968.customers.customer_agreement",
+    "CustomerKind": "zepben.ewb.model.cim.iec61968.customers.customer_kind",
+    "PricingStructure": "zepben.ewb.model.cim.iec61968.customers.pricing_structure",
+    "Tariff": "zepben.ewb.model.cim.iec61968.customers.tariff",
+    "CurrentTransformerInfo": "zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.current_transformer_info",
+    "PotentialTransformerInfo": "zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.potential_transformer_info",
+    "TransformerConstructionKind": "zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.transformer_construction_kind",
+    "TransformerFunctionKind": "zepben.ewb.model.cim.iec61968.infiec61968.infassetinfo.transformer_function_kind",
+    "Pole": "zepben.ewb.model.cim.iec61968.infiec61968.infassets.pole",
+    "StreetlightLampKind": "zepben.ewb.model.cim.iec61968.infiec61968.infassets.streetlight_lamp_kind",
+    "Ratio": "zepben.ewb.model.cim.iec61968.infiec61968.infcommon.ratio",
+    "ControlledAppliance": "zepben.ewb.model.cim.iec61968.metering.controlled_appliance",
+    "Appliance": "zepben.ewb.model.cim.iec61968.metering.controlled_appliance",
+    "EndDevice": "zepben.ewb.model.cim.iec61968.metering.end_device",
+    "EndDeviceFunction": "zepben.ewb.model.cim.iec61968.metering.end_device_function",
+    "EndDeviceFunctionKind": "zepben.ewb.model.cim.iec61968.metering.end_device_function_kind",
+    "Meter": "zepben.ewb.model.cim.iec61968.metering.meter",
+    "UsagePoint": "zepben.ewb.model.cim.iec61968.metering.usage_point",
+    "OperationalRestriction": "zepben.ewb.model.cim.iec61968.operations.operational_restriction",
+    "AuxiliaryEquipment": "zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.auxiliary_equipment",
+    "CurrentTransformer": "zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.current_transformer",
+    "FaultIndicator": "zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.fault_indicator",
+    "PotentialTransformer": "zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.potential_transformer",
+    "PotentialTransformerKind": "zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.potential_transformer_kind",
+    "Sensor": "zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.sensor",
+    "AcDcTerminal": "zepben.ewb.model.cim.iec61970.base.core.ac_dc_terminal",
+    "BaseVoltage": "zepben.ewb.model.cim.iec61970.base.core.base_voltage",
+    "ConductingEquipment": "zepben.ewb.model.cim.iec61970.base.core.conducting_equipment",
+    "ConnectivityNode": "zepben.ewb.model.cim.iec61970.base.core.connectivity_node",
+    "ConnectivityNodeContainer": "zepben.ewb.model.cim.iec61970.base.core.connectivity_node_container",
+    "Curve": "zepben.ewb.model.cim.iec61970.base.core.curve",
+    "CurveData": "zepben.ewb.model.cim.iec61970.base.core.curve_data",
+    "Equipment": "zepben.ewb.model.cim.iec61970.base.core.equipment",
+    "EquipmentContainer": "zepben.ewb.model.cim.iec61970.base.core.equipment_container",
+    "Feeder": "zepben.ewb.model.cim.iec61970.base.core.feeder",
+    "GeographicalRegion": "zepben.ewb.model.cim.iec61970.base.core.geographical_region",
+    "Identifiable": "zepben.ewb.model.cim.iec61970.base.core.identifiable",
+    "TIdentifiable": "zepben.ewb.model.cim.iec61970.base.core.identifiable",
+    "IdentifiedObject": "zepben.ewb.model.cim.iec61970.base.core.identified_object",
+    "TIdentifiedObject": "zepben.ewb.model.cim.iec61970.base.core.identified_object",
+    "Name": "zepben.ewb.model.cim.iec61970.base.core.name",
+    "NameType": "zepben.ewb.model.cim.iec61970.base.core.name_type",
+    "PhaseCode": "zepben.ewb.model.cim.iec61970.base.core.phase_code",
+    "phase_code_by_id": "zepben.ewb.model.cim.iec61970.base.core.phase_code",
+    "phase_code_from_single_phases": "zepben.ewb.model.cim.iec61970.base.core.phase_code",
+    "PowerSystemResource": "zepben.ewb.model.cim.iec61970.base.core.power_system_resource",
+    "SubGeographicalRegion": "zepben.ewb.model.cim.iec61970.base.core.sub_geographical_region",
+    "Substation": "zepben.ewb.model.cim.iec61970.base.core.substation",
+    "Terminal": "zepben.ewb.model.cim.iec61970.base.core.terminal",
+    "Diagram": "zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram",
+    "DiagramObject": "zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram_object",
+    "DiagramObjectPoint": "zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram_object_point",
+    "DiagramStyle": "zepben.ewb.model.cim.iec61970.base.diagramlayout.diagram_style",
+    "OrientationKind": "zepben.ewb.model.cim.iec61970.base.diagramlayout.orientation_kind",
+    "UnitSymbol": "zepben.ewb.model.cim.iec61970.base.domain.unit_symbol",
+    "unit_symbol_from_id": "zepben.ewb.model.cim.iec61970.base.domain.unit_symbol",
+    "unit_symbol_from_cim_name": "zepben.ewb.model.cim.iec61970.base.domain.unit_symbol",
+    "EquivalentBranch": "zepben.ewb.model.cim.iec61970.base.equivalents.equivalent_branch",
+    "EquivalentEquipment": "zepben.ewb.model.cim.iec61970.base.equivalents.equivalent_equipment",
+    "BatteryStateKind": "zepben.ewb.model.cim.iec61970.base.generation.production.battery_state_kind",
+    "BatteryUnit": "zepben.ewb.model.cim.iec61970.base.generation.production.battery_unit",
+    "PhotoVoltaicUnit": "zepben.ewb.model.cim.iec61970.base.generation.production.photo_voltaic_unit",
+    "PowerElectronicsUnit": "zepben.ewb.model.cim.iec61970.base.generation.production.power_electronics_unit",
+    "PowerElectronicsWindUnit": "zepben.ewb.model.cim.iec61970.base.generation.production.power_electronics_wind_unit",
+    "Accumulator": "zepben.ewb.model.cim.iec61970.base.meas.accumulator",
+    "AccumulatorValue": "zepben.ewb.model.cim.iec61970.base.meas.accumulator_value",
+    "Analog": "zepben.ewb.model.cim.iec61970.base.meas.analog",
+    "AnalogValue": "zepben.ewb.model.cim.iec61970.base.meas.analog_value",
+    "Control": "zepben.ewb.model.cim.iec61970.base.meas.control",
+    "Discrete": "zepben.ewb.model.cim.iec61970.base.meas.discrete",
+    "DiscreteValue": "zepben.ewb.model.cim.iec61970.base.meas.discrete_value",
+    "IoPoint": "zepben.ewb.model.cim.iec61970.base.meas.iopoint",
+    "Measurement": "zepben.ewb.model.cim.iec61970.base.meas.measurement",
+    "MeasurementValue": "zepben.ewb.model.cim.iec61970.base.meas.measurement_value",
+    "CurrentRelay": "zepben.ewb.model.cim.iec61970.base.protection.current_relay",
+    "RemoteControl": "zepben.ewb.model.cim.iec61970.base.scada.remote_control",
+    "RemotePoint": "zepben.ewb.model.cim.iec61970.base.scada.remote_point",
+    "RemoteSource": "zepben.ewb.model.cim.iec61970.base.scada.remote_source",
+    "AcLineSegment": "zepben.ewb.model.cim.iec61970.base.wires.ac_line_segment",
+    "AcLineSegmentPhase": "zepben.ewb.model.cim.iec61970.base.wires.ac_line_segment_phase",
+    "Breaker": "zepben.ewb.model.cim.iec61970.base.wires.breaker",
+    "BusbarSection": "zepben.ewb.model.cim.iec61970.base.wires.busbar_section",
+    "Clamp": "zepben.ewb.model.cim.iec61970.base.wires.clamp",
+    "Conductor": "zepben.ewb.model.cim.iec61970.base.wires.conductor",
+    "Connector": "zepben.ewb.model.cim.iec61970.base.wires.connector",
+    "Cut": "zepben.ewb.model.cim.iec61970.base.wires.cut",
+    "Disconnector": "zepben.ewb.model.cim.iec61970.base.wires.disconnector",
+    "EarthFaultCompensator": "zepben.ewb.model.cim.iec61970.base.wires.earth_fault_compensator",
+    "EnergyConnection": "zepben.ewb.model.cim.iec61970.base.wires.energy_connection",
+    "EnergyConsumer": "zepben.ewb.model.cim.iec61970.base.wires.energy_consumer",
+    "EnergyConsumerPhase": "zepben.ewb.model.cim.iec61970.base.wires.energy_consumer_phase",
+    "EnergySource": "zepben.ewb.model.cim.iec61970.base.wires.energy_source",
+    "EnergySourcePhase": "zepben.ewb.model.cim.iec61970.base.wires.energy_source_phase",
+    "Fuse": "zepben.ewb.model.cim.iec61970.base.wires.fuse",
+    "Ground": "zepben.ewb.model.cim.iec61970.base.wires.ground",
+    "GroundDisconnector": "zepben.ewb.model.cim.iec61970.base.wires.ground_disconnector",
+    "GroundingImpedance": "zepben.ewb.model.cim.iec61970.base.wires.grounding_impedance",
+    "Jumper": "zepben.ewb.model.cim.iec61970.base.wires.jumper",
+    "Junction": "zepben.ewb.model.cim.iec61970.base.wires.junction",
+    "Line": "zepben.ewb.model.cim.iec61970.base.wires.line",
+    "LinearShuntCompensator": "zepben.ewb.model.cim.iec61970.base.wires.linear_shunt_compensator",
+    "LoadBreakSwitch": "zepben.ewb.model.cim.iec61970.base.wires.load_break_switch",
+    "PerLengthImpedance": "zepben.ewb.model.cim.iec61970.base.wires.per_length_impedance",
+    "PerLengthLineParameter": "zepben.ewb.model.cim.iec61970.base.wires.per_length_line_parameter",
+    "PerLengthPhaseImpedance": "zepben.ewb.model.cim.iec61970.base.wires.per_length_phase_impedance",
+    "PerLengthSequenceImpedance": "zepben.ewb.model.cim.iec61970.base.wires.per_length_sequence_impedance",
+    "PetersenCoil": "zepben.ewb.model.cim.iec61970.base.wires.petersen_coil",
+    "PhaseImpedanceData": "zepben.ewb.model.cim.iec61970.base.wires.phase_impedance_data",
+    "PhaseShuntConnectionKind": "zepben.ewb.model.cim.iec61970.base.wires.phase_shunt_connection_kind",
+    "PowerElectronicsConnection": "zepben.ewb.model.cim.iec61970.base.wires.power_electronics_connection",
+    "PowerElectronicsConnectionPhase": "zepben.ewb.model.cim.iec61970.base.wires.power_electronics_connection_phase",
+    "PowerTransformer": "zepben.ewb.model.cim.iec61970.base.wires.power_transformer",
+    "PowerTransformerEnd": "zepben.ewb.model.cim.iec61970.base.wires.power_transformer_end",
+    "ProtectedSwitch": "zepben.ewb.model.cim.iec61970.base.wires.protected_switch",
+    "RatioTapChanger": "zepben.ewb.model.cim.iec61970.base.wires.ratio_tap_changer",
+    "ReactiveCapabilityCurve": "zepben.ewb.model.cim.iec61970.base.wires.reactive_capability_curve",
+    "Recloser": "zepben.ewb.model.cim.iec61970.base.wires.recloser",
+    "RegulatingCondEq": "zepben.ewb.model.cim.iec61970.base.wires.regulating_cond_eq",
+    "RegulatingControl": "zepben.ewb.model.cim.iec61970.base.wires.regulating_control",
+    "RegulatingControlModeKind": "zepben.ewb.model.cim.iec61970.base.wires.regulating_control_mode_kind",
+    "RotatingMachine": "zepben.ewb.model.cim.iec61970.base.wires.rotating_machine",
+    "SeriesCompensator": "zepben.ewb.model.cim.iec61970.base.wires.series_compensator",
+    "ShuntCompensator": "zepben.ewb.model.cim.iec61970.base.wires.shunt_compensator",
+    "StaticVarCompensator": "zepben.ewb.model.cim.iec61970.base.wires.static_var_compensator",
+    "SVCControlMode": "zepben.ewb.model.cim.iec61970.base.wires.svc_control_mode",
+    "Switch": "zepben.ewb.model.cim.iec61970.base.wires.switch",
+    "SynchronousMachine": "zepben.ewb.model.cim.iec61970.base.wires.synchronous_machine",
+    "SynchronousMachineKind": "zepben.ewb.model.cim.iec61970.base.wires.synchronous_machine_kind",
+    "TapChanger": "zepben.ewb.model.cim.iec61970.base.wires.tap_changer",
+    "TapChangerControl": "zepben.ewb.model.cim.iec61970.base.wires.tap_changer_control",
+    "TransformerEnd": "zepben.ewb.model.cim.iec61970.base.wires.transformer_end",
+    "TransformerStarImpedance": "zepben.ewb.model.cim.iec61970.base.wires.transformer_star_impedance",
+    "WindingConnection": "zepben.ewb.model.cim.iec61970.base.wires.winding_connection",
+    "Circuit": "zepben.ewb.model.cim.iec61970.infiec61970.feeder.circuit",
+    "ResistanceReactance": "zepben.ewb.model.resistance_reactance",
+    "AssignToFeeders": "zepben.ewb.services.network.tracing.feeder.assign_to_feeders",
+    "BaseFeedersInternal": "zepben.ewb.services.network.tracing.feeder.assign_to_feeders",
+    "cable_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "no_load_test_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "open_circuit_test_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "overhead_wire_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "power_transformer_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "short_circuit_test_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "shunt_compensator_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "switch_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "transformer_end_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "transformer_tank_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "transformer_test_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "wire_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "asset_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "asset_container_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "asset_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "asset_organisation_role_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "asset_owner_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "pole_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "streetlight_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "structure_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "location_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "position_point_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "street_address_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "street_detail_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "town_detail_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "relay_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "current_transformer_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "potential_transformer_info_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "ratio_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "end_device_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "meter_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "usage_point_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "operational_restriction_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "auxiliary_equipment_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "current_transformer_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "fault_indicator_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "potential_transformer_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "sensor_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "ac_dc_terminal_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "base_voltage_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "conducting_equipment_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "connectivity_node_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "connectivity_node_container_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "equipment_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "equipment_container_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "feeder_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "geographical_region_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "power_system_resource_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "site_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "sub_geographical_region_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "substation_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "terminal_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "equivalent_branch_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "equivalent_equipment_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "accumulator_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "analog_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "control_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "discrete_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "io_point_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "measurement_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "current_relay_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "protection_relay_function_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "remote_control_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "remote_point_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "remote_source_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "battery_unit_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "photo_voltaic_unit_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "power_electronics_unit_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "power_electronics_wind_unit_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "ac_line_segment_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "breaker_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "conductor_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "connector_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "disconnector_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "energy_connection_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "energy_consumer_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "energy_consumer_phase_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "energy_source_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "energy_source_phase_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "fuse_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "jumper_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "junction_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "busbar_section_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "line_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "linear_shunt_compensator_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "load_break_switch_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "per_length_line_parameter_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "per_length_impedance_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "per_length_sequence_impedance_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "power_electronics_connection_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "power_electronics_connection_phase_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "power_transformer_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "power_transformer_end_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "transformer_star_impedance_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "protected_switch_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "ratio_tap_changer_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "recloser_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "regulating_cond_eq_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "shunt_compensator_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "switch_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "tap_changer_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "transformer_end_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "circuit_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "loop_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "lv_feeder_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "ev_charging_unit_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "transformer_end_rated_s_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "tap_changer_control_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "regulating_control_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "distance_relay_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "protection_relay_scheme_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "protection_relay_system_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "relay_setting_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "voltage_relay_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "ground_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "ground_disconnector_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "series_compensator_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "pan_demand_response_function_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "battery_control_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "asset_function_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "end_device_function_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "static_var_compensator_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "clamp_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "cut_to_cim": "zepben.ewb.services.network.translator.network_proto2cim",
+    "CimTranslationException": "zepben.ewb.services.network.translator.network_cim2proto",
+    "cable_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "no_load_test_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "open_circuit_test_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "overhead_wire_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "power_transformer_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "short_circuit_test_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "shunt_compensator_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "switch_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "transformer_end_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "transformer_tank_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "transformer_test_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "wire_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "asset_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "asset_container_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "asset_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "asset_organisation_role_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "asset_owner_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "pole_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "streetlight_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "structure_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "location_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "position_point_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "street_address_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "street_detail_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "town_detail_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "relay_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "current_transformer_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "potential_transformer_info_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "ratio_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "end_device_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "meter_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "usage_point_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "operational_restriction_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "auxiliary_equipment_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "current_transformer_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "fault_indicator_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "potential_transformer_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "sensor_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "ac_dc_terminal_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "base_voltage_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "conducting_equipment_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "connectivity_node_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "connectivity_node_container_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "equipment_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "equipment_container_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "feeder_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "geographical_region_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "power_system_resource_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "site_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "sub_geographical_region_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "substation_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "terminal_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "equivalent_branch_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "equivalent_equipment_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "accumulator_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "analog_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "control_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "discrete_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "io_point_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "measurement_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "current_relay_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "distance_relay_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "voltage_relay_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "remote_control_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "remote_point_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "remote_source_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "battery_unit_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "photo_voltaic_unit_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "power_electronics_unit_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "power_electronics_wind_unit_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "ac_line_segment_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "breaker_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "conductor_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "connector_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "disconnector_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "energy_connection_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "energy_consumer_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "energy_consumer_phase_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "energy_source_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "energy_source_phase_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "fuse_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "jumper_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "junction_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "busbar_section_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "line_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "linear_shunt_compensator_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "load_break_switch_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "per_length_line_parameter_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "per_length_impedance_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "per_length_sequence_impedance_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "power_electronics_connection_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "power_electronics_connection_phase_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "power_transformer_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "power_transformer_end_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "protected_switch_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "ratio_tap_changer_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "recloser_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "regulating_cond_eq_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "shunt_compensator_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "switch_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "tap_changer_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "transformer_end_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "transformer_star_impedance_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "circuit_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "loop_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "lv_feeder_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "ev_charging_unit": "zepben.ewb.services.network.translator.network_cim2proto",
+    "transformer_end_rated_s_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "tap_changer_control_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "regulating_control_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "protection_relay_function_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "protection_relay_scheme_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "protection_relay_system_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "relay_setting_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "ground_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "ground_disconnector_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "series_compensator_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "pan_demand_response_function_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "battery_control_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "asset_function_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "end_device_function_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "static_var_compensator_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "per_length_phase_impedance_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "phase_impedance_data_to_pb": "zepben.ewb.services.network.translator.network_cim2proto",
+    "connect": "zepben.ewb.services.network.network_service",
+    "connected_terminals": "zepben.ewb.services.network.network_service",
+    "connected_equipment": "zepben.ewb.services.network.network_service",
+    "NetworkService": "zepben.ewb.services.network.network_service",
+    "NetworkState": "zepben.ewb.services.network.network_state",
+    "NetworkTraceTracker": "zepben.ewb.services.network.tracing.busbranch_trace",
+    "StepContext": "zepben.ewb.services.network.tracing.busbranch_trace",
+    "Traversal": "zepben.ewb.services.network.tracing.busbranch_trace",
+    "TraversalQueue": "zepben.ewb.services.network.tracing.busbranch_trace",
+    "BusBranchTraceStep": "zepben.ewb.services.network.tracing.busbranch_trace",
+    "BusBranchTrace": "zepben.ewb.services.network.tracing.busbranch_trace",
+    "NetworkTrace": "zepben.ewb.services.network.tracing.networktrace.network_trace",
+    "FrozenSet": "zepben.ewb.services.network.tracing.networktrace.network_trace_action_type",
+    "NetworkTraceStep": "zepben.ewb.services.network.tracing.networktrace.network_trace_action_type",
+    "HasTracked": "zepben.ewb.services.network.tracing.networktrace.network_trace_action_type",
+    "CanActionItem": "zepben.ewb.services.network.tracing.networktrace.network_trace_action_type",
+    "NetworkTraceActionType": "zepben.ewb.services.network.tracing.networktrace.network_trace_action_type",
+    "ABC": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "Generator": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "Generic": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "List": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "Union": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "Type": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "NetworkStateOperators": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "ComputeData": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "ComputeDataWithPaths": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "QueueItem": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "QueueBranch": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "GetNextSteps": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "GetNextStepsBranching": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "NetworkTraceQueueNext": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "Basic": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "Branching": "zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next",
+    "NetworkTraceStepPathProvider": "zepben.ewb.services.network.tracing.networktrace.network_trace_step_path_provider",
+    "BranchingNetworkTraceTracker": "zepben.ewb.services.network.tracing.networktrace.network_trace_tracker",
+    "ConnectivityResult": "zepben.ewb.services.network.tracing.connectivity.connectivity_result",
+    "terminal_compare": "zepben.ewb.services.network.tracing.connectivity.connectivity_result",
+    "NominalPhasePath": "zepben.ewb.services.network.tracing.connectivity.nominal_phase_path",
+    "PhasePathLookup": "zepben.ewb.services.network.tracing.connectivity.phase_path_lookup",
+    "phase_mask": "zepben.ewb.services.network.tracing.connectivity.phase_path_lookup",
+    "straight_phase_connectivity": "zepben.ewb.services.network.tracing.connectivity.phase_paths",
+    "straight_phase_path_lookup": "zepben.ewb.services.network.tracing.connectivity.phase_paths",
+    "viable_inferred_phase_connectivity": "zepben.ewb.services.network.tracing.connectivity.phase_paths",
+    "TerminalConnectivityConnected": "zepben.ewb.services.network.tracing.connectivity.terminal_connectivity_connected",
+    "TerminalConnectivityInternal": "zepben.ewb.services.network.tracing.connectivity.terminal_connectivity_internal",
+    "transformer_phase_paths": "zepben.ewb.services.network.tracing.connectivity.transformer_phase_paths",
+    "transformer_phase_path_lookup": "zepben.ewb.services.network.tracing.connectivity.transformer_phase_paths",
+    "add_neutral": "zepben.ewb.services.network.tracing.connectivity.transformer_phase_paths",
+    "X_PRIORITY": "zepben.ewb.services.network.tracing.connectivity.xy_candidate_phase_paths",
+    "Y_PRIORITY": "zepben.ewb.services.network.tracing.connectivity.xy_candidate_phase_paths",
+    "XyCandidatePhasePaths": "zepben.ewb.services.network.tracing.connectivity.xy_candidate_phase_paths",
+    "is_before": "zepben.ewb.services.network.tracing.connectivity.xy_candidate_phase_paths",
+    "is_after": "zepben.ewb.services.network.tracing.connectivity.xy_candidate_phase_paths",
+    "XyPhaseStep": "zepben.ewb.services.network.tracing.connectivity.xy_phase_step",
+    "AssignToLvFeeders": "zepben.ewb.services.network.tracing.feeder.assign_to_lv_feeders",
+    "ClearDirection": "zepben.ewb.services.network.tracing.feeder.clear_direction",
+    "normal_direction": "zepben.ewb.services.network.tracing.feeder.direction_status",
+    "current_direction": "zepben.ewb.services.network.tracing.feeder.direction_status",
+    "DirectionStatus": "zepben.ewb.services.network.tracing.feeder.direction_status",
+    "NormalDirection": "zepben.ewb.services.network.tracing.feeder.direction_status",
+    "CurrentDirection": "zepben.ewb.services.network.tracing.feeder.direction_status",
+    "FeederDirection": "zepben.ewb.services.network.tracing.feeder.feeder_direction",
+    "SetDirection": "zepben.ewb.services.network.tracing.feeder.set_direction",
+    "EquipmentTreeBuilder": "zepben.ewb.services.network.tracing.networktrace.actions.equipment_tree_builder",
+    "TreeNode": "zepben.ewb.services.network.tracing.networktrace.actions.tree_node",
+    "upstream": "zepben.ewb.services.network.tracing.networktrace.conditions.conditions",
+    "downstream": "zepben.ewb.services.network.tracing.networktrace.conditions.conditions",
+    "with_direction": "zepben.ewb.services.network.tracing.networktrace.conditions.conditions",
+    "limit_equipment_steps": "zepben.ewb.services.network.tracing.networktrace.conditions.conditions",
+    "stop_at_open": "zepben.ewb.services.network.tracing.networktrace.conditions.conditions",
+    "stop_on_shunt_compensator_ground": "zepben.ewb.services.network.tracing.networktrace.conditions.conditions",
+    "DirectionCondition": "zepben.ewb.services.network.tracing.networktrace.conditions.direction_condition",
+    "EquipmentStepLimitCondition": "zepben.ewb.services.network.tracing.networktrace.conditions.equipment_step_limit_condition",
+    "EquipmentTypeStepLimitCondition": "zepben.ewb.services.network.tracing.networktrace.conditions.equipment_type_step_limit_condition",
+    "NetworkTraceStopCondition": "zepben.ewb.services.network.tracing.networktrace.conditions.network_trace_stop_condition",
+    "NetworkTraceQueueCondition": "zepben.ewb.services.network.tracing.networktrace.conditions.network_trace_queue_condition",
+    "OpenCondition": "zepben.ewb.services.network.tracing.networktrace.conditions.open_condition",
+    "EquipmentContainerStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.equipment_container_state_operators",
+    "NormalEquipmentContainerStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.equipment_container_state_operators",
+    "CurrentEquipmentContainerStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.equipment_container_state_operators",
+    "FeederDirectionStateOperations": "zepben.ewb.services.network.tracing.networktrace.operators.feeder_direction_state_operations",
+    "NormalFeederDirectionStateOperations": "zepben.ewb.services.network.tracing.networktrace.operators.feeder_direction_state_operations",
+    "CurrentFeederDirectionStateOperations": "zepben.ewb.services.network.tracing.networktrace.operators.feeder_direction_state_operations",
+    "InServiceStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.in_service_state_operators",
+    "NormalInServiceStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.in_service_state_operators",
+    "CurrentInServiceStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.in_service_state_operators",
+    "NormalNetworkStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.network_state_operators",
+    "CurrentNetworkStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.network_state_operators",
+    "OpenStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.open_state_operators",
+    "NormalOpenStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.open_state_operators",
+    "CurrentOpenStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.open_state_operators",
+    "PhaseStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.phase_state_operators",
+    "NormalPhaseStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.phase_state_operators",
+    "CurrentPhaseStateOperators": "zepben.ewb.services.network.tracing.networktrace.operators.phase_state_operators",
+    "PhaseStatus": "zepben.ewb.services.network.tracing.phases.phase_status",
+    "TerminalStateStore": "zepben.ewb.services.network.tracing.terminal_state_store",
+    "terminal_state_store": "zepben.ewb.services.network.tracing.terminal_state_store",
+    "PhaseInferrer": "zepben.ewb.services.network.tracing.phases.phase_inferrer",
+    "Set": "zepben.ewb.services.network.tracing.phases.remove_phases",
+    "TYPE_CHECKING": "zepben.ewb.services.network.tracing.phases.remove_phases",
+    "Tracing": "zepben.ewb.services.network.tracing.phases.remove_phases",
+    "WeightedPriorityQueue": "zepben.ewb.services.network.tracing.phases.remove_phases",
+    "EbbPhases": "zepben.ewb.services.network.tracing.phases.remove_phases",
+    "RemovePhases": "zepben.ewb.services.network.tracing.phases.remove_phases",
+    "SetPhases": "zepben.ewb.services.network.tracing.phases.set_phases",
+    "ContextValueComputer": "zepben.ewb.services.network.tracing.traversal.context_value_computer",
+    "QueueCondition": "zepben.ewb.services.network.tracing.traversal.queue_condition",
+    "QueueConditionWithContextValue": "zepben.ewb.services.network.tracing.traversal.queue_condition",
+    "ShouldQueue": "zepben.ewb.services.network.tracing.traversal.queue_condition",
+    "ShouldQueueStartItem": "zepben.ewb.services.network.tracing.traversal.queue_condition",
+    "StepAction": "zepben.ewb.services.network.tracing.traversal.step_action",
+    "StepActionWithContextValue": "zepben.ewb.services.network.tracing.traversal.step_action",
+    "StepActionFunc": "zepben.ewb.services.network.tracing.traversal.step_action",
+    "StopCondition": "zepben.ewb.services.network.tracing.traversal.stop_condition",
+    "StopConditionWithContextValue": "zepben.ewb.services.network.tracing.traversal.stop_condition",
+    "ShouldStop": "zepben.ewb.services.network.tracing.traversal.stop_condition",
+    "QueueConditionTypes": "zepben.ewb.services.network.tracing.traversal.traversal",
+    "StopConditionTypes": "zepben.ewb.services.network.tracing.traversal.traversal",
+    "ConditionTypes": "zepben.ewb.services.network.tracing.traversal.traversal",
+    "StepActionTypes": "zepben.ewb.services.network.tracing.traversal.traversal",
+    "TraversalCondition": "zepben.ewb.services.network.tracing.traversal.traversal_condition",
+    "DebugLoggingWrapper": "zepben.ewb.services.network.tracing.traversal.debug_logging",
+    "FindSwerEquipment": "zepben.ewb.services.network.tracing.find_swer_equipment",
+    "DataSource": "zepben.ewb.services.common.meta.data_source",
+    "MetadataCollection": "zepben.ewb.services.common.meta.metadata_collection",
+    "ServiceInfo": "zepben.ewb.services.common.meta.service_info",
+    "PBTimestamp": "zepben.ewb.services.common.meta.metadata_translations",
+    "PBDataSource": "zepben.ewb.services.common.meta.metadata_translations",
+    "PBServiceInfo": "zepben.ewb.services.common.meta.metadata_translations",
+    "data_source_to_pb": "zepben.ewb.services.common.meta.metadata_translations",
+    "data_source_from_pb": "zepben.ewb.services.common.meta.metadata_translations",
+    "service_info_to_pb": "zepben.ewb.services.common.meta.metadata_translations",
+    "service_info_from_pb": "zepben.ewb.services.common.meta.metadata_translations",
+    "identified_object_to_cim": "zepben.ewb.services.common.translator.base_proto2cim",
+    "document_to_cim": "zepben.ewb.services.common.translator.base_proto2cim",
+    "organisation_to_cim": "zepben.ewb.services.common.translator.base_proto2cim",
+    "organisation_role_to_cim": "zepben.ewb.services.common.translator.base_proto2cim",
+    "BaseProtoToCim": "zepben.ewb.services.common.translator.base_proto2cim",
+    "add_to_service_or_none": "zepben.ewb.services.common.translator.base_proto2cim",
+    "bind_to_cim": "zepben.ewb.services.common.translator.base_proto2cim",
+    "get_nullable": "zepben.ewb.services.common.translator.base_proto2cim",
+    "BaseService": "zepben.ewb.services.common.base_service",
+    "TBaseService": "zepben.ewb.services.common.base_service",
+    "PendingReferences": "zepben.ewb.services.common.pending_references",
+    "BoundReferenceResolver": "zepben.ewb.services.common.reference_resolvers",
+    "ReferenceResolver": "zepben.ewb.services.common.reference_resolvers",
+    "UnresolvedReference": "zepben.ewb.services.common.reference_resolvers",
+    "resolver": "zepben.ewb.services.common",
+    "diagram_object_point_to_cim": "zepben.ewb.services.diagram.translator.diagram_proto2cim",
+    "diagram_to_cim": "zepben.ewb.services.diagram.translator.diagram_proto2cim",
+    "diagram_object_to_cim": "zepben.ewb.services.diagram.translator.diagram_proto2cim",
+    "diagram_to_pb": "zepben.ewb.services.diagram.translator.diagram_cim2proto",
+    "diagram_object_to_pb": "zepben.ewb.services.diagram.translator.diagram_cim2proto",
+    "diagram_object_point_to_pb": "zepben.ewb.services.diagram.translator.diagram_cim2proto",
+    "DiagramService": "zepben.ewb.services.diagram.diagrams",
+    "agreement_to_pb": "zepben.ewb.services.customer.translator.customer_cim2proto",
+    "customer_to_pb": "zepben.ewb.services.customer.translator.customer_cim2proto",
+    "customer_agreement_to_pb": "zepben.ewb.services.customer.translator.customer_cim2proto",
+    "pricing_structure_to_pb": "zepben.ewb.services.customer.translator.customer_cim2proto",
+    "tariff_to_pb": "zepben.ewb.services.customer.translator.customer_cim2proto",
+    "agreement_to_cim": "zepben.ewb.services.customer.translator.customer_proto2cim",
+    "customer_to_cim": "zepben.ewb.services.customer.translator.customer_proto2cim",
+    "customer_agreement_to_cim": "zepben.ewb.services.customer.translator.customer_proto2cim",
+    "pricing_structure_to_cim": "zepben.ewb.services.customer.translator.customer_proto2cim",
+    "tariff_to_cim": "zepben.ewb.services.customer.translator.customer_proto2cim",
+    "CustomerService": "zepben.ewb.services.customer.customers",
+    "analog_value_to_pb": "zepben.ewb.services.measurement.translator.measurement_cim2proto",
+    "accumulator_value_to_pb": "zepben.ewb.services.measurement.translator.measurement_cim2proto",
+    "discrete_value_to_pb": "zepben.ewb.services.measurement.translator.measurement_cim2proto",
+    "measurement_value_to_pb": "zepben.ewb.services.measurement.translator.measurement_cim2proto",
+    "measurement_value_to_cim": "zepben.ewb.services.measurement.translator.measurement_proto2cim",
+    "analog_value_to_cim": "zepben.ewb.services.measurement.translator.measurement_proto2cim",
+    "accumulator_value_to_cim": "zepben.ewb.services.measurement.translator.measurement_proto2cim",
+    "discrete_value_to_cim": "zepben.ewb.services.measurement.translator.measurement_proto2cim",
+    "MeasurementService": "zepben.ewb.services.measurement.measurements",
+    "GrpcConnectionException": "zepben.ewb.streaming.exceptions",
+    "UnsupportedOperationException": "zepben.ewb.streaming.exceptions",
+    "NetworkHierarchy": "zepben.ewb.streaming.get.hierarchy.data",
+    "CimConsumerClient": "zepben.ewb.streaming.get.consumer",
+    "MultiObjectResult": "zepben.ewb.streaming.get.consumer",
+    "CustomerConsumerClient": "zepben.ewb.streaming.get.customer_consumer",
+    "SyncCustomerConsumerClient": "zepben.ewb.streaming.get.customer_consumer",
+    "DiagramConsumerClient": "zepben.ewb.streaming.get.diagram_consumer",
+    "SyncDiagramConsumerClient": "zepben.ewb.streaming.get.diagram_consumer",
+    "NetworkConsumerClient": "zepben.ewb.streaming.get.network_consumer",
+    "SyncNetworkConsumerClient": "zepben.ewb.streaming.get.network_consumer",
+    "AuthTokenPlugin": "zepben.ewb.streaming.grpc.auth_token_plugin",
+    "GrpcResult": "zepben.ewb.streaming.grpc.grpc",
+    "GrpcClient": "zepben.ewb.streaming.grpc.grpc",
+    "GrpcChannelBuilder": "zepben.ewb.streaming.grpc.grpc_channel_builder",
+    "connect_tls": "zepben.ewb.streaming.grpc.connect",
+    "connect_insecure": "zepben.ewb.streaming.grpc.connect",
+    "connect_with_password": "zepben.ewb.streaming.grpc.connect",
+    "connect_with_secret": "zepben.ewb.streaming.grpc.connect",
+    "connect_with_identity": "zepben.ewb.streaming.grpc.connect",
+    "connect_with_token": "zepben.ewb.streaming.grpc.connect",
+    "CurrentStateEvent": "zepben.ewb.streaming.data.current_state_event",
+    "SwitchStateEvent": "zepben.ewb.streaming.data.current_state_event",
+    "SwitchAction": "zepben.ewb.streaming.data.current_state_event",
+    "AddCutEvent": "zepben.ewb.streaming.data.current_state_event",
+    "RemoveCutEvent": "zepben.ewb.streaming.data.current_state_event",
+    "AddJumperEvent": "zepben.ewb.streaming.data.current_state_event",
+    "RemoveJumperEvent": "zepben.ewb.streaming.data.current_state_event",
+    "JumperConnection": "zepben.ewb.streaming.data.current_state_event",
+    "CurrentStateEventBatch": "zepben.ewb.streaming.data.current_state_event_batch",
+    "SetCurrentStatesStatus": "zepben.ewb.streaming.data.set_current_states_status",
+    "BatchSuccessful": "zepben.ewb.streaming.data.set_current_states_status",
+    "BatchFailure": "zepben.ewb.streaming.data.set_current_states_status",
+    "BatchNotProcessed": "zepben.ewb.streaming.data.set_current_states_status",
+    "StateEventFailure": "zepben.ewb.streaming.data.set_current_states_status",
+    "StateEventInvalidMrid": "zepben.ewb.streaming.data.set_current_states_status",
+    "StateEventUnknownMrid": "zepben.ewb.streaming.data.set_current_states_status",
+    "StateEventDuplicateMrid": "zepben.ewb.streaming.data.set_current_states_status",
+    "StateEventUnsupportedPhasing": "zepben.ewb.streaming.data.set_current_states_status",
+    "StateEventUnsupportedMrid": "zepben.ewb.streaming.data.set_current_states_status",
+    "ApplyCurrentStateEvents": "zepben.ewb.services.network.tracing.apply_current_state_events",
+    "IncludedEnergizedContainers": "zepben.ewb.streaming.get.included_energized_containers",
+    "IncludedEnergizingContainers": "zepben.ewb.streaming.get.included_energizing_containers",
+    "QueryNetworkStateService": "zepben.ewb.streaming.get.query_network_state_service",
+    "QueryNetworkStateClient": "zepben.ewb.streaming.get.query_network_state_client",
+    "UpdateNetworkStateService": "zepben.ewb.streaming.mutations.update_network_state_service",
+    "UpdateNetworkStateClient": "zepben.ewb.streaming.mutations.update_network_state_client",
+    "create_ac_line_segment": "zepben.ewb.services.network.network_extensions",
+    "create_two_winding_power_transformer": "zepben.ewb.services.network.network_extensions",
+    "create_energy_consumer": "zepben.ewb.services.network.network_extensions",
+    "create_energy_source": "zepben.ewb.services.network.network_extensions",
+    "create_bus": "zepben.ewb.services.network.network_extensions",
+    "create_breaker": "zepben.ewb.services.network.network_extensions",
+    "BusBranchNetworkCreationValidator": "zepben.ewb.model.busbranch.bus_branch",
+    "BusBranchNetworkCreator": "zepben.ewb.model.busbranch.bus_branch",
+    "BusBranchNetworkCreationMappings": "zepben.ewb.model.busbranch.bus_branch",
+    "BusBranchNetworkCreationResult": "zepben.ewb.model.busbranch.bus_branch",
+    "TerminalGrouping": "zepben.ewb.model.busbranch.bus_branch",
+    "isnan": "zepben.ewb.services.common.difference",
+    "field": "zepben.ewb.services.common.difference",
+    "Difference": "zepben.ewb.services.common.difference",
+    "ValueDifference": "zepben.ewb.services.common.difference",
+    "CollectionDifference": "zepben.ewb.services.common.difference",
+    "ObjectDifference": "zepben.ewb.services.common.difference",
+    "ReferenceDifference": "zepben.ewb.services.common.difference",
+    "IndexedDifference": "zepben.ewb.services.common.difference",
+    "Iterable": "zepben.ewb.services.common.translator.service_differences",
+    "ServiceDifferences": "zepben.ewb.services.common.translator.service_differences",
+    "BaseServiceComparator": "zepben.ewb.services.common.base_service_comparator",
+    "content_key": "zepben.ewb.services.common.content_fingerprint",
+    "fingerprint": "zepben.ewb.services.common.content_fingerprint",
+    "container_fingerprint": "zepben.ewb.services.common.content_fingerprint",
+    "NetworkServiceComparator": "zepben.ewb.services.network.network_service_comparator",
+    "CustomerServiceComparator": "zepben.ewb.services.customer.customer_service_comparator",
+    "DiagramServiceComparator": "zepben.ewb.services.diagram.diagram_service_comparator",
+    "DatabaseType": "zepben.ewb.database.paths.database_type",
+    "EwbDataFilePaths": "zepben.ewb.database.paths.ewb_data_file_paths",
+    "LocalEwbDataFilePaths": "zepben.ewb.database.paths.local_ewb_data_file_paths",
+    "Nullable": "zepben.ewb.database.sql.column",
+    "Column": "zepben.ewb.database.sql.column",
+    "SqliteTable": "zepben.ewb.database.sqlite.tables.sqlite_table",
+    "TableMetadataDataSources": "zepben.ewb.database.sqlite.tables.table_metadata_data_sources",
+    "TableVersion": "zepben.ewb.database.sqlite.tables.table_version",
+    "LoopSubstationRelationship": "zepben.ewb.database.sqlite.tables.associations.loop_substation_relationship",
+    "TableAssetOrganisationRolesAssets": "zepben.ewb.database.sqlite.tables.associations.table_asset_organisation_roles_assets",
+    "TableAssetsPowerSystemResources": "zepben.ewb.database.sqlite.tables.associations.table_assets_power_system_resources",
+    "TableBatteryUnitsBatteryControls": "zepben.ewb.database.sqlite.tables.associations.table_battery_units_battery_controls",
+    "TableEndDevicesEndDeviceFunctions": "zepben.ewb.database.sqlite.tables.associations.table_end_devices_end_device_functions",
+    "TableCircuitsSubstations": "zepben.ewb.database.sqlite.tables.associations.table_circuits_substations",
+    "TableCircuitsTerminals": "zepben.ewb.database.sqlite.tables.associations.table_circuits_terminals",
+    "TableCustomerAgreementsPricingStructures": "zepben.ewb.database.sqlite.tables.associations.table_customer_agreements_pricing_structures",
+    "TableEquipmentEquipmentContainers": "zepben.ewb.database.sqlite.tables.associations.table_equipment_equipment_containers",
+    "TableEquipmentOperationalRestrictions": "zepben.ewb.database.sqlite.tables.associations.table_equipment_operational_restrictions",
+    "TableEquipmentUsagePoints": "zepben.ewb.database.sqlite.tables.associations.table_equipment_usage_points",
+    "TableLoopsSubstations": "zepben.ewb.database.sqlite.tables.associations.table_loops_substations",
+    "TablePricingStructuresTariffs": "zepben.ewb.database.sqlite.tables.associations.table_pricing_structures_tariffs",
+    "TableProtectionRelayFunctionsProtectedSwitches": "zepben.ewb.database.sqlite.tables.associations.table_protection_relay_functions_protected_switches",
+    "TableProtectionRelayFunctionsSensors": "zepben.ewb.database.sqlite.tables.associations.table_protection_relay_functions_sensors",
+    "TableProtectionRelaySchemesProtectionRelayFunctions": "zepben.ewb.database.sqlite.tables.associations.table_protection_relay_schemes_protection_relay_functions",
+    "TableSynchronousMachinesReactiveCapabilityCurves": "zepben.ewb.database.sqlite.tables.associations.table_synchronous_machines_reactive_capability_curves",
+    "TableUsagePointsEndDevices": "zepben.ewb.database.sqlite.tables.associations.table_usage_points_end_devices",
+    "TableRecloseDelays": "zepben.ewb.database.sqlite.tables.extensions.iec61968.assetinfo.table_reclose_delays",
+    "TableRelayInfo": "zepben.ewb.database.sqlite.tables.extensions.iec61968.assetinfo.table_relay_info",
+    "TablePanDemandResponseFunctions": "zepben.ewb.database.sqlite.tables.extensions.iec61968.metering.table_pan_demand_response_functions",
+    "TableEquipmentContainers": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_hv_customers",
+    "zbex": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_hv_customers",
+    "TableHvCustomers": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_hv_customers",
+    "TableSites": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_sites",
+    "TableLvSubstations": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.core.table_lv_substations",
+    "TableLoops": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.feeder.table_loops",
+    "TableLvFeeders": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.feeder.table_lv_feeders",
+    "TableEvChargingUnits": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.generation.production.table_ev_charging_units",
+    "TableDistanceRelays": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_distance_relays",
+    "TableProtectionRelayFunctionThresholds": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_function_thresholds",
+    "TableProtectionRelayFunctionTimeLimits": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_function_time_limits",
+    "TableProtectionRelayFunctions": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_functions",
+    "TableProtectionRelaySchemes": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_schemes",
+    "TableProtectionRelaySystems": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_protection_relay_systems",
+    "TableVoltageRelays": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.protection.table_voltage_relays",
+    "TableBatteryControls": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.wires.table_battery_controls",
+    "TablePowerTransformerEndRatings": "zepben.ewb.database.sqlite.tables.extensions.iec61970.base.wires.table_power_transformer_end_ratings",
+    "TableCableInfo": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_cable_info",
+    "TableNoLoadTests": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_no_load_tests",
+    "TableOpenCircuitTests": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_open_circuit_tests",
+    "TableOverheadWireInfo": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_overhead_wire_info",
+    "TablePowerTransformerInfo": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_power_transformer_info",
+    "TableShortCircuitTests": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_short_circuit_tests",
+    "TableShuntCompensatorInfo": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_shunt_compensator_info",
+    "TableSwitchInfo": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_switch_info",
+    "TableTransformerEndInfo": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_end_info",
+    "TableTransformerTankInfo": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_tank_info",
+    "TableTransformerTest": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_test",
+    "TableWireInfo": "zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_wire_info",
+    "TableAssetContainers": "zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_containers",
+    "TableAssetFunctions": "zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_functions",
+    "TableAssetInfo": "zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_info",
+    "TableAssetOrganisationRoles": "zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_organisation_roles",
+    "TableAssetOwners": "zepben.ewb.database.sqlite.tables.iec61968.assets.table_asset_owners",
+    "TableAssets": "zepben.ewb.database.sqlite.tables.iec61968.assets.table_assets",
+    "TableStreetlights": "zepben.ewb.database.sqlite.tables.iec61968.assets.table_streetlights",
+    "TableStructures": "zepben.ewb.database.sqlite.tables.iec61968.assets.table_structures",
+    "TableAgreements": "zepben.ewb.database.sqlite.tables.iec61968.common.table_agreements",
+    "TableDocuments": "zepben.ewb.database.sqlite.tables.iec61968.common.table_documents",
+    "TableLocationStreetAddressField": "zepben.ewb.database.sqlite.tables.iec61968.common.table_location_street_address_field",
+    "TableLocationStreetAddresses": "zepben.ewb.database.sqlite.tables.iec61968.common.table_location_street_addresses",
+    "TableLocations": "zepben.ewb.database.sqlite.tables.iec61968.common.table_locations",
+    "TableOrganisationRoles": "zepben.ewb.database.sqlite.tables.iec61968.common.table_organisation_roles",
+    "TableOrganisations": "zepben.ewb.database.sqlite.tables.iec61968.common.table_organisations",
+    "TablePositionPoints": "zepben.ewb.database.sqlite.tables.iec61968.common.table_position_points",
+    "TableStreetAddresses": "zepben.ewb.database.sqlite.tables.iec61968.common.table_street_addresses",
+    "TableTownDetails": "zepben.ewb.database.sqlite.tables.iec61968.common.table_town_details",
+    "TableCustomerAgreements": "zepben.ewb.database.sqlite.tables.iec61968.customers.table_customer_agreements",
+    "TableCustomers": "zepben.ewb.database.sqlite.tables.iec61968.customers.table_customers",
+    "TablePricingStructures": "zepben.ewb.database.sqlite.tables.iec61968.customers.table_pricing_structures",
+    "TableTariffs": "zepben.ewb.database.sqlite.tables.iec61968.customers.table_tariffs",
+    "TableCurrentTransformerInfo": "zepben.ewb.database.sqlite.tables.iec61968.infiec61968.infassetinfo.table_current_transformer_info",
+    "TablePotentialTransformerInfo": "zepben.ewb.database.sqlite.tables.iec61968.infiec61968.infassetinfo.table_potential_transformer_info",
+    "TablePoles": "zepben.ewb.database.sqlite.tables.iec61968.infiec61968.infassets.table_poles",
+    "TableEndDeviceFunctions": "zepben.ewb.database.sqlite.tables.iec61968.metering.table_end_device_functions",
+    "TableEndDevices": "zepben.ewb.database.sqlite.tables.iec61968.metering.table_end_devices",
+    "TableMeters": "zepben.ewb.database.sqlite.tables.iec61968.metering.table_meters",
+    "TableIdentifiedObjects": "zepben.ewb.database.sqlite.tables.iec61968.metering.table_usage_points",
+    "TableUsagePoints": "zepben.ewb.database.sqlite.tables.iec61968.metering.table_usage_points",
+    "TableOperationalRestrictions": "zepben.ewb.database.sqlite.tables.iec61968.operations.table_operational_restrictions",
+    "TableAuxiliaryEquipment": "zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_auxiliary_equipment",
+    "TableCurrentTransformers": "zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_current_transformers",
+    "TableFaultIndicators": "zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_fault_indicators",
+    "TablePotentialTransformers": "zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_potential_transformers",
+    "TableSensors": "zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_sensors",
+    "TableAcDcTerminals": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_ac_dc_terminals",
+    "TableBaseVoltages": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_base_voltages",
+    "TableConductingEquipment": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_conducting_equipment",
+    "TableConnectivityNodeContainers": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_connectivity_node_containers",
+    "TableConnectivityNodes": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_connectivity_nodes",
+    "TableCurveData": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_curve_data",
+    "TableCurves": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_curves",
+    "TableEquipment": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_equipment",
+    "TableFeeders": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_feeders",
+    "TableGeographicalRegions": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_geographical_regions",
+    "TableNameTypes": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_name_types",
+    "TableNames": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_names",
+    "TablePowerSystemResources": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_power_system_resources",
+    "TableSubGeographicalRegions": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_sub_geographical_regions",
+    "TableSubstations": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_substations",
+    "TableTerminals": "zepben.ewb.database.sqlite.tables.iec61970.base.core.table_terminals",
+    "TableDiagramObjectPoints": "zepben.ewb.database.sqlite.tables.iec61970.base.diagramlayout.table_diagram_object_points",
+    "TableDiagramObjects": "zepben.ewb.database.sqlite.tables.iec61970.base.diagramlayout.table_diagram_objects",
+    "TableDiagrams": "zepben.ewb.database.sqlite.tables.iec61970.base.diagramlayout.table_diagrams",
+    "TableEquivalentBranches": "zepben.ewb.database.sqlite.tables.iec61970.base.equivalents.table_equivalent_branches",
+    "TableEquivalentEquipment": "zepben.ewb.database.sqlite.tables.iec61970.base.equivalents.table_equivalent_equipment",
+    "TableBatteryUnits": "zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_battery_units",
+    "TablePhotoVoltaicUnits": "zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_photo_voltaic_units",
+    "TablePowerElectronicsUnits": "zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_power_electronics_units",
+    "TablePowerElectronicsWindUnits": "zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_power_electronics_wind_units",
+    "TableAccumulators": "zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_accumulators",
+    "TableAnalogs": "zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_analogs",
+    "TableControls": "zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_controls",
+    "TableDiscretes": "zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_discretes",
+    "TableIoPoints": "zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_io_points",
+    "TableMeasurements": "zepben.ewb.database.sqlite.tables.iec61970.base.meas.table_measurements",
+    "TableCurrentRelays": "zepben.ewb.database.sqlite.tables.iec61970.base.protection.table_current_relays",
+    "TableRemoteControls": "zepben.ewb.database.sqlite.tables.iec61970.base.scada.table_remote_controls",
+    "TableRemotePoints": "zepben.ewb.database.sqlite.tables.iec61970.base.scada.table_remote_points",
+    "TableRemoteSources": "zepben.ewb.database.sqlite.tables.iec61970.base.scada.table_remote_sources",
+    "TableAcLineSegments": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ac_line_segments",
+    "TableAcLineSegmentPhases": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ac_line_segment_phases",
+    "TableBreakers": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_breakers",
+    "TableBusbarSections": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_busbar_sections",
+    "TableClamps": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_clamps",
+    "TableConductors": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_conductors",
+    "TableConnectors": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_connectors",
+    "TableCuts": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_cuts",
+    "TableDisconnectors": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_disconnectors",
+    "TableEarthFaultCompensators": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_earth_fault_compensators",
+    "TableEnergyConnections": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_connections",
+    "TableEnergyConsumerPhases": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_consumer_phases",
+    "TableEnergyConsumers": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_consumers",
+    "TableEnergySourcePhases": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_source_phases",
+    "TableEnergySources": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_sources",
+    "TableFuses": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_fuses",
+    "TableGroundDisconnectors": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ground_disconnectors",
+    "TableGroundingImpedances": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_grounding_impedances",
+    "TableGrounds": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_grounds",
+    "TableJumpers": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_jumpers",
+    "TableJunctions": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_junctions",
+    "TableLinearShuntCompensators": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_linear_shunt_compensators",
+    "TableLines": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_lines",
+    "TableLoadBreakSwitches": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_load_break_switches",
+    "TablePerLengthImpedances": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_impedances",
+    "TablePerLengthLineParameters": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_line_parameters",
+    "TablePerLengthPhaseImpedances": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_phase_impedances",
+    "TablePerLengthSequenceImpedances": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_per_length_sequence_impedances",
+    "TablePetersenCoils": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_petersen_coils",
+    "TablePhaseImpedanceData": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_phase_impedance_data",
+    "TablePowerElectronicsConnectionPhases": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_electronics_connection_phases",
+    "TablePowerElectronicsConnections": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_electronics_connections",
+    "TablePowerTransformerEnds": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_transformer_ends",
+    "TablePowerTransformers": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_transformers",
+    "TableProtectedSwitches": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_protected_switches",
+    "TableRatioTapChangers": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ratio_tap_changers",
+    "TableReactiveCapabilityCurves": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_reactive_capability_curves",
+    "TableReclosers": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_reclosers",
+    "TableRegulatingCondEq": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_regulating_cond_eq",
+    "TableRegulatingControls": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_regulating_controls",
+    "TableRotatingMachines": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_rotating_machines",
+    "TableSeriesCompensators": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_series_compensators",
+    "TableShuntCompensators": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_shunt_compensators",
+    "TableStaticVarCompensators": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_static_var_compensator",
+    "TableSwitches": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_switches",
+    "TableSynchronousMachines": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_synchronous_machines",
+    "TableTapChangerControls": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_tap_changer_controls",
+    "TableTapChangers": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_tap_changers",
+    "TableTransformerEnds": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_transformer_ends",
+    "TableTransformerStarImpedances": "zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_transformer_star_impedances",
+    "TableCircuits": "zepben.ewb.database.sqlite.tables.iec61970.infiec61970.feeder.table_circuits",
+    "CustomerDatabaseTables": "zepben.ewb.database.sqlite.customer.customer_database_tables",
+    "DiagramDatabaseTables": "zepben.ewb.database.sqlite.diagram.diagram_database_tables",
+    "NetworkDatabaseTables": "zepben.ewb.database.sqlite.network.network_database_tables",
+    "Logger": "zepben.ewb.database.sqlite.extensions.prepared_statement",
+    "Cursor": "zepben.ewb.database.sqlite.extensions.prepared_statement",
+    "SqlException": "zepben.ewb.database.sqlite.extensions.prepared_statement",
+    "PreparedStatement": "zepben.ewb.database.sqlite.extensions.prepared_statement",
+    "MissingTableConfigException": "zepben.ewb.database.sqlite.tables.exceptions",
+    "BaseCimReader": "zepben.ewb.database.sqlite.common.base_cim_reader",
+    "BaseCimWriter": "zepben.ewb.database.sqlite.common.base_cim_writer",
+    "BaseCollectionReader": "zepben.ewb.database.sqlite.common.base_collection_reader",
+    "BaseCollectionWriter": "zepben.ewb.database.sqlite.common.base_collection_writer",
+    "BaseEntryWriter": "zepben.ewb.database.sqlite.common.base_entry_writer",
+    "BaseServiceReader": "zepben.ewb.database.sqlite.common.base_service_reader",
+    "BaseServiceWriter": "zepben.ewb.database.sqlite.common.base_service_writer",
+    "MetadataCollectionWriter": "zepben.ewb.database.sqlite.common.metadata_collection_writer",
+    "MetadataEntryWriter": "zepben.ewb.database.sqlite.common.metadata_entry_writer",
+    "MRIDLookupException": "zepben.ewb.database.sqlite.common.reader_exceptions",
+    "NameTypeLookupException": "zepben.ewb.database.sqlite.common.reader_exceptions",
+    "DuplicateMRIDException": "zepben.ewb.database.sqlite.common.reader_exceptions",
+    "DuplicateNameTypeException": "zepben.ewb.database.sqlite.common.reader_exceptions",
+    "CustomerCimWriter": "zepben.ewb.database.sqlite.customer.customer_cim_writer",
+    "CustomerDatabaseWriter": "zepben.ewb.database.sqlite.customer.customer_database_writer",
+    "CustomerServiceWriter": "zepben.ewb.database.sqlite.customer.customer_service_writer",
+    "DiagramCimWriter": "zepben.ewb.database.sqlite.diagram.diagram_cim_writer",
+    "DiagramDatabaseWriter": "zepben.ewb.database.sqlite.diagram.diagram_database_writer",
+    "DiagramServiceWriter": "zepben.ewb.database.sqlite.diagram.diagram_service_writer",
+    "NetworkCimWriter": "zepben.ewb.database.sqlite.network.network_cim_writer",
+    "NetworkDatabaseWriter": "zepben.ewb.database.sqlite.network.network_database_writer",
+    "NetworkServiceWriter": "zepben.ewb.database.sqlite.network.network_service_writer",
+    "ResultSet": "zepben.ewb.database.sqlite.extensions.result_set",
+    "MetadataCollectionReader": "zepben.ewb.database.sqlite.common.metadata_collection_reader",
+    "MetadataEntryReader": "zepben.ewb.database.sqlite.common.metadata_entry_reader",
+    "CustomerCimReader": "zepben.ewb.database.sqlite.customer.customer_cim_reader",
+    "CustomerDatabaseReader": "zepben.ewb.database.sqlite.customer.customer_database_reader",
+    "CustomerServiceReader": "zepben.ewb.database.sqlite.customer.customer_service_reader",
+    "DiagramCimReader": "zepben.ewb.database.sqlite.diagram.diagram_cim_reader",
+    "DiagramDatabaseReader": "zepben.ewb.database.sqlite.diagram.diagram_database_reader",
+    "DiagramServiceReader": "zepben.ewb.database.sqlite.diagram.diagram_service_reader",
+    "NetworkCimReader": "zepben.ewb.database.sqlite.network.network_cim_reader",
+    "NetworkContainerScope": "zepben.ewb.database.sqlite.network.network_container_scope",
+    "NetworkDatabaseReader": "zepben.ewb.database.sqlite.network.network_database_reader",
+    "NetworkSnapshot": "zepben.ewb.database.sqlite.network.network_snapshot",
+    "NetworkServiceReader": "zepben.ewb.database.sqlite.network.network_service_reader",
+    "Protocol": "zepben.ewb.testing.test_network_builder",
+    "SubclassesConductingEquipment": "zepben.ewb.testing.test_network_builder",
+    "null_action": "zepben.ewb.testing.test_network_builder",
+    "OtherCreator": "zepben.ewb.testing.test_network_builder",
+    "TestNetworkBuilder": "zepben.ewb.testing.test_network_builder",
+    "MissingReferenceException": "zepben.ewb.exceptions",
+    "NetworkException": "zepben.ewb.exceptions",
+    "AlreadyExistsException": "zepben.ewb.exceptions",
+    "ReadingException": "zepben.ewb.exceptions",
+    "PhaseException": "zepben.ewb.exceptions",
+    "NominalPhaseException": "zepben.ewb.exceptions",
+    "WiringException": "zepben.ewb.exceptions",
+    "TracingException": "zepben.ewb.exceptions",
+    "OpenTest": "zepben.ewb.types",
+}
@@ -0,0 +1,102 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Generates ``zepben/ewb/_exports.py``, the map of each name exported by ``zepben.ewb`` to the module it is lazily imported from.
+
+The exported names are those imported by the ``if TYPE_CHECKING:`` block of ``zepben/ewb/__init__.py``, resolved the same way the imports would be if they
+were run in order. Regenerate the map after changing the block with ``python -m zepben.ewb._generate_exports``.
+"""
+
+__all__ = ["generate_exports", "write_exports"]
+
+import ast
+import importlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+_PACKAGE_DIR = Path(__file__).parent
+_INIT_FILE = _PACKAGE_DIR / "__init__.py"
+_EXPORTS_FILE = _PACKAGE_DIR / "_exports.py"
+
+_HEADER = '''#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+# NOTE: This file is generated by `python -m zepben.ewb._generate_exports` from the imports in `zepben/ewb/__init__.py`. Do not edit it by hand.
+
+from typing import Dict
+
+EXPORTS: Dict[str, str] = {
+'''
+
+
+def _type_checking_imports() -> List[Tuple[str, Optional[List[str]]]]:
+    tree = ast.parse(_INIT_FILE.read_text(encoding="utf-8"))
+    block = next(
+        (it for it in tree.body if isinstance(it, ast.If) and isinstance(it.test, ast.Name) and it.test.id == "TYPE_CHECKING"),
+        None
+    )
+    if block is None:
+        raise ValueError(f"Unable to find the `if TYPE_CHECKING:` block in {_INIT_FILE}.")
+
+    imports = []
+    for it in block.body:
+        if not isinstance(it, ast.ImportFrom):
+            raise ValueError(f"Only `from ... import ...` statements are supported in the `if TYPE_CHECKING:` block, found {ast.unparse(it)}.")
+        if [alias.name for alias in it.names] == ["*"]:
+            imports.append((it.module, None))
+        else:
+            imports.append((it.module, [alias.asname or alias.name for alias in it.names]))
+    return imports
+
+
+def generate_exports() -> Dict[str, str]:
+    """
+    Generate the map of exported names, importing every exported module.
+
+    :return: The module to import each exported name from, in the order they are exported.
+    """
+    # Add each name to the package as it is resolved, the same as the imports would if they were run, so the modules can import the names exported
+    # before them from the package even if the map is out of date.
+    package = importlib.import_module("zepben.ewb")
+
+    exports = {}
+    values = {}
+    for module_name, names in _type_checking_imports():
+        module = importlib.import_module(module_name)
+        if names is None:
+            names = getattr(module, "__all__", None)
+            if names is None:
+                # Only public identifiers, ignoring anything added by tooling such as the assertion rewriting of pytest.
+                names = [it for it in vars(module) if not it.startswith("_") and it.isidentifier()]
+
+        for name in names:
+            if not hasattr(module, name):
+                # Submodules of a package are only attributes of the package once they have been imported.
+                importlib.import_module(f"{module_name}.{name}")
+            value = getattr(module, name)
+
+            # Later imports replace earlier ones, unless it is the same object, in which case we keep the earlier module as it will be cheaper to import.
+            if (name not in values) or (values[name] is not value):
+                exports[name] = module_name
+                values[name] = value
+                setattr(package, name, value)
+
+    return exports
+
+
+def write_exports():
+    """
+    Regenerate ``zepben/ewb/_exports.py``.
+    """
+    lines = [_HEADER]
+    lines.extend(f'    "{name}": "{module}",\n' for name, module in generate_exports().items())
+    lines.append("}\n")
+    _EXPORTS_FILE.write_text("".join(lines), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    write_exports()
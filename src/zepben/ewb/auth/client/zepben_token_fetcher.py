@@ -4,11 +4,14 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-__all__ = ["ZepbenTokenFetcher", "create_token_fetcher", "get_token_fetcher", "create_token_fetcher_managed_identity"]
+__all__ = ["ZepbenTokenFetcher", "TokenRefreshStats", "create_token_fetcher", "get_token_fetcher", "create_token_fetcher_managed_identity"]
 
+import logging
+import threading
 import warnings
 from dataclasses import dataclass, field, InitVar
-from datetime import datetime
+from datetime import datetime, timedelta
+from time import perf_counter
 from typing import Optional, Callable
 
 import jwt
@@ -21,6 +24,14 @@ from zepben.ewb.auth.common.auth_method import AuthMethod
 # noinspection PyProtectedMember
 from zepben.ewb.auth.common.auth_provider_config import AuthProviderConfig, create_auth_provider_config, fetch_provider_details
 
+logger = logging.getLogger(__name__)
+
+# A single session is shared by every token fetcher so connections to the token provider are pooled and reused between requests.
+_session = requests.Session()
+
+# How long to wait before trying to refresh a token in the background again after a background refresh fails.
+_BACKGROUND_RETRY_INTERVAL = timedelta(seconds=10)
+
 
 def _fetch_token_generator(
     is_entraid: bool,
@@ -46,7 +57,7 @@ def _fetch_token_generator(
 
             })
 
-        return requests.post(
+        return _session.post(
             url=token_endpoint,
             headers={"content-type": "application/x-www-form-urlencoded"},
             data=refresh_request_data if refresh else token_request_data,
@@ -79,7 +90,7 @@ def _fetch_token_generator(
         verify: Optional[bool] = False
     ) -> requests.Response:
 
-        return requests.get(identity_url, headers={"Metadata": "true"}, verify=verify)
+        return _session.get(identity_url, headers={"Metadata": "true"}, verify=verify)
 
     if use_identity:
         if not identity_url:
@@ -89,11 +100,39 @@ def _fetch_token_generator(
         return _get_token_response
 
 
+@dataclass
+class TokenRefreshStats:
+    """
+    Counters describing the token refreshes made by a :class:`ZepbenTokenFetcher`, which can be used to monitor for calls stalled by authentication.
+
+    :var refreshes: The number of successful token requests.
+    :var failures: The number of failed token requests.
+    :var background_refreshes: The number of token requests made in the background ahead of the token expiring.
+    :var total_seconds: The total time spent on token requests, in seconds.
+    :var max_seconds: The longest time taken by a token request, in seconds.
+    :var last_seconds: The time taken by the most recent token request, in seconds.
+    :var blocked_calls: The number of calls to `fetch_token` that had to wait for a token request.
+    :var blocked_seconds: The total time calls to `fetch_token` spent waiting for token requests, in seconds.
+    """
+    refreshes: int = 0
+    failures: int = 0
+    background_refreshes: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seconds: Optional[float] = None
+    blocked_calls: int = 0
+    blocked_seconds: float = 0.0
+
+
 @dataclass(init=True, repr=True, eq=True)
 class ZepbenTokenFetcher:
     """
     Fetches access tokens from an authentication provider using the OAuth 2.0 protocol.
 
+    Once the stored token is within `refresh_margin` of expiring, a new token is requested in a background thread while the stored token continues to be
+    used, so calls to `fetch_token` only wait for a token request if the stored token has actually expired. Only one token request is made at a time, with
+    any other callers waiting for it to finish rather than making their own.
+
     :param audience: Audience to use when requesting tokens
     :param token_endpoint: The domain of the token issuer.
     :param token_request_data: Data to pass in token requests.
@@ -102,6 +141,8 @@ class ZepbenTokenFetcher:
         certificate of the OAUTH service or not. When this is a string, it is used as the filename of the certificate
         truststore to use when verifying the OAUTH service.
     :param auth_method:  Deprecated. Kept for backwards compatibility, but this is now unused.
+    :param refresh_margin: How long before the stored token expires to start requesting a new one in the background. This is limited to half the lifetime
+        of each token, so tokens that don't outlive the margin aren't requested again on every call.
     """
 
     audience: str
@@ -119,6 +160,13 @@ class ZepbenTokenFetcher:
     _token_expiry: Optional[datetime] = datetime.min
     token_type: Optional[str] = None
 
+    refresh_margin: timedelta = timedelta(minutes=1)
+    refresh_stats: TokenRefreshStats = field(default_factory=TokenRefreshStats, init=False, repr=False, compare=False)
+    """Counters describing the token requests made by this fetcher."""
+
+    _refresh_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _next_background_refresh: datetime = field(default=datetime.min, init=False, repr=False, compare=False)
+
     def __post_init__(self, _request_token):
         if _request_token is None:
             _request_token = _fetch_token_generator(False, False)
@@ -132,16 +180,18 @@ class ZepbenTokenFetcher:
         Returns a JWT access token and its type in the form of '<type> <3 part JWT>', retrieved from the configured OAuth2 token provider.
         Throws AuthException if an access token request fails.
         """
-        if datetime.utcnow() > self._token_expiry:
-            # Stored token has expired, try to refresh
-            self._access_token = None
-            if self._refresh_token:
-                self._fetch_token(refresh=True)
-
-            if self._access_token is None:
-                # If using the refresh token did not work for any reason, self._access_token will still be None.
-                # and thus we must try get a fresh access token using credentials instead.
-                self._fetch_token()
+        now = datetime.utcnow()
+        if now > self._token_expiry:
+            # Stored token has expired, so we need to wait for a new one. If another thread is already fetching one, we wait for it rather than
+            # making our own request.
+            start = perf_counter()
+            with self._refresh_lock:
+                try:
+                    if datetime.utcnow() > self._token_expiry:
+                        self._refresh()
+                finally:
+                    self.refresh_stats.blocked_calls += 1
+                    self.refresh_stats.blocked_seconds += perf_counter() - start
 
             # Just to give a friendly error if a token retrieval failed for a case we haven't handled.
             if not self._token_type or not self._access_token:
@@ -149,8 +199,54 @@ class ZepbenTokenFetcher:
                     f"Token couldn't be retrieved from {self.token_endpoint} using configuration "
                     f"{self.auth_method}, audience: {self.audience}"
                 )
+            return f"{self._token_type} {self._access_token}"
+
+        token = f"{self._token_type} {self._access_token}"
+        if (now > self._token_expiry - self.refresh_margin) and (now > self._next_background_refresh):
+            self._start_background_refresh()
+
+        return token
+
+    def _start_background_refresh(self):
+        # If the lock is already held, a token is already being fetched, so there is nothing to do. Otherwise, the lock is released by the background
+        # thread once it has finished.
+        if self._refresh_lock.acquire(blocking=False):
+            try:
+                threading.Thread(target=self._background_refresh, name=f"{self.__class__.__name__}-refresh", daemon=True).start()
+            except BaseException:
+                self._refresh_lock.release()
+                raise
+
+    def _background_refresh(self):
+        try:
+            self.refresh_stats.background_refreshes += 1
+            self._refresh()
+        except Exception as e:
+            # The stored token is still valid, so we just log the failure and try again later. If the token expires before a refresh succeeds, the
+            # next call to `fetch_token` will make the request itself and raise any error.
+            self._next_background_refresh = datetime.utcnow() + _BACKGROUND_RETRY_INTERVAL
+            logger.warning(f"Failed to refresh the access token from {self.token_endpoint} in the background: {e}")
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self):
+        # Must only be called while holding `_refresh_lock`.
+        start = perf_counter()
+        try:
+            if self._refresh_token:
+                self._fetch_token(refresh=True)
+            else:
+                self._fetch_token()
+        except BaseException:
+            self.refresh_stats.failures += 1
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            self.refresh_stats.total_seconds += elapsed
+            self.refresh_stats.max_seconds = max(self.refresh_stats.max_seconds, elapsed)
+            self.refresh_stats.last_seconds = elapsed
 
-        return f"{self._token_type} {self._access_token}"
+        self.refresh_stats.refreshes += 1
 
     def _fetch_token(self, refresh: Optional[bool] = False):
         if refresh:
@@ -182,9 +278,14 @@ class ZepbenTokenFetcher:
                 f'{data.get("error", "Access Token absent in token response")} - {data.get("error_description", f"Response was: {data}")}'
             )
 
+        # The expiry is decoded before anything is stored, as the stored token may be in use by other threads while it is being refreshed.
+        token_expiry = datetime.fromtimestamp(jwt.decode(data["access_token"], options={"verify_signature": False})['exp'])
         self._token_type = data["token_type"]
         self._access_token = data["access_token"]
-        self._token_expiry = datetime.fromtimestamp(jwt.decode(self._access_token, options={"verify_signature": False})['exp'])
+        self._token_expiry = token_expiry
+
+        # If the token doesn't outlive the refresh margin, it would be within the margin as soon as it was stored, so every call would request another one.
+        self._next_background_refresh = token_expiry - min(self.refresh_margin, (token_expiry - datetime.utcnow()) / 2)
 
         if refresh:
             self._refresh_token = data.get("refresh_token", None)
@@ -9,12 +9,14 @@ import logging
 from abc import ABC, abstractmethod
 from contextlib import closing
 from sqlite3 import Connection
-from typing import Callable, Type, Optional
+from typing import Callable, Type, Optional, List
 
 from zepben.ewb.database.sqlite.common.base_database_tables import BaseDatabaseTables, TSqliteTable
 from zepben.ewb.database.sqlite.common.reader_exceptions import MRIDLookupException, DuplicateMRIDException
+from zepben.ewb.database.sqlite.common.table_prefetcher import TablePrefetcher
 from zepben.ewb.database.sqlite.extensions.prepared_statement import SqlException
 from zepben.ewb.database.sqlite.extensions.result_set import ResultSet
+from zepben.ewb.database.sqlite.tables.sqlite_table import SqliteTable
 
 
 class BaseCollectionReader(ABC):
@@ -39,6 +41,20 @@ class BaseCollectionReader(ABC):
         The connection to the database to read.
         """
 
+        self.fetch_size: int = ResultSet.DEFAULT_FETCH_SIZE
+        """
+        The number of rows to read from the database at a time when loading each table. Larger values trade memory for fewer round trips into sqlite.
+        """
+
+        self.fetch_workers: int = 0
+        """
+        The number of worker threads used to fetch the rows of upcoming tables while the current table is being processed, each with its own read-only
+        connection to the database. Set to 0 (default) to read each table sequentially on `connection`. Only supported for databases stored in a file.
+        """
+
+        self._prefetcher: Optional[TablePrefetcher] = None
+        self._planned_tables: Optional[List[SqliteTable]] = None
+
     @abstractmethod
     def load(self) -> bool:
         """
@@ -57,6 +73,9 @@ class BaseCollectionReader(ABC):
           callback to set the identifier for the row, which returns the same value, so it can be used fluently.
         """
         table = self.base_database_tables.get_table(type_)
+        if self._planned_tables is not None:
+            self._planned_tables.append(table)
+            return True
 
         def process_rows(results: ResultSet):
             last_identifier: Optional[str] = None
@@ -86,11 +105,53 @@ class BaseCollectionReader(ABC):
         self._logger.info(f"Loading {table.describe()}...")
 
         try:
-            with closing(self._connection.cursor()) as cur:
-                cur.execute(table.select_sql)
-                count = process_rows(ResultSet(cur.fetchall()))
+            rows = self._prefetcher.take(table) if self._prefetcher else None
+            if rows is not None:
+                count = process_rows(ResultSet(rows))
+            else:
+                with closing(self._connection.cursor()) as cur:
+                    cur.execute(self._select_sql(table))
+                    count = process_rows(ResultSet(cur, self.fetch_size))
             self._logger.info(f"Successfully loaded {count} {table.describe()}.")
             return True
         except (SqlException, ValueError, MRIDLookupException, DuplicateMRIDException) as ex:
             self._logger.exception(f"Failed to read the {table.describe()} from '{table.name}': {ex}")
             return False
+
+    def _select_sql(self, table: TSqliteTable) -> str:
+        """
+        Get the SQL used to read the rows of a table. Override this to limit the rows that are read.
+
+        :param table: The table being read.
+        :return: The select statement for `table`.
+        """
+        return table.select_sql
+
+    def _start_prefetch(self, load_tables: Callable[[], bool]):
+        """
+        Start fetching the rows of each table in the background if `fetch_workers` has been set. You must call `_stop_prefetch` once loading has finished.
+
+        :param load_tables: The function that loads the tables via `_load_each`. It is called without reading anything to find the tables it reads, and the
+          order it reads them in, so only those tables are fetched, in the order they will be taken.
+        """
+        if self.fetch_workers <= 0:
+            return
+
+        database_file = TablePrefetcher.database_file_of(self._connection)
+        if database_file is None:
+            self._logger.warning("Tables can only be fetched in parallel from a database file. Falling back to reading each table sequentially.")
+            return
+
+        self._planned_tables = []
+        try:
+            load_tables()
+            tables = self._planned_tables
+        finally:
+            self._planned_tables = None
+
+        self._prefetcher = TablePrefetcher(database_file, tables, self.fetch_workers)
+
+    def _stop_prefetch(self):
+        if self._prefetcher:
+            self._prefetcher.close()
+            self._prefetcher = None
@@ -99,11 +99,13 @@ class BaseDatabaseTables(ABC):
         for t in self.tables:
             action(t)
 
-    def prepare_insert_statements(self, connection: Connection):
+    def prepare_insert_statements(self, connection: Connection, batch_size: int = 1):
         """
         Create a `PreparedStatement` for inserting into each table.
 
         :param connection: The `Connection` to prepare the statements on.
+        :param batch_size: The number of rows to write to each table at a time. Values greater than 1 require `flush_insert_statements` to be called once all
+          rows have been inserted.
         """
         self._close_insert_statements()
 
@@ -113,7 +115,18 @@ class BaseDatabaseTables(ABC):
         self._insert_cursor = connection.cursor()
         self._insert_statements = dict()
         for t, table in self._tables.items():
-            self._insert_statements[t] = PreparedStatement(table.prepared_insert_sql, self._insert_cursor)
+            self._insert_statements[t] = PreparedStatement(table.prepared_insert_sql, self._insert_cursor, batch_size)
+
+    def flush_insert_statements(self) -> bool:
+        """
+        Write any rows that have been queued by batched insert statements.
+
+        :return: True if all queued rows were successfully written, otherwise False.
+        """
+        status = True
+        for s in self.insert_statements:
+            status = s.flush() and status
+        return status
 
     def close(self):
         self._close_insert_statements()
@@ -33,7 +33,8 @@ class BaseDatabaseWriter(ABC):
         database_tables: BaseDatabaseTables,
         create_metadata_writer: Callable[[], MetadataCollectionWriter],
         create_service_writer: Callable[[], BaseServiceWriter],
-        get_connection: Callable[[str], Connection]
+        get_connection: Callable[[str], Connection],
+        batch_size: int = 1
     ):
         super().__init__()
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
@@ -66,6 +67,11 @@ class BaseDatabaseWriter(ABC):
         Provider of the connection to the specified database.
         """
 
+        self._batch_size: int = batch_size
+        """
+        The number of rows to write to each table at a time. Batching the writes greatly reduces the overhead of saving large services.
+        """
+
         self._save_connection: Optional[Connection] = None
         self._has_been_used: bool = False
 
@@ -88,7 +94,8 @@ class BaseDatabaseWriter(ABC):
         try:
             status = all([
                 self._create_metadata_writer().save(),
-                self._create_service_writer().save()
+                self._create_service_writer().save(),
+                self._database_tables.flush_insert_statements()
             ])
         except MissingTableConfigException as e:
             self._logger.exception(f"Unable to save database: {e}")
@@ -130,7 +137,7 @@ class BaseDatabaseWriter(ABC):
 
     def _prepare_insert_statements(self) -> bool:
         try:
-            self._database_tables.prepare_insert_statements(self._save_connection)
+            self._database_tables.prepare_insert_statements(self._save_connection, self._batch_size)
             return True
         except SqlException as e:
             self._logger.exception(f"Failed to prepare insert statements: {e}")
@@ -37,6 +37,13 @@ class BaseServiceReader(BaseCollectionReader, ABC):
         """
 
     def load(self) -> bool:
+        self._start_prefetch(self._load_tables)
+        try:
+            return self._load_tables()
+        finally:
+            self._stop_prefetch()
+
+    def _load_tables(self) -> bool:
         return (self._do_load()
                 and self._load_each(TableNameTypes, self._reader.load_name_types)
                 and self._load_each(TableNames, self._reader.load_names))
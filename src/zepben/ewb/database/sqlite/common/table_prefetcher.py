@@ -0,0 +1,118 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+__all__ = ["TablePrefetcher"]
+
+import logging
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from contextlib import closing
+from pathlib import Path
+from sqlite3 import Connection
+from typing import Dict, List, Optional, Iterable, Any, Tuple, Deque
+
+from zepben.ewb.database.sqlite.tables.sqlite_table import SqliteTable
+
+
+class TablePrefetcher:
+    """
+    Fetches the rows of tables in a pool of worker threads, each using its own read-only connection to the database, so the rows are ready to be
+    processed by the time they are needed. The rows are fetched in the order the tables are provided, so you should provide them in the order they will be
+    read for the best results.
+
+    NOTE: The fetched rows are held in memory until they are taken, so this trades memory for load time. To bound the memory used, only `max_workers`
+      tables are fetched ahead of the table being read, with the next table only being submitted once a fetched table has been taken.
+
+    :param database_file: The filename of the database to read.
+    :param tables: The tables to fetch, in the order they will be requested.
+    :param max_workers: The number of worker threads (and connections) to use, which is also the number of tables that will be fetched ahead.
+    """
+
+    def __init__(self, database_file: str, tables: Iterable[SqliteTable], max_workers: int):
+        self._database_uri: str = f"{Path(database_file).absolute().as_uri()}?mode=ro"
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[Connection] = []
+
+        self._max_in_flight = max(max_workers, 1)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=self.__class__.__name__)
+        self._pending: Deque[SqliteTable] = deque(tables)
+        self._pending_types = {type(table) for table in self._pending}
+        self._futures: Dict[type, Future] = dict()
+        self._submit_next()
+
+    @staticmethod
+    def database_file_of(connection: Connection) -> Optional[str]:
+        """
+        Get the filename of the main database for a connection.
+
+        :param connection: The connection to check.
+        :return: The filename of the database, or None if the database is not stored in a file (e.g. in memory databases).
+        """
+        with closing(connection.cursor()) as cur:
+            for _, name, file in cur.execute("PRAGMA database_list").fetchall():
+                if name == "main":
+                    return file or None
+        return None
+
+    def take(self, table: SqliteTable) -> Optional[List[Tuple[Any, ...]]]:
+        """
+        Take the fetched rows of a table, waiting for them to be fetched if required. Each table can only be taken once.
+
+        :param table: The table to take the rows of.
+        :return: The rows of the table, or None if the table was not fetched by this prefetcher, in which case it should be read directly. Tables that are
+          requested before they have been submitted are not fetched, as reading them directly avoids holding their rows in memory.
+        """
+        future = self._futures.pop(type(table), None)
+        if future is None:
+            # Requested out of order, so let it be read directly and skip it when submitting the upcoming tables.
+            self._pending_types.discard(type(table))
+            self._submit_next()
+            return None
+
+        # No more than `max_workers` tables are submitted at once, so a fetch that hasn't started yet will be picked up by the worker that just finished.
+        self._submit_next()
+        return future.result()
+
+    def close(self):
+        """
+        Stop fetching any tables that have not yet been started and close all the connections used by the workers.
+        """
+        self._pending.clear()
+        self._pending_types.clear()
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._executor.shutdown(wait=True)
+
+        for connection in self._connections:
+            try:
+                connection.close()
+            except sqlite3.Error as e:
+                logging.getLogger(self.__class__.__name__).warning(f"Failed to close prefetch connection: {e}")
+        self._connections.clear()
+
+    def _submit_next(self):
+        while self._pending and (len(self._futures) < self._max_in_flight):
+            table = self._pending.popleft()
+            if type(table) in self._pending_types:
+                self._pending_types.discard(type(table))
+                self._futures[type(table)] = self._executor.submit(self._fetch, table.select_sql)
+
+    def _fetch(self, select_sql: str) -> List[Tuple[Any, ...]]:
+        with closing(self._connection().cursor()) as cur:
+            cur.execute(select_sql)
+            return cur.fetchall()
+
+    def _connection(self) -> Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._database_uri, uri=True, check_same_thread=False)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
@@ -23,6 +23,7 @@ class CustomerDatabaseWriter(BaseDatabaseWriter):
 
     :param database_file: the filename of the database to write.
     :param service: The `CustomerService` to save to the database.
+    :param batch_size: The number of rows to write to each table at a time. Larger batches are significantly faster for large services.
     """
 
     def __init__(
@@ -32,7 +33,8 @@ class CustomerDatabaseWriter(BaseDatabaseWriter):
         database_tables: CustomerDatabaseTables = None,
         create_metadata_writer: Callable[[], MetadataCollectionWriter] = None,
         create_service_writer: Callable[[], CustomerServiceWriter] = None,
-        get_connection: Callable[[str], Connection] = None
+        get_connection: Callable[[str], Connection] = None,
+        batch_size: int = 1
     ):
         database_tables = database_tables if database_tables is not None else CustomerDatabaseTables()
 
@@ -41,5 +43,6 @@ class CustomerDatabaseWriter(BaseDatabaseWriter):
             database_tables,
             create_metadata_writer if create_metadata_writer is not None else lambda: MetadataCollectionWriter(service, database_tables),
             create_service_writer if create_service_writer is not None else lambda: CustomerServiceWriter(service, database_tables),
-            get_connection if get_connection is not None else sqlite3.connect
+            get_connection if get_connection is not None else sqlite3.connect,
+            batch_size
         )
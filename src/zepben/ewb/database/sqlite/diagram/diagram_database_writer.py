@@ -23,6 +23,7 @@ class DiagramDatabaseWriter(BaseDatabaseWriter):
 
     :param database_file: the filename of the database to write.
     :param service: The `DiagramService` to save to the database.
+    :param batch_size: The number of rows to write to each table at a time. Larger batches are significantly faster for large services.
     """
 
     def __init__(
@@ -32,7 +33,8 @@ class DiagramDatabaseWriter(BaseDatabaseWriter):
         database_tables: DiagramDatabaseTables = None,
         create_metadata_writer: Callable[[], MetadataCollectionWriter] = None,
         create_service_writer: Callable[[], DiagramServiceWriter] = None,
-        get_connection: Callable[[str], Connection] = None
+        get_connection: Callable[[str], Connection] = None,
+        batch_size: int = 1
     ):
         database_tables = database_tables if database_tables is not None else DiagramDatabaseTables()
         super().__init__(
@@ -40,5 +42,6 @@ class DiagramDatabaseWriter(BaseDatabaseWriter):
             database_tables,
             create_metadata_writer if create_metadata_writer is not None else lambda: MetadataCollectionWriter(service, database_tables),
             create_service_writer if create_service_writer is not None else lambda: DiagramServiceWriter(service, database_tables),
-            get_connection if get_connection is not None else sqlite3.connect
+            get_connection if get_connection is not None else sqlite3.connect,
+            batch_size
         )
@@ -4,7 +4,7 @@
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from logging import Logger
 from sqlite3 import Cursor
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, List, Tuple
 
 from zepben.ewb.model.cim.iec61968.infiec61968.infcommon.ratio import Ratio
 
@@ -16,15 +16,24 @@ class SqlException(Exception):
 class PreparedStatement(object):
     """
     A class giving the same functionality as the JVM PreparedStatement with the JVM SDK extensions added.
+
+    When created with a `batch_size` greater than 1, `try_execute_single_update` will queue the current values rather than executing them immediately. The
+    queued rows are written with a single `executemany` once `batch_size` rows have been queued, or when `flush` is called. You must call `flush` once you
+    have finished with a batched statement to write any remaining rows.
     """
 
-    def __init__(self, sql: str, cursor: Cursor):
+    def __init__(self, sql: str, cursor: Cursor, batch_size: int = 1):
         self.sql: str = sql
         self._cursor: Cursor = cursor
+        self.batch_size: int = batch_size
 
         self._num_cols: int = self.sql.count('?')
         self._values: Dict[int, Any] = dict()
 
+        self._batch: List[Tuple[Any, ...]] = []
+        self._batch_on_error: List[Optional[Callable[[Exception], Any]]] = []
+        self._batch_failed: bool = False
+
     def __str__(self):
         return f"PreparedStatement[sql={self.sql}, values={self._values}]"
 
@@ -55,6 +64,9 @@ class PreparedStatement(object):
 
         Throws any exception possible from `cursor.execute`, typically `sqlite3.DatabaseError`
         """
+        self._cursor.execute(self.sql, self._current_parameters())
+
+    def _current_parameters(self) -> List[Any]:
         parameters = []
         missing = []
         for i in range(1, self.num_columns + 1):
@@ -66,7 +78,7 @@ class PreparedStatement(object):
         if missing:
             raise SqlException(f"Missing values for indices {', '.join(missing)}. Ensure all ?'s have a corresponding value in the prepared statement.")
 
-        self._cursor.execute(self.sql, parameters)
+        return parameters
 
     def add_value(self, index: int, value: Any):
         if 0 < index <= self._num_cols:
@@ -90,15 +102,63 @@ class PreparedStatement(object):
         `id` The mRID of the relevant object that is being saved
         `description` A description of the type of object (e.g. AcLineSegment)
         Returns True if the `execute` was successful, False otherwise.
+
+        When batching, the values are queued and True is returned unless the values are incomplete. Any failure to write the queued values will be passed to
+        `on_error` when the batch is written, and reflected in the result of the next call to `flush`.
         """
         try:
-            self.execute()
+            if self.batch_size > 1:
+                self._add_batch(on_error)
+            else:
+                self.execute()
             return True
         except Exception as ex:
             if on_error:
                 on_error(ex)
             return False
 
+    def flush(self) -> bool:
+        """
+        Write any rows queued by a batched statement to the database.
+
+        Returns True if every row queued since the previous `flush` was successfully written, False otherwise.
+        """
+        self._execute_batch()
+        success = not self._batch_failed
+        self._batch_failed = False
+        return success
+
+    def _add_batch(self, on_error: Optional[Callable[[Exception], Any]]):
+        self._batch.append(tuple(self._current_parameters()))
+        self._batch_on_error.append(on_error)
+        if len(self._batch) >= self.batch_size:
+            self._execute_batch()
+
+    def _execute_batch(self):
+        rows, on_errors = self._batch, self._batch_on_error
+        self._batch, self._batch_on_error = [], []
+
+        # Each insert changes exactly one row, so when a row fails we can use the number of changes to find out which row it was. The rows before it have
+        # already been written, so we only need to report the failing row and continue with the rows after it.
+        connection = self._cursor.connection
+        start = 0
+        while start < len(rows):
+            changes_before = connection.total_changes
+            try:
+                self._cursor.executemany(self.sql, rows[start:] if start else rows)
+                return
+            except Exception as ex:
+                failed = start + connection.total_changes - changes_before
+                self._batch_failed = True
+
+                on_error = on_errors[failed] if failed < len(rows) else None
+                if on_error:
+                    # Restore the values of the failed row so any logging of this statement reflects the row that failed.
+                    self._values = dict(enumerate(rows[failed], 1))
+                    on_error(ex)
+
+                start = failed + 1
+
     def log_failure(self, logger: Logger, description: str, ex: Exception):
         logger.warning(
             f"Failed to save {description}.\n" +
@@ -6,7 +6,8 @@
 __all__ = ["ResultSet"]
 
 from datetime import datetime
-from typing import Any, Optional, Union, Type, TypeVar, List
+from sqlite3 import Cursor
+from typing import Any, Optional, Union, Type, TypeVar, Sequence
 
 from zepben.ewb.model.cim.iec61968.infiec61968.infcommon.ratio import Ratio
 
@@ -16,25 +17,49 @@ T = TypeVar("T")
 class ResultSet:
     """
     Wrapper class for records read from a database.
+
+    The records can either be supplied up front, or read from an executed `Cursor` in batches of `fetch_size` rows as they are processed, which avoids
+    holding a copy of every row of a large table in memory.
     """
-    # The values of this row
-    _rows: List[List[Any]]
+
+    DEFAULT_FETCH_SIZE: int = 10000
+    """The default number of rows to fetch from a `Cursor` at a time."""
+
+    # The rows that are currently available for processing
+    _rows: Sequence[Sequence[Any]]
+
+    # The cursor to fetch further rows from once `_rows` has been processed, or None if there are no further rows
+    _cursor: Optional[Cursor] = None
+
+    # The number of rows to fetch from `_cursor` at a time
+    _fetch_size: int = DEFAULT_FETCH_SIZE
 
     # The index of the next row to process
     _next_row_index: int = 0
 
     # The current row being processed
-    _current_row: Optional[List[Any]] = None
+    _current_row: Optional[Sequence[Any]] = None
 
-    def __init__(self, rows: List[List[Any]]):
-        self._rows = rows
+    def __init__(self, rows: Union[Sequence[Sequence[Any]], Cursor], fetch_size: int = DEFAULT_FETCH_SIZE):
+        """
+        :param rows: The rows to process, or an executed `Cursor` to read the rows from.
+        :param fetch_size: The number of rows to read from the cursor at a time. Ignored if `rows` is not a `Cursor`.
+        """
+        if isinstance(rows, Cursor):
+            if fetch_size <= 0:
+                raise ValueError(f"fetch_size must be positive, got {fetch_size}")
+            self._rows = ()
+            self._cursor = rows
+            self._fetch_size = fetch_size
+        else:
+            self._rows = rows
 
     def next(self) -> bool:
         """
         Move to the next row.
         :return: True if a new row was available, otherwise False.
         """
-        if self._next_row_index >= len(self._rows):
+        if self._next_row_index >= len(self._rows) and not self._fetch_next_rows():
             self._current_row = None
             return False
 
@@ -42,6 +67,17 @@ class ResultSet:
         self._next_row_index = self._next_row_index + 1
         return True
 
+    def _fetch_next_rows(self) -> bool:
+        if self._cursor is None:
+            return False
+
+        self._rows = self._cursor.fetchmany(self._fetch_size)
+        self._next_row_index = 0
+        if not self._rows:
+            self._cursor = None
+            return False
+        return True
+
     def get_string(self, column_index: int, on_none: Union[Optional[str], Type[Exception]] = ValueError) -> Optional[str]:
         """
         Get the value in the specified `column_index` as a string.
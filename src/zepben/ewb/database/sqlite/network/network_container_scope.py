@@ -0,0 +1,266 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+__all__ = ["NetworkContainerScope"]
+
+from contextlib import closing
+from sqlite3 import Connection, Cursor
+from typing import Iterable, List, Set, Tuple, Type
+
+from zepben.ewb.database.sql.column import Column
+from zepben.ewb.database.sqlite.network.network_database_tables import NetworkDatabaseTables
+from zepben.ewb.database.sqlite.tables.associations.table_equipment_equipment_containers import TableEquipmentEquipmentContainers
+from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.feeder.table_lv_feeders import TableLvFeeders
+from zepben.ewb.database.sqlite.tables.extensions.iec61970.base.generation.production.table_ev_charging_units import TableEvChargingUnits
+from zepben.ewb.database.sqlite.tables.iec61968.assetinfo.table_transformer_end_info import TableTransformerEndInfo
+from zepben.ewb.database.sqlite.tables.iec61968.metering.table_usage_points_contact_details import TableUsagePointsContactDetails
+from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_current_transformers import TableCurrentTransformers
+from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_fault_indicators import TableFaultIndicators
+from zepben.ewb.database.sqlite.tables.iec61970.base.auxiliaryequipment.table_potential_transformers import TablePotentialTransformers
+from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_feeders import TableFeeders
+from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_substations import TableSubstations
+from zepben.ewb.database.sqlite.tables.iec61970.base.core.table_terminals import TableTerminals
+from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_battery_units import TableBatteryUnits
+from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_photo_voltaic_units import TablePhotoVoltaicUnits
+from zepben.ewb.database.sqlite.tables.iec61970.base.generation.production.table_power_electronics_wind_units import TablePowerElectronicsWindUnits
+from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ac_line_segment_phases import TableAcLineSegmentPhases
+from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_consumer_phases import TableEnergyConsumerPhases
+from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_energy_source_phases import TableEnergySourcePhases
+from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_electronics_connection_phases import TablePowerElectronicsConnectionPhases
+from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_transformer_ends import TablePowerTransformerEnds
+from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_power_transformers import TablePowerTransformers
+from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_ratio_tap_changers import TableRatioTapChangers
+from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_switches import TableSwitches
+from zepben.ewb.database.sqlite.tables.sqlite_table import SqliteTable
+
+_SCOPE = "temp.scoped_mrids"
+_FRONTIER = "temp.scoped_frontier"
+_NEXT = "temp.scoped_next"
+_CONTAINERS = "temp.scoped_containers"
+_BLOCKED = "temp.scoped_blocked"
+_OPEN = "temp.scoped_open"
+_TEMP_TABLES = (_SCOPE, _FRONTIER, _NEXT, _CONTAINERS, _BLOCKED, _OPEN)
+
+
+class NetworkContainerScope:
+    """
+    The objects that need to be read from a network database to load the equipment in a set of equipment containers, such as feeders or LV feeders, without
+    loading the rest of the network.
+
+    The equipment in containers that store their contents in the database (e.g. sites and substations) is found via `TableEquipmentEquipmentContainers`.
+    Feeder and LV feeder membership is not stored, as it is assigned by tracing after the network is loaded, so the equipment for these is found by walking
+    the terminals and connectivity nodes from the head terminal of each container. The walk is bounded the same way as `AssignToFeeders` and
+    `AssignToLvFeeders`, stopping at the head equipment of every feeder and LV feeder, at switches that are open in both the normal and current state, and at
+    transformers in a substation (or any transformer for LV feeders). This can include more equipment than is in the container (e.g. the LV network below
+    transformers that are not the head of an LV feeder), which is removed when the equipment is assigned to the containers after loading.
+
+    So the phases can be traced the same as they are for the full network, the network upstream of each container is also included, up to the energy
+    sources feeding it. This is found by walking away from the head equipment of each container, crossing any equipment other than switches that are open
+    in both the normal and current state, but never into another feeder or LV feeder through its head terminal. For an LV feeder, this includes the whole
+    feeder (or feeders) energising it.
+
+    The equipment is then extended with the objects it owns (terminals, auxiliary equipment, transformer ends, tap changers, phases and power electronics
+    units), and everything those objects reference, such as connectivity nodes, asset info, base voltages, locations and the substation energising a feeder.
+    Each of these is found with indexed queries, with the results stored in temporary tables on the connection that are used to filter the rows read from
+    each table.
+
+    Only associations where both sides are in the scope are read, so equipment will not be associated with any containers outside the scope, and the
+    names of the objects in the scope are read along with every name type. Anything else that refers to the equipment, such as usage points, measurements
+    and protection relays, is not read.
+
+    :param container_mrids: The mRIDs of the equipment containers to load.
+    """
+
+    def __init__(self, container_mrids: Iterable[str]):
+        self.container_mrids: Set[str] = set(container_mrids)
+
+    def create(self, connection: Connection, tables: NetworkDatabaseTables) -> int:
+        """
+        Find the mRIDs of every object in the scope, storing them in temporary tables on the `connection`.
+
+        :param connection: The connection to the database. The scope is only available to queries made on this connection.
+        :param tables: The tables available in the database.
+        :return: The number of mRIDs in the scope.
+        """
+        owned = self._owned_columns(tables)
+        references = [(table, self._reference_columns(table)) for table in tables.tables if self._has_mrid(table)]
+
+        terminals = tables.get_table(TableTerminals)
+        feeders = tables.get_table(TableFeeders)
+        lv_feeders = tables.get_table(TableLvFeeders)
+        equipment_containers = tables.get_table(TableEquipmentEquipmentContainers)
+
+        with closing(connection.cursor()) as cur:
+            for it in _TEMP_TABLES:
+                cur.execute(f"DROP TABLE IF EXISTS {it}")
+                cur.execute(f"CREATE TABLE {it} (mrid TEXT PRIMARY KEY NOT NULL) WITHOUT ROWID")
+
+            cur.executemany(f"INSERT OR IGNORE INTO {_CONTAINERS} VALUES (?)", [(it,) for it in self.container_mrids])
+            self._find_blocked(cur, tables)
+
+            cur.execute(f"INSERT INTO {_FRONTIER} SELECT mrid FROM {_CONTAINERS}")
+            cur.execute(
+                f"INSERT OR IGNORE INTO {_FRONTIER} SELECT {equipment_containers.equipment_mrid.name} FROM {equipment_containers.name} "
+                f"WHERE {equipment_containers.equipment_container_mrid.name} IN (SELECT mrid FROM {_CONTAINERS})"
+            )
+            self._walk(cur, terminals, feeders, "")
+            self._walk(cur, terminals, lv_feeders, f"AND t1.{terminals.conducting_equipment_mrid.name} NOT IN (SELECT mrid FROM {tables.get_table(TablePowerTransformers).name})")
+            self._walk_upstream(cur, terminals, feeders, lv_feeders)
+
+            # Each newly found object is checked once for the objects it owns and references, until no new objects are found.
+            while self._count(cur, _FRONTIER):
+                cur.execute(f"INSERT INTO {_SCOPE} SELECT mrid FROM {_FRONTIER}")
+
+                for table, column in owned:
+                    cur.execute(f"INSERT OR IGNORE INTO {_NEXT} SELECT mrid FROM {table.name} WHERE {column.name} IN (SELECT mrid FROM {_FRONTIER})")
+                for table, columns in references:
+                    for column in columns:
+                        cur.execute(
+                            f"INSERT OR IGNORE INTO {_NEXT} SELECT {column.name} FROM {table.name} "
+                            f"WHERE mrid IN (SELECT mrid FROM {_FRONTIER}) AND {column.name} IS NOT NULL AND {column.name} != ''"
+                        )
+
+                cur.execute(f"DELETE FROM {_FRONTIER}")
+                cur.execute(f"INSERT INTO {_FRONTIER} SELECT mrid FROM {_NEXT} WHERE mrid NOT IN (SELECT mrid FROM {_SCOPE})")
+                cur.execute(f"DELETE FROM {_NEXT}")
+
+            return self._count(cur, _SCOPE)
+
+    def drop(self, connection: Connection):
+        """
+        Remove the temporary tables created by `create`.
+
+        :param connection: The connection the scope was created on.
+        """
+        with closing(connection.cursor()) as cur:
+            for it in _TEMP_TABLES:
+                cur.execute(f"DROP TABLE IF EXISTS {it}")
+
+    def select_sql(self, table: SqliteTable) -> str:
+        """
+        Get the SQL to select the rows of a table that are in the scope.
+
+        :param table: The table to select from.
+        :return: The select statement for `table`, limited to the objects in the scope, or the associations where every object is in the scope.
+        """
+        if self._has_mrid(table):
+            return self._where(table, f"mrid IN (SELECT mrid FROM {_SCOPE})")
+
+        columns = self._reference_columns(table)
+        if columns:
+            return self._where(table, " AND ".join(f"{it.name} IN (SELECT mrid FROM {_SCOPE})" for it in columns))
+        elif any(it.name == "contact_details_id" for it in table.column_set):
+            contact_details = TableUsagePointsContactDetails()
+            return self._where(
+                table,
+                f"contact_details_id IN (SELECT {contact_details.id.name} FROM {contact_details.name} "
+                f"WHERE {contact_details.usage_point_mrid.name} IN (SELECT mrid FROM {_SCOPE}))"
+            )
+        else:
+            return table.select_sql
+
+    @staticmethod
+    def _where(table: SqliteTable, condition: str) -> str:
+        # Some tables sort the rows they select, so we need to add the condition before the ordering.
+        select_sql, order_by, ordering = table.select_sql.rstrip().rstrip(";").partition(" ORDER BY ")
+        return f"{select_sql} WHERE {condition}{order_by}{ordering}"
+
+    @staticmethod
+    def _find_blocked(cur: Cursor, tables: NetworkDatabaseTables):
+        terminals = tables.get_table(TableTerminals)
+        for heads in (tables.get_table(TableFeeders), tables.get_table(TableLvFeeders)):
+            cur.execute(
+                f"INSERT OR IGNORE INTO {_BLOCKED} SELECT t.{terminals.conducting_equipment_mrid.name} FROM {heads.name} h "
+                f"JOIN {terminals.name} t ON t.mrid = h.{heads.normal_head_terminal_mrid.name} WHERE t.{terminals.conducting_equipment_mrid.name} IS NOT NULL"
+            )
+
+        for table in tables.tables:
+            if isinstance(table, TableSwitches):
+                cur.execute(f"INSERT OR IGNORE INTO {_OPEN} SELECT mrid FROM {table.name} WHERE {table.normal_open.name} != 0 AND {table.open.name} != 0")
+        cur.execute(f"INSERT OR IGNORE INTO {_BLOCKED} SELECT mrid FROM {_OPEN}")
+
+        equipment_containers = tables.get_table(TableEquipmentEquipmentContainers)
+        cur.execute(
+            f"INSERT OR IGNORE INTO {_BLOCKED} SELECT {equipment_containers.equipment_mrid.name} FROM {equipment_containers.name} "
+            f"WHERE {equipment_containers.equipment_mrid.name} IN (SELECT mrid FROM {tables.get_table(TablePowerTransformers).name}) "
+            f"AND {equipment_containers.equipment_container_mrid.name} IN (SELECT mrid FROM {tables.get_table(TableSubstations).name})"
+        )
+
+    @staticmethod
+    def _walk(cur: Cursor, terminals: TableTerminals, heads: SqliteTable, extra_blocked: str):
+        # We walk from the head terminal of each container to the terminals connected via their connectivity node, or via their equipment if it isn't
+        # blocked. The head equipment is always blocked, so we only walk away from it.
+        node = terminals.connectivity_node_mrid.name
+        equipment = terminals.conducting_equipment_mrid.name
+        cur.execute(
+            f"INSERT OR IGNORE INTO {_FRONTIER} "
+            f"WITH RECURSIVE walk(mrid) AS ("
+            f"SELECT {heads.normal_head_terminal_mrid.name} FROM {heads.name} WHERE mrid IN (SELECT mrid FROM {_CONTAINERS}) "
+            f"UNION "
+            f"SELECT t2.mrid FROM walk w JOIN {terminals.name} t1 ON t1.mrid = w.mrid JOIN {terminals.name} t2 ON (t2.{node} = t1.{node}) "
+            f"OR (t2.{equipment} = t1.{equipment} AND t1.{equipment} NOT IN (SELECT mrid FROM {_BLOCKED}) {extra_blocked})"
+            f") "
+            f"SELECT {equipment} FROM {terminals.name} WHERE mrid IN walk AND {equipment} IS NOT NULL"
+        )
+
+    @staticmethod
+    def _walk_upstream(cur: Cursor, terminals: TableTerminals, feeders: TableFeeders, lv_feeders: TableLvFeeders):
+        # We walk from the other terminals of the head equipment of each container, which leads away from the container. Crossing equipment onto the head
+        # terminal of any container would lead into that container, so we never do, which keeps the walk out of the other feeders and LV feeders.
+        node = terminals.connectivity_node_mrid.name
+        equipment = terminals.conducting_equipment_mrid.name
+        all_heads = f"SELECT {feeders.normal_head_terminal_mrid.name} FROM {feeders.name} UNION SELECT {lv_feeders.normal_head_terminal_mrid.name} FROM {lv_feeders.name}"
+        cur.execute(
+            f"INSERT OR IGNORE INTO {_FRONTIER} "
+            f"WITH RECURSIVE heads(mrid) AS ("
+            f"SELECT {feeders.normal_head_terminal_mrid.name} FROM {feeders.name} WHERE mrid IN (SELECT mrid FROM {_CONTAINERS}) "
+            f"UNION SELECT {lv_feeders.normal_head_terminal_mrid.name} FROM {lv_feeders.name} WHERE mrid IN (SELECT mrid FROM {_CONTAINERS})"
+            f"), "
+            f"walk(mrid) AS ("
+            f"SELECT t2.mrid FROM heads h JOIN {terminals.name} t1 ON t1.mrid = h.mrid JOIN {terminals.name} t2 ON t2.{equipment} = t1.{equipment} "
+            f"WHERE t2.mrid != t1.mrid "
+            f"UNION "
+            f"SELECT t2.mrid FROM walk w JOIN {terminals.name} t1 ON t1.mrid = w.mrid JOIN {terminals.name} t2 ON (t2.{node} = t1.{node}) "
+            f"OR (t2.{equipment} = t1.{equipment} AND t1.{equipment} NOT IN (SELECT mrid FROM {_OPEN}) AND t2.mrid NOT IN ({all_heads}))"
+            f") "
+            f"SELECT {equipment} FROM {terminals.name} WHERE mrid IN walk AND {equipment} IS NOT NULL"
+        )
+
+    @staticmethod
+    def _owned_columns(tables: NetworkDatabaseTables) -> List[Tuple[SqliteTable, Column]]:
+        def owned(type_: Type[SqliteTable], column_name: str) -> Tuple[SqliteTable, Column]:
+            table = tables.get_table(type_)
+            return table, getattr(table, column_name)
+
+        return [
+            owned(TableTerminals, "conducting_equipment_mrid"),
+            owned(TableCurrentTransformers, "terminal_mrid"),
+            owned(TablePotentialTransformers, "terminal_mrid"),
+            owned(TableFaultIndicators, "terminal_mrid"),
+            owned(TablePowerTransformerEnds, "power_transformer_mrid"),
+            owned(TableRatioTapChangers, "transformer_end_mrid"),
+            owned(TableAcLineSegmentPhases, "ac_line_segment_mrid"),
+            owned(TableEnergyConsumerPhases, "energy_consumer_mrid"),
+            owned(TableEnergySourcePhases, "energy_source_mrid"),
+            owned(TablePowerElectronicsConnectionPhases, "power_electronics_connection_mrid"),
+            owned(TableBatteryUnits, "power_electronics_connection_mrid"),
+            owned(TablePhotoVoltaicUnits, "power_electronics_connection_mrid"),
+            owned(TablePowerElectronicsWindUnits, "power_electronics_connection_mrid"),
+            owned(TableEvChargingUnits, "power_electronics_connection_mrid"),
+        ]
+
+    @staticmethod
+    def _reference_columns(table: SqliteTable) -> List[Column]:
+        # The transformer tests are the only references that don't follow the `_mrid` naming convention.
+        extra = {it.name for it in table.column_set if it.name.endswith("_tests")} if isinstance(table, TableTransformerEndInfo) else set()
+        return [it for it in table.column_set if (it.name.endswith("_mrid") or it.name in extra)]
+
+    @staticmethod
+    def _has_mrid(table: SqliteTable) -> bool:
+        return any(it.name == "mrid" for it in table.column_set)
+
+    @staticmethod
+    def _count(cur: Cursor, table: str) -> int:
+        return cur.execute(f"SELECT count(*) FROM {table}").fetchone()[0]
@@ -7,13 +7,15 @@ __all__ = ["NetworkDatabaseReader"]
 
 from collections import Counter
 from sqlite3 import Connection
-from typing import List
+from typing import Iterable, List
 from typing import Optional
 
 from zepben.ewb.database.sqlite.common.base_database_reader import BaseDatabaseReader
 from zepben.ewb.database.sqlite.common.metadata_collection_reader import MetadataCollectionReader
+from zepben.ewb.database.sqlite.common.table_prefetcher import TablePrefetcher
 from zepben.ewb.database.sqlite.network.network_database_tables import NetworkDatabaseTables
 from zepben.ewb.database.sqlite.network.network_service_reader import NetworkServiceReader
+from zepben.ewb.database.sqlite.network.network_snapshot import NetworkSnapshot
 from zepben.ewb.database.sqlite.tables.table_version import TableVersion
 from zepben.ewb.model.cim.iec61970.base.core.equipment import Equipment
 from zepben.ewb.model.cim.iec61970.base.core.feeder import Feeder
@@ -39,6 +41,14 @@ class NetworkDatabaseReader(BaseDatabaseReader):
     :param connection: The connection to the database.
     :param service: The `NetworkService` to populate with CIM objects from the database.
     :param database_description: The description of the database for logging (e.g. filename).
+    :param fetch_workers: The number of worker threads to use to fetch the rows of each table ahead of them being processed. Defaults to 0, which reads each
+      table sequentially. See `BaseCollectionReader.fetch_workers`.
+    :param snapshot_file: An optional filename of a `NetworkSnapshot` to use. If the snapshot was written for the current contents of the database it is
+      restored instead of reading and post-processing the database, otherwise (including if the snapshot is corrupt) the database is loaded as normal and a
+      new snapshot is written.
+    :param container_mrids: An optional collection of feeder or LV feeder mRIDs to load, rather than the entire network. The post-processing is run on the
+      partial network, with the network upstream of each container loaded along with it so the phases are traced from the energy sources feeding
+      it. See `NetworkContainerScope`. Snapshots are not used when loading containers.
     """
 
     def __init__(
@@ -54,12 +64,15 @@ class NetworkDatabaseReader(BaseDatabaseReader):
         set_phases: SetPhases = Tracing.set_phases(),
         phase_inferrer: PhaseInferrer = Tracing.phase_inferrer(),
         assign_to_feeders: AssignToFeeders = Tracing.assign_equipment_to_feeders(),
-        assign_to_lv_feeders: AssignToLvFeeders = Tracing.assign_equipment_to_lv_feeders()
+        assign_to_lv_feeders: AssignToLvFeeders = Tracing.assign_equipment_to_lv_feeders(),
+        fetch_workers: int = 0,
+        snapshot_file: Optional[str] = None,
+        container_mrids: Optional[Iterable[str]] = None
     ):
         super().__init__(
             connection,
             metadata_reader if metadata_reader else MetadataCollectionReader(service, NetworkDatabaseTables(), connection),
-            service_reader if service_reader else NetworkServiceReader(service, NetworkDatabaseTables(), connection),
+            service_reader if service_reader else NetworkServiceReader(service, NetworkDatabaseTables(), connection, container_mrids=container_mrids),
             service,
             database_description,
             table_version
@@ -71,6 +84,32 @@ class NetworkDatabaseReader(BaseDatabaseReader):
         self.phase_inferrer = phase_inferrer
         self.assign_to_feeders = assign_to_feeders
         self.assign_to_lv_feeders = assign_to_lv_feeders
+        if fetch_workers:
+            self._service_reader.fetch_workers = fetch_workers
+        self.snapshot_file = snapshot_file if container_mrids is None else None
+
+    async def load(self, perform_after_read_processing: bool = True) -> bool:
+        # Snapshots are only used for fully processed networks loaded from a database file.
+        database_file = TablePrefetcher.database_file_of(self._connection) if self.snapshot_file and perform_after_read_processing else None
+        if (database_file is None) or self._has_been_used:
+            return await super().load(perform_after_read_processing)
+
+        snapshot = NetworkSnapshot(self.snapshot_file)
+        try:
+            if self._pre_load() and snapshot.load(self.service, database_file):
+                self._has_been_used = True
+                return True
+        except Exception as e:
+            # The service is only modified once the snapshot has been restored, so we can discard it and load the database instead.
+            self._logger.exception(f"Unable to restore snapshot {self.snapshot_file}, loading the database instead: {e}")
+
+        status = await super().load(perform_after_read_processing)
+        if status:
+            try:
+                snapshot.write(self.service, database_file)
+            except Exception as e:
+                self._logger.warning(f"Unable to write snapshot {self.snapshot_file}: {e}")
+        return status
 
     async def _post_load(self) -> bool:
         status = await super()._post_load()
@@ -23,6 +23,7 @@ class NetworkDatabaseWriter(BaseDatabaseWriter):
 
     :param database_file: the filename of the database to write.
     :param service: The `NetworkService` to save to the database.
+    :param batch_size: The number of rows to write to each table at a time. Larger batches are significantly faster for large services.
     """
 
     def __init__(
@@ -32,12 +33,14 @@ class NetworkDatabaseWriter(BaseDatabaseWriter):
         database_tables: NetworkDatabaseTables = NetworkDatabaseTables(),
         create_metadata_writer: Callable[[Connection], MetadataCollectionWriter] = None,
         create_service_writer: Callable[[Connection], NetworkServiceWriter] = None,
-        get_connection: Callable[[str], Connection] = None
+        get_connection: Callable[[str], Connection] = None,
+        batch_size: int = 1
     ):
         super().__init__(
             database_file,
             database_tables,
             create_metadata_writer if create_metadata_writer is not None else lambda: MetadataCollectionWriter(service, database_tables),
             create_service_writer if create_service_writer is not None else lambda: NetworkServiceWriter(service, database_tables),
-            get_connection if get_connection is not None else sqlite3.connect
+            get_connection if get_connection is not None else sqlite3.connect,
+            batch_size
         )
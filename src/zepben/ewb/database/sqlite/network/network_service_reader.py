@@ -6,9 +6,11 @@
 __all__ = ["NetworkServiceReader"]
 
 from sqlite3 import Connection
+from typing import Callable, Iterable, Optional
 
 from zepben.ewb.database.sqlite.common.base_service_reader import BaseServiceReader
 from zepben.ewb.database.sqlite.network.network_cim_reader import NetworkCimReader
+from zepben.ewb.database.sqlite.network.network_container_scope import NetworkContainerScope
 from zepben.ewb.database.sqlite.network.network_database_tables import NetworkDatabaseTables
 from zepben.ewb.database.sqlite.tables.associations.table_asset_organisation_roles_assets import TableAssetOrganisationRolesAssets
 from zepben.ewb.database.sqlite.tables.associations.table_assets_power_system_resources import TableAssetsPowerSystemResources
@@ -131,6 +133,7 @@ from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_synchronous_mac
 from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_tap_changer_controls import TableTapChangerControls
 from zepben.ewb.database.sqlite.tables.iec61970.base.wires.table_transformer_star_impedances import TableTransformerStarImpedances
 from zepben.ewb.database.sqlite.tables.iec61970.infiec61970.feeder.table_circuits import TableCircuits
+from zepben.ewb.database.sqlite.tables.sqlite_table import SqliteTable
 from zepben.ewb.services.network.network_service import NetworkService
 
 
@@ -143,6 +146,8 @@ class NetworkServiceReader(BaseServiceReader):
     :param connection: A connection to the database.
 
     :param reader: The `NetworkCimReader` used to load the objects from the database.
+    :param container_mrids: An optional collection of feeder or LV feeder mRIDs. When provided, only the equipment in these containers (and the objects
+      they need) is loaded, rather than the entire network. See `NetworkContainerScope` for the objects that are included.
     """
 
     def __init__(
@@ -150,7 +155,8 @@ class NetworkServiceReader(BaseServiceReader):
         service: NetworkService,
         database_tables: NetworkDatabaseTables,
         connection: Connection,
-        reader: NetworkCimReader = None
+        reader: NetworkCimReader = None,
+        container_mrids: Optional[Iterable[str]] = None
     ):
         reader = reader if reader else NetworkCimReader(service)
         super().__init__(database_tables, connection, reader)
@@ -158,6 +164,35 @@ class NetworkServiceReader(BaseServiceReader):
         # This is not strictly necessary, it is just to update the type of the reader. It could be done with a generic
         # on the base class which looks like it works, but that actually silently breaks code insight and completion
         self._reader: NetworkCimReader = reader
+        self._service = service
+        self._scope: Optional[NetworkContainerScope] = NetworkContainerScope(container_mrids) if container_mrids is not None else None
+
+    def load(self) -> bool:
+        if self._scope is None:
+            return super().load()
+
+        self._logger.info(f"Finding the objects in {len(self._scope.container_mrids)} equipment containers...")
+        count = self._scope.create(self._connection, self.base_database_tables)
+        self._logger.info(f"Found {count} objects to load.")
+        try:
+            status = super().load()
+        finally:
+            self._scope.drop(self._connection)
+
+        for it in self._scope.container_mrids:
+            if it not in self._service:
+                self._logger.warning(f"Equipment container {it} was not found in the database.")
+        return status
+
+    def _select_sql(self, table: SqliteTable) -> str:
+        return self._scope.select_sql(table) if self._scope else super()._select_sql(table)
+
+    def _start_prefetch(self, load_tables: Callable[[], bool]):
+        if self._scope and self.fetch_workers > 0:
+            # The scope is stored in temporary tables, which are only visible to our own connection.
+            self._logger.warning("Tables can not be fetched in parallel when loading equipment containers. Falling back to reading each table sequentially.")
+            return
+        super()._start_prefetch(load_tables)
 
     def _do_load(self) -> bool:
         return all([
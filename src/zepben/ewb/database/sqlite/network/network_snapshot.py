@@ -0,0 +1,212 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+__all__ = ["NetworkSnapshot"]
+
+import hashlib
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from zepben.protobuf.cim.iec61970.base.core.NameType_pb2 import NameType as PBNameType
+from zepben.protobuf.metadata.metadata_data_pb2 import DataSource as PBDataSource
+from zepben.protobuf.nc.nc_data_pb2 import NetworkIdentifiable as PBNetworkIdentifiable
+
+from zepben.ewb.database.sqlite.tables.table_version import TableVersion
+from zepben.ewb.services.common.meta.metadata_translations import data_source_to_pb, data_source_from_pb
+from zepben.ewb.services.network.network_service import NetworkService
+# NOTE: These are imported to bind the `to_pb` and `to_cim` functions used to translate the objects.
+# noinspection PyUnresolvedReferences
+import zepben.ewb.services.network.translator.network_cim2proto  # noqa: F401
+# noinspection PyUnresolvedReferences
+import zepben.ewb.services.network.translator.network_proto2cim  # noqa: F401
+
+_MAGIC = b"EWBSNAP\0"
+
+# The header is the magic bytes, the snapshot format version, the database schema version and the key of the source database.
+_HEADER = struct.Struct(f"<{len(_MAGIC)}sHI32s")
+
+# Each record is prefixed with its kind and its length.
+_RECORD = struct.Struct("<BI")
+_DATA_SOURCE = 0
+_NAME_TYPE = 1
+_IDENTIFIABLE = 2
+
+# The name of the `NetworkIdentifiable` field used to wrap each protobuf message type.
+_wrapper_field_by_type: Dict[str, str] = {it.message_type.name: it.name for it in PBNetworkIdentifiable.DESCRIPTOR.fields}
+
+
+class NetworkSnapshot:
+    """
+    A binary snapshot of a post-processed `NetworkService`, which can be restored much faster than reading the network database it was loaded from and
+    re-running the feeder assignment, feeder direction and phasing.
+
+    Each object is stored as its protobuf message, so the snapshot includes everything sent by the network consumer, such as the traced phases and feeder
+    directions of each terminal and the normal and current containers of each equipment, along with the name types and the `MetadataCollection`.
+
+    The snapshot is keyed to the contents of the database it was loaded from, so it will not be restored if the database has changed since it was written,
+    or if it was written with a different snapshot format or database version.
+
+    :param snapshot_file: The filename of the snapshot.
+    """
+
+    FORMAT_VERSION: int = 1
+    """
+    The version of the snapshot format. Snapshots written with any other version will not be restored.
+    """
+
+    def __init__(self, snapshot_file: Union[str, Path]):
+        self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
+        self.snapshot_file: Path = Path(snapshot_file)
+        self._database_version: int = TableVersion.SUPPORTED_VERSION
+
+    @staticmethod
+    def source_key(database_file: Union[str, Path]) -> bytes:
+        """
+        Get the key of a database used to check if a snapshot was written for it.
+
+        :param database_file: The filename of the database.
+        :return: The SHA-256 digest of the contents of the database.
+        """
+        digest = hashlib.sha256()
+        with open(database_file, "rb") as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+        return digest.digest()
+
+    def write(self, service: NetworkService, database_file: Union[str, Path]):
+        """
+        Write a snapshot of the `service`. The snapshot is written to a temporary file which replaces any existing snapshot once it is complete, so a
+        partially written snapshot will never be restored.
+
+        :param service: The `NetworkService` to write, which should have already been post-processed.
+        :param database_file: The filename of the database the `service` was loaded from.
+        """
+        records = []
+
+        def add_record(kind: int, data: bytes):
+            records.append(_RECORD.pack(kind, len(data)))
+            records.append(data)
+
+        for data_source in service.metadata.data_sources:
+            add_record(_DATA_SOURCE, data_source_to_pb(data_source).SerializeToString())
+
+        for name_type in service.name_types:
+            add_record(_NAME_TYPE, name_type.to_pb().SerializeToString())
+
+        for it in service.objects():
+            pb = it.to_pb()
+            field = _wrapper_field_by_type.get(type(pb).DESCRIPTOR.name)
+            if field is None:
+                raise TypeError(f"Unable to snapshot {it}: {type(it).__name__} is not supported by the network snapshot.")
+
+            wrapper = PBNetworkIdentifiable()
+            getattr(wrapper, field).CopyFrom(pb)
+            add_record(_IDENTIFIABLE, wrapper.SerializeToString())
+
+        temp_file = self.snapshot_file.with_name(f"{self.snapshot_file.name}.tmp")
+        with open(temp_file, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.FORMAT_VERSION, self._database_version, self.source_key(database_file)))
+            f.writelines(records)
+        os.replace(temp_file, self.snapshot_file)
+
+        self._logger.info(f"Wrote snapshot of {len(records) // 2} records to {self.snapshot_file}.")
+
+    def load(self, service: NetworkService, database_file: Union[str, Path]) -> bool:
+        """
+        Restore the snapshot into the `service` if it was written for the current contents of the database.
+
+        The snapshot is fully decoded and restored into a scratch service before any objects are added, so the `service` is only modified if the snapshot
+        is restored.
+
+        :param service: The `NetworkService` to populate, which should be empty.
+        :param database_file: The filename of the database the snapshot should have been written for.
+        :return: `True` if the snapshot was restored, otherwise `False` if it was missing, or written for another version or database.
+        :raises ValueError: If the snapshot is corrupt, has unresolved references, or contains objects that are already in the `service`.
+        """
+        if not self.snapshot_file.is_file():
+            self._logger.info(f"No snapshot found at {self.snapshot_file}.")
+            return False
+
+        with open(self.snapshot_file, "rb") as f:
+            data = memoryview(f.read())
+
+        if len(data) < _HEADER.size:
+            self._logger.warning(f"Ignoring snapshot {self.snapshot_file}: The file is too short to be a snapshot.")
+            return False
+
+        magic, format_version, database_version, key = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            self._logger.warning(f"Ignoring snapshot {self.snapshot_file}: The file is not a network snapshot.")
+            return False
+        elif (format_version != self.FORMAT_VERSION) or (database_version != self._database_version):
+            self._logger.warning(
+                f"Ignoring snapshot {self.snapshot_file}: Found format v{format_version} for database v{database_version}, "
+                f"expected format v{self.FORMAT_VERSION} for database v{self._database_version}."
+            )
+            return False
+        elif key != self.source_key(database_file):
+            self._logger.warning(f"Ignoring snapshot {self.snapshot_file}: The database {database_file} has changed since it was written.")
+            return False
+
+        data_sources, name_types, identifiables = self._decode(data, _HEADER.size)
+        data_sources = [data_source_from_pb(it) for it in data_sources]
+
+        # The objects are restored into a scratch service, so the `service` is only modified once the snapshot has been fully restored and validated.
+        restored = NetworkService()
+        for it in name_types:
+            it.to_cim(restored)
+        restored.add_all_from_pb(identifiables)
+
+        for it in restored.unresolved_references():
+            raise ValueError(f"Unresolved references found in snapshot {self.snapshot_file}. Failing reference was from {it.from_ref} resolving "
+                             f"{it.resolver.to_class.__name__} {it.to_mrid}")
+
+        for it in restored.objects():
+            if it.mrid in service:
+                raise ValueError(f"Unable to restore snapshot {self.snapshot_file}: {it} is already in the service.")
+        existing_name_types = {it.name for it in service.name_types}
+        for it in restored.name_types:
+            if it.name in existing_name_types:
+                raise ValueError(f"Unable to restore snapshot {self.snapshot_file}: The name type {it.name} is already in the service.")
+
+        for it in data_sources:
+            service.metadata.add(it)
+        for it in restored.name_types:
+            service.add_name_type(it)
+        for it in restored.objects():
+            service.add(it)
+
+        self._logger.info(f"Restored snapshot of {len(identifiables)} objects from {self.snapshot_file}.")
+        return True
+
+    def _decode(self, data: memoryview, offset: int) -> Tuple[List[PBDataSource], List[PBNameType], List]:
+        data_sources = []
+        name_types = []
+        identifiables = []
+
+        end = len(data)
+        while offset < end:
+            if offset + _RECORD.size > end:
+                raise ValueError(f"Snapshot {self.snapshot_file} is truncated.")
+            kind, length = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size + length
+            if offset > end:
+                raise ValueError(f"Snapshot {self.snapshot_file} is truncated.")
+            record = data[offset - length:offset]
+
+            if kind == _IDENTIFIABLE:
+                wrapper = PBNetworkIdentifiable.FromString(record)
+                identifiables.append(getattr(wrapper, wrapper.WhichOneof("identifiable")))
+            elif kind == _NAME_TYPE:
+                name_types.append(PBNameType.FromString(record))
+            elif kind == _DATA_SOURCE:
+                data_sources.append(PBDataSource.FromString(record))
+            else:
+                raise ValueError(f"Snapshot {self.snapshot_file} contains an unknown record kind {kind}.")
+
+        return data_sources, name_types, identifiables
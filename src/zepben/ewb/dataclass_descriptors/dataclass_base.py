@@ -3,14 +3,38 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from dataclasses import dataclass, fields, MISSING
+from typing import Any, Callable, Dict, Optional, Tuple
 
+_UNSET = object()
+
+_InitPlan = Tuple[Tuple[str, Any, Optional[Callable[[], Any]]], ...]
+_init_plans: Dict[type, _InitPlan] = {}
+"""
+The compiled init plan for each class that has been instantiated, as an ordered tuple of ``(name, default, default_factory)`` for each field that needs a
+default assigned. ``default`` is ``_UNSET`` for fields without a default that must be supplied at instantiation time.
+"""
+
+
+def _compile_init_plan(cls: type) -> _InitPlan:
+    # Currently post init implementation requires a lot of extra logic,
+    # which would mess with readability. If you require it - add it.
+    if callable(getattr(cls, "__post_init__", None)):
+        raise NotImplementedError("Current dataclass base does not support __post_init__ calls for redundancy reasons.")
+
+    plan = []
+    for f in fields(cls):
+        if f.default is not MISSING:
+            plan.append((f.name, f.default, None))
+        elif f.default_factory is not MISSING:
+            plan.append((f.name, _UNSET, f.default_factory))
+        # Ignore custom descriptors
+        elif not hasattr(f, '__get__'):
+            plan.append((f.name, _UNSET, None))
+
+    plan = tuple(plan)
+    _init_plans[cls] = plan
+    return plan
 
-def _is_set(obj: object, name: str) -> bool:
-    try:
-        object.__getattribute__(obj, name)
-    except AttributeError:
-        return False
-    return True
 
 @dataclass(slots=True)
 class DataclassBase:
@@ -21,6 +45,8 @@ class DataclassBase:
     allowing custom inits to not break the entire inheritance tree.
     It fills fields with default values, and treats kwargs the same way @dataclass does.
 
+    The fields of each class are only inspected the first time it is instantiated, with the resulting plan of defaults cached for all later instances.
+
     For more motivation, refer to `MANIFESTO.md`
     """
     def __init__(self, **kwargs) -> None:
@@ -29,34 +55,29 @@ class DataclassBase:
         for attr, value in kwargs.items():
             setattr(self, attr, value)
 
+        cls = type(self)
+        plan = _init_plans.get(cls)
+        if plan is None:
+            plan = _compile_init_plan(cls)
+
         # Manually assign defaults in dataclass fields
-        for f in fields(type(self)):
+        for name, default, default_factory in plan:
             # We cannot just check kwargs because fields could be set in subclass __init__'s
-            if _is_set(self, f.name):
+            if getattr(self, name, _UNSET) is not _UNSET:
                 continue
 
-            # Set field defaults
-            if f.default is not MISSING:
-                setattr(self, f.name, f.default)
-            elif f.default_factory is not MISSING:
-                setattr(self, f.name, f.default_factory())
-
-            # Ignore custom descriptors
-            elif hasattr(f, '__get__'):
-                continue
+            if default_factory is not None:
+                setattr(self, name, default_factory())
+            elif default is not _UNSET:
+                setattr(self, name, default)
 
             # Mimic default Python missing arg error
             else:
                 raise TypeError(
-                    f"Missing required field {f.name!r} "
-                    f"for {type(self).__name__}"
+                    f"Missing required field {name!r} "
+                    f"for {cls.__name__}"
                 )
 
-        # Currently post init implementation requires a lot of extra logic,
-        # which would mess with readability. If you require it - add it.
-        if callable(getattr(self, "__post_init__", None)):
-            raise NotImplementedError("Current dataclass base does not support __post_init__ calls for redundancy reasons.")
-
 
 # Alias for dataclass with params. Makes it easier to edit params for all of CIM at once.
 zb_dataclass = dataclass(init=False, eq=False, slots=True, repr=False)
@@ -17,9 +17,9 @@ import abc
 from collections import Counter
 from dataclasses import dataclass, field
 from functools import reduce
-from typing import Set, Tuple, FrozenSet, Dict, Callable, Union, TypeVar, Any, List, Generic, Optional, Iterable, TYPE_CHECKING
+from typing import Set, Tuple, FrozenSet, Dict, Callable, Union, TypeVar, Any, List, Generic, Optional, Iterable
 
-from zepben.ewb import EquivalentBranch, Traversal
+from zepben.ewb import EquivalentBranch
 from zepben.ewb.model.cim.iec61970.base.core.conducting_equipment import ConductingEquipment
 from zepben.ewb.model.cim.iec61970.base.core.terminal import Terminal
 from zepben.ewb.model.cim.iec61970.base.wires.ac_line_segment import AcLineSegment
@@ -32,10 +32,6 @@ from zepben.ewb.model.cim.iec61970.base.wires.power_transformer import PowerTran
 from zepben.ewb.model.cim.iec61970.base.wires.power_transformer_end import PowerTransformerEnd
 from zepben.ewb.model.cim.iec61970.base.wires.switch import Switch
 from zepben.ewb.services.network.network_service import NetworkService
-from zepben.ewb.services.network.tracing.busbranch_trace import BusBranchTrace, BusBranchTraceStep
-
-if TYPE_CHECKING:
-    from zepben.ewb import StepContext
 
 BBN = TypeVar('BBN')  # Bus-Branch Network
 TN = TypeVar('TN')  # Topological Node
@@ -500,46 +496,49 @@ async def _create_bus_branch_network(
 
     bus_branch_network = bus_branch_network_creator.bus_branch_network_creator(node_breaker_network)
 
+    # group every terminal into its topological node in a single pass, rather than tracing from each terminal as it is needed
+    terminal_groupings = _group_terminals_by_negligible_impedance(node_breaker_network.objects(Terminal), bus_branch_network_creator.has_negligible_impedance)
+
     terminals_to_tns = {}
     # create topological branches
     tbs_creation_success = await _create_topological_branches(node_breaker_network, bus_branch_network,
                                                               bus_branch_network_creator, result,
-                                                              terminals_to_tns, validator)
+                                                              terminals_to_tns, terminal_groupings, validator)
     if not tbs_creation_success:
         return result
 
     # create equivalent branches
     ebs_creation_success = await _create_equivalent_branches(node_breaker_network, bus_branch_network,
                                                              bus_branch_network_creator, result,
-                                                             terminals_to_tns, validator)
+                                                             terminals_to_tns, terminal_groupings, validator)
     if not ebs_creation_success:
         return result
 
     # create power transformers
     pt_creation_success = await _create_power_transformers(node_breaker_network, bus_branch_network,
                                                            bus_branch_network_creator, result,
-                                                           terminals_to_tns, validator)
+                                                           terminals_to_tns, terminal_groupings, validator)
     if not pt_creation_success:
         return result
 
     # create energy sources
     es_creation_success = await _create_energy_sources(node_breaker_network, bus_branch_network,
                                                        bus_branch_network_creator,
-                                                       result, terminals_to_tns, validator)
+                                                       result, terminals_to_tns, terminal_groupings, validator)
     if not es_creation_success:
         return result
 
     # create energy consumers
     ec_creation_success = await _create_energy_consumers(node_breaker_network, bus_branch_network,
                                                          bus_branch_network_creator,
-                                                         result, terminals_to_tns, validator)
+                                                         result, terminals_to_tns, terminal_groupings, validator)
     if not ec_creation_success:
         return result
 
     # create power electronics connections
     pec_creation_success = await _create_power_electronics_connections(node_breaker_network, bus_branch_network,
                                                                        bus_branch_network_creator,
-                                                                       result, terminals_to_tns, validator)
+                                                                       result, terminals_to_tns, terminal_groupings, validator)
     if not pec_creation_success:
         return result
 
@@ -551,6 +550,7 @@ async def _create_bus_branch_network(
 async def _get_or_create_topological_node(
     terminal: Terminal,
     terminals_to_tns: Dict[str, TN],
+    terminal_groupings: Dict[Terminal, TerminalGrouping[ConductingEquipment]],
     node_breaker_network: NetworkService,
     bus_branch_network: BBN,
     bus_branch_network_creator: BusBranchNetworkCreator[BBN, TN, TB, EB, PT, ES, EC, PEC, BNV],
@@ -562,8 +562,10 @@ async def _get_or_create_topological_node(
         return True, cached_tn
 
     # group terminals connected by negligible impedance equipment
-    terminals_grouping = await _group_negligible_impedance_terminals(terminal,
-                                                                     bus_branch_network_creator.has_negligible_impedance)
+    terminals_grouping = terminal_groupings.get(terminal)
+    if terminals_grouping is None:
+        # the terminal isn't in the network, so wasn't included when grouping the network terminals
+        terminals_grouping = _group_terminals_by_negligible_impedance([terminal], bus_branch_network_creator.has_negligible_impedance)[terminal]
     negligible_impedance_equipment = frozenset(terminals_grouping.conducting_equipment_group)
     inner_terms = frozenset(terminals_grouping.inner_terminals)
     border_terms = frozenset(terminals_grouping.border_terminals)
@@ -614,12 +616,14 @@ async def _create_topological_branches(
     bus_branch_network_creator: BusBranchNetworkCreator[BBN, TN, TB, EB, PT, ES, EC, PEC, BNV],
     result: BusBranchNetworkCreationResult[BBN, BNV],
     terminals_to_tns: Dict[str, TN],
+    terminal_groupings: Dict[Terminal, TerminalGrouping[ConductingEquipment]],
     validator: BNV
 ) -> bool:
     processed_acls_ids = set()
+    line_groupings = _group_ac_line_segments_by_common_impedance(node_breaker_network.objects(AcLineSegment))
     for acls in node_breaker_network.objects(AcLineSegment):
         if not (acls.mrid in processed_acls_ids or bus_branch_network_creator.has_negligible_impedance(acls)):
-            lines_grouping = await _group_common_ac_line_segment_terminals(acls)
+            lines_grouping = line_groupings[acls]
             border_terms = frozenset(lines_grouping.border_terminals)
             common_acls = frozenset(lines_grouping.conducting_equipment_group)
             inner_terms = frozenset(lines_grouping.inner_terminals)
@@ -627,7 +631,7 @@ async def _create_topological_branches(
             # get/create connected topological nodes
             acls_tns = []
             for t in _sort_terminals_by_feeder_direction(border_terms):
-                tn_creation_success, tn = await _get_or_create_topological_node(t, terminals_to_tns,
+                tn_creation_success, tn = await _get_or_create_topological_node(t, terminals_to_tns, terminal_groupings,
                                                                                 node_breaker_network,
                                                                                 bus_branch_network,
                                                                                 bus_branch_network_creator,
@@ -681,6 +685,7 @@ async def _create_equivalent_branches(
     bus_branch_network_creator: BusBranchNetworkCreator[BBN, TN, TB, EB, PT, ES, EC, PEC, BNV],
     result: BusBranchNetworkCreationResult[BBN, BNV],
     terminals_to_tns: Dict[str, TN],
+    terminal_groupings: Dict[Terminal, TerminalGrouping[ConductingEquipment]],
     validator: BNV
 ) -> bool:
     for eb in node_breaker_network.objects(EquivalentBranch):
@@ -691,7 +696,7 @@ async def _create_equivalent_branches(
         # get/create connected topological nodes
         eb_tns = []
         for t in _sort_terminals_by_feeder_direction(eb.terminals):
-            tn_creation_success, tn = await _get_or_create_topological_node(t, terminals_to_tns,
+            tn_creation_success, tn = await _get_or_create_topological_node(t, terminals_to_tns, terminal_groupings,
                                                                             node_breaker_network,
                                                                             bus_branch_network,
                                                                             bus_branch_network_creator,
@@ -722,6 +727,7 @@ async def _create_power_transformers(
     bus_branch_network_creator: BusBranchNetworkCreator[BBN, TN, TB, EB, PT, ES, EC, PEC, BNV],
     result: BusBranchNetworkCreationResult[BBN, BNV],
     terminals_to_tns: Dict[str, TN],
+    terminal_groupings: Dict[Terminal, TerminalGrouping[ConductingEquipment]],
     validator: BNV
 ) -> bool:
     for pt in node_breaker_network.objects(PowerTransformer):
@@ -729,7 +735,7 @@ async def _create_power_transformers(
         ends_to_topological_nodes = []
         for end in _sort_ends_by_feeder_direction(pt.ends):
             if end.terminal is not None:
-                tn_creation_success, tn = await _get_or_create_topological_node(end.terminal, terminals_to_tns,
+                tn_creation_success, tn = await _get_or_create_topological_node(end.terminal, terminals_to_tns, terminal_groupings,
                                                                                 node_breaker_network,
                                                                                 bus_branch_network,
                                                                                 bus_branch_network_creator, result,
@@ -762,11 +768,12 @@ async def _create_energy_sources(
     bus_branch_network_creator: BusBranchNetworkCreator[BBN, TN, TB, EB, PT, ES, EC, PEC, BNV],
     result: BusBranchNetworkCreationResult[BBN, BNV],
     terminals_to_tns: Dict[str, TN],
+    terminal_groupings: Dict[Terminal, TerminalGrouping[ConductingEquipment]],
     validator: BNV
 ) -> bool:
     for es in node_breaker_network.objects(EnergySource):
         es_terminal = next((t for t in es.terminals))
-        tn_creation_success, tn = await _get_or_create_topological_node(es_terminal, terminals_to_tns,
+        tn_creation_success, tn = await _get_or_create_topological_node(es_terminal, terminals_to_tns, terminal_groupings,
                                                                         node_breaker_network,
                                                                         bus_branch_network, bus_branch_network_creator,
                                                                         result, validator)
@@ -792,11 +799,12 @@ async def _create_energy_consumers(
     bus_branch_network_creator: BusBranchNetworkCreator[BBN, TN, TB, EB, PT, ES, EC, PEC, BNV],
     result: BusBranchNetworkCreationResult[BBN, BNV],
     terminals_to_tns: Dict[str, TN],
+    terminal_groupings: Dict[Terminal, TerminalGrouping[ConductingEquipment]],
     validator: BNV
 ):
     for ec in node_breaker_network.objects(EnergyConsumer):
         ec_terminal = next((t for t in ec.terminals))
-        tn_creation_success, tn = await _get_or_create_topological_node(ec_terminal, terminals_to_tns,
+        tn_creation_success, tn = await _get_or_create_topological_node(ec_terminal, terminals_to_tns, terminal_groupings,
                                                                         node_breaker_network,
                                                                         bus_branch_network, bus_branch_network_creator,
                                                                         result, validator)
@@ -823,11 +831,12 @@ async def _create_power_electronics_connections(
     bus_branch_network_creator: BusBranchNetworkCreator[BBN, TN, TB, EB, PT, ES, EC, PEC, BNV],
     result: BusBranchNetworkCreationResult[BBN, BNV],
     terminals_to_tns: Dict[str, TN],
+    terminal_groupings: Dict[Terminal, TerminalGrouping[ConductingEquipment]],
     validator: BNV
 ):
     for pec in node_breaker_network.objects(PowerElectronicsConnection):
         pec_terminal = next((t for t in pec.terminals))
-        tn_creation_success, tn = await _get_or_create_topological_node(pec_terminal, terminals_to_tns,
+        tn_creation_success, tn = await _get_or_create_topological_node(pec_terminal, terminals_to_tns, terminal_groupings,
                                                                         node_breaker_network,
                                                                         bus_branch_network, bus_branch_network_creator,
                                                                         result, validator)
@@ -903,140 +912,164 @@ def _validate_number_of_terminals(network: NetworkService):
             f"NetworkService contains the following PowerElectronicsConnections with an invalid number of terminals: {illegal_pec}")
 
 
-async def _group_negligible_impedance_terminals(
-    terminal: Terminal,
-    has_negligible_impedance: Callable[[ConductingEquipment], bool]
-) -> TerminalGrouping[ConductingEquipment]:
-    tg = TerminalGrouping[ConductingEquipment]()
+class _DisjointSet(Generic[D]):
+    """
+    A disjoint-set (union-find) of hashable items, used to group connected items in a single pass over their connections.
+    """
 
-    trace = (
-        BusBranchTrace(
-            queue_next=Traversal.QueueNext(_queue_terminals_across_negligible_impedance(has_negligible_impedance))
-        ).add_start_item(terminal)
-        .add_step_action(_process_terminal(tg, has_negligible_impedance))
-    )
+    def __init__(self):
+        self._parent: Dict[D, D] = {}
+        self._size: Dict[D, int] = {}
 
-    await trace.run()
-    return tg
+    def add(self, item: D) -> bool:
+        """
+        Add an item to the set in a group of its own.
 
+        :return: `True` if the item was added, or `False` if it was already in the set.
+        """
+        if item in self._parent:
+            return False
 
-def _create_traversal_step_object(next_item: Union[Terminal, AcLineSegment]) -> BusBranchTraceStep:
-    return BusBranchTraceStep(next_item)
+        self._parent[item] = item
+        self._size[item] = 1
+        return True
 
+    def find(self, item: D) -> D:
+        """
+        :return: The item that represents the group containing `item`.
+        """
+        parent = self._parent
+        while parent[item] is not item:
+            # Path halving, which keeps the trees flat without needing recursion.
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: D, b: D):
+        """
+        Merge the groups containing `a` and `b`.
+        """
+        a = self.find(a)
+        b = self.find(b)
+        if a is b:
+            return
 
-def _process_terminal(
-    tg: TerminalGrouping[ConductingEquipment],
-    has_negligible_impedance: Callable[[ConductingEquipment], bool]
-):
-    async def add_to_group(item: BusBranchTraceStep, _):
-        t = item.identified_object
-        if has_negligible_impedance(t.conducting_equipment):
-            tg.conducting_equipment_group.add(t.conducting_equipment)
-            tg.inner_terminals.add(t)
-        else:
-            tg.border_terminals.add(t)
+        if self._size[a] < self._size[b]:
+            a, b = b, a
+        self._parent[b] = a
+        self._size[a] += self._size.pop(b)
 
-    return add_to_group
+    def groups(self) -> Dict[D, List[D]]:
+        """
+        :return: The items in each group, keyed by the item that represents the group.
+        """
+        groups = {}
+        for item in self._parent:
+            groups.setdefault(self.find(item), []).append(item)
+        return groups
 
 
-def _queue_terminals_across_negligible_impedance(
+def _group_terminals_by_negligible_impedance(
+    terminals: Iterable[Terminal],
     has_negligible_impedance: Callable[[ConductingEquipment], bool]
-):
-    def queue_next(item: BusBranchTraceStep, context: StepContext, _queue_next: Callable[[BusBranchTraceStep], bool]):
-        terminal = item.identified_object
-        if terminal.connectivity_node is not None:
-            for ot in terminal.connectivity_node.terminals:
-                if ot != terminal:
-                    _queue_next(_create_traversal_step_object(ot))
-
-        if has_negligible_impedance(terminal.conducting_equipment):
-            for ot in terminal.conducting_equipment.terminals:
-                if ot != terminal:
-                    _queue_next(_create_traversal_step_object(ot))
-
-    return queue_next
-
-
-async def _group_common_ac_line_segment_terminals(acls: AcLineSegment) -> TerminalGrouping[AcLineSegment]:
-    def has_common_impedance(line: AcLineSegment):
-        return line.per_length_sequence_impedance.mrid == acls.per_length_sequence_impedance.mrid
-
-    common_acls: TerminalGrouping[AcLineSegment] = TerminalGrouping()
-    connectivity_node_counter = Counter()
-
-    trace = (
-        BusBranchTrace(
-            queue_next=Traversal.QueueNext(_queue_common_impedance_lines(common_acls, has_common_impedance))
-        ).add_start_item(acls)
-        .add_step_action(_process_acls(common_acls, connectivity_node_counter))
-    )
-
-    await trace.run()
+) -> Dict[Terminal, TerminalGrouping[ConductingEquipment]]:
+    """
+    Group terminals that are connected via connectivity nodes or negligible impedance equipment, starting from `terminals` and including any terminals
+    connected to them. Terminals without any conducting equipment are always border terminals, and are never passed to `has_negligible_impedance`.
 
-    for t in (t for line in common_acls.conducting_equipment_group for t in line.terminals):
-        if t.connectivity_node is None:
-            common_acls.border_terminals.add(t)
-            continue
+    :return: The grouping for each terminal. Terminals in the same group share the same `TerminalGrouping`.
+    """
+    sets = _DisjointSet[Terminal]()
+    negligible: Dict[ConductingEquipment, bool] = {}
+    seen_nodes = set()
+    pending = [t for t in terminals if sets.add(t)]
 
-        count = connectivity_node_counter.get(t.connectivity_node, 0)
-        if count == 1:
-            common_acls.border_terminals.add(t)
-        else:
-            common_acls.inner_terminals.add(t)
+    def union_all(t: Terminal, others: Iterable[Terminal]):
+        for ot in others:
+            if sets.add(ot):
+                pending.append(ot)
+            sets.union(t, ot)
 
-    return common_acls
+    while pending:
+        t = pending.pop()
 
+        cn = t.connectivity_node
+        if (cn is not None) and (cn not in seen_nodes):
+            seen_nodes.add(cn)
+            union_all(t, cn.terminals)
 
-def _process_acls(
-    common_acls: TerminalGrouping[AcLineSegment],
-    connectivity_node_counter: Counter
-):
-    async def add_to_group(item: BusBranchTraceStep, _):
-        acls = item.identified_object
-        if acls in common_acls.conducting_equipment_group:
-            return
-
-        common_acls.conducting_equipment_group.add(acls)
-        connectivity_node_counter.update(
-            (t.connectivity_node for t in acls.terminals if t.connectivity_node is not None))
+        ce = t.conducting_equipment
+        if (ce is not None) and (ce not in negligible):
+            negligible[ce] = has_negligible_impedance(ce)
+            if negligible[ce]:
+                union_all(t, ce.terminals)
+
+    groupings = {}
+    for group in sets.groups().values():
+        tg = TerminalGrouping[ConductingEquipment]()
+        for t in group:
+            if (t.conducting_equipment is not None) and negligible[t.conducting_equipment]:
+                tg.conducting_equipment_group.add(t.conducting_equipment)
+                tg.inner_terminals.add(t)
+            else:
+                tg.border_terminals.add(t)
+            groupings[t] = tg
 
-    return add_to_group
+    return groupings
 
 
-def _queue_common_impedance_lines(
-    common_acls: TerminalGrouping[AcLineSegment],
-    has_common_impedance: Callable[[AcLineSegment], bool]
-):
-    def queue_next(item: BusBranchTraceStep, context: StepContext, _queue_next: Callable[[BusBranchTraceStep], bool]):
-        acls = item.identified_object
+def _group_ac_line_segments_by_common_impedance(lines: Iterable[AcLineSegment]) -> Dict[AcLineSegment, TerminalGrouping[AcLineSegment]]:
+    """
+    Group lines that are joined end to end without any forks and have the same per length sequence impedance, starting from `lines` and including any
+    lines connected to them.
 
-        for it in _next_common_acls(acls, has_common_impedance, common_acls):
-            _queue_next(_create_traversal_step_object(it))
+    :return: The grouping for each line. Lines in the same group share the same `TerminalGrouping`.
+    """
+    sets = _DisjointSet[AcLineSegment]()
+    pending = [line for line in lines if sets.add(line)]
+
+    while pending:
+        acls = pending.pop()
+        for t in acls.terminals:
+            cn = t.connectivity_node
+            if (cn is None) or (cn.num_terminals() != 2):
+                continue
+
+            for o in cn.terminals:
+                other = o.conducting_equipment
+                if (other is not acls) \
+                    and isinstance(other, AcLineSegment) \
+                    and other.per_length_sequence_impedance.mrid == acls.per_length_sequence_impedance.mrid:
+                    if sets.add(other):
+                        pending.append(other)
+                    sets.union(acls, other)
+
+    groupings = {}
+    for group in sets.groups().values():
+        common_acls: TerminalGrouping[AcLineSegment] = TerminalGrouping(conducting_equipment_group=set(group))
+        connectivity_node_counter = Counter(t.connectivity_node for line in group for t in line.terminals if t.connectivity_node is not None)
+
+        for t in (t for line in group for t in line.terminals):
+            if (t.connectivity_node is None) or (connectivity_node_counter[t.connectivity_node] == 1):
+                common_acls.border_terminals.add(t)
+            else:
+                common_acls.inner_terminals.add(t)
 
-    return queue_next
+        for line in group:
+            groupings[line] = common_acls
 
+    return groupings
 
-def _next_common_acls(
-    acls: AcLineSegment,
-    has_common_impedance: Callable[[AcLineSegment], bool],
-    common_acls: TerminalGrouping[AcLineSegment]
-) -> Set[AcLineSegment]:
-    acls_terminals = {*acls.terminals}
 
-    def can_process_ac_line(o: Terminal) -> bool:
-        return o not in acls_terminals \
-            and isinstance(o.conducting_equipment, AcLineSegment) \
-            and has_common_impedance(o.conducting_equipment) \
-            and o.conducting_equipment not in common_acls.conducting_equipment_group
+async def _group_negligible_impedance_terminals(
+    terminal: Terminal,
+    has_negligible_impedance: Callable[[ConductingEquipment], bool]
+) -> TerminalGrouping[ConductingEquipment]:
+    return _group_terminals_by_negligible_impedance([terminal], has_negligible_impedance)[terminal]
 
-    def is_non_forking_ac_line(t: Terminal) -> bool:
-        return t.connectivity_node is not None and len(list(t.connectivity_node.terminals)) == 2
 
-    return {
-        o.conducting_equipment
-        for t in acls.terminals if is_non_forking_ac_line(t)
-        for o in t.connectivity_node.terminals if can_process_ac_line(o)
-    }
+async def _group_common_ac_line_segment_terminals(acls: AcLineSegment) -> TerminalGrouping[AcLineSegment]:
+    return _group_ac_line_segments_by_common_impedance([acls])[acls]
 
 
 def _is_no_impedance_branch(eb: EquivalentBranch):
@@ -6,7 +6,9 @@
 __all__ = ["Identifiable", "TIdentifiable"]
 
 from abc import ABCMeta
-from typing import TypeVar, overload, Callable, Any
+from functools import wraps
+from types import FunctionType
+from typing import TypeVar, overload, Callable, Any, Optional
 
 from zepben.ewb import require
 from zepben.ewb.dataclass_descriptors.dataclass_base import DataclassBase, zb_dataclass
@@ -15,6 +17,8 @@ TIdentifiable = TypeVar('TIdentifiable')
 
 T = TypeVar('T')
 
+_MUTATOR_PREFIXES = ("add_", "remove_", "clear_", "insert_", "set_")
+
 
 @zb_dataclass
 class Identifiable(DataclassBase, metaclass=ABCMeta):
@@ -25,6 +29,18 @@ class Identifiable(DataclassBase, metaclass=ABCMeta):
     """
     mrid: str
 
+    _content_cache: Optional[tuple] = None
+    """The fingerprint of this object, if it has been cached. See `zepben.ewb.services.common.content_fingerprint.fingerprint`."""
+
+    def __init_subclass__(cls, **kwargs):
+        super(Identifiable, cls).__init_subclass__(**kwargs)
+
+        # Collections are modified in place by the mutator methods, so they need to clear the cached content rather than relying on it being validated
+        # against the values of the fields.
+        for name, value in list(cls.__dict__.items()):
+            if name.startswith(_MUTATOR_PREFIXES) and isinstance(value, FunctionType) and not hasattr(value, "_clears_content_cache"):
+                setattr(cls, name, _clears_content_cache(value))
+
     def __init__(self, mrid: str, *args, **kwargs):
         self.mrid = mrid
         if mrid in kwargs:
@@ -49,6 +65,22 @@ class Identifiable(DataclassBase, metaclass=ABCMeta):
     def __eq__(self, other):
         return self is other
 
+    def to_pb(self):
+        """
+        Convert this object to its protobuf message.
+
+        The translators replace this with the conversion for each class when they are loaded, so this loads them and converts the object with the
+        conversion for its class.
+
+        :raises AttributeError: If there is no conversion for the class of this object.
+        """
+        # NOTE: import exists here so the translators are only loaded when needed.
+        from zepben.ewb.services.common.translator import _load_translators
+        _load_translators()
+        if type(self).to_pb is _to_pb_before_translators_loaded:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute 'to_pb'")
+        return self.to_pb()
+
     @overload
     def _validate_reference(self, other: 'Identifiable', getter: Callable[[str], 'Identifiable | None'], type_description: str) -> bool: ...
 
@@ -101,3 +133,16 @@ class Identifiable(DataclassBase, metaclass=ABCMeta):
             return True
         except IndexError:
             return False
+
+
+_to_pb_before_translators_loaded = Identifiable.to_pb
+
+
+def _clears_content_cache(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._content_cache = None
+        return func(self, *args, **kwargs)
+
+    wrapper._clears_content_cache = True
+    return wrapper
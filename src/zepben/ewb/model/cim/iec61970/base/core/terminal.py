@@ -19,12 +19,16 @@ from zepben.ewb.model.cim.iec61970.base.core.phase_code import PhaseCode
 from zepben.ewb.model.cim.iec61970.base.wires.busbar_section import BusbarSection
 from zepben.ewb.services.network.tracing.feeder.feeder_direction import FeederDirection
 from zepben.ewb.services.network.tracing.phases.phase_status import PhaseStatus
+from zepben.ewb.services.network.tracing.terminal_state_store import terminal_state_store, NORMAL, CURRENT
 from zepben.ewb.dataclass_descriptors.dataclass_base import zb_dataclass
 
 if TYPE_CHECKING:
     from zepben.ewb.model.cim.iec61970.base.core.conducting_equipment import ConductingEquipment
     from zepben.ewb.model.cim.iec61970.base.core.connectivity_node import ConnectivityNode
 
+_directions = tuple(FeederDirection)
+"""Each `FeederDirection` indexed by its value."""
+
 
 @zb_dataclass
 class Terminal(AcDcTerminal):
@@ -43,28 +47,20 @@ class Terminal(AcDcTerminal):
     """The orientation of the terminal connections for a multiple terminal conducting equipment. The sequence numbering starts with 1 and additional
     terminals should follow in increasing order. The first terminal is the "starting point" for a two terminal branch."""
 
-    normal_feeder_direction: FeederDirection = FeederDirection.NONE
-    """ Stores the direction of the feeder head relative to this [Terminal] in the normal state of the network.
-    """
-
-    current_feeder_direction: FeederDirection = FeederDirection.NONE
-    """ Stores the direction of the feeder head relative to this [Terminal] in the current state of the network.
-    """
-
     _cn: Optional[ReferenceType] = None
     """This is a weak reference to the connectivity node so if a Network object goes out of scope, holding a single conducting equipment
     reference does not cause everything connected to it in the network to stay in memory."""
 
-    _normal_phases: PhaseStatus = None
-    _current_phases: PhaseStatus = None
+    _state_index: Optional[int] = None
+    """The slot in the `TerminalStateStore` holding the traced phases and feeder directions of this terminal, or `None` if it has never been traced."""
+
+    _trace_index: Optional[int] = None
+    """A compact integer index for this terminal, assigned the first time it is tracked by a network trace, which allows traces to track visited
+    terminals without hashing their mRID."""
 
     def __init__(self, *args, conducting_equipment: ConductingEquipment = None, connectivity_node: ConnectivityNode = None, **kwargs):
         super(Terminal, self).__init__(*args, **kwargs)
 
-        self._normal_phases = PhaseStatus(self)
-
-        self._current_phases = PhaseStatus(self)
-
         if conducting_equipment:
             self.conducting_equipment = conducting_equipment
 
@@ -74,15 +70,71 @@ class Terminal(AcDcTerminal):
         else:
             self.connectivity_node = self._cn
 
+    def __del__(self):
+        # The slot won't have been initialised if the constructor failed.
+        index = getattr(self, "_state_index", None)
+        if index is not None:
+            terminal_state_store.release(index)
+
+    def __getstate__(self):
+        # The slot in the `TerminalStateStore` belongs to this terminal, so copies (including unpickled terminals) are given the traced state to store in
+        # their own slot. They are also given their own trace index, as they are tracked separately by network traces.
+        state, slots = super(Terminal, self).__getstate__()
+        index = slots["_state_index"]
+        slots["_state_index"] = None if index is None else terminal_state_store.state_of(index)
+        slots["_trace_index"] = None
+        return state, slots
+
+    def __setstate__(self, state):
+        _, slots = state
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+
+        traced_state = slots["_state_index"]
+        if traced_state is not None:
+            self._state_index = terminal_state_store.allocate(traced_state)
+
     @property
     def normal_phases(self) -> PhaseStatus:
         """The status of phases as traced for the normal state of the network."""
-        return self._normal_phases
+        return PhaseStatus(self, NORMAL)
 
     @property
     def current_phases(self) -> PhaseStatus:
-        """The status of phases as traced for the current state of the network.gi"""
-        return self._current_phases
+        """The status of phases as traced for the current state of the network."""
+        return PhaseStatus(self, CURRENT)
+
+    @property
+    def normal_feeder_direction(self) -> FeederDirection:
+        """Stores the direction of the feeder head relative to this [Terminal] in the normal state of the network."""
+        return self._get_direction(NORMAL)
+
+    @normal_feeder_direction.setter
+    def normal_feeder_direction(self, direction: FeederDirection):
+        self._set_direction(NORMAL, direction)
+
+    @property
+    def current_feeder_direction(self) -> FeederDirection:
+        """Stores the direction of the feeder head relative to this [Terminal] in the current state of the network."""
+        return self._get_direction(CURRENT)
+
+    @current_feeder_direction.setter
+    def current_feeder_direction(self, direction: FeederDirection):
+        self._set_direction(CURRENT, direction)
+
+    def _get_direction(self, state: int) -> FeederDirection:
+        if self._state_index is None:
+            return FeederDirection.NONE
+        return _directions[terminal_state_store.directions[state][self._state_index]]
+
+    def _set_direction(self, state: int, direction: FeederDirection):
+        # The directions can be set via the constructor before the slot has been initialised.
+        index = getattr(self, "_state_index", None)
+        if index is None:
+            if direction is FeederDirection.NONE:
+                return
+            index = self._state_index = terminal_state_store.allocate()
+        terminal_state_store.directions[state][index] = direction.value
 
     @property
     def conducting_equipment(self):
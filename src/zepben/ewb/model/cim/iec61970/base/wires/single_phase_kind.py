@@ -6,16 +6,12 @@
 __all__ = ["SinglePhaseKind", "single_phase_kind_by_id", "SINGLE_PHASE_KIND_VALUES"]
 
 from enum import Enum
-from typing import Union
+from typing import Union, TYPE_CHECKING
 
 from zepben.ewb import unique
 
-
-#
-# NOTE: The following import is actually at the bottom of this file to avoid cyclic imports.
-#
-# from zepben.ewb.model.cim.iec61970.base.core.phase_code import phase_code_from_single_phases, PhaseCode
-#
+if TYPE_CHECKING:
+    from zepben.ewb.model.cim.iec61970.base.core.phase_code import PhaseCode
 
 def single_phase_kind_by_id(value):
     """
@@ -83,6 +79,9 @@ class SinglePhaseKind(Enum):
         return self.id < other.id
 
     def __add__(self, other: Union['SinglePhaseKind', 'PhaseCode']) -> 'PhaseCode':
+        # NOTE: import exists here to avoid cyclic imports, as `PhaseCode` is defined in terms of `SinglePhaseKind`.
+        from zepben.ewb.model.cim.iec61970.base.core.phase_code import phase_code_from_single_phases, PhaseCode
+
         if isinstance(other, SinglePhaseKind):
             return phase_code_from_single_phases({self, other})
         elif isinstance(other, PhaseCode):
@@ -91,6 +90,9 @@ class SinglePhaseKind(Enum):
             return PhaseCode.NONE
 
     def __sub__(self, other: Union['SinglePhaseKind', 'PhaseCode']) -> 'PhaseCode':
+        # NOTE: import exists here to avoid cyclic imports, as `PhaseCode` is defined in terms of `SinglePhaseKind`.
+        from zepben.ewb.model.cim.iec61970.base.core.phase_code import phase_code_from_single_phases, PhaseCode
+
         if isinstance(other, SinglePhaseKind):
             return phase_code_from_single_phases({} if (self == other) else {self})
         elif isinstance(other, PhaseCode):
@@ -100,8 +102,3 @@ class SinglePhaseKind(Enum):
 
 
 SINGLE_PHASE_KIND_VALUES = list(SinglePhaseKind.__members__.values())
-
-#
-# NOTE: The following import is deliberately at the bottom of this file to avoid cyclic imports.
-#
-from zepben.ewb.model.cim.iec61970.base.core.phase_code import phase_code_from_single_phases, PhaseCode  # noqa: E402
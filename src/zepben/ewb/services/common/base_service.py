@@ -9,13 +9,16 @@ __all__ = ["BaseService", "TBaseService"]
 
 from abc import ABC
 from collections import OrderedDict
-from typing import Dict, Generator, Callable, Optional, List, Union, Sized, Set, TypeVar, overload
+from contextlib import contextmanager
+from typing import Dict, Generator, Callable, Optional, List, Union, Sized, TypeVar, overload, Iterable, Tuple
 from typing import Type
 
 from zepben.ewb.model.cim.iec61970.base.core.identifiable import Identifiable, TIdentifiable
 from zepben.ewb.model.cim.iec61970.base.core.name_type import NameType
 from zepben.ewb.services.common.meta.metadata_collection import MetadataCollection
-from zepben.ewb.services.common.reference_resolvers import BoundReferenceResolver, UnresolvedReference
+from zepben.ewb.services.common.translator import _load_translators
+from zepben.ewb.services.common.pending_references import PendingReferences
+from zepben.ewb.services.common.reference_resolvers import BoundReferenceResolver, UnresolvedReference, ReferenceResolver
 
 _GET_DEFAULT = (1,)
 
@@ -29,49 +32,53 @@ class BaseService(ABC):
     ):
         super().__init__()
 
+        # A service is needed to convert protobuf messages with `to_cim` or `add_from_pb`, so the translators are loaded by the first service created.
+        _load_translators()
+
         self.name: str = name
         self.metadata: MetadataCollection = metadata or MetadataCollection()
 
         self._objects_by_type: Dict[type, Dict[str, Identifiable]] = OrderedDict()
+        self._objects_by_mrid: Dict[str, Identifiable] = dict()
+        """
+        An index of every object in the service by its mRID, kept in sync with `_objects_by_type`. As mRIDs are unique across all types in the service, this
+        allows lookups that don't know (or care about) the concrete type of the object to be a single dictionary access rather than a search of every type map.
+        """
+        self._concrete_types_by_type: Dict[type, List[type]] = dict()
+        """
+        A cache of the concrete types stored in `_objects_by_type` that are a subclass of the requested (typically abstract) type. This is cleared whenever a new
+        concrete type is first added to the service, which happens very rarely in comparison to the lookups.
+        """
+        self._counts_by_type: Dict[type, int] = dict()
+        """
+        The number of objects in the service that are an instance of each type, including every base class of the concrete types.
+        """
         self._name_types: Dict[str, NameType] = dict()
-        self._unresolved_references_to: Dict[str, Set[UnresolvedReference]] = OrderedDict()
-        """
-        A dictionary of references between mRID's that as yet have not been resolved - typically when transferring services between systems.
-        The key is the to_mrid of the `UnresolvedReference`s, and the value is a list of `UnresolvedReference`s for that specific object.
-        For example, if an AcLineSegment with mRID 'acls1' is present in the service, but the service is missing its `location` with mRID 'location-l1' 
-        and `per_length_sequence_impedance` with mRID 'plsi-1', the following key value pairs would be present:
-    
-        {
-            "plsi-1": [
-                UnresolvedReference(from_ref=AcLineSegment('acls1'),
-                                    to_mrid='plsi-1',
-                                     resolver=ReferenceResolver(from_class=AcLineSegment, to_class=PerLengthSequenceImpedance, resolve=...), ...)
-            ],
-            "location-l1": [
-                UnresolvedReference(from_ref=AcLineSegment('acls1'),
-                                    to_mrid='location-l1',
-                                    resolver=ReferenceResolver(from_class=AcLineSegment, to_class=Location, resolve=...), ...)
-            ]
-        }
-        
-        `resolve` in `ReferenceResolver` will be the function used to populate the relationship between the `Identifiable`s either when 
+        self._unresolved_references: PendingReferences = PendingReferences()
+        """
+        The references between mRID's that as yet have not been resolved - typically when transferring services between systems, indexed by both the mRID
+        being referenced and the mRID of the object holding the reference. For example, if an AcLineSegment with mRID 'acls1' is present in the service, but
+        the service is missing its `location` with mRID 'location-l1' and `per_length_sequence_impedance` with mRID 'plsi-1', the following references would
+        be present:
+
+            UnresolvedReference(from_ref=AcLineSegment('acls1'),
+                                to_mrid='plsi-1',
+                                resolver=ReferenceResolver(from_class=AcLineSegment, to_class=PerLengthSequenceImpedance, resolve=...), ...)
+            UnresolvedReference(from_ref=AcLineSegment('acls1'),
+                                to_mrid='location-l1',
+                                resolver=ReferenceResolver(from_class=AcLineSegment, to_class=Location, resolve=...), ...)
+
+        `resolve` in `ReferenceResolver` will be the function used to populate the relationship between the `Identifiable`s either when
         `resolve_or_defer_reference() is called if the other side of the reference exists in the service, or otherwise when the second object is added to the service.
         """
 
-        self._unresolved_references_from: Dict[str, Set[UnresolvedReference]] = OrderedDict()
-        """ 
-        An index of the unresolved references by their `from_ref.mrid`. For the above example this will be a dictionary of the form:
-    
-        {
-            "acls1": [
-                UnresolvedReference(from_ref=AcLineSegment('acls1'),
-                                    to_mrid='location-l1',
-                                    resolver=ReferenceResolver(from_class=AcLineSegment, to_class=Location, resolve=...), ...),
-                UnresolvedReference(from_ref=AcLineSegment('acls1'),
-                                    to_mrid='plsi-1',
-                                    resolver=ReferenceResolver(from_class=AcLineSegment, to_class=PerLengthSequenceImpedance, resolve=...), ...)
-            ]
-        }
+        self._batch_references: Optional[List[Tuple[BoundReferenceResolver, str]]] = None
+        """
+        The references requested while linking references in a batch (see `batch_references`), which are resolved or deferred when the batch finishes.
+        """
+        self._batch_added: Optional[List[Identifiable]] = None
+        """
+        The objects added to the service while linking references in a batch, which resolve any references deferred before the batch when it finishes.
         """
 
     @overload
@@ -96,14 +103,9 @@ class BaseService(ABC):
         :returns: True if there is an object matching ``to_find``, False otherwise.
         """
         if isinstance(to_find, Identifiable):
-            matcher = lambda it: it.get(to_find.mrid) == to_find
+            return self._objects_by_mrid.get(to_find.mrid) == to_find
         else:
-            matcher = lambda it: to_find in it
-
-        for type_map in self._objects_by_type.values():
-            if matcher(type_map):
-                return True
-        return False
+            return to_find in self._objects_by_mrid
 
     def __str__(self):
         return f"{self.__class__.__name__}{f' {self.name}' if self.name else ''}"
@@ -115,7 +117,7 @@ class BaseService(ABC):
         :param mrid: The mRID to check for `UnresolvedReference`s. If None, will check if any unresolved references exist in the service.
         :returns: True if at least one reference exists.
         """
-        return len(self._unresolved_references_to) > 0 if mrid is None else mrid in self._unresolved_references_to
+        return len(self._unresolved_references) > 0 if mrid is None else self._unresolved_references.has_references_to(mrid)
 
     def len_of(self, t: type = None) -> int:
         """
@@ -124,19 +126,9 @@ class BaseService(ABC):
         :param t: The type of object to get the len of. If None (default), will get the len of all objects in the service.
         """
         if t is None:
-            return sum([len(vals) for vals in self._objects_by_type.values()])
+            return len(self._objects_by_mrid)
         else:
-            try:
-                return len(self._objects_by_type[t].values())
-            except KeyError:
-                count = 0
-                for c, obj_map in self._objects_by_type.items():
-                    if issubclass(c, t):
-                        try:
-                            count += len(self._objects_by_type[c].values())
-                        except KeyError:
-                            pass
-                return count
+            return self._counts_by_type.get(t, 0)
 
     def num_unresolved_references(self, mrid: str = None):
         """
@@ -146,20 +138,17 @@ class BaseService(ABC):
         :returns: The number of `UnresolvedReference`s.
         """
         if mrid is None:
-            return sum([len(r) for r in self._unresolved_references_to.copy().values()])
-        elif mrid in self._unresolved_references_to:
-            return len(self._unresolved_references_to[mrid])
+            return len(self._unresolved_references)
         else:
-            return 0
+            return self._unresolved_references.count_to(mrid)
 
     def unresolved_references(self) -> Generator[UnresolvedReference, None, None]:
         """
         Returns a generator over all the `UnresolvedReferences` that are known to this service. This should typically be avoided when resolving references in
         favour of `get_unresolved_reference_mrids_by_resolver()`, `get_unresolved_reference_mrids_from()`, and `get_unresolved_reference_mrids_to()`
         """
-        for unresolved_refs in self._unresolved_references_to.copy().values():
-            for ur in unresolved_refs:
-                yield ur
+        for ur in self._unresolved_references:
+            yield ur
 
     def get(self, mrid: str, type_: Type[TIdentifiable] = Identifiable, default=_GET_DEFAULT,
             generate_error: Callable[[str, str], str] = lambda mrid, typ: f"Failed to find {typ}[{mrid}]") -> TIdentifiable:
@@ -180,20 +169,12 @@ class BaseService(ABC):
             raise KeyError("You must specify an mRID to get. Empty/None is invalid.")
 
         # This can be written much simpler than below, but we want to avoid throwing any exceptions in this high frequency function
-        if type_ != Identifiable:
-            objs = self._objects_by_type.get(type_)
-            if objs:
-                obj = objs.get(mrid)
-                if obj:
-                    return obj
-
-        for c, objs in self._objects_by_type.items():
-            obj = objs.get(mrid)
-            if obj:
-                if isinstance(obj, type_):
-                    return obj
-                else:
-                    raise TypeError(f"Invalid type for {mrid}. Found {type(obj).__name__}, expected {type_.__name__}.")
+        obj = self._objects_by_mrid.get(mrid)
+        if obj is not None:
+            if type_ is Identifiable or isinstance(obj, type_):
+                return obj
+            else:
+                raise TypeError(f"Invalid type for {mrid}. Found {type(obj).__name__}, expected {type_.__name__}.")
 
         if default is _GET_DEFAULT:
             raise KeyError(generate_error(mrid, type_.__name__))
@@ -223,28 +204,23 @@ class BaseService(ABC):
             return False
         # TODO: Only allow supported types
 
-        objs = self._objects_by_type.get(identifiable.__class__, dict())
-        if mrid in objs:
-            return objs[mrid] is identifiable
-
-        # Check other types and make sure this mRID is unique
-        for obj_map in self._objects_by_type.values():
-            if mrid in obj_map:
-                return False
-
-        unresolved_refs = self._unresolved_references_to.get(mrid, None)
-        if unresolved_refs:
-            for ref in unresolved_refs:
-                ref.resolver.resolve(ref.from_ref, identifiable)
-                if ref.reverse_resolver:
-                    ref.reverse_resolver.resolve(identifiable, ref.from_ref)
-                self._unresolved_references_from[ref.from_ref.mrid].remove(ref)
-                if not self._unresolved_references_from[ref.from_ref.mrid]:
-                    del self._unresolved_references_from[ref.from_ref.mrid]
-            del self._unresolved_references_to[mrid]
+        # mRIDs must be unique across all types, so we only accept the add if this is the object already associated with the mRID.
+        existing = self._objects_by_mrid.get(mrid)
+        if existing is not None:
+            return existing is identifiable
 
+        if self._batch_added is not None:
+            self._batch_added.append(identifiable)
+        else:
+            self._resolve_deferred_references_to(identifiable)
+
+        objs = self._objects_by_type.get(identifiable.__class__)
+        if objs is None:
+            objs = self._objects_by_type[identifiable.__class__] = dict()
+            self._concrete_types_by_type.clear()
         objs[mrid] = identifiable
-        self._objects_by_type[identifiable.__class__] = objs
+        self._objects_by_mrid[mrid] = identifiable
+        self._update_counts(identifiable.__class__, 1)
         return True
 
     def resolve_or_defer_reference(self, bound_resolver: BoundReferenceResolver, to_mrid: str) -> bool:
@@ -254,16 +230,17 @@ class BaseService(ABC):
 
         If the ``to_mrid`` object has not yet been added to the service, the reference resolution will be deferred until the
         object with ``to_mrid`` is added to the service, which will then use the resolver from the ``bound_resolver`` at that
-        time to resolve the reference relationship.
+        time to resolve the reference relationship. Inside `batch_references`, the reference is instead queued to be linked when
+        the batch finishes.
 
 
         :param bound_resolver:
         :param to_mrid: The MRID of an object that is the subclass of the to_class of ``bound_resolver``.
-        :returns: true if the reference was resolved, otherwise false if it has been deferred.
+        :returns: true if the reference was resolved, otherwise false if it has been deferred or queued.
         """
         if not to_mrid:
             return True
-        to_mrid = to_mrid
+
         from_ = bound_resolver.from_obj
         resolver = bound_resolver.resolver
         reverse_resolver = bound_resolver.reverse_resolver
@@ -271,34 +248,105 @@ class BaseService(ABC):
             # If to_mrid is present in the service, we resolve any references immediately.
             # noinspection PyTypeChecker
             to = self.get(to_mrid, resolver.to_class)
-            resolver.resolve(from_, to)
-            if reverse_resolver:
-                reverse_resolver.resolve(to, from_)
-
-                # Clean up any reverse resolvers now that the reference has been resolved
-                if from_.mrid in self._unresolved_references_to:
-                    # noinspection PyArgumentList
-                    to_remove = UnresolvedReference(from_ref=to, to_mrid=from_.mrid, resolver=reverse_resolver)
-                    self._unresolved_references_to[from_.mrid].remove(to_remove)
-                    self._unresolved_references_from[to_remove.from_ref.mrid].remove(to_remove)
-                    if not self._unresolved_references_from[to_remove.from_ref.mrid]:
-                        del self._unresolved_references_from[to_remove.from_ref.mrid]
-                    if not self._unresolved_references_to[from_.mrid]:
-                        del self._unresolved_references_to[from_.mrid]
-
+            self._resolve_reference(from_, to, resolver, reverse_resolver)
             return True
         except KeyError:
-            # to_mrid didn't exist in the service, populate the reference caches for resolution when it is added.
-            urefs = self._unresolved_references_to.get(to_mrid, set())
-            # noinspection PyArgumentList
-            uref = UnresolvedReference(from_ref=from_, to_mrid=to_mrid, resolver=resolver, reverse_resolver=reverse_resolver)
-            urefs.add(uref)
-            self._unresolved_references_to[to_mrid] = urefs
-            rev_urefs = self._unresolved_references_from.get(from_.mrid, set())
-            rev_urefs.add(uref)
-            self._unresolved_references_from[from_.mrid] = rev_urefs
+            if self._batch_references is not None:
+                # to_mrid may still be added in the batch, so we leave it to be linked when the batch finishes.
+                self._batch_references.append((bound_resolver, to_mrid))
+            else:
+                # to_mrid didn't exist in the service, populate the reference caches for resolution when it is added.
+                self._defer_reference(from_, to_mrid, resolver, reverse_resolver)
             return False
 
+    @contextmanager
+    def batch_references(self) -> Generator[None, None, None]:
+        """
+        Link the references of every object added to the service inside the ``with`` block in a single pass when the block exits, rather than deferring each
+        reference to an object that hasn't been added yet as it is requested. References to objects in the batch are resolved directly, so only references to
+        objects that are still missing from the service once the batch has been added are deferred.
+
+        While the batch is open, ``resolve_or_defer_reference`` still resolves references to objects already in the service immediately, but queues the rest,
+        returning False for them. The objects added in the batch should not be used until it has finished. Nested batches are linked when the outermost
+        batch finishes.
+        """
+        if self._batch_references is not None:
+            yield
+            return
+
+        self._batch_references = []
+        self._batch_added = []
+        try:
+            yield
+        finally:
+            references, added = self._batch_references, self._batch_added
+            self._batch_references = None
+            self._batch_added = None
+            self._link_batch(references, added)
+
+    def add_all_from_pb(self, pbs: Iterable) -> List[Optional[Identifiable]]:
+        """
+        Convert protobuf messages to their CIM objects and add them to this service, linking the references between them in a single pass (see
+        `batch_references`).
+
+        :param pbs: The protobuf messages to convert.
+        :returns: The CIM object for each message, or None if it couldn't be added to the service.
+        :raises TypeError: If the type of any message isn't supported by this service.
+        """
+        with self.batch_references():
+            return [self.add_from_pb(pb) for pb in pbs]
+
+    def _link_batch(self, references: List[Tuple[BoundReferenceResolver, str]], added: List[Identifiable]):
+        # Both sides of a relationship with a reverse resolver typically request it, so we skip the second request once the first has resolved both sides.
+        # The resolvers are shared module level instances, so they are tracked by identity to avoid hashing them.
+        linked = set()
+        objects_by_mrid = self._objects_by_mrid
+        for bound_resolver, to_mrid in references:
+            from_ = bound_resolver.from_obj
+            resolver = bound_resolver.resolver
+            if (from_.mrid, id(resolver), to_mrid) in linked:
+                continue
+
+            reverse_resolver = bound_resolver.reverse_resolver
+            to = objects_by_mrid.get(to_mrid)
+            if to is None:
+                self._defer_reference(from_, to_mrid, resolver, reverse_resolver)
+                continue
+            elif not isinstance(to, resolver.to_class):
+                raise TypeError(f"Invalid type for {to_mrid}. Found {type(to).__name__}, expected {resolver.to_class.__name__}.")
+
+            try:
+                self._resolve_reference(from_, to, resolver, reverse_resolver)
+            except KeyError:
+                # Matches the handling of `resolve_or_defer_reference`.
+                self._defer_reference(from_, to_mrid, resolver, reverse_resolver)
+                continue
+
+            if reverse_resolver:
+                linked.add((to_mrid, id(reverse_resolver), from_.mrid))
+
+        # References deferred before the batch that weren't the reverse of a reference in the batch still need to be resolved.
+        for it in added:
+            self._resolve_deferred_references_to(it)
+
+    def _resolve_reference(self, from_: Identifiable, to: Identifiable, resolver: ReferenceResolver, reverse_resolver: Optional[ReferenceResolver]):
+        resolver.resolve(from_, to)
+        if reverse_resolver:
+            reverse_resolver.resolve(to, from_)
+
+            # Clean up any reverse resolvers now that the reference has been resolved
+            if self._unresolved_references.has_references_to(from_.mrid):
+                self._unresolved_references.remove(to.mrid, from_.mrid, reverse_resolver)
+
+    def _defer_reference(self, from_: Identifiable, to_mrid: str, resolver: ReferenceResolver, reverse_resolver: Optional[ReferenceResolver]):
+        self._unresolved_references.add(from_, to_mrid, resolver, reverse_resolver)
+
+    def _resolve_deferred_references_to(self, identifiable: Identifiable):
+        for from_ref, resolver, reverse_resolver in self._unresolved_references.pop_references_to(identifiable.mrid):
+            resolver.resolve(from_ref, identifiable)
+            if reverse_resolver:
+                reverse_resolver.resolve(identifiable, from_ref)
+
     def get_unresolved_reference_mrids_by_resolver(
         self,
         bound_resolvers: Union[BoundReferenceResolver, Sized[BoundReferenceResolver]]
@@ -317,9 +365,7 @@ class BaseService(ABC):
             resolvers = [bound_resolvers]
 
         for resolver in resolvers:
-            if resolver.from_obj.mrid not in self._unresolved_references_from:
-                continue
-            for ref in self._unresolved_references_from[resolver.from_obj.mrid]:
+            for ref in self._unresolved_references.references_from(resolver.from_obj.mrid):
                 if ref.to_mrid not in seen and ref.resolver == resolver.resolver:
                     seen.add(ref.to_mrid)
                     yield ref.to_mrid
@@ -331,9 +377,8 @@ class BaseService(ABC):
         :param mrid: The mRID to get unresolved references for.
         :returns:  a generator over the ``UnresolvedReference``s that need to be resolved for ``mrid``.
         """
-        if mrid in self._unresolved_references_from:
-            for ref in self._unresolved_references_from[mrid]:
-                yield ref
+        for ref in self._unresolved_references.references_from(mrid):
+            yield ref
 
     def get_unresolved_references_to(self, mrid: str) -> Generator[UnresolvedReference, None, None]:
         """
@@ -342,9 +387,8 @@ class BaseService(ABC):
         :param mrid: The mRID to fetch unresolved references for that are pointing to it.
         :returns: a generator over the `UnresolvedReference`s that need to be resolved for ``mrid``.
         """
-        if mrid in self._unresolved_references_to:
-            for ref in self._unresolved_references_to[mrid]:
-                yield ref
+        for ref in self._unresolved_references.references_to(mrid):
+            yield ref
 
     def remove(self, identifiable: Identifiable) -> bool:
         """
@@ -354,6 +398,8 @@ class BaseService(ABC):
         :raises KeyError: if `identifiable` or its type was not present in the service.
         """
         del self._objects_by_type[identifiable.__class__][identifiable.mrid]
+        del self._objects_by_mrid[identifiable.mrid]
+        self._update_counts(identifiable.__class__, -1)
         return True
 
     def objects(self, obj_type: Optional[Type[TIdentifiable]] = None, exc_types: Optional[List[type]] = None) -> Generator[TIdentifiable, None, None]:
@@ -372,14 +418,27 @@ class BaseService(ABC):
                     yield obj
             return
         else:
-            try:
-                for obj in self._objects_by_type[obj_type].values():
+            for _type in self._concrete_types_of(obj_type):
+                for obj in self._objects_by_type[_type].values():
                     yield obj
-            except KeyError:
-                for _type, object_map in self._objects_by_type.items():
-                    if issubclass(_type, obj_type):
-                        for obj in object_map.values():
-                            yield obj
+
+    def _concrete_types_of(self, obj_type: type) -> List[type]:
+        """
+        Get the types stored in this service that are ``obj_type`` or one of its subclasses.
+
+        :param obj_type: The type to find the stored types for.
+        :returns: The stored types that are an ``obj_type``. The returned list is cached and must not be modified.
+        """
+        types = self._concrete_types_by_type.get(obj_type)
+        if types is None:
+            types = [it for it in self._objects_by_type if issubclass(it, obj_type)]
+            self._concrete_types_by_type[obj_type] = types
+        return types
+
+    def _update_counts(self, concrete_type: type, delta: int):
+        counts = self._counts_by_type
+        for it in concrete_type.__mro__:
+            counts[it] = counts.get(it, 0) + delta
 
     @property
     def name_types(self) -> Generator[NameType, None, None]:
@@ -2,6 +2,7 @@
 #  This Source Code Form is subject to the terms of the Mozilla Public
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from functools import partial
 from math import isnan
 from types import MemberDescriptorType
 from typing import get_type_hints, Dict, Type, Callable, Any, TypeVar, Optional, Union, List, Tuple
@@ -10,6 +11,7 @@ from zepben.ewb import BaseService, IdentifiedObject, Organisation, Document, Or
 from zepben.ewb.model.cim.iec61970.base.core.identifiable import Identifiable
 from zepben.ewb.model.cim.iec61970.base.core.name import Name
 from zepben.ewb.model.cim.iec61970.base.core.name_type import NameType
+from zepben.ewb.services.common.content_fingerprint import content_key, fingerprint
 from zepben.ewb.services.common.difference import ObjectDifference, Difference, ValueDifference, ReferenceDifference, CollectionDifference, IndexedDifference
 from zepben.ewb.services.common.translator.service_differences import ServiceDifferences
 
@@ -48,13 +50,19 @@ class BaseServiceComparator:
         self._compare_by_type: Dict[Type, Callable[[Any, T, T], ObjectDifference]] = {}
         _find_comparisons_for_type(type(self))
 
-    def compare_services(self, source: BaseService, target: BaseService, compare_name_types: bool = True) -> ServiceDifferences:
+    def compare_services(self, source: BaseService, target: BaseService, compare_name_types: bool = True,
+                         cache_fingerprints: bool = False) -> ServiceDifferences:
         """
         Run the compare with the specified optional checks
 
+        Objects with identical content (see `content_key`) are skipped without running their comparison, so only objects that actually differ pay for
+        building their `ObjectDifference`.
+
         :param source: The service to use as the source
         :param target: The service to use as the target
         :param compare_name_types: Optional parameter to suppress comparing name types
+        :param cache_fingerprints: Compare the cached `fingerprint` of each object rather than its `content_key`, caching the fingerprints on the objects
+            of both services. This makes repeated comparisons of long-lived services much faster, at the cost of the memory used by the cache.
 
         :return: The differences detected between the source and the target
         """
@@ -65,23 +73,7 @@ class BaseServiceComparator:
             lambda name: target.get_name_type(name)
         )
 
-        for s in source.objects():
-            t = target.get(s.mrid, default=None)
-            if t:
-                source_type = type(s)
-                if source_type is not type(t):
-                    differences.add_to_missing_from_source(s.mrid)
-                    differences.add_to_missing_from_target(s.mrid)
-                else:
-                    diff = self._try_compare(source_type, s, t)
-                    if diff.differences:
-                        differences.add_modifications(s.mrid, diff)
-            else:
-                differences.add_to_missing_from_target(s.mrid)
-
-        for t in target.objects():
-            if t.mrid not in source:
-                differences.add_to_missing_from_source(t.mrid)
+        self._compare_all_objects(source, target, differences, cache_fingerprints)
 
         if compare_name_types:
             for s in source.name_types:
@@ -117,6 +109,34 @@ class BaseServiceComparator:
             raise ValueError(f"source and target must be of the same type. {source_type.__name__} vs {target_type.__name__}")
         return self._try_compare(source_type, source, target)
 
+    def _compare_all_objects(self, source: BaseService, target: BaseService, differences: ServiceDifferences, cache_fingerprints: bool):
+        # Compares the objects one type at a time so each type only looks up its comparison once.
+        content_of = partial(fingerprint, cache=True) if cache_fingerprints else content_key
+        source_by_mrid = source._objects_by_mrid
+        target_by_mrid = target._objects_by_mrid
+
+        for source_type, source_objects in source._objects_by_type.items():
+            compare = self._compare_by_type.get(source_type)
+            target_objects = target._objects_by_type.get(source_type, {})
+            for mrid, s in source_objects.items():
+                t = target_objects.get(mrid)
+                if t is None:
+                    if mrid in target_by_mrid:
+                        # The object exists in both services, but with different types.
+                        differences.add_to_missing_from_source(mrid)
+                    differences.add_to_missing_from_target(mrid)
+                elif compare is None:
+                    raise AssertionError(f"INTERNAL ERROR: Attempted to compare {source_type.__name__} which is not registered with the comparator.")
+                elif content_of(s) != content_of(t):
+                    diff = compare(self, s, t)
+                    if diff.differences:
+                        differences.add_modifications(mrid, diff)
+
+        for target_objects in target._objects_by_type.values():
+            for mrid in target_objects:
+                if mrid not in source_by_mrid:
+                    differences.add_to_missing_from_source(mrid)
+
     def _try_compare(self, source_type: Type, s: T, t: T) -> ObjectDifference:
         try:
             compare = self._compare_by_type[source_type]
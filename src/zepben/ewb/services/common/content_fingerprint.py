@@ -0,0 +1,183 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import annotations
+
+__all__ = ["content_key", "fingerprint", "container_fingerprint"]
+
+from hashlib import blake2b
+from operator import attrgetter, is_, itemgetter
+from typing import Dict, Callable, Any, Tuple, Optional, TYPE_CHECKING
+from weakref import ReferenceType
+
+from zepben.ewb.model.cim.iec61970.base.core.identifiable import Identifiable
+from zepben.ewb.model.cim.iec61970.base.core.name import Name
+
+if TYPE_CHECKING:
+    from zepben.ewb.model.cim.iec61970.base.core.equipment_container import EquipmentContainer
+
+_IGNORED_SLOTS = frozenset({"__weakref__", "_trace_index", "_state_index", "_content_cache"})
+"""Slots that only hold bookkeeping, rather than content of the object."""
+
+_ORDERED_SLOTS = frozenset({"_terminals", "_power_transformer_ends"})
+"""Collections of references whose order is compared, rather than just their contents."""
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_DIGEST_SIZE = 16
+
+_content_getters: Dict[type, Tuple[Callable[[Any], Tuple[Any, ...]], Tuple[Callable[[Any], Any], ...], bool]] = {}
+
+
+def content_key(obj: Identifiable) -> Tuple[Any, ...]:
+    """
+    Get a key describing the content of an object, which is equal for two objects of the same type only if comparing them would find no differences.
+
+    The key holds the value of every field of the object, with references to other objects replaced by their mRID, and the traced phases and feeder
+    directions of terminals. Collections that are compared without regard to their order (e.g. the equipment of a container) are sorted by the mRID of
+    each object, so the key doesn't depend on the order the objects were added. The key is calculated each time it is requested.
+
+    :param obj: The object to describe.
+    :return: The key describing the content of `obj`. An object with a field that has never been set can't be described, so its key won't match anything.
+    """
+    get_raw, normalisers, has_traced_state = _content_getter(type(obj))
+    try:
+        raw = get_raw(obj)
+    except AttributeError:
+        return (object(),)
+
+    return _content_key(obj, raw, normalisers, has_traced_state)
+
+
+def fingerprint(obj: Identifiable, cache: bool = False) -> str:
+    """
+    Get a fingerprint of the content of an object, which can be stored to detect if the object has changed since it was taken.
+
+    The fingerprint is a hash of the `content_key` of the object. Unlike the key, it is stable between processes, so it can be compared to fingerprints
+    taken in previous runs.
+
+    :param obj: The object to fingerprint.
+    :param cache: Cache the fingerprint on the object, to be reused until any of its fields are assigned, or any of its collections are modified via its
+      ``add_``, ``remove_`` or ``clear_`` methods. Modifying the value objects held by a field (e.g. assigning the ``x_position`` of a ``PositionPoint``,
+      or the ``name`` of a ``Name``) or modifying a collection directly does not invalidate the cached fingerprint. The cache holds the fields the
+      fingerprint was calculated from, so only use it for objects that will be fingerprinted repeatedly.
+    :return: The fingerprint of `obj` as a hex string.
+    """
+    get_raw, normalisers, has_traced_state = _content_getter(type(obj))
+    try:
+        raw = get_raw(obj)
+    except AttributeError:
+        return _digest(repr(object()))
+
+    # The cache holds the raw values of the fields the fingerprint was created from, which are checked by identity to see if any have been replaced, along
+    # with the traced state of terminals, which is held in the `TerminalStateStore` rather than the terminal.
+    traced = _traced_state(obj) if has_traced_state else None
+    cached: Optional[Tuple[Any, ...]] = obj._content_cache
+    if (cached is not None) and (cached[1] == traced) and all(map(is_, raw, cached[0])):
+        return cached[2]
+
+    digest = _digest(repr(_content_key(obj, raw, normalisers, has_traced_state)))
+    if cache:
+        obj._content_cache = (raw, traced, digest)
+    return digest
+
+
+def container_fingerprint(container: EquipmentContainer, cache: bool = False) -> str:
+    """
+    Get a fingerprint of the content of an equipment container, including everything it contains, which can be used to detect if anything in the
+    container has changed without checking each object.
+
+    The rollup covers the container itself, each of its equipment and the terminals of that equipment. The rollup of a `Substation` also covers the rollup
+    of each of its feeders.
+
+    :param container: The container to fingerprint.
+    :param cache: Cache the fingerprint of each object in the rollup. See `fingerprint`.
+    :return: The fingerprint of `container` and its contents as a hex string.
+    """
+    # NOTE: import exists here due to a circular import problem.
+    from zepben.ewb.model.cim.iec61970.base.core.conducting_equipment import ConductingEquipment
+    from zepben.ewb.model.cim.iec61970.base.core.substation import Substation
+
+    parts = [fingerprint(container, cache)]
+    for equipment in sorted(container.equipment, key=_by_mrid):
+        parts.append(fingerprint(equipment, cache))
+        if isinstance(equipment, ConductingEquipment):
+            parts.extend(fingerprint(it, cache) for it in equipment.terminals)
+
+    if isinstance(container, Substation):
+        parts.extend(container_fingerprint(it, cache) for it in sorted(container.feeders, key=_by_mrid))
+
+    return _digest("\n".join(parts))
+
+
+def _content_getter(type_: type) -> Tuple[Callable[[Any], Tuple[Any, ...]], Tuple[Callable[[Any], Any], ...], bool]:
+    getter = _content_getters.get(type_)
+    if getter is None:
+        getter = _content_getters[type_] = _create_content_getter(type_)
+    return getter
+
+
+def _content_key(obj: Identifiable, raw: Tuple[Any, ...], normalisers: Tuple[Callable[[Any], Any], ...], has_traced_state: bool) -> Tuple[Any, ...]:
+    key = tuple(normalise(value) for normalise, value in zip(normalisers, raw))
+    if has_traced_state:
+        key += _traced_state(obj)
+    return key
+
+
+def _create_content_getter(type_: type) -> Tuple[Callable[[Any], Tuple[Any, ...]], Tuple[Callable[[Any], Any], ...], bool]:
+    slots = []
+    for cls in type_.__mro__:
+        cls_slots = cls.__dict__.get("__slots__", ())
+        slots.extend([cls_slots] if isinstance(cls_slots, str) else cls_slots)
+
+    # The traced state of a terminal is held in the `TerminalStateStore` rather than the terminal, so we use the state itself rather than its index.
+    has_traced_state = "_state_index" in slots
+    content_slots = [it for it in slots if it not in _IGNORED_SLOTS]
+    normalisers = tuple(_ordered_content_value if it in _ORDERED_SLOTS else _content_value for it in content_slots)
+
+    get_slots = attrgetter(*content_slots)
+    if len(content_slots) == 1:
+        return (lambda obj: (get_slots(obj),)), normalisers, has_traced_state
+    return get_slots, normalisers, has_traced_state
+
+
+def _traced_state(terminal) -> Tuple[Any, ...]:
+    return (terminal.normal_phases._phase_status_internal, terminal.current_phases._phase_status_internal,
+            terminal.normal_feeder_direction, terminal.current_feeder_direction)
+
+
+def _content_value(value: Any) -> Any:
+    if type(value) in _SCALAR_TYPES:
+        return value
+    elif isinstance(value, Name):
+        return value.name, value.type.name
+    elif isinstance(value, Identifiable):
+        return value.mrid
+    elif isinstance(value, ReferenceType):
+        return _content_value(value())
+    elif isinstance(value, (list, tuple)):
+        values = tuple(map(_content_value, value))
+        # Collections of references and names are compared without regard to their order, unless they are in `_ORDERED_SLOTS`.
+        if value and all(isinstance(it, (Identifiable, Name)) for it in value):
+            return tuple(sorted(values))
+        return values
+    elif isinstance(value, dict):
+        return tuple((k, _content_value(v)) for k, v in sorted(value.items(), key=itemgetter(0)))
+    else:
+        return value
+
+
+def _ordered_content_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(map(_content_value, value))
+    return _content_value(value)
+
+
+def _digest(content: str) -> str:
+    return blake2b(content.encode("utf-8"), digest_size=_DIGEST_SIZE).hexdigest()
+
+
+def _by_mrid(obj: Identifiable) -> str:
+    return obj.mrid
@@ -0,0 +1,55 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+__all__ = ["can_fork_workers", "forked_worker_pool", "worker_state"]
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from typing import Any, Optional
+
+_worker_state: Any = None
+"""The state passed to `forked_worker_pool`, which is only ever set in the worker processes."""
+
+
+def can_fork_workers(max_workers: Optional[int]) -> bool:
+    """
+    Check if work can be split between forked worker processes.
+
+    Forking only copies the calling thread, so any lock held by another thread at the time (e.g. by a logging handler, or a thread pool used by an asyncio
+    event loop) would never be released in the workers. To avoid deadlocking the workers, they are only forked while this is the only running thread.
+
+    :param max_workers: The number of worker processes requested, if any.
+    :return: True if more than one worker was requested, the platform supports the "fork" start method and no other threads are running.
+    """
+    return ((max_workers or 0) > 1) and ("fork" in get_all_start_methods()) and (threading.active_count() == 1)
+
+
+def forked_worker_pool(max_workers: int, state: Any) -> ProcessPoolExecutor:
+    """
+    Create a pool of forked worker processes which can each read `state` via `worker_state`. Only use this if `can_fork_workers` is True.
+
+    The state is passed to the initializer of each worker, which inherits it when it is forked rather than having it pickled, so it can hold large objects
+    such as a whole service. Each pool has its own state, so pools can be created by multiple callers without interfering with each other.
+
+    :param max_workers: The number of worker processes to fork.
+    :param state: The state to make available to the workers.
+    :return: The pool of workers, which should be shut down when finished with (e.g. by using it as a context manager).
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("fork"), initializer=_set_worker_state, initargs=(state,))
+
+
+def worker_state() -> Any:
+    """
+    Get the state of the worker process this is called from.
+
+    :return: The `state` passed to the `forked_worker_pool` that created this worker.
+    """
+    return _worker_state
+
+
+def _set_worker_state(state: Any):
+    global _worker_state
+    _worker_state = state
@@ -0,0 +1,290 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import annotations
+
+__all__ = ["PendingReferences"]
+
+from array import array
+from sys import intern
+from typing import Dict, Generator, List, Optional, Tuple
+
+from zepben.ewb.model.cim.iec61970.base.core.identifiable import Identifiable
+from zepben.ewb.services.common.reference_resolvers import ReferenceResolver, UnresolvedReference
+
+_END = -1
+
+
+class PendingReferences:
+    """
+    Compact storage of the references between objects that have not yet been resolved, indexed by both the mRID of the object being referenced, and the
+    mRID of the object holding the reference.
+
+    Each reference takes a slot in a set of columns, holding the object with the reference, the mRID it references, and the index of its resolvers. The
+    references to and from each mRID are chained together through the slots, with only the first slot of each chain held in a dictionary. This avoids
+    allocating an `UnresolvedReference` for each reference, along with a set for each mRID in each index. The referenced mRIDs are interned, so every
+    reference to an mRID shares a single string, and each resolver is only held once.
+
+    Slots are released when their reference is removed, and are reused by the next reference that needs one. `UnresolvedReference`s are only created when
+    the references are read.
+    """
+
+    __slots__ = ("_from_refs", "_to_mrids", "_resolver_indexes", "_reverse_resolver_indexes", "_next_to", "_previous_to", "_next_from", "_previous_from",
+                 "_first_to", "_first_from", "_resolvers", "_resolver_indexes_by_id", "_free", "_count")
+
+    def __init__(self):
+        self._from_refs: List[Optional[Identifiable]] = []
+        """The object holding the reference in each slot, or None if the slot is free."""
+
+        self._to_mrids: List[Optional[str]] = []
+        """The interned mRID referenced by each slot, or None if the slot is free."""
+
+        self._resolver_indexes = array("i")
+        """The index into `_resolvers` of the resolver for each slot."""
+
+        self._reverse_resolver_indexes = array("i")
+        """The index into `_resolvers` of the reverse resolver for each slot, or `_END` if it doesn't have one."""
+
+        self._next_to = array("i")
+        """The next slot referencing the same mRID as each slot, or `_END` if it is the last."""
+
+        self._previous_to = array("i")
+        """The previous slot referencing the same mRID as each slot, or `_END` if it is the first."""
+
+        self._next_from = array("i")
+        """The next slot held by the same object as each slot, or `_END` if it is the last."""
+
+        self._previous_from = array("i")
+        """The previous slot held by the same object as each slot, or `_END` if it is the first."""
+
+        self._first_to: Dict[str, int] = dict()
+        """The first slot referencing each mRID."""
+
+        self._first_from: Dict[str, int] = dict()
+        """The first slot held by the object with each mRID."""
+
+        self._resolvers: List[ReferenceResolver] = []
+        self._resolver_indexes_by_id: Dict[int, int] = dict()
+        self._free: List[int] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        """
+        :return: The number of unresolved references.
+        """
+        return self._count
+
+    def __iter__(self) -> Generator[UnresolvedReference, None, None]:
+        """
+        Iterate over every unresolved reference without copying them. References added while iterating may or may not be included.
+        """
+        from_refs = self._from_refs
+        for slot in range(len(from_refs)):
+            if from_refs[slot] is not None:
+                yield self._reference(slot)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: The number of bytes used by the slots and indexes, excluding the objects and mRIDs they refer to, which are held by the service anyway.
+        """
+        columns = (self._resolver_indexes, self._reverse_resolver_indexes, self._next_to, self._previous_to, self._next_from, self._previous_from)
+        return (sum(it.itemsize * len(it) for it in columns)
+                + 8 * (len(self._from_refs) + len(self._to_mrids) + len(self._free) + len(self._resolvers))
+                + sum(it.__sizeof__() for it in (self._first_to, self._first_from, self._resolver_indexes_by_id)))
+
+    def has_references_to(self, to_mrid: str) -> bool:
+        """
+        :param to_mrid: The mRID to check.
+        :return: True if there are unresolved references to `to_mrid`.
+        """
+        return to_mrid in self._first_to
+
+    def count_to(self, to_mrid: str) -> int:
+        """
+        :param to_mrid: The mRID to count the references to.
+        :return: The number of unresolved references to `to_mrid`.
+        """
+        count = 0
+        slot = self._first_to.get(to_mrid, _END)
+        while slot != _END:
+            count += 1
+            slot = self._next_to[slot]
+        return count
+
+    def references_to(self, to_mrid: str) -> Generator[UnresolvedReference, None, None]:
+        """
+        :param to_mrid: The mRID to get the references to.
+        :return: A generator over the unresolved references to `to_mrid`.
+        """
+        slot = self._first_to.get(to_mrid, _END)
+        while slot != _END:
+            next_slot = self._next_to[slot]
+            yield self._reference(slot)
+            slot = next_slot
+
+    def references_from(self, from_mrid: str) -> Generator[UnresolvedReference, None, None]:
+        """
+        :param from_mrid: The mRID of the object to get the references from.
+        :return: A generator over the unresolved references held by the object with `from_mrid`.
+        """
+        slot = self._first_from.get(from_mrid, _END)
+        while slot != _END:
+            next_slot = self._next_from[slot]
+            yield self._reference(slot)
+            slot = next_slot
+
+    def add(self, from_ref: Identifiable, to_mrid: str, resolver: ReferenceResolver, reverse_resolver: Optional[ReferenceResolver] = None) -> bool:
+        """
+        Add an unresolved reference, unless the same reference has already been added.
+
+        :param from_ref: The object holding the reference.
+        :param to_mrid: The mRID of the referenced object.
+        :param resolver: The resolver used to resolve the reference.
+        :param reverse_resolver: The resolver used to resolve the reverse of the reference, if any.
+        :return: True if the reference was added, False if it was already present.
+        """
+        resolver_index = self._resolver_index(resolver)
+        if self._find(from_ref.mrid, to_mrid, resolver_index) != _END:
+            return False
+
+        to_mrid = intern(to_mrid)
+        reverse_index = _END if reverse_resolver is None else self._resolver_index(reverse_resolver)
+        next_to = self._first_to.get(to_mrid, _END)
+        next_from = self._first_from.get(from_ref.mrid, _END)
+
+        if self._free:
+            slot = self._free.pop()
+            self._from_refs[slot] = from_ref
+            self._to_mrids[slot] = to_mrid
+            self._resolver_indexes[slot] = resolver_index
+            self._reverse_resolver_indexes[slot] = reverse_index
+            self._next_to[slot] = next_to
+            self._previous_to[slot] = _END
+            self._next_from[slot] = next_from
+            self._previous_from[slot] = _END
+        else:
+            slot = len(self._from_refs)
+            self._from_refs.append(from_ref)
+            self._to_mrids.append(to_mrid)
+            self._resolver_indexes.append(resolver_index)
+            self._reverse_resolver_indexes.append(reverse_index)
+            self._next_to.append(next_to)
+            self._previous_to.append(_END)
+            self._next_from.append(next_from)
+            self._previous_from.append(_END)
+
+        if next_to != _END:
+            self._previous_to[next_to] = slot
+        if next_from != _END:
+            self._previous_from[next_from] = slot
+        self._first_to[to_mrid] = slot
+        self._first_from[from_ref.mrid] = slot
+        self._count += 1
+        return True
+
+    def remove(self, from_mrid: str, to_mrid: str, resolver: ReferenceResolver):
+        """
+        Remove an unresolved reference.
+
+        :param from_mrid: The mRID of the object holding the reference.
+        :param to_mrid: The mRID of the referenced object.
+        :param resolver: The resolver used to resolve the reference.
+        :raises KeyError: If the reference is not present.
+        """
+        slot = self._find(from_mrid, to_mrid, self._resolver_indexes_by_id.get(id(resolver), _END), resolver)
+        if slot == _END:
+            raise KeyError(f"No unresolved reference from {from_mrid} to {to_mrid}.")
+
+        self._unlink_to(slot)
+        self._unlink_from(slot)
+        self._release(slot)
+
+    def pop_references_to(self, to_mrid: str) -> List[Tuple[Identifiable, ReferenceResolver, Optional[ReferenceResolver]]]:
+        """
+        Remove every unresolved reference to an mRID.
+
+        :param to_mrid: The mRID of the referenced object.
+        :return: The object holding each removed reference, along with its resolver and reverse resolver.
+        """
+        slot = self._first_to.pop(to_mrid, _END)
+        popped = []
+        while slot != _END:
+            reverse_index = self._reverse_resolver_indexes[slot]
+            popped.append((self._from_refs[slot], self._resolvers[self._resolver_indexes[slot]],
+                           None if reverse_index == _END else self._resolvers[reverse_index]))
+
+            next_slot = self._next_to[slot]
+            self._unlink_from(slot)
+            self._release(slot)
+            slot = next_slot
+
+        return popped
+
+    def _reference(self, slot: int) -> UnresolvedReference:
+        reverse_index = self._reverse_resolver_indexes[slot]
+        # noinspection PyArgumentList
+        return UnresolvedReference(
+            from_ref=self._from_refs[slot],
+            to_mrid=self._to_mrids[slot],
+            resolver=self._resolvers[self._resolver_indexes[slot]],
+            reverse_resolver=None if reverse_index == _END else self._resolvers[reverse_index]
+        )
+
+    def _resolver_index(self, resolver: ReferenceResolver) -> int:
+        # The resolvers are held by the store, so their ids can't be reused by another resolver while they are indexed.
+        index = self._resolver_indexes_by_id.get(id(resolver))
+        if index is None:
+            index = self._resolver_indexes_by_id[id(resolver)] = len(self._resolvers)
+            self._resolvers.append(resolver)
+        return index
+
+    def _find(self, from_mrid: str, to_mrid: str, resolver_index: int, resolver: Optional[ReferenceResolver] = None) -> int:
+        # The references held by an object are far fewer than the references to a popular mRID (e.g. a feeder that hasn't been fetched), so we search the
+        # references from the object. Resolvers are indexed by identity, so we fall back to comparing them by value, which matches the equality of
+        # `UnresolvedReference`.
+        if resolver is None:
+            resolver = self._resolvers[resolver_index]
+
+        slot = self._first_from.get(from_mrid, _END)
+        while slot != _END:
+            if self._to_mrids[slot] == to_mrid:
+                index = self._resolver_indexes[slot]
+                if (index == resolver_index) or (self._resolvers[index] == resolver):
+                    return slot
+            slot = self._next_from[slot]
+        return _END
+
+    def _unlink_to(self, slot: int):
+        next_slot = self._next_to[slot]
+        previous = self._previous_to[slot]
+        if next_slot != _END:
+            self._previous_to[next_slot] = previous
+
+        if previous != _END:
+            self._next_to[previous] = next_slot
+        elif next_slot != _END:
+            self._first_to[self._to_mrids[slot]] = next_slot
+        else:
+            del self._first_to[self._to_mrids[slot]]
+
+    def _unlink_from(self, slot: int):
+        next_slot = self._next_from[slot]
+        previous = self._previous_from[slot]
+        if next_slot != _END:
+            self._previous_from[next_slot] = previous
+
+        if previous != _END:
+            self._next_from[previous] = next_slot
+        elif next_slot != _END:
+            self._first_from[self._from_refs[slot].mrid] = next_slot
+        else:
+            del self._first_from[self._from_refs[slot].mrid]
+
+    def _release(self, slot: int):
+        self._from_refs[slot] = None
+        self._to_mrids[slot] = None
+        self._free.append(slot)
+        self._count -= 1
@@ -2,3 +2,25 @@
 #  This Source Code Form is subject to the terms of the Mozilla Public
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+__all__ = []
+
+_translators_loaded = False
+
+
+def _load_translators():
+    # The translators bind `to_pb` to each CIM class, `to_cim` to each protobuf message and `add_from_pb` to `BaseService` when they are imported. As they
+    # load the entire CIM model and protobuf definitions, they are only imported the first time a translation is needed.
+    global _translators_loaded
+    if _translators_loaded:
+        return
+
+    import zepben.ewb.services.common.translator.base_proto2cim  # noqa: F401
+    import zepben.ewb.services.customer.translator.customer_cim2proto  # noqa: F401
+    import zepben.ewb.services.customer.translator.customer_proto2cim  # noqa: F401
+    import zepben.ewb.services.diagram.translator.diagram_cim2proto  # noqa: F401
+    import zepben.ewb.services.diagram.translator.diagram_proto2cim  # noqa: F401
+    import zepben.ewb.services.network.translator.network_cim2proto  # noqa: F401
+    import zepben.ewb.services.network.translator.network_proto2cim  # noqa: F401
+
+    _translators_loaded = True
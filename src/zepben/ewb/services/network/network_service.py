@@ -220,7 +220,7 @@ class NetworkService(BaseService):
         cn.remove_terminal(terminal)
         terminal.disconnect()
         if cn.num_terminals() == 0:
-            del self._connectivity_nodes[cn.mrid]
+            self._remove_connectivity_node(cn.mrid)
 
     def disconnect_by_mrid(self, connectivity_node_mrid: str):
         """
@@ -235,7 +235,7 @@ class NetworkService(BaseService):
             for term in cn.terminals:
                 term.disconnect()
             cn.clear_terminals()
-            del self._connectivity_nodes[connectivity_node_mrid]
+            self._remove_connectivity_node(connectivity_node_mrid)
 
     def get_primary_sources(self):
         """
@@ -251,11 +251,18 @@ class NetworkService(BaseService):
         Returns A new ConnectivityNode with `mrid` if it doesn't already exist, otherwise the existing
                  ConnectivityNode represented by `mrid`
         """
-        if mrid not in self._connectivity_nodes:
-            self._connectivity_nodes[mrid] = ConnectivityNode(mrid=mrid)
-            return self._connectivity_nodes[mrid]
-        else:
-            return self._connectivity_nodes[mrid]
+        cn = self._connectivity_nodes.get(mrid)
+        if cn is None:
+            cn = self._connectivity_nodes[mrid] = ConnectivityNode(mrid=mrid)
+            self._objects_by_mrid.setdefault(mrid, cn)
+            self._update_counts(ConnectivityNode, 1)
+        return cn
+
+    def _remove_connectivity_node(self, mrid: str):
+        cn = self._connectivity_nodes.pop(mrid)
+        if self._objects_by_mrid.get(mrid) is cn:
+            del self._objects_by_mrid[mrid]
+        self._update_counts(ConnectivityNode, -1)
 
     def _index_measurement(self, measurement: Measurement, mrid: str) -> bool:
         if not mrid:
@@ -318,3 +325,9 @@ class NetworkService(BaseService):
         if phases is None:
             phases = terminal.phases.single_phases
         return TerminalConnectivityConnected().connected_terminals(terminal, phases)
+
+
+#
+# NOTE: The following import is deliberately at the bottom of this file, as it adds the `create_*` functions to `NetworkService`.
+#
+import zepben.ewb.services.network.network_extensions  # noqa: E402,F401
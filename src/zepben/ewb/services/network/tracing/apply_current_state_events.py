@@ -0,0 +1,195 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from __future__ import annotations
+
+__all__ = ["ApplyCurrentStateEvents"]
+
+from typing import Iterable, List, Optional, Set, Type, TYPE_CHECKING
+
+from zepben.ewb.model.cim.extensions.iec61970.base.feeder.lv_feeder import LvFeeder
+from zepben.ewb.model.cim.iec61970.base.core.conducting_equipment import ConductingEquipment
+from zepben.ewb.model.cim.iec61970.base.core.feeder import Feeder
+from zepben.ewb.model.cim.iec61970.base.core.phase_code import PhaseCode
+from zepben.ewb.model.cim.iec61970.base.core.terminal import Terminal
+from zepben.ewb.model.cim.iec61970.base.wires.cut import Cut
+from zepben.ewb.model.cim.iec61970.base.wires.energy_source import EnergySource
+from zepben.ewb.model.cim.iec61970.base.wires.jumper import Jumper
+from zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind import SinglePhaseKind
+from zepben.ewb.model.cim.iec61970.base.wires.switch import Switch
+from zepben.ewb.services.network.network_service import NetworkService
+from zepben.ewb.services.network.tracing.feeder.assign_to_feeders import AssignToFeedersInternal
+from zepben.ewb.services.network.tracing.feeder.assign_to_lv_feeders import AssignToLvFeedersInternal
+from zepben.ewb.services.network.tracing.feeder.feeder_direction import FeederDirection
+from zepben.ewb.services.network.tracing.feeder.set_direction import SetDirection
+from zepben.ewb.services.network.tracing.networktrace.network_trace_action_type import NetworkTraceActionType
+from zepben.ewb.services.network.tracing.networktrace.operators.network_state_operators import NetworkStateOperators
+from zepben.ewb.services.network.tracing.networktrace.tracing import Tracing
+from zepben.ewb.services.network.tracing.phases.set_phases import SetPhases
+from zepben.ewb.streaming.data.current_state_event import CurrentStateEvent, SwitchStateEvent, SwitchAction, AddCutEvent, RemoveCutEvent, \
+    AddJumperEvent, RemoveJumperEvent
+
+if TYPE_CHECKING:
+    from logging import Logger
+
+
+class ApplyCurrentStateEvents:
+    """
+    Applies a batch of `CurrentStateEvent` to the current state of a `NetworkService`, and then updates the current feeder and LV feeder assignment, feeder
+    direction and phases of the network to match, without having to rerun `AssignToFeeders`, `AssignToLvFeeders`, `SetDirection` and `SetPhases` for the
+    whole network.
+
+    Only the region of the network connected to the changed switches is updated. This region is bounded by switches that are open on all phases, so it
+    includes everything any of the traces could have reached through the changed switches, both before and after the events were applied. The derived
+    state in the region is cleared and then reapplied from the feeder heads, LV feeder heads and energy sources in the region, so the resulting feeder and
+    LV feeder membership, directions and phases match those of a full recompute.
+
+    NOTE: Cut and jumper events can only be applied to a `Cut` or `Jumper` that is already in the network, as they can't change the connectivity of the
+      network. Adding a cut opens it, and adding a jumper closes it. The order of the feeders in the containers of the updated equipment may differ from a
+      full recompute.
+
+    :param debug_logger: An optional logger to add information about how the traces are processing items.
+    """
+
+    def __init__(self, debug_logger: Logger = None):
+        self._debug_logger = debug_logger
+        self._state_operators = NetworkStateOperators.CURRENT
+
+    async def run(self, network: NetworkService, events: Iterable[CurrentStateEvent]) -> List[CurrentStateEvent]:
+        """
+        Apply the `events` to the current state of the `network` and update the derived current state of the affected region.
+
+        :param network: The `NetworkService` to apply the events to.
+        :param events: The events to apply, in the order they should be applied.
+        :return: The events that could not be applied, because they were for an unknown switch, cut or jumper, or had an unknown action.
+        """
+        changed_switches: List[Switch] = []
+        unapplied: List[CurrentStateEvent] = []
+        for event in events:
+            if (switch := self._apply(network, event)) is not None:
+                if switch not in changed_switches:
+                    changed_switches.append(switch)
+            else:
+                unapplied.append(event)
+
+        if changed_switches:
+            await self._update_region(network, self._affected_terminals(changed_switches))
+
+        return unapplied
+
+    def _apply(self, network: NetworkService, event: CurrentStateEvent) -> Optional[Switch]:
+        if isinstance(event, SwitchStateEvent):
+            switch = network.get(event.mrid, default=None)
+            if not isinstance(switch, Switch) or (event.action == SwitchAction.UNKNOWN):
+                return None
+
+            is_open = event.action == SwitchAction.OPEN
+            if event.phases == PhaseCode.NONE:
+                self._state_operators.set_open(switch, is_open)
+            else:
+                for phase in event.phases.single_phases:
+                    self._state_operators.set_open(switch, is_open, phase)
+            return switch
+
+        elif isinstance(event, (AddCutEvent, RemoveCutEvent)):
+            return self._set_open(network.get(event.mrid, default=None), Cut, isinstance(event, AddCutEvent))
+        elif isinstance(event, (AddJumperEvent, RemoveJumperEvent)):
+            return self._set_open(network.get(event.mrid, default=None), Jumper, isinstance(event, RemoveJumperEvent))
+        else:
+            return None
+
+    def _set_open(self, switch: Optional[Switch], expected_type: Type[Switch], is_open: bool) -> Optional[Switch]:
+        if not isinstance(switch, expected_type):
+            return None
+
+        self._state_operators.set_open(switch, is_open)
+        return switch
+
+    def _affected_terminals(self, changed_switches: List[Switch]) -> Set[Terminal]:
+        # We trace without phases, stopping only at switches that are open on every phase, so we find every terminal the phase aware traces could reach.
+        # The changed switches are never stopped at, so we include both sides of the switches, which covers the region before the events were applied.
+        terminals = set()
+        trace = (
+            Tracing.network_trace(
+                network_state_operators=self._state_operators,
+                action_step_type=NetworkTraceActionType.ALL_STEPS,
+                debug_logger=self._debug_logger,
+                name=f'ApplyCurrentStateEvents({self._state_operators.description})'
+            )
+            .add_queue_condition(
+                lambda step, *args: not (step.path.traced_internally and self._is_fully_open(step.path.to_equipment, changed_switches))
+            )
+            .add_step_action(lambda step, ctx: terminals.add(step.path.to_terminal))
+        )
+
+        for switch in changed_switches:
+            trace.add_start_item(switch)
+        trace.run_sync(can_stop_on_start_item=False)
+
+        return terminals
+
+    def _is_fully_open(self, equipment: ConductingEquipment, changed_switches: List[Switch]) -> bool:
+        if not isinstance(equipment, Switch) or (equipment in changed_switches) or (equipment.num_terminals() == 0):
+            return False
+        return all(self._state_operators.is_open(equipment, phase) for phase in next(equipment.terminals).phases.single_phases)
+
+    async def _update_region(self, network: NetworkService, terminals: Set[Terminal]):
+        state_operators = self._state_operators
+
+        # Any trace that reached the region must have started in it, so we only need to process the feeders and sources in the region.
+        feeders = [it for it in network.objects(Feeder) if it.normal_head_terminal in terminals]
+        lv_feeders = [it for it in network.objects(LvFeeder) if it.normal_head_terminal in terminals]
+        energy_sources = [it for it in network.objects(EnergySource) if any(t in terminals for t in it.terminals)]
+
+        for feeder in feeders:
+            for equipment in list(state_operators.get_equipment(feeder)):
+                state_operators.disassociate_equipment_and_container(equipment, feeder)
+            for lv_feeder in list(state_operators.get_energized_lv_feeders(feeder)):
+                feeder.remove_current_energized_lv_feeder(lv_feeder)
+                lv_feeder.remove_current_energizing_feeder(feeder)
+            for lv_substation in list(state_operators.get_energized_lv_substations(feeder)):
+                feeder.remove_current_energized_lv_substation(lv_substation)
+                lv_substation.remove_current_energizing_feeder(feeder)
+
+        # The energizing feeders of the LV feeders are all in the region, so they have already been removed above.
+        for lv_feeder in lv_feeders:
+            for equipment in list(state_operators.get_equipment(lv_feeder)):
+                state_operators.disassociate_equipment_and_container(equipment, lv_feeder)
+
+        for terminal in terminals:
+            state_operators.set_direction(terminal, FeederDirection.NONE)
+            phase_status = state_operators.phase_status(terminal)
+            for phase in PhaseCode.ABCN.single_phases:
+                phase_status[phase] = SinglePhaseKind.NONE
+
+        assign_to_feeders = AssignToFeedersInternal(state_operators, self._debug_logger)
+        feeder_start_points = network.feeder_start_points
+        lv_feeder_start_points = network.lv_feeder_start_points
+        terminal_to_aux_equipment = network.aux_equipment_by_terminal
+        for feeder in feeders:
+            await assign_to_feeders.run_with_feeders(feeder.normal_head_terminal,
+                                                     feeder_start_points,
+                                                     lv_feeder_start_points,
+                                                     terminal_to_aux_equipment,
+                                                     [feeder])
+
+        # The LV feeders are assigned the same way as `AssignToLvFeeders`, after the feeders, so their energizing feeders can be found from their heads.
+        assign_to_lv_feeders = AssignToLvFeedersInternal(state_operators, self._debug_logger)
+        for lv_feeder in lv_feeders:
+            if (head_equipment := lv_feeder.normal_head_terminal.conducting_equipment) is not None:
+                for feeder in head_equipment.feeders(state_operators):
+                    state_operators.associate_energizing_feeder(feeder, lv_feeder)
+            await assign_to_lv_feeders.run_with_feeders(lv_feeder.normal_head_terminal,
+                                                        lv_feeder_start_points,
+                                                        terminal_to_aux_equipment,
+                                                        [lv_feeder])
+
+        set_direction = SetDirection(self._debug_logger)
+        for feeder in feeders:
+            if (head_equipment := feeder.normal_head_terminal.conducting_equipment) is not None:
+                if not state_operators.is_open(head_equipment, None):
+                    await set_direction.run(feeder.normal_head_terminal, state_operators)
+
+        await SetPhases(self._debug_logger).run_from_sources(energy_sources, state_operators)
@@ -53,6 +53,23 @@ class ConnectivityResult:
         self.from_terminal = from_terminal
         self.to_terminal = to_terminal
 
+    @classmethod
+    def from_sorted_paths(cls, from_terminal: Terminal, to_terminal: Terminal, nominal_phase_paths: Tuple[NominalPhasePath, ...]) -> ConnectivityResult:
+        """
+        Create a `ConnectivityResult` from nominal phase paths that are already a tuple sorted by phase, such as those returned by a `PhasePathLookup`,
+        without copying or sorting them again.
+
+        :param from_terminal: The terminal from which the connectivity was requested.
+        :param to_terminal: The terminal which is connected to the requested terminal.
+        :param nominal_phase_paths: The nominal phase paths, sorted by their from and to phases.
+        :return: The `ConnectivityResult`, which holds `nominal_phase_paths` rather than a copy.
+        """
+        result = cls.__new__(cls)
+        result.nominal_phase_paths = nominal_phase_paths
+        result.from_terminal = from_terminal
+        result.to_terminal = to_terminal
+        return result
+
     def __eq__(self, other: ConnectivityResult):
         if self is other:
             return True
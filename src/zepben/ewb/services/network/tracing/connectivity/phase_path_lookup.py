@@ -0,0 +1,103 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+__all__ = ["PhasePathLookup", "phase_mask"]
+
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from zepben.ewb.model.cim.iec61970.base.core.phase_code import PhaseCode
+from zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind import SinglePhaseKind
+from zepben.ewb.services.network.tracing.connectivity.nominal_phase_path import NominalPhasePath
+
+# NOTE: We can't use `SinglePhaseKind.bit_mask` for these as it shares bits between phases (e.g. A, X and s1), which would allow an included X to
+#       select a path from A through a transformer.
+_phase_bits: Dict[int, int] = {id(it): 1 << it.id for it in SinglePhaseKind}
+
+_interned_paths: Dict[Tuple[NominalPhasePath, ...], Tuple[NominalPhasePath, ...]] = {}
+
+_PairPaths = Tuple[int, Dict[int, Tuple[NominalPhasePath, ...]]]
+
+
+def phase_mask(phases: Iterable[SinglePhaseKind]) -> int:
+    """
+    Get the mask used to select the phases to include when looking up paths in a `PhasePathLookup`.
+
+    :param phases: The phases to include.
+    :return: A mask with a unique bit set for each of the `phases`.
+    """
+    mask = 0
+    for phase in phases:
+        mask |= _phase_bits[id(phase)]
+    return mask
+
+
+class PhasePathLookup:
+    """
+    A lookup of the nominal phase paths between two `PhaseCode`, limited to the paths from a set of phases to include.
+
+    The paths for each pair of phase codes are calculated the first time the pair is requested, for every combination of phases that could be included,
+    so each subsequent lookup is a few dictionary lookups that returns a shared, immutable tuple of paths sorted by phase.
+
+    :param find_paths: Finds every path between two phase codes, or `None` if there are no paths between them.
+    :param always_include_none: Indicates if paths from `SinglePhaseKind.NONE` should be included regardless of the phases to include, which is used for
+        paths added by equipment, such as the neutral added by a transformer.
+    """
+
+    def __init__(
+        self,
+        find_paths: Callable[[PhaseCode, PhaseCode], Optional[Iterable[NominalPhasePath]]],
+        always_include_none: bool = False
+    ):
+        self._find_paths = find_paths
+        self._always_include_none = always_include_none
+        self._paths_by_codes: Dict[int, Dict[int, Optional[_PairPaths]]] = {}
+
+    def get(self, from_phases: PhaseCode, to_phases: PhaseCode, include_mask: int) -> Optional[Tuple[NominalPhasePath, ...]]:
+        """
+        Get the paths between two phase codes.
+
+        :param from_phases: The phases you are moving from.
+        :param to_phases: The phases you are moving to.
+        :param include_mask: The mask of the phases on `from_phases` you want to use, as returned by `phase_mask`.
+        :return: The paths from the included phases, which may be empty, or `None` if there are no paths between the phase codes at all.
+        """
+        paths_by_to = self._paths_by_codes.get(id(from_phases))
+        if paths_by_to is None:
+            paths_by_to = self._paths_by_codes[id(from_phases)] = {}
+
+        try:
+            pair_paths = paths_by_to[id(to_phases)]
+        except KeyError:
+            pair_paths = paths_by_to[id(to_phases)] = self._calculate(from_phases, to_phases)
+
+        if pair_paths is None:
+            return None
+
+        from_mask, paths_by_mask = pair_paths
+        return paths_by_mask[include_mask & from_mask]
+
+    def _calculate(self, from_phases: PhaseCode, to_phases: PhaseCode) -> Optional[_PairPaths]:
+        paths = sorted(self._find_paths(from_phases, to_phases) or (), key=attrgetter('from_phase', 'to_phase'))
+        if not paths:
+            return None
+
+        def is_included(path: NominalPhasePath, mask: int) -> bool:
+            if path.from_phase == SinglePhaseKind.NONE and self._always_include_none:
+                return True
+            return (_phase_bits[id(path.from_phase)] & mask) != 0
+
+        # Only the bits of the phases we have paths from are used as keys, with every other bit masked out during the lookup.
+        from_mask = phase_mask(it.from_phase for it in paths)
+        paths_by_mask = {}
+        mask = from_mask
+        while True:
+            included = tuple(it for it in paths if is_included(it, mask))
+            paths_by_mask[mask] = _interned_paths.setdefault(included, included)
+            if mask == 0:
+                break
+            mask = (mask - 1) & from_mask
+
+        return from_mask, paths_by_mask
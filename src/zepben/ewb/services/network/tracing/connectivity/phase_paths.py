@@ -3,12 +3,13 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-__all__ = ["straight_phase_connectivity", "viable_inferred_phase_connectivity"]
+__all__ = ["straight_phase_connectivity", "straight_phase_path_lookup", "viable_inferred_phase_connectivity"]
 
 from typing import Dict, List
 
 from zepben.ewb import PhaseCode, SinglePhaseKind
 from zepben.ewb.services.network.tracing.connectivity.nominal_phase_path import NominalPhasePath
+from zepben.ewb.services.network.tracing.connectivity.phase_path_lookup import PhasePathLookup
 
 # noinspection PyArgumentList
 _STRAIGHT_PHASE_PATHS = {
@@ -38,6 +39,9 @@ straight_phase_connectivity.update({
     } for from_phases in _UNKNOWN_PHASE_CODES
 })
 
+straight_phase_path_lookup = PhasePathLookup(lambda from_phases, to_phases: straight_phase_connectivity.get(from_phases, {}).get(to_phases))
+"""A lookup of the `straight_phase_connectivity` limited to the paths from the included phases."""
+
 viable_inferred_phase_connectivity: Dict[PhaseCode, Dict[PhaseCode, Dict[SinglePhaseKind, List[SinglePhaseKind]]]] = {
     PhaseCode.XY: {
         PhaseCode.ABC: {SinglePhaseKind.X: [SinglePhaseKind.A, SinglePhaseKind.B, SinglePhaseKind.C],
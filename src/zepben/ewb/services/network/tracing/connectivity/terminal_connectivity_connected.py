@@ -5,16 +5,26 @@
 
 __all__ = ["TerminalConnectivityConnected"]
 
-from typing import List, Iterable, Optional, Set, Dict, Callable, Any
+from typing import List, Iterable, Optional, Set, Dict, Callable, Any, Tuple
+from weakref import WeakKeyDictionary
 
-from zepben.ewb import Terminal, PhaseCode, SinglePhaseKind, Switch
+from zepben.ewb import Terminal, PhaseCode, SinglePhaseKind, Switch, ConnectivityNode
 from zepben.ewb.services.network.tracing.connectivity.connectivity_result import ConnectivityResult
 from zepben.ewb.services.network.tracing.connectivity.nominal_phase_path import NominalPhasePath
-from zepben.ewb.services.network.tracing.connectivity.phase_paths import viable_inferred_phase_connectivity, straight_phase_connectivity
+from zepben.ewb.services.network.tracing.connectivity.phase_path_lookup import phase_mask
+from zepben.ewb.services.network.tracing.connectivity.phase_paths import viable_inferred_phase_connectivity, straight_phase_path_lookup
 from zepben.ewb.services.network.tracing.connectivity.xy_candidate_phase_paths import XyCandidatePhasePaths
 from zepben.ewb.services.network.tracing.connectivity.xy_phase_step import XyPhaseStep
 from zepben.ewb.services.network.tracing.traversal.queue import LIFODeque
 
+_NodeState = Tuple[Tuple[Terminal, PhaseCode, int], ...]
+
+_xy_phase_paths_by_node: WeakKeyDictionary[ConnectivityNode, Tuple[_NodeState, Dict[SinglePhaseKind, SinglePhaseKind]]] = WeakKeyDictionary()
+"""
+The XY phase paths calculated for each connectivity node, along with the state of the terminals on the node they were calculated from. Only paths that
+could be calculated from the terminals on the node are stored, so any change to the terminals on the node, or their phases, invalidates the paths.
+"""
+
 
 class TerminalConnectivityConnected:
     """
@@ -44,10 +54,11 @@ class TerminalConnectivityConnected:
         if connectivity_node is None:
             return []
 
+        include_mask = phase_mask(include_phases)
         results = []
         for connected_terminal in connectivity_node.terminals:
             if connected_terminal != terminal:
-                cr = self.terminal_connectivity(terminal, connected_terminal, include_phases)
+                cr = self.terminal_connectivity(terminal, connected_terminal, include_phases, include_mask)
                 if cr.nominal_phase_paths:
                     results.append(cr)
 
@@ -57,24 +68,35 @@ class TerminalConnectivityConnected:
         self,
         terminal: Terminal,
         connected_terminal: Terminal,
-        include_phases: Set[SinglePhaseKind]
+        include_phases: Set[SinglePhaseKind],
+        include_mask: Optional[int] = None
     ) -> ConnectivityResult:
-        return ConnectivityResult(
-            from_terminal=terminal,
-            to_terminal=connected_terminal,
-            nominal_phase_paths=[
-                path for path in (
-                    self._find_straight_phase_paths(terminal, connected_terminal)
-                    or self._find_xy_phase_paths(terminal, connected_terminal)
-                ) if (path.from_phase in include_phases) and (path.to_phase in connected_terminal.phases)
-            ]
+        """
+        Find the phase paths between two terminals connected by a connectivity node.
+
+        :param terminal: The `Terminal` you are moving from.
+        :param connected_terminal: The `Terminal` you are moving to.
+        :param include_phases: The phases on `terminal` you want to use.
+        :param include_mask: The `phase_mask` of `include_phases`. Provide this when finding connectivity for the same phases many times to avoid
+            recalculating it. Defaults to None (calculated from `include_phases`).
+        :return: The `ConnectivityResult` between `terminal` and `connected_terminal`.
+        """
+        # Straight paths are looked up with the included phases already applied. We only need to filter when there are no straight paths between the
+        # phases, and we fall back to the XY paths.
+        paths = straight_phase_path_lookup.get(
+            terminal.phases,
+            connected_terminal.phases,
+            phase_mask(include_phases) if include_mask is None else include_mask
         )
+        if paths is None:
+            paths = [
+                path for path in self._find_xy_phase_paths(terminal, connected_terminal)
+                if (path.from_phase in include_phases) and (path.to_phase in connected_terminal.phases)
+            ]
+            return ConnectivityResult(from_terminal=terminal, to_terminal=connected_terminal, nominal_phase_paths=paths)
 
-    @staticmethod
-    def _find_straight_phase_paths(terminal: Terminal, connected_terminal: Terminal) -> Optional[List[NominalPhasePath]]:
-        paths = straight_phase_connectivity.get(terminal.phases, None)
-
-        return paths and paths.get(connected_terminal.phases)
+        # The looked up paths are already sorted, so they don't need to be sorted again.
+        return ConnectivityResult.from_sorted_paths(terminal, connected_terminal, paths)
 
     def _find_xy_phase_paths(self, terminal: Terminal, connected_terminal: Terminal) -> List[NominalPhasePath]:
         xy_phases = _find_xy_phases(terminal)
@@ -112,20 +134,52 @@ class TerminalConnectivityConnected:
                         .forEach { (from, to) -> addPath(from, to) }
                 }
         """
-        cn = terminal.connectivity_node
-
-        xy_phases = {it: _find_xy_phases(it) for it in cn.terminals if _is_not_none(_find_xy_phases(it))}
-        primary_phases = {it: _find_primary_phases(it) for it in cn.terminals if _is_not_none(_find_primary_phases(it))}
-
-        candidate_phases = self._find_xy_candidate_phases(xy_phases, primary_phases)
-        for from_phase, to_phase in candidate_phases.calculate_paths().items():
+        for from_phase, to_phase in self._calculate_xy_phase_paths(terminal.connectivity_node).items():
             if (to_phase != SinglePhaseKind.NONE) and ((from_phase in terminal.phases.single_phases) or (to_phase in terminal.phases.single_phases)):
                 add_path(from_phase, to_phase)
 
-    def _find_xy_candidate_phases(self, xy_phases: Dict[Terminal, PhaseCode], primary_phases: Dict[Terminal, PhaseCode]) -> XyCandidatePhasePaths:
+    def _calculate_xy_phase_paths(self, cn: ConnectivityNode) -> Dict[SinglePhaseKind, SinglePhaseKind]:
+        # The paths are the same for every terminal on the node, so we reuse them until the terminals on the node change. We can't reuse them when
+        # the candidate phases were found by searching beyond the node, as they then depend on the state of the network around the node, or when using
+        # a custom candidate phase factory, as it may depend on the factory being called.
+        use_cache = self._create_candidate_phases is XyCandidatePhasePaths
+        if use_cache:
+            node_state = tuple((it, it.phases, it.normal_phases._phase_status_internal) for it in cn.terminals)
+            cached = _xy_phase_paths_by_node.get(cn)
+            if (cached is not None) and (cached[0] == node_state):
+                return cached[1]
+
+        xy_phases = {}
+        primary_phases = {}
+        for it in cn.terminals:
+            xy_phase_code = _find_xy_phases(it)
+            if _is_not_none(xy_phase_code):
+                xy_phases[it] = xy_phase_code
+
+            primary_phase_code = _find_primary_phases(it)
+            if _is_not_none(primary_phase_code):
+                primary_phases[it] = primary_phase_code
+
+        candidate_phases, searched_beyond_node = self._find_xy_candidate_phases(xy_phases, primary_phases)
+        paths = candidate_phases.calculate_paths()
+
+        if use_cache:
+            if searched_beyond_node:
+                _xy_phase_paths_by_node.pop(cn, None)
+            else:
+                _xy_phase_paths_by_node[cn] = (node_state, paths)
+
+        return paths
+
+    def _find_xy_candidate_phases(
+        self,
+        xy_phases: Dict[Terminal, PhaseCode],
+        primary_phases: Dict[Terminal, PhaseCode]
+    ) -> Tuple[XyCandidatePhasePaths, bool]:
         queue = LIFODeque[XyPhaseStep]()
         visited = set()
         candidate_phases = self._create_candidate_phases()
+        searched_beyond_node = False
 
         for terminal, xy_phase_code in xy_phases.items():
             for primary_phase_code in primary_phases.values():
@@ -133,12 +187,13 @@ class TerminalConnectivityConnected:
                     candidate_phases.add_candidates(phase, candidates)
 
             # noinspection PyArgumentList
-            self._find_more_xy_candidate_phases(XyPhaseStep(terminal, xy_phase_code), visited, queue, candidate_phases)
+            if self._find_more_xy_candidate_phases(XyPhaseStep(terminal, xy_phase_code), visited, queue, candidate_phases):
+                searched_beyond_node = True
 
         while len(queue) > 0:
             self._find_more_xy_candidate_phases(queue.pop(), visited, queue, candidate_phases)
 
-        return candidate_phases
+        return candidate_phases, searched_beyond_node
 
     def _find_more_xy_candidate_phases(
         self,
@@ -146,9 +201,12 @@ class TerminalConnectivityConnected:
         visited: Set[XyPhaseStep],
         queue: LIFODeque[XyPhaseStep],
         candidate_phases: XyCandidatePhasePaths
-    ):
+    ) -> bool:
+        """
+        :return: True if the search needs to continue beyond the terminal of the step, otherwise False.
+        """
         if step in visited:
-            return
+            return False
 
         visited.add(step)
 
@@ -156,10 +214,13 @@ class TerminalConnectivityConnected:
         if (SinglePhaseKind.X in without_neutral) or (SinglePhaseKind.Y in without_neutral):
             if not self._check_traced_phases(step, candidate_phases):
                 self._queue_next(step.terminal, without_neutral, queue)
+                return True
         else:
             for (phase, candidates) in viable_inferred_phase_connectivity.get(step.phase_code, {}).get(without_neutral, {}).items():
                 candidate_phases.add_candidates(phase, candidates)
 
+        return False
+
     @staticmethod
     def _check_traced_phases(step: XyPhaseStep, candidate_phases: XyCandidatePhasePaths) -> bool:
         found_traced = False
@@ -5,10 +5,16 @@
 
 __all__ = ["TerminalConnectivityInternal"]
 
-from typing import Set, Optional, Iterable, cast
+from typing import Set, Optional, Iterable, Tuple, cast
 
 from zepben.ewb import Terminal, PowerTransformer, SinglePhaseKind, ConnectivityResult, NominalPhasePath, ShuntCompensator
-from zepben.ewb.services.network.tracing.connectivity.transformer_phase_paths import transformer_phase_paths
+from zepben.ewb.services.network.tracing.connectivity.phase_path_lookup import PhasePathLookup, phase_mask
+from zepben.ewb.services.network.tracing.connectivity.transformer_phase_paths import transformer_phase_path_lookup
+
+# noinspection PyArgumentList
+_straight_phase_path_lookup = PhasePathLookup(
+    lambda from_phases, to_phases: [NominalPhasePath(it, it) for it in from_phases.single_phases if it in to_phases.single_phases]
+)
 
 
 class TerminalConnectivityInternal:
@@ -35,23 +41,23 @@ class TerminalConnectivityInternal:
         if include_phases is None:
             include_phases = set(terminal.phases.single_phases)
 
-        if isinstance(terminal.conducting_equipment, PowerTransformer):
+        if isinstance(terminal.conducting_equipment, ShuntCompensator):
+            return ConnectivityResult(terminal, other_terminal, self._find_shunt_compensator_phase_paths(terminal, other_terminal, include_phases))
+        elif isinstance(terminal.conducting_equipment, PowerTransformer):
             paths = self._find_transformer_phase_paths(terminal, other_terminal, include_phases)
-        elif isinstance(terminal.conducting_equipment, ShuntCompensator):
-            paths = self._find_shunt_compensator_phase_paths(terminal, other_terminal, include_phases)
         else:
             paths = self._find_straight_phase_paths(terminal, other_terminal, include_phases)
 
-        return ConnectivityResult(terminal, other_terminal, paths)
+        # The looked up paths are already sorted, so they don't need to be sorted again.
+        return ConnectivityResult.from_sorted_paths(terminal, other_terminal, paths)
 
     @staticmethod
     def _find_transformer_phase_paths(
         terminal: Terminal,
         other_terminal: Terminal,
         include_phases: Set[SinglePhaseKind]
-    ) -> Iterable[NominalPhasePath]:
-        return [it for it in transformer_phase_paths.get(terminal.phases, {}).get(other_terminal.phases, [])
-                if (it.from_phase in include_phases) or (it.from_phase == SinglePhaseKind.NONE)]
+    ) -> Tuple[NominalPhasePath, ...]:
+        return transformer_phase_path_lookup.get(terminal.phases, other_terminal.phases, phase_mask(include_phases)) or ()
 
     def _find_shunt_compensator_phase_paths(
         self,
@@ -73,6 +79,5 @@ class TerminalConnectivityInternal:
         terminal: Terminal,
         other_terminal: Terminal,
         include_phases: Set[SinglePhaseKind]
-    ) -> Iterable[NominalPhasePath]:
-        return [NominalPhasePath(it, it) for it in set(terminal.phases.single_phases).intersection(set(other_terminal.phases.single_phases))
-                if it in include_phases]
+    ) -> Tuple[NominalPhasePath, ...]:
+        return _straight_phase_path_lookup.get(terminal.phases, other_terminal.phases, phase_mask(include_phases)) or ()
@@ -3,11 +3,12 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
-__all__ = ["transformer_phase_paths", "add_neutral"]
+__all__ = ["transformer_phase_paths", "transformer_phase_path_lookup", "add_neutral"]
 
 from typing import Dict, List
 
 from zepben.ewb import SinglePhaseKind as Phase, NominalPhasePath, PhaseCode
+from zepben.ewb.services.network.tracing.connectivity.phase_path_lookup import PhasePathLookup
 
 
 def _path(from_phase: Phase, to_phase: Phase) -> NominalPhasePath:
@@ -200,3 +201,9 @@ transformer_phase_paths: Dict[PhaseCode, Dict[PhaseCode, List[NominalPhasePath]]
         PhaseCode.XYN: [_path(Phase.X, Phase.X), _path(Phase.NONE, Phase.Y), add_neutral],
     },
 }
+
+transformer_phase_path_lookup = PhasePathLookup(
+    lambda from_phases, to_phases: transformer_phase_paths.get(from_phases, {}).get(to_phases),
+    always_include_none=True
+)
+"""A lookup of the `transformer_phase_paths` limited to the paths from the included phases, which always includes the paths added by the transformer."""
@@ -9,12 +9,14 @@ __all__ = ["AssignToFeeders", "BaseFeedersInternal"]
 
 from collections.abc import Collection
 from logging import Logger
-from typing import Iterable, Union, List, Dict, Any, Set, Type, Generator, TYPE_CHECKING
+from typing import Iterable, Union, List, Dict, Any, Set, Type, Generator, Optional, Tuple, Callable, TYPE_CHECKING
 
 from zepben.ewb import Switch, ProtectedSwitch, PowerElectronicsConnection
 from zepben.ewb.model.cim.extensions.iec61970.base.feeder.lv_substation import LvSubstation
 from zepben.ewb.model.cim.iec61970.base.core.feeder import Feeder
+from zepben.ewb.model.cim.iec61970.base.core.identified_object import IdentifiedObject
 from zepben.ewb.model.cim.iec61970.base.wires.power_transformer import PowerTransformer
+from zepben.ewb.services.common.forked_workers import can_fork_workers, forked_worker_pool, worker_state
 from zepben.ewb.services.network.network_service import NetworkService
 from zepben.ewb.services.network.tracing.networktrace.conditions.conditions import stop_at_open
 from zepben.ewb.services.network.tracing.networktrace.network_trace import NetworkTrace
@@ -27,6 +29,10 @@ from zepben.ewb.services.network.tracing.traversal.step_context import StepConte
 if TYPE_CHECKING:
     from zepben.ewb import AuxiliaryEquipment, Equipment, LvFeeder, ConductingEquipment, EquipmentContainer, Terminal
 
+_ObjectRef = Tuple[str, type]
+_Assignment = Tuple[str, _ObjectRef, _ObjectRef]
+"""An association collected by a trace, made up of the name of the `NetworkStateOperators` method to call and references to the objects to pass to it."""
+
 
 class AssignToFeeders:
     """
@@ -35,8 +41,16 @@ class AssignToFeeders:
     This class is backed by a `NetworkTrace`.
     """
 
-    def __init__(self, debug_logger: Logger = None):
+    def __init__(self, debug_logger: Logger = None, max_workers: Optional[int] = None):
+        """
+        :param debug_logger: An optional logger to add information about how the trace is processing items.
+        :param max_workers: The number of worker processes used to trace the feeders when assigning every feeder in the network. The traces of each feeder
+          are collected by the workers and then applied in the same order they would have been assigned one feeder at a time, so the results are identical.
+          Defaults to None, which traces one feeder at a time. NOTE: Worker processes are only used on platforms that support forking the process, and
+          only while no other threads are running, as forking a process with other running threads can deadlock the workers.
+        """
         self._debug_logger = debug_logger
+        self._max_workers = max_workers
 
     async def run(
         self,
@@ -56,7 +70,8 @@ class AssignToFeeders:
 
         await AssignToFeedersInternal(
             network_state_operators,
-            self._debug_logger
+            self._debug_logger,
+            self._max_workers
         ).run(network, start_terminal)
 
 
@@ -64,6 +79,23 @@ class BaseFeedersInternal:
     def __init__(self, network_state_operators: Type[NetworkStateOperators] = NetworkStateOperators.NORMAL, debug_logger: Logger = None):
         self.network_state_operators = network_state_operators
         self._debug_logger = debug_logger
+        self._collected: Optional[List[_Assignment]] = None
+
+    def _associate_equipment_and_container(self, equipment: Equipment, container: EquipmentContainer):
+        if self._collected is None:
+            self.network_state_operators.associate_equipment_and_container(equipment, container)
+        else:
+            self._collect("associate_equipment_and_container", equipment, container)
+
+    def _associate_energizing_feeder(self, feeder: Feeder, other: Union[LvFeeder, LvSubstation]):
+        if self._collected is None:
+            self.network_state_operators.associate_energizing_feeder(feeder, other)
+        else:
+            self._collect("associate_energizing_feeder", feeder, other)
+
+    def _collect(self, method: str, obj: IdentifiedObject, other: IdentifiedObject):
+        # We record the association to be applied later, rather than making it, so the trace can be run away from the network being updated.
+        self._collected.append((method, (obj.mrid, type(obj)), (other.mrid, type(other))))
 
     def _feeders_from_terminal(self, terminal: Terminal) -> Generator[Feeder, None, None]:
         return terminal.conducting_equipment.feeders(self.network_state_operators)
@@ -74,7 +106,7 @@ class BaseFeedersInternal:
                 #todo remove this and fix the test that is using PatchedNetworkTraceStepPath (removing it). Error is that the feeder test doesn't have a head
                 # equipment, and the trace validation throws an error.
                 if it is not None:
-                    self.network_state_operators.associate_equipment_and_container(it, feeder)
+                    self._associate_equipment_and_container(it, feeder)
 
     def _associate_relay_systems_with_containers(self, equipment_containers: Iterable[EquipmentContainer], to_equipment: ProtectedSwitch):
         self._associate_equipment_with_containers(
@@ -88,12 +120,12 @@ class BaseFeedersInternal:
     def _feeder_energizes(self, feeders: Iterable[Union[LvFeeder, Feeder]], lv_feeders: Iterable[LvFeeder]):
         for feeder in feeders:
             for lv_feeder in lv_feeders:
-                self.network_state_operators.associate_energizing_feeder(feeder, lv_feeder)
+                self._associate_energizing_feeder(feeder, lv_feeder)
 
     def _feeder_energizes_lv_substations(self, feeders: Iterable[LvFeeder | Feeder], lv_substations: Iterable[LvSubstation]):
         for feeder in feeders:
             for lvs in lv_substations:
-                self.network_state_operators.associate_energizing_feeder(feeder, lvs)
+                self._associate_energizing_feeder(feeder, lvs)
 
     def _feeder_try_energize_lv_feeders_and_substations(
         self,
@@ -115,6 +147,15 @@ class BaseFeedersInternal:
 
 class AssignToFeedersInternal(BaseFeedersInternal):
 
+    def __init__(
+        self,
+        network_state_operators: Type[NetworkStateOperators] = NetworkStateOperators.NORMAL,
+        debug_logger: Logger = None,
+        max_workers: Optional[int] = None
+    ):
+        super().__init__(network_state_operators, debug_logger)
+        self._max_workers = max_workers
+
     async def run(
         self,
         network: NetworkService,
@@ -125,12 +166,16 @@ class AssignToFeedersInternal(BaseFeedersInternal):
         terminal_to_aux_equipment = network.aux_equipment_by_terminal
 
         if start_terminal is None:
-            for it in list(it for it in network.objects(Feeder)):
-                await self.run_with_feeders(it.normal_head_terminal,
-                                            feeder_start_points,
-                                            lv_feeder_start_points,
-                                            terminal_to_aux_equipment,
-                                            [it])
+            feeders = list(network.objects(Feeder))
+            if self._can_use_workers(feeders):
+                self._run_in_workers(network, feeders, feeder_start_points, lv_feeder_start_points, terminal_to_aux_equipment)
+            else:
+                for it in feeders:
+                    await self.run_with_feeders(it.normal_head_terminal,
+                                                feeder_start_points,
+                                                lv_feeder_start_points,
+                                                terminal_to_aux_equipment,
+                                                [it])
 
         else:
             await self.run_with_feeders(start_terminal,
@@ -145,6 +190,14 @@ class AssignToFeedersInternal(BaseFeedersInternal):
                                lv_feeder_start_points: Set[ConductingEquipment],
                                terminal_to_aux_equipment: Dict[Terminal, List[AuxiliaryEquipment]],
                                feeders_to_assign: List[Feeder]):
+        self._run_with_feeders(terminal, feeder_start_points, lv_feeder_start_points, terminal_to_aux_equipment, feeders_to_assign)
+
+    def _run_with_feeders(self,
+                          terminal: Terminal,
+                          feeder_start_points: Set[ConductingEquipment],
+                          lv_feeder_start_points: Set[ConductingEquipment],
+                          terminal_to_aux_equipment: Dict[Terminal, List[AuxiliaryEquipment]],
+                          feeders_to_assign: List[Feeder]):
 
         if terminal is None or len(feeders_to_assign) == 0:
             return
@@ -152,15 +205,61 @@ class AssignToFeedersInternal(BaseFeedersInternal):
         if isinstance(start_ce := terminal.conducting_equipment, Switch) and self.network_state_operators.is_open(start_ce):
             self._associate_equipment_with_containers(feeders_to_assign, [start_ce])
         else:
-            traversal = await self._create_trace(terminal_to_aux_equipment, feeder_start_points, lv_feeder_start_points, feeders_to_assign)
-            await traversal.run(terminal, False, can_stop_on_start_item=False)
+            traversal = self._create_trace(terminal_to_aux_equipment, feeder_start_points, lv_feeder_start_points, feeders_to_assign)
+            traversal.run_sync(terminal, False, can_stop_on_start_item=False)
 
-    async def _create_trace(self,
-                            terminal_to_aux_equipment: Dict[Terminal, List[AuxiliaryEquipment]],
-                            feeder_start_points: Set[ConductingEquipment],
-                            lv_feeder_start_points: Set[ConductingEquipment],
-                            feeders_to_assign: List[Feeder]
-                            ) -> NetworkTrace[Any]:
+    def _can_use_workers(self, feeders: List[Feeder]) -> bool:
+        return (len(feeders) > 1) and can_fork_workers(self._max_workers)
+
+    def _run_in_workers(
+        self,
+        network: NetworkService,
+        feeders: List[Feeder],
+        *trace_args: Any
+    ):
+        # The feeders are traced in forked worker processes, which share the network with this process, and only collect the associations each feeder
+        # would make. The traces don't read anything the associations change, so applying them in the original feeder order gives the same result as
+        # tracing the feeders one at a time.
+        workers = min(self._max_workers, len(feeders))
+        chunk_size = max(1, len(feeders) // (workers * 4))
+        with forked_worker_pool(workers, (self, network, trace_args)) as executor:
+            collected = executor.map(_collect_feeder_assignments, [it.mrid for it in feeders], chunksize=chunk_size)
+
+            for feeder, assignments in zip(feeders, collected):
+                if not self._apply_collected(network, assignments):
+                    # If we couldn't find something the worker traced to (e.g. it isn't in the network), we just trace the feeder again here.
+                    self._run_with_feeders(feeder.normal_head_terminal, *trace_args, [feeder])
+
+    def _collect_assignments(self, feeder: Feeder, *trace_args: Any) -> List[_Assignment]:
+        self._collected = collected = []
+        try:
+            self._run_with_feeders(feeder.normal_head_terminal, *trace_args, [feeder])
+        finally:
+            self._collected = None
+        return collected
+
+    def _apply_collected(self, network: NetworkService, assignments: List[_Assignment]) -> bool:
+        def resolve(ref: _ObjectRef) -> Optional[IdentifiedObject]:
+            obj = network.get(ref[0], default=None)
+            return obj if type(obj) is ref[1] else None
+
+        resolved: List[Tuple[Callable[[Any, Any], None], IdentifiedObject, IdentifiedObject]] = []
+        for method, obj_ref, other_ref in assignments:
+            obj, other = resolve(obj_ref), resolve(other_ref)
+            if (obj is None) or (other is None):
+                return False
+            resolved.append((getattr(self.network_state_operators, method), obj, other))
+
+        for associate, obj, other in resolved:
+            associate(obj, other)
+        return True
+
+    def _create_trace(self,
+                      terminal_to_aux_equipment: Dict[Terminal, List[AuxiliaryEquipment]],
+                      feeder_start_points: Set[ConductingEquipment],
+                      lv_feeder_start_points: Set[ConductingEquipment],
+                      feeders_to_assign: List[Feeder]
+                      ) -> NetworkTrace[Any]:
 
         def _reached_lv(ce: ConductingEquipment):
             return True if ce.base_voltage and ce.base_voltage.nominal_voltage < 1000 else False
@@ -168,8 +267,8 @@ class AssignToFeedersInternal(BaseFeedersInternal):
         def _reached_substation_transformer(ce: ConductingEquipment):
             return True if isinstance(ce, PowerTransformer) and len(list(ce.substations)) > 0 else False
 
-        async def step_action(nts: NetworkTraceStep, context: StepContext):
-            await self._process(nts.path, context, terminal_to_aux_equipment, lv_feeder_start_points, feeders_to_assign)
+        def step_action(nts: NetworkTraceStep, context: StepContext):
+            self._process(nts.path, context, terminal_to_aux_equipment, lv_feeder_start_points, feeders_to_assign)
 
         return (
             Tracing.network_trace(
@@ -191,12 +290,12 @@ class AssignToFeedersInternal(BaseFeedersInternal):
             .add_step_action(step_action)
         )
 
-    async def _process(self,
-                       step_path: NetworkTraceStep.Path,
-                       step_context: StepContext,
-                       terminal_to_aux_equipment: Dict[Terminal, Collection[AuxiliaryEquipment]],
-                       lv_feeder_start_points: Set[ConductingEquipment],
-                       feeders_to_assign: List[Feeder]):
+    def _process(self,
+                 step_path: NetworkTraceStep.Path,
+                 step_context: StepContext,
+                 terminal_to_aux_equipment: Dict[Terminal, Collection[AuxiliaryEquipment]],
+                 lv_feeder_start_points: Set[ConductingEquipment],
+                 feeders_to_assign: List[Feeder]):
 
         if step_path.traced_internally and not step_context.is_start_item:
             return
@@ -211,3 +310,8 @@ class AssignToFeedersInternal(BaseFeedersInternal):
             self._associate_relay_systems_with_containers(feeders_to_assign, to_equip)
         elif isinstance(to_equip, PowerElectronicsConnection):
             self._associate_power_electronic_units(feeders_to_assign, to_equip)
+
+
+def _collect_feeder_assignments(feeder_mrid: str) -> List[_Assignment]:
+    internal, network, trace_args = worker_state()
+    return internal._collect_assignments(network.get(feeder_mrid, Feeder), *trace_args)
@@ -24,7 +24,7 @@ from zepben.ewb.services.network.tracing.networktrace.conditions.network_trace_s
 from zepben.ewb.services.network.tracing.networktrace.network_trace_action_type import NetworkTraceActionType, CanActionItem
 from zepben.ewb.services.network.tracing.networktrace.network_trace_queue_next import NetworkTraceQueueNext
 from zepben.ewb.services.network.tracing.networktrace.network_trace_step import NetworkTraceStep
-from zepben.ewb.services.network.tracing.networktrace.network_trace_tracker import NetworkTraceTracker
+from zepben.ewb.services.network.tracing.networktrace.network_trace_tracker import NetworkTraceTracker, BranchingNetworkTraceTracker
 from zepben.ewb.services.network.tracing.networktrace.operators.network_state_operators import NetworkStateOperators
 from zepben.ewb.services.network.tracing.traversal.queue import TraversalQueue
 from zepben.ewb.services.network.tracing.traversal.queue_condition import QueueCondition
@@ -94,7 +94,11 @@ class NetworkTrace(Traversal[NetworkTraceStep[T], 'NetworkTrace[T]'], Generic[T]
         self.network_state_operators = network_state_operators
         self._action_type = action_type
 
-        self._tracker = NetworkTraceTracker()
+        if isinstance(queue_type, Traversal.BranchingQueueType):
+            parent_tracker = parent._tracker if parent is not None else None
+            self._tracker = BranchingNetworkTraceTracker(self, parent_tracker if isinstance(parent_tracker, BranchingNetworkTraceTracker) else None)
+        else:
+            self._tracker = NetworkTraceTracker()
 
         super().__init__(self._queue_type, parent=parent, debug_logger=debug_logger)
 
@@ -296,6 +300,29 @@ class NetworkTrace(Traversal[NetworkTraceStep[T], 'NetworkTrace[T]'], Generic[T]
         await super().run(can_stop_on_start_item=can_stop_on_start_item)
         return self
 
+    def run_sync(
+        self,
+        start: Union[ConductingEquipment, Terminal, NetworkTraceStep.Path] = None,
+        data: T = None,
+        phases: PhaseCode = None,
+        can_stop_on_start_item: bool = True,
+    ) -> "NetworkTrace[T]":
+        """
+        Runs the network trace synchronously starting from ``start``. See :meth:`run` for details of the start items. This can only be used when
+        none of the step actions are async.
+
+        :param start: The starting :class:`Terminal` or :class:`ConductingEquipment` for the trace.
+        :param data: The data associated with the start step.
+        :param phases: Phases to trace; ``None`` to ignore phases.
+        :param can_stop_on_start_item: indicates whether the trace should check stop conditions on start items.
+        """
+
+        if start is not None:
+            self.add_start_item(start, data, phases)
+
+        super().run_sync(can_stop_on_start_item=can_stop_on_start_item)
+        return self
+
     @singledispatchmethod
     def add_condition(self, condition: QueueCondition[T], **kwargs) -> "NetworkTrace[T]":
         """
@@ -400,16 +427,10 @@ class NetworkTrace(Traversal[NetworkTraceStep[T], 'NetworkTrace[T]'], Generic[T]
         return {NominalPhasePath(it, it) for it in phases.single_phases} if phases and phases.single_phases else set()
 
     def has_visited(self, terminal: Terminal, phases: FrozenSet[SinglePhaseKind]) -> bool:
-        parent = self.parent
-        while parent is not None:
-            if parent._tracker.has_visited(terminal, phases):
-                return True
-            parent = parent.parent
+        # Branching traces share a tracker with their ancestors, so this also checks what has been visited by the parent branches.
         return self._tracker.has_visited(terminal, phases)
 
     def visit(self, terminal: Terminal, phases: FrozenSet[SinglePhaseKind]) -> bool:
-        if self.parent and self.parent.has_visited(terminal, phases):
-            return False
         return self._tracker.visit(terminal, phases)
 
 
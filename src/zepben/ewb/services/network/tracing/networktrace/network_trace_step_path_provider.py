@@ -14,6 +14,7 @@ from zepben.ewb.model.cim.iec61970.base.wires.ac_line_segment import AcLineSegme
 from zepben.ewb.model.cim.iec61970.base.wires.busbar_section import BusbarSection
 from zepben.ewb.model.cim.iec61970.base.wires.clamp import Clamp
 from zepben.ewb.model.cim.iec61970.base.wires.cut import Cut
+from zepben.ewb.services.network.tracing.connectivity.phase_path_lookup import phase_mask
 from zepben.ewb.services.network.tracing.connectivity.terminal_connectivity_connected import TerminalConnectivityConnected
 from zepben.ewb.services.network.tracing.networktrace.network_trace_step import NetworkTraceStep
 
@@ -23,6 +24,8 @@ if TYPE_CHECKING:
 
 PathFactory = Callable[['Terminal', AcLineSegment], Optional[NetworkTraceStep.Path]]
 
+_terminal_connectivity_connected = TerminalConnectivityConnected()
+
 
 class NetworkTraceStepPathProvider:
     def __init__(
@@ -73,10 +76,11 @@ class NetworkTraceStepPathProvider:
     ) -> PathFactory:
 
         phase_paths = set(p.to_phase for p in path.nominal_phase_paths)
+        include_mask = phase_mask(phase_paths)
         next_from_terminal = path.to_terminal
 
         def path_factory(next_terminal: 'Terminal', traversed: AcLineSegment):
-            next_paths = TerminalConnectivityConnected().terminal_connectivity(next_from_terminal, next_terminal, phase_paths)
+            next_paths = _terminal_connectivity_connected.terminal_connectivity(next_from_terminal, next_terminal, phase_paths, include_mask)
             if next_paths.nominal_phase_paths:
                 return NetworkTraceStep.Path(next_from_terminal, next_terminal, traversed, set(next_paths.nominal_phase_paths))
             else:
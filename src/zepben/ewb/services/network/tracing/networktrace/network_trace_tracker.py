@@ -2,38 +2,192 @@
 #  This Source Code Form is subject to the terms of the Mozilla Public
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
-from typing import Any, FrozenSet
+
+from __future__ import annotations
+
+__all__ = ["NetworkTraceTracker", "BranchingNetworkTraceTracker"]
+
+from itertools import count
+from typing import Any, FrozenSet, Set, Iterable, Dict, Optional, TYPE_CHECKING
+from weakref import ref, ReferenceType
 
 from zepben.ewb.model.cim.iec61970.base.core.terminal import Terminal
 from zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind import SinglePhaseKind
 
+if TYPE_CHECKING:
+    from zepben.ewb.services.network.tracing.traversal.traversal import Traversal
+
+_next_trace_index = count()
+
+# Phases are looked up by identity, as hashing an enum member calls back into Python, which is far slower than the lookup itself. Every phase gets its
+# own bit (rather than using `SinglePhaseKind.bit_mask`, which is shared between A/X/s1 and B/Y/s2), so the packed keys are exactly equivalent to the
+# set of phases they were created from.
+_phase_bits = {id(it): 1 << it.id for it in SinglePhaseKind}
+_phase_bits_width = len(SinglePhaseKind)
+
 
 class NetworkTraceTracker:
     """
-    Internal class that tracks visited state of a Terminal's Phase in a Network Trace
+    Internal class that tracks visited state of a Terminal's Phase in a Network Trace.
+
+    Terminals are tracked by a compact integer index that is assigned to each terminal the first time it is tracked. Visits without phases are stored
+    in a bitset of these indexes, and visits with phases are stored as the index packed with a bitmask of the phases. Anything other than a
+    terminal is tracked by its mRID.
+
+    As the index belongs to the Terminal object rather than its mRID, separate Terminal objects are always tracked separately, even if they share an
+    mRID. Within a single network this is the same as tracking by mRID, and when one tracker is used to trace more than one network, such as a copy
+    of a network, the terminals of each network are tracked independently.
     """
     def __init__(self):
-        self._visited = set()
+        self._visited_terminals = bytearray()
+        self._first_index = 0
+        self._visited_phases: Set[int] = set()
+        self._visited_other: Set[Any] = set()
 
     def has_visited(self, terminal: Terminal, phases: FrozenSet[SinglePhaseKind]=None) -> bool:
         """Returns True if this Terminal's Phase has been visited, False otherwise"""
-        return self._get_key(terminal, phases) in self._visited
+        if not isinstance(terminal, Terminal):
+            return self._get_key(terminal, phases) in self._visited_other
+
+        index = terminal._trace_index
+        if index is None:
+            # A terminal that has never been tracked can't have been visited.
+            return False
+
+        if phases:
+            return _packed_key(index, phases) in self._visited_phases
+
+        position = index - self._first_index
+        visited = self._visited_terminals
+        return (0 <= position < (len(visited) << 3)) and (visited[position >> 3] & (1 << (position & 7)) != 0)
 
     def visit(self, terminal: Terminal, phases: FrozenSet[SinglePhaseKind]=None) -> bool:
         """Marks this Terminal's Phase as visited"""
-        key = self._get_key(terminal, phases)
-        if key not in self._visited:
-            self._visited.add(self._get_key(terminal, phases))
-            return True
-        return False
+        if not isinstance(terminal, Terminal):
+            return _add(self._visited_other, self._get_key(terminal, phases))
+
+        index = terminal._trace_index
+        if index is None:
+            index = terminal._trace_index = next(_next_trace_index)
+
+        if phases:
+            return _add(self._visited_phases, _packed_key(index, phases))
+
+        position = index - self._first_index
+        visited = self._visited_terminals
+        if not (0 <= position < (len(visited) << 3)):
+            position = self._grow_to(index)
+
+        byte = position >> 3
+        bit = 1 << (position & 7)
+        if visited[byte] & bit:
+            return False
+        visited[byte] |= bit
+        return True
 
     def clear(self):
         """Unmarks this Terminal's Phase as visited"""
-        self._visited.clear()
+        self._visited_terminals = bytearray()
+        self._first_index = 0
+        self._visited_phases.clear()
+        self._visited_other.clear()
+
+    def _grow_to(self, index: int) -> int:
+        # Grow the bitset to include the index, returning the bit position of the index. The bitset only covers the range of indexes that have been
+        # visited, and grows by at least its current size to keep the cost of growing it constant when amortised. The bitset is grown in place, so
+        # existing references to it remain valid.
+        if not self._visited_terminals:
+            self._first_index = index
+            self._visited_terminals.extend(bytes(8))
+            return 0
+
+        position = index - self._first_index
+        if position < 0:
+            grow_by = max((7 - position) >> 3, len(self._visited_terminals))
+            self._visited_terminals[:0] = bytes(grow_by)
+            self._first_index -= grow_by << 3
+            return index - self._first_index
+
+        required = (position >> 3) + 1
+        if required > len(self._visited_terminals):
+            self._visited_terminals.extend(bytes(max(required - len(self._visited_terminals), len(self._visited_terminals))))
+        return position
 
     @staticmethod
-    def _get_key(terminal: Terminal, phases: FrozenSet[SinglePhaseKind]) -> Any:
+    def _get_key(terminal: Any, phases: FrozenSet[SinglePhaseKind]) -> Any:
         if phases:
             return terminal.mrid, phases
         else:
             return terminal.mrid
+
+
+class BranchingNetworkTraceTracker:
+    """
+    Internal class that tracks visited state of a Terminal's Phase for a single branch of a branching Network Trace.
+
+    The visits of every branch created from the same root trace are stored together, stamped with the branch that made them. Each branch, along with
+    all of its own branches, is run to completion before the next branch is started, which means the only traces running at any point are the
+    current branch and its ancestors. A visit is therefore only seen by a branch if it was made by the branch itself or by a trace that is still
+    running, making each check a single lookup no matter how deep the branch is. As with `NetworkTraceTracker`, terminals are tracked by object rather
+    than by mRID.
+
+    :param trace: The trace whose visits are tracked.
+    :param parent: The tracker of the parent branch, or None if this is the root of the branching trace.
+    """
+
+    def __init__(self, trace: Traversal, parent: Optional[BranchingNetworkTraceTracker] = None):
+        # Visits are stamped with a weak reference to the trace, so finished branches can be freed while the visits they made are still stored.
+        self._trace_ref: ReferenceType = ref(trace)
+        self._parent = parent
+        self._visited_by: Dict[Any, ReferenceType] = parent._visited_by if parent is not None else {}
+
+    def has_visited(self, terminal: Terminal, phases: FrozenSet[SinglePhaseKind]=None) -> bool:
+        """Returns True if this Terminal's Phase has been visited by this branch or any of its ancestors, False otherwise"""
+        return self._is_visible(self._visited_by.get(_key_of(terminal, phases)))
+
+    def visit(self, terminal: Terminal, phases: FrozenSet[SinglePhaseKind]=None) -> bool:
+        """Marks this Terminal's Phase as visited, unless it has already been visited by this branch or any of its ancestors"""
+        key = _key_of(terminal, phases)
+        if self._is_visible(self._visited_by.get(key)):
+            return False
+        self._visited_by[key] = self._trace_ref
+        return True
+
+    def clear(self):
+        """Unmarks this Terminal's Phase as visited. Clearing the root of the branching trace also clears the visits of all its branches."""
+        if self._parent is None:
+            self._visited_by.clear()
+        else:
+            for key in [key for key, visited_by in self._visited_by.items() if visited_by is self._trace_ref]:
+                del self._visited_by[key]
+
+    def _is_visible(self, visited_by: Optional[ReferenceType]) -> bool:
+        if visited_by is None:
+            return False
+        if visited_by is self._trace_ref:
+            return True
+        trace = visited_by()
+        return (trace is not None) and trace.running
+
+
+def _key_of(terminal: Terminal, phases: Optional[Iterable[SinglePhaseKind]]) -> Any:
+    if not isinstance(terminal, Terminal):
+        return NetworkTraceTracker._get_key(terminal, phases)
+
+    index = terminal._trace_index
+    if index is None:
+        index = terminal._trace_index = next(_next_trace_index)
+    return _packed_key(index, phases) if phases else index << _phase_bits_width
+
+
+def _packed_key(index: int, phases: Iterable[SinglePhaseKind]) -> int:
+    mask = 0
+    for phase in phases:
+        mask |= _phase_bits[id(phase)]
+    return (index << _phase_bits_width) | mask
+
+
+def _add(visited: Set[Any], key: Any) -> bool:
+    size = len(visited)
+    visited.add(key)
+    return len(visited) != size
@@ -3,7 +3,7 @@
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 from logging import Logger
-from typing import TypeVar, Union, Callable, Type
+from typing import TypeVar, Union, Callable, Type, Optional
 
 from zepben.ewb.services.network.tracing.networktrace.compute_data import ComputeData, ComputeDataWithPaths
 from zepben.ewb.services.network.tracing.networktrace.network_trace import NetworkTrace
@@ -102,9 +102,9 @@ class Tracing:
         return ClearDirection(debug_logger=debug_logger)
 
     @staticmethod
-    def assign_equipment_to_feeders(debug_logger: Logger = None):
+    def assign_equipment_to_feeders(debug_logger: Logger = None, max_workers: Optional[int] = None):
         from zepben.ewb.services.network.tracing.feeder.assign_to_feeders import AssignToFeeders
-        return AssignToFeeders(debug_logger=debug_logger)
+        return AssignToFeeders(debug_logger=debug_logger, max_workers=max_workers)
 
     @staticmethod
     def assign_equipment_to_lv_feeders(debug_logger: Logger = None):
@@ -130,3 +130,8 @@ class Tracing:
     def find_swer_equipment(debug_logger: Logger = None):
         from zepben.ewb.services.network.tracing.find_swer_equipment import FindSwerEquipment
         return FindSwerEquipment(debug_logger=debug_logger)
+
+    @staticmethod
+    def apply_current_state_events(debug_logger: Logger = None):
+        from zepben.ewb.services.network.tracing.apply_current_state_events import ApplyCurrentStateEvents
+        return ApplyCurrentStateEvents(debug_logger=debug_logger)
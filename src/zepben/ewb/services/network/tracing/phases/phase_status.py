@@ -7,13 +7,13 @@ from __future__ import annotations
 
 __all__ = ["PhaseStatus"]
 
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
 from zepben.ewb.model.cim.iec61970.base.core.phase_code import phase_code_from_single_phases, PhaseCode
 from zepben.ewb.model.cim.iec61970.base.wires.single_phase_kind import SinglePhaseKind
 from zepben.ewb.exceptions import PhaseException
 from zepben.ewb.services.network.tracing.phases.traced_phases_bit_manipulation import TracedPhasesBitManipulation
+from zepben.ewb.services.network.tracing.terminal_state_store import terminal_state_store
 
 if TYPE_CHECKING:
     from zepben.ewb.model.cim.iec61970.base.core.terminal import Terminal
@@ -27,26 +27,65 @@ def _validate_spk(spk: SinglePhaseKind):
 
 SinglePhaseKind.validate = _validate_spk
 
-@dataclass(slots=True)
 class PhaseStatus:
     """
     Class that holds the traced phase statuses for a nominal phase on a [Terminal].
 
-    :var _phase_status_internal:
-    """
-    terminal: Terminal
+    The statuses of the phases traced for the network are stored in the `TerminalStateStore`, with the `Terminal.normal_phases` and
+    `Terminal.current_phases` of each terminal being a view of the state it has stored there. A `PhaseStatus` created without a `state` holds its own
+    statuses, independent of the terminal.
 
-    _phase_status_internal: int = 0
+    :param terminal: The terminal the phase statuses are for.
+    :param state: The state of the network in the `TerminalStateStore` to view, or `None` to hold the statuses in this object.
     """
-    The underlying implementation value tracking the phase status for nominal phases of a terminal.
-    It is exposed internally for data serialisation and debugging within official EWB libraries and utilities.
 
-    This property should be considered internal and not for public use as the underlying
-    data structure to store the status could change at any time (and thus be a breaking change).
-    Use directly at your own risk.
+    __slots__ = ("terminal", "_state", "_value")
 
-    See ``TracedPhasesBitManipulation`` for details on bit representation for phase_status_internal and how we track phases status.
-    """
+    def __init__(self, terminal: Terminal, state: Optional[int] = None, _phase_status_internal: int = 0):
+        self.terminal: Terminal = terminal
+        self._state: Optional[int] = state
+        self._value: int = _phase_status_internal
+
+    @property
+    def _phase_status_internal(self) -> int:
+        """
+        The underlying implementation value tracking the phase status for nominal phases of a terminal.
+        It is exposed internally for data serialisation and debugging within official EWB libraries and utilities.
+
+        This property should be considered internal and not for public use as the underlying
+        data structure to store the status could change at any time (and thus be a breaking change).
+        Use directly at your own risk.
+
+        See ``TracedPhasesBitManipulation`` for details on bit representation for phase_status_internal and how we track phases status.
+        """
+        if self._state is None:
+            return self._value
+
+        index = self.terminal._state_index
+        return 0 if index is None else terminal_state_store.phases[self._state][index]
+
+    @_phase_status_internal.setter
+    def _phase_status_internal(self, value: int):
+        if self._state is None:
+            self._value = value
+            return
+
+        index = self.terminal._state_index
+        if index is None:
+            if not value:
+                return
+            index = self.terminal._state_index = terminal_state_store.allocate()
+        terminal_state_store.phases[self._state][index] = value
+
+    def __eq__(self, other):
+        if not isinstance(other, PhaseStatus):
+            return NotImplemented
+        return (self.terminal is other.terminal) and (self._phase_status_internal == other._phase_status_internal)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"PhaseStatus(terminal={self.terminal!r}, _phase_status_internal={self._phase_status_internal})"
 
     def __getitem__(self, nominal_phase: SinglePhaseKind) -> SinglePhaseKind:
         """
@@ -80,13 +80,28 @@ class SetPhases:
         :param network_state_operators: The `NetworkStateOperators` to be used when setting phases.
         """
 
-        def _terminals_from_network():
-            for energy_source in network.objects(EnergySource):
+        await self.run_from_sources(network.objects(EnergySource), network_state_operators)
+
+    async def run_from_sources(
+        self,
+        energy_sources: Iterable[EnergySource],
+        network_state_operators: Type[NetworkStateOperators] = NetworkStateOperators.NORMAL,
+    ):
+        """
+        Apply phases and flow from the specified energy sources.
+        This will apply `Terminal.phases` to all terminals on each `EnergySource` and then flow along the connected network.
+
+        :param energy_sources: The energy sources to apply phases from.
+        :param network_state_operators: The `NetworkStateOperators` to be used when setting phases.
+        """
+
+        def _terminals_from_sources():
+            for energy_source in energy_sources:
                 for terminal in energy_source.terminals:
                     self._apply_phases(terminal.phases.single_phases, terminal, network_state_operators)
                     yield terminal
 
-        await self._run_terminals(_terminals_from_network(), network_state_operators=network_state_operators)
+        await self._run_terminals(_terminals_from_sources(), network_state_operators=network_state_operators)
 
     @run.register
     async def _(
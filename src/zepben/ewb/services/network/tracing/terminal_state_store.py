@@ -0,0 +1,102 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+__all__ = ["TerminalStateStore", "terminal_state_store"]
+
+from array import array
+from threading import RLock
+from typing import List, Tuple, Optional
+
+NORMAL = 0
+CURRENT = 1
+
+
+class TerminalStateStore:
+    """
+    Columnar storage of the traced state of terminals, holding the phase status (see `TracedPhasesBitManipulation`) and feeder direction of each terminal
+    for the normal and current state of the network.
+
+    Each terminal is given a slot in the store the first time any of its traced state is set to something other than the default, so terminals that have
+    never been traced don't take up any space. Slots are released when the terminal is garbage collected, and are reused by the next terminal that needs
+    one.
+
+    The state is stored in an `array` per column rather than as attributes of each terminal, which avoids allocating a `PhaseStatus` and integer object
+    for each state of every terminal.
+
+    Slots are allocated and released under a lock, as terminals can be created and garbage collected on any thread. The lock is re-entrant, as a garbage
+    collection triggered while allocating a slot can release the slot of a collected terminal on the same thread.
+    """
+
+    __slots__ = ("phases", "directions", "_columns", "_free", "_lock")
+
+    def __init__(self):
+        self.phases: Tuple[array, array] = (array("H"), array("H"))
+        """The phase status of each slot, for the normal and current state, indexed by `NORMAL` and `CURRENT`."""
+
+        self.directions: Tuple[array, array] = (array("B"), array("B"))
+        """The `FeederDirection` value of each slot, for the normal and current state, indexed by `NORMAL` and `CURRENT`."""
+
+        self._columns: Tuple[array, ...] = (*self.phases, *self.directions)
+        self._free: List[int] = []
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        """
+        :return: The number of slots in use.
+        """
+        return len(self.phases[NORMAL]) - len(self._free)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        :return: The number of bytes used to store the state, including free slots waiting to be reused.
+        """
+        return sum(it.itemsize * len(it) for it in self._columns) + 8 * len(self._free)
+
+    def allocate(self, state: Optional[Tuple[int, ...]] = None) -> int:
+        """
+        Allocate a slot with the default state of no traced phases and no feeder direction.
+
+        :param state: An optional state for the slot, as returned by `state_of`, rather than the default.
+        :return: The index of the slot.
+        """
+        with self._lock:
+            if self._free:
+                index = self._free.pop()
+            else:
+                index = len(self._columns[0])
+                for it in self._columns:
+                    it.append(0)
+
+            if state is not None:
+                for it, value in zip(self._columns, state):
+                    it[index] = value
+            return index
+
+    def state_of(self, index: int) -> Tuple[int, ...]:
+        """
+        Get the state of a slot, which can be used to allocate another slot with the same state.
+
+        :param index: The index of the slot.
+        :return: The normal and current phase status, followed by the normal and current feeder direction of the slot.
+        """
+        return tuple(it[index] for it in self._columns)
+
+    def release(self, index: int):
+        """
+        Release a slot so it can be reused, resetting it to the default state.
+
+        :param index: The index of the slot to release.
+        """
+        with self._lock:
+            for it in self._columns:
+                it[index] = 0
+            self._free.append(index)
+
+
+terminal_state_store = TerminalStateStore()
+"""
+The store used for the traced state of every `Terminal`.
+"""
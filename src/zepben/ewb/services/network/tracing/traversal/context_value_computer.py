@@ -54,10 +54,10 @@ class ContextValueComputer(Generic[T]):
         return context.get_value(self.key)
 
     def is_standalone_computer(self):
-        return not isinstance(self, (StepAction, StopCondition, QueueCondition))
+        # NOTE: these imports exist here due to a circular import problem.
+        from zepben.ewb.services.network.tracing.traversal.queue_condition import QueueCondition
+        from zepben.ewb.services.network.tracing.traversal.step_action import StepAction
+        from zepben.ewb.services.network.tracing.traversal.stop_condition import StopCondition
 
+        return not isinstance(self, (StepAction, StopCondition, QueueCondition))
 
-# these imports are here to stop circular imports
-from zepben.ewb.services.network.tracing.traversal.stop_condition import StopCondition  # noqa: E402
-from zepben.ewb.services.network.tracing.traversal.step_action import StepAction  # noqa: E402
-from zepben.ewb.services.network.tracing.traversal.queue_condition import QueueCondition  # noqa: E402
@@ -5,6 +5,7 @@
 
 __all__ = ['StepAction', 'StepActionWithContextValue', 'StepActionFunc']
 
+import inspect
 from abc import abstractmethod
 from typing import TypeVar, Generic, Callable, final, Any
 
@@ -51,6 +52,13 @@ class StepAction(Generic[T]):
 
         return self._func(item, context)
 
+    @property
+    def is_async(self) -> bool:
+        """
+        Indicates if this action is a coroutine function that must be awaited when it is applied.
+        """
+        return inspect.iscoroutinefunction(self._func)
+
     @abstractmethod
     def _apply(self, item: T, context: StepContext):
         """
@@ -13,7 +13,7 @@ from collections import deque
 from collections.abc import Callable
 from functools import singledispatchmethod
 from logging import Logger
-from typing import List, TypeVar, Generic, Optional, Dict, Union
+from typing import List, TypeVar, Generic, Optional, Dict, Union, Generator, Awaitable
 
 from zepben.ewb import require
 from zepben.ewb.services.network.tracing.traversal.context_value_computer import ContextValueComputer
@@ -350,7 +350,7 @@ class Traversal(Generic[T, D]):
 
     @if_not_stopping.register(Callable)
     def _(self, action: StepActionFunc) -> D:
-        return self.add_step_action(lambda it, context: action(it, context) if not context.is_stopping else None)
+        return self.add_step_action(_conditional_step_action(action, lambda context: not context.is_stopping))
 
     @if_not_stopping.register
     def _(self, action: StepAction) -> D:
@@ -369,7 +369,7 @@ class Traversal(Generic[T, D]):
 
     @if_stopping.register(Callable)
     def _(self, action: StepActionFunc) -> D:
-        return self.add_step_action(lambda it, context: action(it, context) if context.is_stopping else None)
+        return self.add_step_action(_conditional_step_action(action, lambda context: context.is_stopping))
 
     @if_stopping.register
     def _(self, action: StepAction) -> D:
@@ -388,12 +388,27 @@ class Traversal(Generic[T, D]):
             self.add_step_action(it)
         return self
 
+    def has_async_step_actions(self) -> bool:
+        """
+        Check if any of the step actions registered on this traversal are coroutine functions that need to be awaited.
+
+        :return: ``True`` if any step action is async, otherwise ``False``.
+        """
+
+        return any(it.is_async for it in self.step_actions)
+
     async def apply_step_actions(self, item: T, context: StepContext) -> D:
+        for pending in self._apply_step_actions(item, context):
+            await pending
+        return self
+
+    def _apply_step_actions(self, item: T, context: StepContext) -> Generator[Awaitable, None, None]:
+        # Any coroutine returned by an action is yielded to the caller to be awaited before the next action is applied, which allows
+        # the traversal itself to be plain synchronous code that only ever suspends for step actions that are actually async.
         for it in self.step_actions:
             _apply = it.apply(item, context)
-            if inspect.iscoroutine(_apply):
-                await _apply
-        return self
+            if (_apply is not None) and inspect.iscoroutine(_apply):
+                yield _apply
 
     def add_context_value_computer(self, computer: ContextValueComputer[T]) -> D:
         """
@@ -462,6 +477,39 @@ class Traversal(Generic[T, D]):
         if start_item is not None:
             self.start_items.append(start_item)
 
+        # The traversal only suspends to await step actions that return a coroutine, so when none of the step actions are async the entire
+        # traversal, including all of its branches, runs without ever yielding to the event loop.
+        for pending in self._run(can_stop_on_start_item):
+            await pending
+
+        return self
+
+    def run_sync(self, start_item: T = None, can_stop_on_start_item: bool = True) -> D:
+        """
+        Runs the traversal synchronously, optionally adding [startItem] to the collection of start items. This can be used by callers
+        outside of asyncio, and can only be used when none of the step actions are async.
+
+        :param start_item: The item from which to start the traversal. (optional)
+        :param can_stop_on_start_item: Indicates if the traversal should check stop conditions
+            on the starting item.
+        :return: The current traversal instance.
+        :raises ValueError: If any of the step actions are async.
+        """
+
+        require(not self.has_async_step_actions(), lambda: "Traversals with async step actions must be run with `run`")
+
+        if start_item is not None:
+            self.start_items.append(start_item)
+
+        for pending in self._run(can_stop_on_start_item):
+            # Only reachable if a step action returns a coroutine without being declared async (e.g. a callable object with an async
+            # `__call__`), so we clean up the coroutine to avoid warnings about it never being awaited.
+            pending.close()
+            raise RuntimeError("A step action returned a coroutine, which is not supported by `run_sync`. Use `run` instead.")
+
+        return self
+
+    def _run(self, can_stop_on_start_item: bool) -> Generator[Awaitable, None, None]:
         require(not self.running, lambda: "Traversal is already running")
 
         if self.has_run:
@@ -474,14 +522,13 @@ class Traversal(Generic[T, D]):
             self._branch_start_items()
             # Because we don't traverse anything at the top level parent, we need to pass can_stop_at_start item
             # to the child branch only in this case because they are actually start items.
-            await self._traverse_branches(can_stop_on_start_item)
+            yield from self._traverse_branches(can_stop_on_start_item)
         else:
-            await self._traverse(can_stop_on_start_item)
+            yield from self._traverse(can_stop_on_start_item)
             # Child branches should never stop at start items because a branch start item is not a whole trace start item.
-            await self._traverse_branches(True)
+            yield from self._traverse_branches(True)
 
         self.running = False
-        return self
 
     def reset(self) -> D:
         """
@@ -519,7 +566,7 @@ class Traversal(Generic[T, D]):
 
                 self.branch_queue.append(branch)
 
-    async def _traverse(self, can_stop_on_start_item: bool):
+    def _traverse(self, can_stop_on_start_item: bool) -> Generator[Awaitable, None, None]:
         while len(self.start_items) > 0:
             start_item = self.start_items.popleft()
 
@@ -544,7 +591,7 @@ class Traversal(Generic[T, D]):
                 context.is_actionable_item = self.can_action_item(current, context)
 
                 if context.is_actionable_item:
-                    await self.apply_step_actions(current, context)
+                    yield from self._apply_step_actions(current, context)
 
                 if not context.is_stopping:
                     self.queue_next(current, context)
@@ -597,14 +644,14 @@ class Traversal(Generic[T, D]):
 
         return queue_next.accept(current, current_context, self._item_queuer(current, current_context), queue_branch)
 
-    async def _traverse_branches(self, can_stop_on_start_item: bool):
+    def _traverse_branches(self, can_stop_on_start_item: bool) -> Generator[Awaitable, None, None]:
         if self.branch_queue is None:
             return
 
         while len(self.branch_queue) > 0:
             next_branch = self.branch_queue.pop()
             if next_branch:
-                await next_branch.run(can_stop_on_start_item=can_stop_on_start_item)
+                yield from next_branch._run(can_stop_on_start_item)
 
     def _can_queue_item(self, next_item: T, next_context: StepContext, current_item: T, current_context: StepContext) -> bool:
         for it in self.queue_conditions:
@@ -631,3 +678,15 @@ class Traversal(Generic[T, D]):
 
         def accept(self, item: T, context: StepContext, queue_item: Callable[[T], bool], queue_branch: Callable[[T], bool]) -> bool:
             return self._func(item, context, queue_item, queue_branch)
+
+
+def _conditional_step_action(action: StepActionFunc, should_apply: Callable[[StepContext], bool]) -> StepActionFunc:
+    # Make sure the wrapper is only a coroutine function when the action is, so the traversal can still tell if it has any async step actions.
+    if inspect.iscoroutinefunction(action):
+        async def apply_async(it, context: StepContext):
+            if should_apply(context):
+                await action(it, context)
+
+        return apply_async
+
+    return lambda it, context: action(it, context) if should_apply(context) else None
@@ -5,8 +5,8 @@
 
 __all__ = ['WeightedPriorityQueue']
 
-from collections import defaultdict
-from typing import TypeVar, Callable, Iterable
+from heapq import heappush, heappop
+from typing import TypeVar, Callable, Iterable, Dict, List
 
 from zepben.ewb.services.network.tracing.traversal.queue import TraversalQueue
 from zepben.ewb.services.network.tracing.traversal.traversal import Traversal
@@ -15,18 +15,13 @@ T = TypeVar('T')
 U = TypeVar('U')
 
 
-class SortedDefaultDict(defaultdict):
-    def keys(self):
-        return sorted(super().keys())
-
-    def items(self):
-        return sorted(super().items())
-
-
 class WeightedPriorityQueue(TraversalQueue[T]):
     """
     A traversal queue which uses a weighted order. The higher the weight, the higher the priority.
 
+    Items with the same weight are stored in a queue created by the `queue_provider`, with a heap of the weights that have items queued used to find the
+    highest priority queue. This makes adding and removing items O(log n) in the number of distinct weights, and the length O(1).
+
     :param queue_provider: A queue provider. This allows you to customise the priority of items with the same weight.
     :param get_weight:     A method to extract the weight of an item being added to the queue.
     """
@@ -35,20 +30,35 @@ class WeightedPriorityQueue(TraversalQueue[T]):
         self._queue_provider = queue_provider
         self._get_weight = get_weight
 
-        self.queue: SortedDefaultDict[int, TraversalQueue[T]] = SortedDefaultDict(self._queue_provider)
+        self._queues: Dict[int, TraversalQueue[T]] = {}
+        # A max heap (using negated weights) of each weight that currently has items in its queue.
+        self._weights: List[int] = []
+        self._len: int = 0
 
     def __len__(self) -> int:
-        """need to aggregate the lengths of all queues"""
-        return sum(len(v) for v in self.queue.values())
+        return self._len
 
     def pop(self):
-        for weight in reversed(self.queue.keys()):
-            if self.queue[weight].has_next():
-                return self.queue[weight].pop()
+        weights = self._weights
+        if not weights:
+            return None
+
+        queue = self._queues[-weights[0]]
+        item = queue.pop()
+        self._len -= 1
+        if not queue.has_next():
+            heappop(weights)
+        return item
 
     def append(self, item: T) -> bool:
         weight = self._get_weight(item)
-        self.queue[weight].append(item)
+        queue = self._queues.get(weight)
+        if queue is None:
+            queue = self._queues[weight] = self._queue_provider()
+        if not queue.has_next():
+            heappush(self._weights, -weight)
+        queue.append(item)
+        self._len += 1
         return True
 
     def extend(self, items: Iterable[T]) -> bool:
@@ -72,14 +82,12 @@ class WeightedPriorityQueue(TraversalQueue[T]):
         return cls(TraversalQueue.breadth_first, condition)
 
     def has_next(self) -> bool:
-        for weight in self.queue.keys():
-            _next = self.queue.get(weight)
-            if _next:
-                return True
-        return False
+        return self._len > 0
 
     def peek(self) -> T:
         raise Exception
 
     def clear(self):
-        self.queue.clear()
+        self._queues.clear()
+        self._weights.clear()
+        self._len = 0
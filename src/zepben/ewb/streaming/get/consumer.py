@@ -8,7 +8,7 @@ from __future__ import annotations
 __all__ = ["CimConsumerClient", "MultiObjectResult"]
 
 from abc import abstractmethod
-from typing import Iterable, Dict, Set, TypeVar, Generic, Tuple, AsyncGenerator, Type, Generator, cast
+from typing import Iterable, Dict, Set, TypeVar, Generic, Tuple, AsyncGenerator, Type, Generator, cast, List
 from dataclasses import dataclass, field
 
 from typing_extensions import deprecated
@@ -187,6 +187,25 @@ class CimConsumerClient(GrpcClient[TStub], Generic[ServiceType, TStub]):
         else:
             raise UnsupportedOperationException(f"Received a {desc} identifiable where no field was set")
 
+    def _extract_identifiables(self,
+                               desc: str,
+                               pb_ios: Iterable[PBIdentifiable],
+                               pb_type_to_cim: Dict[str, Type[CIM_TYPE]],
+                               check_presence: bool = True) -> List[Tuple[Identifiable | None, str]]:
+        """
+        Add all the identifiables in a response to the service, linking the references between them in a single pass once they have all been converted. See
+        `_extract_identifiable` for details.
+
+        Parameters
+            - `pb_ios` - The wrapped identifiables returned by the server.
+            - `pb_type_to_cim` - The mapping of wrapped identifiable types to CIM objects.
+            - `check_presence` - Whether to check if each identifiable already exists in the service and skip it if it does.
+
+        Raises :class:`UnsupportedOperationException` if any of `pb_ios` was invalid/unset.
+        """
+        with self.service.batch_references():
+            return [self._extract_identifiable(desc, it, pb_type_to_cim, check_presence) for it in pb_ios]
+
     @staticmethod
     async def _process_extract_results(
         mrids: Iterable[str] | None,
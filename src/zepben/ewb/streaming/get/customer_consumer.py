@@ -69,8 +69,8 @@ class CustomerConsumerClient(CimConsumerClient[CustomerService, CustomerConsumer
 
         responses = self._stub.getCustomersForContainer(self._batch_send(GetCustomersForContainerRequest(), mrids), timeout=self.timeout)
         async for response in responses:
-            for cio in response.identifiables:
-                yield self._extract_identifiable("customer", cio, _cio_type_to_cim)
+            for result in self._extract_identifiables("customer", response.identifiables, _cio_type_to_cim):
+                yield result
 
     async def _process_identifiables(self, mrids: Iterable[str]) -> AsyncGenerator[Tuple[Identifiable | None, str], None]:
         if not mrids:
@@ -78,8 +78,8 @@ class CustomerConsumerClient(CimConsumerClient[CustomerService, CustomerConsumer
 
         responses = self._stub.getIdentifiables(self._batch_send(GetIdentifiablesRequest(), mrids), timeout=self.timeout)
         async for response in responses:
-            for cio in response.identifiables:
-                yield self._extract_identifiable("customer", cio, _cio_type_to_cim)
+            for result in self._extract_identifiables("customer", response.identifiables, _cio_type_to_cim):
+                yield result
 
 
 class SyncCustomerConsumerClient(CustomerConsumerClient):
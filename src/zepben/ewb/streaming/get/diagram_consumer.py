@@ -71,8 +71,8 @@ class DiagramConsumerClient(CimConsumerClient[DiagramService, DiagramConsumerStu
 
         responses = self._stub.getDiagramObjects(self._batch_send(GetDiagramObjectsRequest(), mrids), timeout=self.timeout)
         async for response in responses:
-            for dio in response.identifiables:
-                yield self._extract_identifiable("diagram", dio, _dio_type_to_cim)
+            for result in self._extract_identifiables("diagram", response.identifiables, _dio_type_to_cim):
+                yield result
 
     async def _process_identifiables(self, mrids: Iterable[str]) -> AsyncGenerator[Tuple[Identifiable | None, str], None]:
         if not mrids:
@@ -80,8 +80,8 @@ class DiagramConsumerClient(CimConsumerClient[DiagramService, DiagramConsumerStu
 
         responses = self._stub.getIdentifiables(self._batch_send(GetIdentifiablesRequest(), mrids), timeout=self.timeout)
         async for response in responses:
-            for dio in response.identifiables:
-                yield self._extract_identifiable("diagram", dio, _dio_type_to_cim)
+            for result in self._extract_identifiables("diagram", response.identifiables, _dio_type_to_cim):
+                yield result
 
 
 class SyncDiagramConsumerClient(DiagramConsumerClient):
@@ -8,8 +8,9 @@ from __future__ import annotations
 __all__ = ["NetworkConsumerClient", "SyncNetworkConsumerClient"]
 
 import warnings
-from asyncio import get_event_loop
+from asyncio import get_event_loop, gather, Semaphore
 from itertools import chain
+from time import perf_counter
 from typing import Iterable, Dict, Optional, AsyncGenerator, Union, List, Callable, Set, Tuple, TypeVar, Awaitable, cast, overload, Generic
 from dataclasses import dataclass, field
 
@@ -73,6 +74,21 @@ MAX_64_BIT_INTEGER = 9223372036854775807
 class NetworkResult:
     network_service: Optional[NetworkService]
     failed: Set[str] = field(default_factory=set)
+    """The mRIDs of objects that could not be retrieved."""
+
+    container_errors: Dict[str, Exception] = field(default_factory=dict)
+    """The error that occurred retrieving each equipment container that could not be retrieved, keyed by the container mRID."""
+
+    num_containers: int = 0
+    """The number of equipment containers that were requested."""
+
+    duration: float = 0.0
+    """The time taken to retrieve the equipment containers, in seconds."""
+
+    @property
+    def containers_per_second(self) -> float:
+        """The rate the equipment containers were retrieved at."""
+        return self.num_containers / self.duration if self.duration > 0 else 0.0
 
 
 @dataclass(slots=True)
@@ -352,12 +368,15 @@ class NetworkConsumerClient(CimConsumerClient[NetworkService, NetworkConsumerStu
         """
         return await self._get_all_loops(network_state)
 
-    async def retrieve_network(self) -> GrpcResult[NetworkResult]:
+    async def retrieve_network(self, max_concurrent_requests: int = 1) -> GrpcResult[NetworkResult]:
         """
         Retrieve the entire network.
+
+        :param max_concurrent_requests: The maximum number of equipment containers to retrieve at the same time. Defaults to 1, retrieving each container
+          one after the other. All retrieved objects are added to `service` on the event loop, so concurrent requests are safe.
         Returns a GrpcResult containing the complete `NetworkService` from the server.
         """
-        return await self._retrieve_network()
+        return await self._retrieve_network(max_concurrent_requests)
 
     async def _get_equipment_for_container(
         self,
@@ -471,18 +490,28 @@ class NetworkConsumerClient(CimConsumerClient[NetworkService, NetworkConsumerStu
         # noinspection PyArgumentList
         return GrpcResult(mor)
 
-    async def _retrieve_network(self) -> GrpcResult[NetworkResult]:
+    async def _retrieve_network(self, max_concurrent_requests: int = 1) -> GrpcResult[NetworkResult]:
         result = (await self._get_network_hierarchy()).throw_on_error()
 
         hierarchy: NetworkHierarchy = result.result
-        failed = set()
-        for mrid in chain(hierarchy.substations, hierarchy.feeders, hierarchy.circuits):
-            result = await self._get_equipment_container(mrid)
-            if result.was_successful:
-                failed.update(result.result.failed)
+        containers = list(chain(hierarchy.substations, hierarchy.feeders, hierarchy.circuits))
+        network_result = NetworkResult(self.service, num_containers=len(containers))
+        limit = Semaphore(max(1, max_concurrent_requests))
+
+        async def retrieve(mrid: str):
+            async with limit:
+                container_result = await self._get_equipment_container(mrid)
+            if container_result.was_successful:
+                network_result.failed.update(container_result.result.failed)
+            else:
+                network_result.container_errors[mrid] = container_result.thrown
+
+        start = perf_counter()
+        await gather(*(retrieve(mrid) for mrid in containers))
+        network_result.duration = perf_counter() - start
 
         # noinspection PyArgumentList
-        return GrpcResult(NetworkResult(self.service, failed))
+        return GrpcResult(network_result)
 
     async def _process_equipment_for_container(
         self, it: Union[str, EquipmentContainer],
@@ -511,8 +540,8 @@ class NetworkConsumerClient(CimConsumerClient[NetworkService, NetworkConsumerStu
         request.networkState = _map_network_state.to_pb(network_state)
         responses = self._stub.getEquipmentForContainers(self._batch_send(request, mrids), timeout=self.timeout)
         async for response in responses:
-            for nio in response.identifiables:
-                yield self._extract_identifiable("network", nio, _nio_type_to_cim)
+            for result in self._extract_identifiables("network", response.identifiables, _nio_type_to_cim):
+                yield result
 
     async def _process_equipment_for_restriction(
         self,
@@ -521,8 +550,8 @@ class NetworkConsumerClient(CimConsumerClient[NetworkService, NetworkConsumerStu
         mrid = it.mrid if isinstance(it, OperationalRestriction) else it
         responses = self._stub.getEquipmentForRestriction(GetEquipmentForRestrictionRequest(mrid=mrid), timeout=self.timeout)
         async for response in responses:
-            for nio in response.identifiables:
-                yield self._extract_identifiable("network", nio, _nio_type_to_cim)
+            for result in self._extract_identifiables("network", response.identifiables, _nio_type_to_cim):
+                yield result
 
     async def _process_terminals_for_connectivity_node(
         self,
@@ -540,8 +569,8 @@ class NetworkConsumerClient(CimConsumerClient[NetworkService, NetworkConsumerStu
 
         responses = self._stub.getIdentifiables(self._batch_send(GetIdentifiablesRequest(), mrids), timeout=self.timeout)
         async for response in responses:
-            for nio in response.identifiables:
-                yield self._extract_identifiable("network", nio, _nio_type_to_cim)
+            for result in self._extract_identifiables("network", response.identifiables, _nio_type_to_cim):
+                yield result
 
     async def _handle_network_hierarchy(self, config: GetNetworkHierarchyConfig):
         response = await self._stub.getNetworkHierarchy(GetNetworkHierarchyRequest(**config.generate_config()), timeout=self.timeout)
@@ -721,8 +750,8 @@ class SyncNetworkConsumerClient(NetworkConsumerClient):
         # noinspection PyArgumentList
         return get_event_loop().run_until_complete(super().get_all_loops(self, network_state))
 
-    def retrieve_network(self) -> GrpcResult[Union[NetworkResult, Exception]]:
-        return get_event_loop().run_until_complete(super().retrieve_network())
+    def retrieve_network(self, max_concurrent_requests: int = 1) -> GrpcResult[Union[NetworkResult, Exception]]:
+        return get_event_loop().run_until_complete(super().retrieve_network(max_concurrent_requests))
 
     def get_metadata(self) -> GrpcResult[ServiceInfo]:
         return get_event_loop().run_until_complete(super().get_metadata())
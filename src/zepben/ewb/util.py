@@ -31,9 +31,8 @@ from typing import List, Optional, Iterable, Callable, Any, TypeVar, Generator,
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from google.protobuf.timestamp_pb2 import Timestamp as PBTimestamp
-
 if TYPE_CHECKING:
+    from google.protobuf.timestamp_pb2 import Timestamp as PBTimestamp
     from zepben.ewb.model.cim.iec61970.base.core.identifiable import Identifiable, TIdentifiable
 
 T = TypeVar('T')
@@ -192,6 +191,9 @@ def datetime_to_timestamp(date_time: Optional[datetime]) -> Optional[PBTimestamp
     if date_time is None:
         return None
 
+    # NOTE: import exists here so protobuf is only loaded when a timestamp is needed, rather than by everything using these utilities.
+    from google.protobuf.timestamp_pb2 import Timestamp as PBTimestamp
+
     timestamp = PBTimestamp()
     timestamp.FromDatetime(date_time)
     return timestamp
@@ -5,11 +5,15 @@
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import random
+import threading
+import time
 import re
 import string
+from datetime import datetime, timedelta
 from unittest import mock
 from unittest.mock import ANY
 
+import jwt
 import pytest
 from zepben.ewb.auth import ZepbenTokenFetcher, AuthException, create_token_fetcher, AuthMethod
 from zepben.ewb.auth.client.zepben_token_fetcher import _fetch_token_generator
@@ -94,7 +98,7 @@ def test_create_token_fetcher_missing_json(mock_get):
 
 class TestZepbenTokenFetcher:
 
-    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher.requests.post', side_effect=lambda *args, **kwargs: MockResponse(
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post', side_effect=lambda *args, **kwargs: MockResponse(
         {"access_token": TOKEN, "refresh_token": mock_refresh_token, "token_type": "Bearer"}, 200))
     def test_fetch_token_successful(self, mock_post):
         token_fetcher = ZepbenTokenFetcher(
@@ -115,7 +119,7 @@ class TestZepbenTokenFetcher:
             verify=mock_verify_certificate
         )  # Appropriate-looking password grant request was made to the issuer
 
-    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher.requests.post', side_effect=lambda *args, **kwargs: MockResponse(
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post', side_effect=lambda *args, **kwargs: MockResponse(
         {"access_token": TOKEN, "refresh_token": mock_refresh_token, "token_type": "Bearer"}, 200))
     def test_fetch_token_azure_successful(self, mock_post):
         token_fetcher = ZepbenTokenFetcher(
@@ -137,7 +141,7 @@ class TestZepbenTokenFetcher:
             verify=mock_verify_certificate
         )  # Appropriate-looking password grant request was made to the issuer
 
-    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher.requests.get', side_effect=lambda *args, **kwargs: MockResponse(
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.get', side_effect=lambda *args, **kwargs: MockResponse(
         {"access_token": TOKEN, "refresh_token": mock_refresh_token, "token_type": "Bearer"}, 200))
     def test_fetch_token_managed_identity_successful(self, mock_post):
         token_fetcher = ZepbenTokenFetcher(
@@ -158,7 +162,7 @@ class TestZepbenTokenFetcher:
             verify=mock_verify_certificate
         )  # Appropriate-looking identity request was made to the issuer
 
-    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher.requests.post', side_effect=lambda *args, **kwargs: MockResponse(None, 404, "test reason", "test text"))
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post', side_effect=lambda *args, **kwargs: MockResponse(None, 404, "test reason", "test text"))
     def test_fetch_token_throws_exception_on_bad_response(self, mock_post):
         token_fetcher = ZepbenTokenFetcher(
             audience=mock_audience,
@@ -181,7 +185,7 @@ class TestZepbenTokenFetcher:
             verify=mock_verify_certificate
         )
 
-    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher.requests.post', side_effect=lambda *args, **kwargs: MockResponse(None, 200, "test reason", "test text"))
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post', side_effect=lambda *args, **kwargs: MockResponse(None, 200, "test reason", "test text"))
     def test_fetch_token_throws_exception_on_missing_json(self, mock_post):
         token_fetcher = ZepbenTokenFetcher(
             audience=mock_audience,
@@ -202,7 +206,7 @@ class TestZepbenTokenFetcher:
             verify=mock_verify_certificate
         )
 
-    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher.requests.post',
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post',
                 side_effect=lambda *args, **kwargs: MockResponse({'error': 'fail', 'error_description': 'test error description'}, 200))
     def test_fetch_token_throws_exception_on_error_response(self, mock_post):
         token_fetcher = ZepbenTokenFetcher(
@@ -224,7 +228,7 @@ class TestZepbenTokenFetcher:
             verify=mock_verify_certificate
         )
 
-    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher.requests.post',
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post',
                 side_effect=lambda *args, **kwargs: MockResponse({'test': 'fail'}, 200))
     def test_fetch_token_throws_exception_on_missing_access_token(self, mock_post):
         token_fetcher = ZepbenTokenFetcher(
@@ -246,7 +250,7 @@ class TestZepbenTokenFetcher:
             verify=mock_verify_certificate
         )
 
-    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher.requests.post', side_effect=lambda *args, **kwargs: MockResponse(
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post', side_effect=lambda *args, **kwargs: MockResponse(
         {"access_token": TOKEN, "refresh_token": mock_refresh_token, "token_type": "Bearer"}, 200))
     def test_fetch_token_successful_using_refresh(self, mock_post):
         token_fetcher = ZepbenTokenFetcher(
@@ -267,3 +271,84 @@ class TestZepbenTokenFetcher:
             data=token_fetcher.refresh_request_data,
             verify=mock_verify_certificate
         )
+
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post', side_effect=lambda *args, **kwargs: MockResponse(
+        {"access_token": TOKEN, "refresh_token": mock_refresh_token, "token_type": "Bearer"}, 200))
+    def test_fetch_token_refreshes_in_the_background_before_expiry(self, mock_post):
+        token_fetcher = ZepbenTokenFetcher(audience=mock_audience, token_endpoint=mock_token_endpoint, refresh_margin=timedelta(minutes=5))
+        token_fetcher._token_type = "Bearer"
+        token_fetcher._access_token = "old-token"
+        token_fetcher._token_expiry = datetime.utcnow() + timedelta(minutes=1)
+
+        assert token_fetcher.fetch_token() == "Bearer old-token"  # The stored token is still used while the new one is fetched.
+
+        with token_fetcher._refresh_lock:  # Wait for the background refresh to finish.
+            pass
+
+        assert token_fetcher.fetch_token() == f"Bearer {TOKEN}"
+        mock_post.assert_called_once()
+        assert token_fetcher.refresh_stats.refreshes == 1
+        assert token_fetcher.refresh_stats.background_refreshes == 1
+        assert token_fetcher.refresh_stats.blocked_calls == 0
+
+    @mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post', side_effect=lambda *args, **kwargs: MockResponse(None, 500, "test reason"))
+    def test_fetch_token_keeps_the_stored_token_if_a_background_refresh_fails(self, mock_post):
+        token_fetcher = ZepbenTokenFetcher(audience=mock_audience, token_endpoint=mock_token_endpoint, refresh_margin=timedelta(minutes=5))
+        token_fetcher._token_type = "Bearer"
+        token_fetcher._access_token = "old-token"
+        token_fetcher._token_expiry = datetime.utcnow() + timedelta(minutes=1)
+
+        assert token_fetcher.fetch_token() == "Bearer old-token"
+        with token_fetcher._refresh_lock:
+            pass
+
+        # Failed background refreshes are not retried straight away.
+        assert token_fetcher.fetch_token() == "Bearer old-token"
+        mock_post.assert_called_once()
+        assert token_fetcher.refresh_stats.failures == 1
+        assert token_fetcher.refresh_stats.refreshes == 0
+
+    def test_fetch_token_does_not_refresh_short_lived_tokens_on_every_call(self):
+        # The token only lives for a minute, which is within the refresh margin as soon as it is fetched.
+        short_lived_token = jwt.encode({"exp": int((datetime.utcnow() + timedelta(minutes=1)).timestamp())}, "secret", algorithm="HS256")
+        token_fetcher = ZepbenTokenFetcher(audience=mock_audience, token_endpoint=mock_token_endpoint, refresh_margin=timedelta(minutes=5))
+        token_fetcher._token_type = "Bearer"
+        token_fetcher._access_token = "old-token"
+        token_fetcher._token_expiry = datetime.utcnow() + timedelta(minutes=1)
+
+        with mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post', side_effect=lambda *args, **kwargs: MockResponse(
+                {"access_token": short_lived_token, "token_type": "Bearer"}, 200)) as mock_post:
+            assert token_fetcher.fetch_token() == "Bearer old-token"
+            with token_fetcher._refresh_lock:
+                pass
+
+            # The new token isn't refreshed until it is half way through its lifetime.
+            for _ in range(5):
+                assert token_fetcher.fetch_token() == f"Bearer {short_lived_token}"
+            with token_fetcher._refresh_lock:
+                pass
+
+        mock_post.assert_called_once()
+        assert token_fetcher.refresh_stats.background_refreshes == 1
+
+    def test_fetch_token_only_makes_one_request_for_concurrent_callers(self):
+        def slow_post(*args, **kwargs):
+            time.sleep(0.1)
+            return MockResponse({"access_token": TOKEN, "refresh_token": mock_refresh_token, "token_type": "Bearer"}, 200)
+
+        token_fetcher = ZepbenTokenFetcher(audience=mock_audience, token_endpoint=mock_token_endpoint)
+        tokens = []
+
+        with mock.patch('zepben.ewb.auth.client.zepben_token_fetcher._session.post', side_effect=slow_post) as mock_post:
+            threads = [threading.Thread(target=lambda: tokens.append(token_fetcher.fetch_token())) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert tokens == [f"Bearer {TOKEN}"] * 5
+        mock_post.assert_called_once()
+        assert token_fetcher.refresh_stats.refreshes == 1
+        assert token_fetcher.refresh_stats.blocked_calls == 5
+        assert token_fetcher.refresh_stats.max_seconds >= 0.1
+        assert token_fetcher.refresh_stats.blocked_seconds >= 0.1
@@ -0,0 +1,63 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Benchmark of `BaseService.add_all_from_pb`, which links the references of a batch of protobuf messages in a single pass, against adding each message
+with `BaseService.add_from_pb`, for the messages of a feeder in the order they are returned by a `getEquipmentForContainers` response.
+
+Run with ``python test/benchmarks/run_bulk_translation.py`` from the root of the repo.
+"""
+from time import perf_counter
+
+from zepben.ewb import NetworkService, AcLineSegment, Terminal, Feeder, EnergyConsumer, Breaker, PerLengthSequenceImpedance, BaseVoltage
+
+num_segments = 20_000
+
+
+def run_bulk_translation():
+    pbs = _create_messages()
+
+    print(f"{len(pbs):,} messages")
+    print(f"{'implementation':<16} {'time (ms)':>10} {'unresolved':>11}")
+    for description, translate in [
+        ("add_from_pb", lambda service: _add_each(service, pbs)),
+        ("add_all_from_pb", lambda service: service.add_all_from_pb(pbs)),
+    ]:
+        # noinspection PyArgumentList
+        service = NetworkService()
+        start = perf_counter()
+        translate(service)
+        elapsed = perf_counter() - start
+        print(f"{description:<16} {elapsed * 1000:>10.1f} {service.num_unresolved_references():>11,}")
+
+
+def _add_each(service: NetworkService, pbs: list):
+    for pb in pbs:
+        service.add_from_pb(pb)
+
+
+def _create_messages() -> list:
+    # The base voltage and impedance are left out of the messages, as they are typically fetched separately from the equipment of each container.
+    bv = BaseVoltage(mrid="bv", nominal_voltage=11000)
+    plsi = PerLengthSequenceImpedance(mrid="plsi", r=0.1, x=0.2)
+    feeder = Feeder(mrid="feeder")
+
+    objects = [feeder]
+    for i in range(num_segments):
+        acls = AcLineSegment(mrid=f"acls-{i}", length=10.0, per_length_impedance=plsi, base_voltage=bv)
+        other = EnergyConsumer(mrid=f"ec-{i}", base_voltage=bv) if i % 2 == 0 else Breaker(mrid=f"breaker-{i}", base_voltage=bv)
+        for ce in (acls, other):
+            ce.add_container(feeder)
+            feeder.add_equipment(ce)
+            for sequence_number in (1, 2):
+                terminal = Terminal(mrid=f"{ce.mrid}-t{sequence_number}", conducting_equipment=ce, sequence_number=sequence_number)
+                ce.add_terminal(terminal)
+                objects.append(terminal)
+            objects.append(ce)
+
+    return [it.to_pb() for it in objects]
+
+
+if __name__ == "__main__":
+    run_bulk_translation()
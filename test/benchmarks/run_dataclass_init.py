@@ -0,0 +1,91 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Micro-benchmark of instantiating the most common CIM classes, comparing the cached init plan used by `DataclassBase` against the original implementation that
+inspected the dataclass fields of every instance.
+
+Run with ``python test/benchmarks/run_dataclass_init.py`` from the root of the repo.
+"""
+from dataclasses import fields, MISSING
+from timeit import timeit
+from typing import Callable, Any
+
+from zepben.ewb import Terminal, AcLineSegment, Junction, Breaker, EnergyConsumer, PowerTransformer, PowerTransformerEnd, Location, ConnectivityNode, NameType, \
+    Name
+from zepben.ewb.dataclass_descriptors import dataclass_base
+from zepben.ewb.dataclass_descriptors.dataclass_base import DataclassBase
+
+iterations = 100_000
+
+
+def _is_set(obj: object, name: str) -> bool:
+    try:
+        object.__getattribute__(obj, name)
+    except AttributeError:
+        return False
+    return True
+
+
+def _introspecting_init(self, **kwargs) -> None:
+    # The DataclassBase.__init__ implementation prior to caching the init plans.
+    for attr, value in kwargs.items():
+        setattr(self, attr, value)
+
+    for f in fields(type(self)):
+        if _is_set(self, f.name):
+            continue
+
+        if f.default is not MISSING:
+            setattr(self, f.name, f.default)
+        elif f.default_factory is not MISSING:
+            setattr(self, f.name, f.default_factory())
+        elif hasattr(f, '__get__'):
+            continue
+        else:
+            raise TypeError(f"Missing required field {f.name!r} for {type(self).__name__}")
+
+    if callable(getattr(self, "__post_init__", None)):
+        raise NotImplementedError("Current dataclass base does not support __post_init__ calls for redundancy reasons.")
+
+
+_name_type = NameType(name="nt")
+
+_creators = {
+    "Terminal": lambda: Terminal(mrid="t"),
+    "AcLineSegment": lambda: AcLineSegment(mrid="acls", length=1.0),
+    "Junction": lambda: Junction(mrid="j"),
+    "Breaker": lambda: Breaker(mrid="b"),
+    "EnergyConsumer": lambda: EnergyConsumer(mrid="ec"),
+    "PowerTransformer": lambda: PowerTransformer(mrid="pt"),
+    "PowerTransformerEnd": lambda: PowerTransformerEnd(mrid="pte"),
+    "Location": lambda: Location(mrid="loc"),
+    "ConnectivityNode": lambda: ConnectivityNode(mrid="cn"),
+    "Name": lambda: Name("n", type=_name_type),
+}
+
+
+def run_dataclass_init():
+    cached_init = DataclassBase.__init__
+    print(f"{'class':<20} {'introspect (us)':>16} {'cached (us)':>12} {'speedup':>8}")
+    for desc, create in _creators.items():
+        DataclassBase.__init__ = _introspecting_init
+        try:
+            introspect = _time(create)
+        finally:
+            DataclassBase.__init__ = cached_init
+        dataclass_base._init_plans.clear()
+        cached = _time(create)
+
+        print(f"{desc:<20} {introspect:>16.2f} {cached:>12.2f} {introspect / cached:>7.2f}x")
+
+
+def _time(create: Callable[[], Any]) -> float:
+    # Warm up, so the cached plan is built before timing.
+    create()
+    return timeit(create, number=iterations) / iterations * 1_000_000
+
+
+if __name__ == "__main__":
+    run_dataclass_init()
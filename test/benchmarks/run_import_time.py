@@ -0,0 +1,59 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Benchmark of the time taken to import `zepben.ewb`, and to then use some of the names it exports, each in a fresh interpreter so nothing is already
+imported. It fails if importing the package takes longer than `max_import_fraction` of the time taken to use every export, which is how long importing
+the package took when everything was imported eagerly, to catch anything being imported eagerly again on any machine.
+
+Run with ``python test/benchmarks/run_import_time.py`` from the root of the repo.
+"""
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+num_runs = 10
+max_import_fraction = 0.1
+
+_SRC_DIR = Path(__file__).parents[2] / "src"
+
+_SCENARIOS = {
+    "import zepben.ewb": "",
+    "+ NetworkService": "zepben.ewb.NetworkService",
+    "+ NetworkDatabaseReader": "zepben.ewb.NetworkDatabaseReader",
+    "+ NetworkConsumerClient": "zepben.ewb.NetworkConsumerClient",
+    "+ every export": "[getattr(zepben.ewb, it) for it in zepben.ewb.__all__]",
+}
+
+
+def run_import_time():
+    print(f"{'scenario':<24} {'median (ms)':>12} {'min (ms)':>9}")
+    medians = {}
+    for scenario, usage in _SCENARIOS.items():
+        timings = [_time_in_fresh_interpreter(usage) for _ in range(num_runs)]
+        medians[scenario] = statistics.median(timings)
+        print(f"{scenario:<24} {medians[scenario] * 1000:>12.1f} {min(timings) * 1000:>9.1f}")
+
+    import_seconds = medians["import zepben.ewb"]
+    limit = max_import_fraction * medians["+ every export"]
+    if import_seconds > limit:
+        raise AssertionError(f"Importing zepben.ewb took {import_seconds:.3f}s, which is longer than the limit of {limit:.3f}s "
+                             f"({max_import_fraction:.0%} of the time taken to use every export).")
+
+
+def _time_in_fresh_interpreter(usage: str) -> float:
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "import zepben.ewb\n"
+        f"{usage}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=_SRC_DIR, capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+if __name__ == "__main__":
+    run_import_time()
@@ -0,0 +1,85 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Benchmark of the integer keyed `NetworkTraceTracker` against the original implementation that tracked a tuple of the terminal mRID and its phases.
+
+Run with ``python test/benchmarks/run_network_trace_tracker.py`` from the root of the repo.
+"""
+import tracemalloc
+from time import perf_counter
+from typing import Callable, List, Optional, FrozenSet
+
+from zepben.ewb import NetworkTraceTracker, Terminal, SinglePhaseKind
+
+num_terminals = 200_000
+
+
+class _MridNetworkTraceTracker:
+    # The NetworkTraceTracker implementation prior to using integer keys.
+    def __init__(self):
+        self._visited = set()
+
+    def has_visited(self, terminal, phases=None) -> bool:
+        return self._get_key(terminal, phases) in self._visited
+
+    def visit(self, terminal, phases=None) -> bool:
+        key = self._get_key(terminal, phases)
+        if key not in self._visited:
+            self._visited.add(self._get_key(terminal, phases))
+            return True
+        return False
+
+    @staticmethod
+    def _get_key(terminal, phases):
+        if phases:
+            return terminal.mrid, phases
+        else:
+            return terminal.mrid
+
+
+def run_network_trace_tracker():
+    terminals = [Terminal(mrid=f"terminal-{i}") for i in range(num_terminals)]
+    abc = [SinglePhaseKind.A, SinglePhaseKind.B, SinglePhaseKind.C]
+
+    print(f"{'phases':>6} {'mRID (ms)':>10} {'index (ms)':>11} {'speedup':>8} {'mRID (KiB)':>11} {'index (KiB)':>12}")
+    for phases in (None, abc):
+        mrid_time, mrid_memory = _measure(_MridNetworkTraceTracker, terminals, phases)
+        index_time, index_memory = _measure(NetworkTraceTracker, terminals, phases)
+        print(f"{'yes' if phases else 'no':>6} {mrid_time:>10.1f} {index_time:>11.1f} {mrid_time / index_time:>7.1f}x {mrid_memory:>11.0f} {index_memory:>12.0f}")
+
+
+def _measure(create_tracker: Callable[[], NetworkTraceTracker], terminals: List[Terminal], phases: Optional[List[SinglePhaseKind]]) -> (float, float):
+    # Mimic a trace, which checks if each step has been visited when actioning it after visiting it. Phases are converted to a new frozenset for each
+    # call as `NetworkTraceStep.Path.to_phases_set` does.
+    def to_phases_set() -> Optional[FrozenSet[SinglePhaseKind]]:
+        return frozenset(phases) if phases else None
+
+    def trace() -> NetworkTraceTracker:
+        tracker = create_tracker()
+        for terminal in terminals:
+            tracker.visit(terminal, to_phases_set())
+            tracker.has_visited(terminal, to_phases_set())
+        return tracker
+
+    # The first trace assigns the terminal indexes, so we only time subsequent traces, taking the best of several runs.
+    trace()
+    duration = min(_time(trace) for _ in range(5))
+
+    tracemalloc.start()
+    retained = trace()
+    memory = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+    del retained
+
+    return duration, memory
+
+def _time(func: Callable[[], object]) -> float:
+    start = perf_counter()
+    func()
+    return (perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    run_network_trace_tracker()
@@ -0,0 +1,118 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Benchmark of the memory and time used to hold the unresolved references of a partial network fetch in `PendingReferences`, against the original
+implementation that held an `UnresolvedReference` in a set for each mRID in two dictionaries.
+
+The partial fetch is the equipment of a feeder, as returned by `getEquipmentForContainers`, without the feeder itself, or the locations, asset info,
+impedances and base voltages referenced by the equipment, which are left unresolved until they are fetched separately.
+
+Run with ``python test/benchmarks/run_pending_references.py`` from the root of the repo.
+"""
+import gc
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Dict, List, Set, Tuple, Any
+
+from zepben.ewb import NetworkService, AcLineSegment, Terminal, Feeder, EnergyConsumer, Breaker, PerLengthSequenceImpedance, BaseVoltage, Location, \
+    OverheadWireInfo, PendingReferences, UnresolvedReference
+
+num_segments = 20_000
+num_counts = 100
+
+
+class _LegacyUnresolvedReferences:
+    # The storage of unresolved references used by `BaseService` prior to `PendingReferences`.
+
+    def __init__(self):
+        self.to: Dict[str, Set[UnresolvedReference]] = dict()
+        self.from_: Dict[str, Set[UnresolvedReference]] = dict()
+
+    def add(self, from_ref, to_mrid, resolver, reverse_resolver):
+        urefs = self.to.get(to_mrid, set())
+        # noinspection PyArgumentList
+        uref = UnresolvedReference(from_ref=from_ref, to_mrid=to_mrid, resolver=resolver, reverse_resolver=reverse_resolver)
+        urefs.add(uref)
+        self.to[to_mrid] = urefs
+        rev_urefs = self.from_.get(from_ref.mrid, set())
+        rev_urefs.add(uref)
+        self.from_[from_ref.mrid] = rev_urefs
+
+    def __len__(self):
+        return sum([len(r) for r in self.to.copy().values()])
+
+
+def run_pending_references():
+    references = _fetch_partial_network()
+
+    print(f"{len(references):,} unresolved references")
+    print(f"{'implementation':<20} {'memory (MiB)':>13} {'add (ms)':>9} {f'{num_counts} counts (ms)':>17}")
+    for description, create in [
+        ("dict of sets", _LegacyUnresolvedReferences),
+        ("PendingReferences", PendingReferences),
+    ]:
+        memory, store = _measure(lambda: _add_all(create(), references))
+
+        start = perf_counter()
+        _add_all(create(), references)
+        add_time = perf_counter() - start
+
+        start = perf_counter()
+        for _ in range(num_counts):
+            len(store)
+        count_time = perf_counter() - start
+
+        print(f"{description:<20} {memory / 2 ** 20:>13.1f} {add_time * 1000:>9.1f} {count_time * 1000:>17.1f}")
+
+
+def _fetch_partial_network() -> List[Tuple[Any, str, Any, Any]]:
+    # noinspection PyArgumentList
+    service = NetworkService()
+    service.add_all_from_pb(_create_messages())
+    return [(it.from_ref, it.to_mrid, it.resolver, it.reverse_resolver) for it in service.unresolved_references()]
+
+
+def _create_messages() -> list:
+    bv = BaseVoltage(mrid="bv", nominal_voltage=11000)
+    plsi = PerLengthSequenceImpedance(mrid="plsi", r=0.1, x=0.2)
+    wire_info = OverheadWireInfo(mrid="wire-info")
+    feeder = Feeder(mrid="feeder")
+
+    objects = []
+    for i in range(num_segments):
+        acls = AcLineSegment(mrid=f"acls-{i}", length=10.0, per_length_impedance=plsi, asset_info=wire_info, base_voltage=bv,
+                             location=Location(mrid=f"acls-{i}-location"))
+        other = EnergyConsumer(mrid=f"ec-{i}", base_voltage=bv) if i % 2 == 0 else Breaker(mrid=f"breaker-{i}", base_voltage=bv)
+        other.location = Location(mrid=f"{other.mrid}-location")
+        for ce in (acls, other):
+            ce.add_container(feeder)
+            for sequence_number in (1, 2):
+                terminal = Terminal(mrid=f"{ce.mrid}-t{sequence_number}", conducting_equipment=ce, sequence_number=sequence_number)
+                ce.add_terminal(terminal)
+                objects.append(terminal)
+            objects.append(ce)
+
+    return [it.to_pb() for it in objects]
+
+
+def _add_all(store, references: List[Tuple[Any, str, Any, Any]]):
+    # Each reference uses its own copy of the mRID, the same as when they are read from separate protobuf messages.
+    for from_ref, to_mrid, resolver, reverse_resolver in references:
+        store.add(from_ref, "".join(to_mrid), resolver, reverse_resolver)
+    return store
+
+
+def _measure(func: Callable[[], Any]) -> Tuple[int, Any]:
+    gc.collect()
+    tracemalloc.start()
+    retained = func()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return memory, retained
+
+
+if __name__ == "__main__":
+    run_pending_references()
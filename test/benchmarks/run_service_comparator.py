@@ -0,0 +1,94 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Benchmark of `NetworkServiceComparator.compare_services` with content key short-circuiting, with and without fingerprints cached on each object, against
+the original implementation that compared every object.
+
+Run with ``python test/benchmarks/run_service_comparator.py`` from the root of the repo.
+"""
+from time import perf_counter
+
+from zepben.ewb import NetworkService, AcLineSegment, Terminal, Location, PositionPoint, EnergyConsumer, Breaker, PerLengthSequenceImpedance, \
+    NetworkServiceComparator, ServiceDifferences, BaseService
+
+num_segments = 20_000
+modified_every = 100
+
+
+def run_service_comparator():
+    source = _create_network(modified=False)
+    target = _create_network(modified=True)
+    comparator = NetworkServiceComparator()
+
+    print(f"{num_segments * 6:,} objects per service")
+    print(f"{'implementation':<24} {'time (ms)':>10} {'modifications':>14}")
+    for description, compare in [
+        ("compare every object", lambda: _legacy_compare_services(comparator, source, target)),
+        ("content keys", lambda: comparator.compare_services(source, target)),
+        ("cache fingerprints", lambda: comparator.compare_services(source, target, cache_fingerprints=True)),
+        # The fingerprints are cached on each object by the previous comparison, as they are for repeated comparisons of long-lived services.
+        ("cached fingerprints", lambda: comparator.compare_services(source, target, cache_fingerprints=True)),
+    ]:
+        start = perf_counter()
+        differences = compare()
+        elapsed = perf_counter() - start
+        print(f"{description:<24} {elapsed * 1000:>10.1f} {len(list(differences.modifications())):>14}")
+
+
+def _create_network(modified: bool) -> NetworkService:
+    network = NetworkService()
+    plsi = PerLengthSequenceImpedance(mrid="plsi", r=0.1, x=0.2)
+    network.add(plsi)
+
+    for i in range(num_segments):
+        location = Location(mrid=f"location-{i}")
+        location.add_point(PositionPoint(x_position=(i % 100) / 1000, y_position=0.0))
+        location.add_point(PositionPoint(x_position=(i % 100 + 1) / 1000, y_position=0.0))
+
+        acls = AcLineSegment(mrid=f"acls-{i}", name=f"line {i}", length=10.0 + (1.0 if modified and (i % modified_every == 0) else 0.0), location=location,
+                             per_length_impedance=plsi)
+        for sequence_number in (1, 2):
+            terminal = Terminal(mrid=f"acls-{i}-t{sequence_number}", conducting_equipment=acls)
+            acls.add_terminal(terminal)
+            network.add(terminal)
+            network.connect(terminal, f"cn-{i + sequence_number - 1}")
+
+        network.add(location)
+        network.add(acls)
+
+        if i % 2 == 0:
+            network.add(EnergyConsumer(mrid=f"ec-{i}", customer_count=i % 7))
+        else:
+            network.add(Breaker(mrid=f"breaker-{i}", name=f"breaker {i}"))
+
+    return network
+
+
+def _legacy_compare_services(comparator: NetworkServiceComparator, source: BaseService, target: BaseService) -> ServiceDifferences:
+    # The object comparison of `compare_services` prior to the content keys.
+    differences = ServiceDifferences(lambda mrid: source.get(mrid, default=None), lambda mrid: target.get(mrid, default=None),
+                                     source.get_name_type, target.get_name_type)
+    for s in source.objects():
+        t = target.get(s.mrid, default=None)
+        if t:
+            if type(s) is not type(t):
+                differences.add_to_missing_from_source(s.mrid)
+                differences.add_to_missing_from_target(s.mrid)
+            else:
+                diff = comparator._try_compare(type(s), s, t)
+                if diff.differences:
+                    differences.add_modifications(s.mrid, diff)
+        else:
+            differences.add_to_missing_from_target(s.mrid)
+
+    for t in target.objects():
+        if t.mrid not in source:
+            differences.add_to_missing_from_source(t.mrid)
+
+    return differences
+
+
+if __name__ == "__main__":
+    run_service_comparator()
@@ -0,0 +1,95 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Benchmark of the memory used to hold the traced phases and feeder directions of terminals in the `TerminalStateStore`, against the original
+implementation that stored them as attributes of each terminal.
+
+Run with ``python test/benchmarks/run_terminal_state_store.py`` from the root of the repo.
+"""
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List
+
+from zepben.ewb import Terminal, PhaseCode, FeederDirection, SinglePhaseKind
+from zepben.ewb.services.network.tracing.phases.traced_phases_bit_manipulation import TracedPhasesBitManipulation
+
+num_terminals = 200_000
+
+_POINTER_SIZE = 8
+
+
+@dataclass(slots=True)
+class _LegacyPhaseStatus:
+    # The PhaseStatus implementation prior to using the TerminalStateStore.
+    terminal: Terminal
+    _phase_status_internal: int = 0
+
+
+@dataclass(slots=True)
+class _LegacyTracedState:
+    # The attributes used by each terminal to hold its traced state prior to using the TerminalStateStore.
+    normal_feeder_direction: FeederDirection
+    current_feeder_direction: FeederDirection
+    _normal_phases: _LegacyPhaseStatus
+    _current_phases: _LegacyPhaseStatus
+
+
+def run_terminal_state_store():
+    terminals = [Terminal(mrid=f"terminal-{i}", phases=PhaseCode.ABCN) for i in range(num_terminals)]
+
+    print(f"{'traced':>6} {'attributes (MiB)':>17} {'store (MiB)':>12} {'saving':>7}")
+    for traced in (False, True):
+        legacy = _measure(lambda: _legacy_state(terminals, traced)) + 4 * _POINTER_SIZE * num_terminals
+        store = _measure(lambda: _store_state(terminals, traced)) + _POINTER_SIZE * num_terminals
+        print(f"{'yes' if traced else 'no':>6} {legacy / 2 ** 20:>17.1f} {store / 2 ** 20:>12.1f} {legacy / store:>6.1f}x")
+
+
+def _legacy_state(terminals: List[Terminal], traced: bool) -> List[_LegacyTracedState]:
+    # The phase statuses were created with every terminal, regardless of whether it was traced.
+    states = []
+    for terminal in terminals:
+        state = _LegacyTracedState(FeederDirection.NONE, FeederDirection.NONE, _LegacyPhaseStatus(terminal), _LegacyPhaseStatus(terminal))
+        if traced:
+            for phase_status in (state._normal_phases, state._current_phases):
+                for nominal, traced_phase in _traced_phases(terminal):
+                    phase_status._phase_status_internal = TracedPhasesBitManipulation.set(phase_status._phase_status_internal, nominal, traced_phase)
+            state.normal_feeder_direction = FeederDirection.DOWNSTREAM
+            state.current_feeder_direction = FeederDirection.DOWNSTREAM
+        states.append(state)
+    return states
+
+
+def _store_state(terminals: List[Terminal], traced: bool) -> List[Terminal]:
+    # Terminals that haven't been traced don't use the store.
+    if traced:
+        for terminal in terminals:
+            for phase_status in (terminal.normal_phases, terminal.current_phases):
+                for nominal, traced_phase in _traced_phases(terminal):
+                    phase_status[nominal] = traced_phase
+            terminal.normal_feeder_direction = FeederDirection.DOWNSTREAM
+            terminal.current_feeder_direction = FeederDirection.DOWNSTREAM
+    return list(terminals)
+
+
+def _traced_phases(terminal: Terminal):
+    # Use a non-standard phasing so the traced value isn't one of the small integers that are cached by Python.
+    return zip(terminal.phases, [SinglePhaseKind.B, SinglePhaseKind.C, SinglePhaseKind.A, SinglePhaseKind.N])
+
+
+def _measure(func: Callable[[], list]) -> int:
+    # The size of the list holding the results is excluded, as the terminals are already held in a list of the same size.
+    gc.collect()
+    tracemalloc.start()
+    retained = func()
+    memory = tracemalloc.get_traced_memory()[0] - (len(retained) + 1) * _POINTER_SIZE
+    tracemalloc.stop()
+    del retained
+
+    return memory
+
+
+if __name__ == "__main__":
+    run_terminal_state_store()
@@ -0,0 +1,77 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+"""
+Benchmark of the heap based `WeightedPriorityQueue` against the original implementation that sorted every weight for each `pop`, `has_next` and `len`.
+
+Run with ``python test/benchmarks/run_weighted_priority_queue.py`` from the root of the repo.
+"""
+import random
+from collections import defaultdict
+from time import perf_counter
+from typing import Callable
+
+from zepben.ewb import TraversalQueue, WeightedPriorityQueue
+
+num_items = 100_000
+
+
+class _SortedDefaultDict(defaultdict):
+    def keys(self):
+        return sorted(super().keys())
+
+
+class _SortingWeightedPriorityQueue:
+    # The WeightedPriorityQueue implementation prior to using a heap of the weights.
+    def __init__(self, queue_provider, get_weight):
+        self._get_weight = get_weight
+        self.queue = _SortedDefaultDict(queue_provider)
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self.queue.values())
+
+    def pop(self):
+        for weight in reversed(self.queue.keys()):
+            if self.queue[weight].has_next():
+                return self.queue[weight].pop()
+
+    def append(self, item) -> bool:
+        self.queue[self._get_weight(item)].append(item)
+        return True
+
+    def has_next(self) -> bool:
+        for weight in self.queue.keys():
+            if self.queue.get(weight):
+                return True
+        return False
+
+
+def run_weighted_priority_queue():
+    print(f"{'distinct weights':>16} {'sorting (ms)':>13} {'heap (ms)':>10} {'speedup':>8}")
+    for num_weights in (3, 10, 100, 1000):
+        rng = random.Random(num_weights)
+        weights = [rng.randrange(num_weights) for _ in range(num_items)]
+
+        sorting = _time(lambda: _SortingWeightedPriorityQueue(TraversalQueue.depth_first, lambda it: it), weights)
+        heap = _time(lambda: WeightedPriorityQueue(TraversalQueue.depth_first, lambda it: it), weights)
+
+        print(f"{num_weights:>16} {sorting:>13.1f} {heap:>10.1f} {sorting / heap:>7.1f}x")
+
+
+def _time(create_queue: Callable[[], TraversalQueue], weights) -> float:
+    # Mimic a trace, where each step checks the queue, pops an item and queues the next items.
+    queue = create_queue()
+    start = perf_counter()
+    for index in range(0, len(weights), 2):
+        queue.append(weights[index])
+        queue.append(weights[index + 1])
+        if queue.has_next() and len(queue) > 0:
+            queue.pop()
+    while queue.has_next():
+        queue.pop()
+    return (perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    run_weighted_priority_queue()
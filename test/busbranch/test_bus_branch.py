@@ -22,7 +22,8 @@ from zepben.ewb import ConnectivityNode, Disconnector, Switch, ConductingEquipme
 from zepben.ewb.model.cim.iec61970.base.wires.junction import Junction
 from zepben.ewb.model.cim.iec61970.base.wires.busbar_section import BusbarSection
 # noinspection PyProtectedMember
-from zepben.ewb.model.busbranch.bus_branch import _group_negligible_impedance_terminals, _group_common_ac_line_segment_terminals
+from zepben.ewb.model.busbranch.bus_branch import _group_negligible_impedance_terminals, _group_common_ac_line_segment_terminals, \
+    _group_terminals_by_negligible_impedance, _group_ac_line_segments_by_common_impedance
 
 
 @pytest.mark.asyncio
@@ -291,6 +292,53 @@ async def test_group_negligible_impedance_terminals_end_of_branch_multiple_ec_pe
     await _validate_term_grouping(has_neg_imp, nb_network, "a2_ec_pec1_pec2", set(), set(), get_terms({a2: 2, ec: 1, pec1: 1, pec2: 1}))
 
 
+@pytest.mark.asyncio
+async def test_grouping_the_whole_network_matches_grouping_from_each_item():
+    nb_network = negligible_impedance_equipment_basic_network(lambda mrid: Junction(mrid=mrid))
+
+    def has_neg_imp(ce) -> bool:
+        return isinstance(ce, Junction) or (isinstance(ce, AcLineSegment) and ce.length == 0)
+
+    terminal_groupings = _group_terminals_by_negligible_impedance(nb_network.objects(Terminal), has_neg_imp)
+    assert set(terminal_groupings) == set(nb_network.objects(Terminal))
+    for t in nb_network.objects(Terminal):
+        assert terminal_groupings[t] == await _group_negligible_impedance_terminals(t, has_neg_imp)
+        for other in terminal_groupings[t].terminals():
+            assert terminal_groupings[other] is terminal_groupings[t]
+
+    nb_network = multi_branch_common_lines_network()
+
+    line_groupings = _group_ac_line_segments_by_common_impedance(nb_network.objects(AcLineSegment))
+    assert len({id(it) for it in line_groupings.values()}) == 5
+    for line in nb_network.objects(AcLineSegment):
+        assert line_groupings[line] == await _group_common_ac_line_segment_terminals(line)
+
+
+def test_grouping_skips_terminals_without_conducting_equipment():
+    nb_network = NetworkService()
+    j1 = Junction(mrid="j1")
+    j1_t1 = Terminal(mrid="j1_t1", conducting_equipment=j1)
+    j1.add_terminal(j1_t1)
+    loose = Terminal(mrid="loose")
+    for it in (j1, j1_t1, loose):
+        nb_network.add(it)
+    nb_network.connect_terminals(j1_t1, loose)
+
+    checked = []
+
+    def has_neg_imp(ce) -> bool:
+        checked.append(ce)
+        return True
+
+    terminal_groupings = _group_terminals_by_negligible_impedance(nb_network.objects(Terminal), has_neg_imp)
+
+    assert checked == [j1]
+    assert terminal_groupings[loose] is terminal_groupings[j1_t1]
+    assert terminal_groupings[loose].conducting_equipment_group == {j1}
+    assert terminal_groupings[loose].inner_terminals == {j1_t1}
+    assert terminal_groupings[loose].border_terminals == {loose}
+
+
 @pytest.mark.asyncio
 async def test_switches_excluded_when_getting_voltage():
     nb_network = open_switch_between_different_voltages()
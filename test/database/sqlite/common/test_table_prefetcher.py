@@ -0,0 +1,42 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import sqlite3
+from contextlib import closing
+
+from zepben.ewb.database.sqlite.common.table_prefetcher import TablePrefetcher
+
+
+def _create_tables(count: int):
+    # Tables are identified by their type, so create a class for each one.
+    return [type(f"Table{i}", (), {"select_sql": f"SELECT value FROM table_{i}"})() for i in range(count)]
+
+
+def test_only_fetches_ahead_by_the_number_of_workers(tmp_path):
+    database_file = str(tmp_path / "prefetch.sqlite")
+    with closing(sqlite3.connect(database_file)) as connection:
+        for i in range(5):
+            connection.execute(f"CREATE TABLE table_{i} (value INTEGER)")
+            connection.execute(f"INSERT INTO table_{i} VALUES ({i})")
+        connection.commit()
+
+    tables = _create_tables(5)
+    prefetcher = TablePrefetcher(database_file, tables, 2)
+    try:
+        assert set(prefetcher._futures) == {type(tables[0]), type(tables[1])}
+
+        assert prefetcher.take(tables[0]) == [(0,)]
+        assert set(prefetcher._futures) == {type(tables[1]), type(tables[2])}
+
+        # Tables requested before they are submitted are read directly, and are not fetched later.
+        assert prefetcher.take(tables[3]) is None
+        assert prefetcher.take(tables[1]) == [(1,)]
+        assert set(prefetcher._futures) == {type(tables[2]), type(tables[4])}
+
+        assert prefetcher.take(tables[2]) == [(2,)]
+        assert prefetcher.take(tables[4]) == [(4,)]
+        assert not prefetcher._futures
+        assert prefetcher.take(tables[0]) is None
+    finally:
+        prefetcher.close()
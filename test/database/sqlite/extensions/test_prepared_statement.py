@@ -0,0 +1,69 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from zepben.ewb.database.sqlite.extensions.prepared_statement import PreparedStatement
+
+
+@pytest.fixture
+def connection():
+    with closing(sqlite3.connect(":memory:")) as connection:
+        connection.execute("CREATE TABLE test (id TEXT UNIQUE, value INTEGER)")
+        yield connection
+
+
+def _insert(statement: PreparedStatement, id_: str, value: int, errors: list) -> bool:
+    statement.add_value(1, id_)
+    statement.add_value(2, value)
+    return statement.try_execute_single_update(lambda ex: errors.append((statement.parameters, str(ex))))
+
+
+def _read(connection):
+    return connection.execute("SELECT id, value FROM test ORDER BY value").fetchall()
+
+
+def test_batched_rows_are_written_when_the_batch_is_full_and_on_flush(connection):
+    with closing(connection.cursor()) as cur:
+        statement = PreparedStatement("INSERT INTO test (id, value) VALUES (?, ?)", cur, batch_size=3)
+        errors = []
+
+        for i in range(4):
+            assert _insert(statement, f"id{i}", i, errors)
+
+        assert _read(connection) == [(f"id{i}", i) for i in range(3)]
+
+        assert statement.flush()
+        assert _read(connection) == [(f"id{i}", i) for i in range(4)]
+        assert not errors
+
+
+def test_batched_failures_are_reported_for_the_failing_row(connection):
+    with closing(connection.cursor()) as cur:
+        statement = PreparedStatement("INSERT INTO test (id, value) VALUES (?, ?)", cur, batch_size=10)
+        errors = []
+
+        for id_, value in [("a", 1), ("b", 2), ("a", 3), ("c", 4), ("b", 5), ("d", 6)]:
+            assert _insert(statement, id_, value, errors)
+
+        assert not statement.flush()
+        assert _read(connection) == [("a", 1), ("b", 2), ("c", 4), ("d", 6)]
+        assert [parameters for parameters, _ in errors] == ["a, 3", "b, 5"]
+        assert all("UNIQUE" in message for _, message in errors)
+
+        # The failure is only reported for the flush it occurred in.
+        assert statement.flush()
+
+
+def test_missing_values_fail_immediately_when_batching(connection):
+    with closing(connection.cursor()) as cur:
+        statement = PreparedStatement("INSERT INTO test (id, value) VALUES (?, ?)", cur, batch_size=10)
+        errors = []
+
+        statement.add_value(1, "a")
+        assert not statement.try_execute_single_update(lambda ex: errors.append(ex))
+        assert len(errors) == 1
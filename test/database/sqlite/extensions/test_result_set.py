@@ -0,0 +1,44 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from zepben.ewb.database.sqlite.extensions.result_set import ResultSet
+
+
+def test_reads_rows_from_list():
+    results = ResultSet([["a", 1], ["b", None]])
+
+    assert results.next()
+    assert (results.get_string(1), results.get_int(2)) == ("a", 1)
+    assert results.next()
+    assert (results.get_string(1), results.get_int(2, None)) == ("b", None)
+    assert not results.next()
+
+
+@pytest.mark.parametrize("fetch_size", [1, 2, 3, 10])
+def test_streams_rows_from_cursor(fetch_size: int):
+    with closing(sqlite3.connect(":memory:")) as connection:
+        connection.execute("CREATE TABLE test (id TEXT, value INTEGER)")
+        connection.executemany("INSERT INTO test VALUES (?, ?)", [(f"id{i}", i) for i in range(7)])
+
+        with closing(connection.cursor()) as cur:
+            cur.execute("SELECT id, value FROM test ORDER BY value")
+            results = ResultSet(cur, fetch_size)
+
+            read = []
+            while results.next():
+                read.append((results.get_string(1), results.get_int(2)))
+
+            assert read == [(f"id{i}", i) for i in range(7)]
+            assert not results.next()
+
+
+def test_fetch_size_must_be_positive():
+    with closing(sqlite3.connect(":memory:")) as connection, closing(connection.cursor()) as cur:
+        with pytest.raises(ValueError):
+            ResultSet(cur, 0)
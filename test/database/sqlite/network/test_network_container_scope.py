@@ -0,0 +1,175 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import contextlib
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+
+import pytest
+
+from zepben.ewb import TestNetworkBuilder, NetworkService, NetworkDatabaseWriter, NetworkDatabaseReader, PhaseCode, Feeder, LvFeeder, Substation, \
+    BaseVoltage, CableInfo, NameType, PowerTransformerInfo, AcLineSegment, PowerTransformer, EnergyConsumer, EnergyConsumerPhase, SinglePhaseKind, \
+    ConnectivityNode, Terminal, Equipment, NetworkStateOperators
+
+
+def _create_database(database_file: Path):
+    #
+    # s0 21--b1--21--c2--21--tx3--21--c4--21 ec5
+    #     1
+    #     +--b6--21--c7
+    #
+    # b1 and b6 are the heads of feeders fdr8 and fdr9, with an LV feeder lvf10 on the LV side of tx3.
+    #
+    network = (TestNetworkBuilder()
+               .from_source(PhaseCode.ABC)  # s0
+               .to_breaker()  # b1
+               .to_acls()  # c2
+               .to_power_transformer([PhaseCode.ABC, PhaseCode.ABCN])  # tx3
+               .to_acls(PhaseCode.ABCN)  # c4
+               .to_energy_consumer(PhaseCode.ABCN)  # ec5
+               .branch_from("s0", 1)
+               .to_breaker()  # b6
+               .to_acls()  # c7
+               .add_feeder("b1", 2)  # fdr8
+               .add_feeder("b6", 2)  # fdr9
+               .add_lv_feeder("tx3", 2)  # lvf10
+               ).network
+
+    substation = Substation(mrid="sub")
+    network.add(substation)
+    for it in network.objects(Feeder):
+        it.normal_energizing_substation = substation
+        substation.add_feeder(it)
+
+    base_voltage = BaseVoltage(mrid="bv", nominal_voltage=11000)
+    network.add(base_voltage)
+    network["c2"].base_voltage = base_voltage
+    network["c7"].base_voltage = base_voltage
+
+    lv_base_voltage = BaseVoltage(mrid="lv-bv", nominal_voltage=415)
+    network.add(lv_base_voltage)
+    network["c4"].base_voltage = lv_base_voltage
+    network["ec5"].base_voltage = lv_base_voltage
+
+    cable_info = CableInfo(mrid="cable")
+    network.add(cable_info)
+    network["c2"].asset_info = cable_info
+
+    transformer_info = PowerTransformerInfo(mrid="tx-info")
+    network.add(transformer_info)
+    network["tx3"].asset_info = transformer_info
+
+    ec = network.get("ec5", EnergyConsumer)
+    phase = EnergyConsumerPhase(mrid="ec5-pA", energy_consumer=ec, phase=SinglePhaseKind.A)
+    ec.add_phase(phase)
+    network.add(phase)
+
+    name_type = NameType(name="nt", description="the name type")
+    network.add_name_type(name_type)
+    network["c2"].add_name(name_type, "c2-name")
+    network["c7"].add_name(name_type, "c7-name")
+
+    assert NetworkDatabaseWriter(str(database_file), network).save(), "Database should have been saved"
+
+
+async def _load(database_file: Path, container_mrids: Iterable[str] = None) -> NetworkService:
+    service = NetworkService()
+    with contextlib.closing(sqlite3.connect(database_file)) as connection:
+        assert await NetworkDatabaseReader(connection, service, str(database_file), container_mrids=container_mrids).load(), "Database should have loaded"
+    return service
+
+
+@pytest.fixture()
+def database_file(tmp_path) -> Path:
+    database_file = tmp_path / "network.sqlite"
+    _create_database(database_file)
+    return database_file
+
+
+@pytest.mark.asyncio
+async def test_only_loads_the_requested_feeder(database_file):
+    full = await _load(database_file)
+    partial = await _load(database_file, ["fdr8"])
+
+    assert not list(partial.unresolved_references())
+    assert {it.mrid for it in partial.objects(Feeder)} == {"fdr8"}
+    assert "c7" not in partial
+
+    # The source feeding the feeder is loaded, which stops at the head of the other feeder.
+    assert "s0" in partial
+    assert "b6" in partial
+    assert "b6-t2" in partial
+    assert {it.mrid for it in partial.get("b6-t2", Terminal).connected_terminals()} == set()
+
+    # The LV network below the transformer is not part of the feeder.
+    assert "c4" not in partial
+    assert "lvf10" not in partial
+
+    # Everything in the feeder is loaded, along with the objects it owns and references.
+    assert {it.mrid for it in partial.get("fdr8", Feeder).equipment} == {it.mrid for it in full.get("fdr8", Feeder).equipment}
+    for mrid in ["tx3-e1", "tx3-e2", "cable", "tx-info", "bv", "sub"]:
+        assert mrid in partial, f"{mrid} should have been loaded"
+
+    assert {it.mrid for it in partial.objects(ConnectivityNode)} <= {it.mrid for it in full.objects(ConnectivityNode)}
+    assert partial.get("c2", AcLineSegment).asset_info.mrid == "cable"
+    assert [it.name for it in partial["c2"].names] == ["c2-name"]
+    assert len(list(partial.get_name_type("nt").names)) == 1
+
+    # Associations to containers outside the scope are not loaded.
+    assert {it.mrid for it in partial.get("sub", Substation).feeders} == {"fdr8"}
+
+    # The post-processing has been run on the partial network.
+    assert {it.mrid for it in NetworkStateOperators.NORMAL.get_containers(partial.get("c2", AcLineSegment))} == {"fdr8"}
+
+
+@pytest.mark.asyncio
+async def test_objects_match_the_full_network(database_file):
+    full = await _load(database_file)
+    partial = await _load(database_file, ["fdr8"])
+
+    for it in partial.objects(Terminal):
+        expected = full.get(it.mrid, Terminal)
+        assert it.conducting_equipment.mrid == expected.conducting_equipment.mrid
+        assert it.connectivity_node_id == expected.connectivity_node_id
+        assert it.phases == expected.phases
+        assert it.normal_phases.as_phase_code() == expected.normal_phases.as_phase_code()
+        assert it.current_phases.as_phase_code() == expected.current_phases.as_phase_code()
+
+    # The phases are traced from the source feeding the feeder.
+    assert partial.get("c2-t1", Terminal).normal_phases.as_phase_code() == PhaseCode.ABC
+    assert partial.get("c2-t1", Terminal).current_phases.as_phase_code() == PhaseCode.ABC
+
+    for it in partial.objects(Equipment):
+        assert type(it) is type(full[it.mrid])
+
+    assert [it.mrid for it in partial.get("tx3", PowerTransformer).ends] == [it.mrid for it in full.get("tx3", PowerTransformer).ends]
+
+
+@pytest.mark.asyncio
+async def test_loads_lv_feeders(database_file):
+    full = await _load(database_file)
+    partial = await _load(database_file, ["lvf10"])
+
+    assert not list(partial.unresolved_references())
+    assert {it.mrid for it in partial.objects(LvFeeder)} == {"lvf10"}
+    assert not list(partial.objects(Feeder))
+    assert "ec5-pA" in partial
+    assert {it.mrid for it in NetworkStateOperators.NORMAL.get_containers(partial.get("ec5", EnergyConsumer))} == {"lvf10"}
+
+    # The feeder energising the LV feeder is loaded up to its source, so the phases match the full network.
+    assert {it.mrid for it in partial.objects(Equipment)} == {"s0", "b1", "c2", "tx3", "c4", "ec5", "b6"}
+    for it in partial.objects(Terminal):
+        assert it.normal_phases.as_phase_code() == full.get(it.mrid, Terminal).normal_phases.as_phase_code()
+        assert it.current_phases.as_phase_code() == full.get(it.mrid, Terminal).current_phases.as_phase_code()
+    assert partial.get("ec5-t1", Terminal).normal_phases.as_phase_code() == PhaseCode.ABCN
+
+
+@pytest.mark.asyncio
+async def test_warns_about_unknown_containers(database_file, caplog):
+    partial = await _load(database_file, ["fdr9", "unknown"])
+
+    assert "Equipment container unknown was not found in the database." in caplog.text
+    assert {it.mrid for it in partial.objects(Feeder)} == {"fdr9"}
+    assert not list(partial.objects(PowerTransformer))
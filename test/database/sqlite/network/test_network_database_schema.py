@@ -9,6 +9,7 @@ import time
 import unittest
 from collections import Counter
 from sqlite3 import Connection
+from unittest import mock
 
 import pytest
 from hypothesis import given, settings, HealthCheck, assume
@@ -31,6 +32,8 @@ from cim.fill_fields import create_cable_info, create_no_load_test, create_open_
     create_hv_customer, create_lv_substation, create_ac_line_segment_phase
 from database.sqlite.common.cim_database_schema_common_tests import CimDatabaseSchemaCommonTests, TComparator, TService, TReader, TWriter
 from database.sqlite.schema_utils import SchemaNetworks
+# noinspection PyProtectedMember
+from zepben.ewb.database.sqlite.common.table_prefetcher import TablePrefetcher
 from zepben.ewb import Identifiable, AcLineSegment, NoLoadTest, OpenCircuitTest, PowerTransformerInfo, \
     ShortCircuitTest, ShuntCompensatorInfo, TransformerEndInfo, TransformerTankInfo, Pole, Streetlight, Location, Organisation, \
     OperationalRestriction, BaseVoltage, ConnectivityNode, Feeder, Site, Substation, Terminal, \
@@ -116,6 +119,54 @@ class TestNetworkDatabaseSchema(CimDatabaseSchemaCommonTests[NetworkService, Net
     def create_identifiable(self) -> Identifiable:
         return Junction(mrid="test")
 
+    @pytest.mark.asyncio
+    async def test_batched_writes(self):
+        service = self.create_service()
+        for i in range(25):
+            junction = Junction(mrid=f"j{i}")
+            for j in range(2):
+                terminal = Terminal(mrid=f"j{i}-t{j}", conducting_equipment=junction, sequence_number=j + 1)
+                junction.add_terminal(terminal)
+                service.add(terminal)
+            service.add(junction)
+
+        def create_writer(filename: str, service_: NetworkService) -> NetworkDatabaseWriter:
+            return NetworkDatabaseWriter(filename, service_, batch_size=7)
+
+        self.create_writer = create_writer
+        await self._validate_schema(service)
+
+    @pytest.mark.asyncio
+    async def test_parallel_table_fetching(self):
+        service = self.create_service()
+        for i in range(25):
+            junction = Junction(mrid=f"j{i}", location=Location(mrid=f"l{i}"))
+            for j in range(2):
+                terminal = Terminal(mrid=f"j{i}-t{j}", conducting_equipment=junction, sequence_number=j + 1)
+                junction.add_terminal(terminal)
+                service.add(terminal)
+            service.add(junction.location)
+            service.add(junction)
+
+        def create_reader(connection: Connection, service_: NetworkService, database_description: str) -> NetworkDatabaseReader:
+            return NetworkDatabaseReader(connection, service_, database_description, fetch_workers=3)
+
+        # Check the tables read by the service reader were fetched by the workers, rather than being read directly.
+        taken = []
+        take = TablePrefetcher.take
+
+        def record_take(prefetcher: TablePrefetcher, table):
+            rows = take(prefetcher, table)
+            taken.append(rows is not None)
+            return rows
+
+        self.create_reader = create_reader
+        with mock.patch.object(TablePrefetcher, "take", record_take):
+            await self._validate_schema(service)
+
+        assert len(taken) > 100
+        assert all(taken)
+
     @unittest.skip("Only load real files on demand, not as part of the actual test suite")
     @pytest.mark.timeout(65536)
     async def test_load_real_file(self):
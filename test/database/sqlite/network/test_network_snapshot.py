@@ -0,0 +1,173 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import contextlib
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from zepben.ewb import TestNetworkBuilder, NetworkService, NetworkDatabaseWriter, NetworkDatabaseReader, NetworkSnapshot, NetworkServiceComparator, \
+    NetworkStateOperators, PhaseCode, Switch, Feeder, LvFeeder, Equipment, Terminal, NameType, DataSource
+
+
+def _create_database(database_file: Path, open_switch: str = None):
+    #
+    # s0 21--b1--21--c2--21 b3 21--tx4--21--c5--21 b6 21--c7
+    #
+    network = (TestNetworkBuilder()
+               .from_source(PhaseCode.ABC)  # s0
+               .to_breaker()  # b1
+               .to_acls()  # c2
+               .to_breaker()  # b3
+               .to_power_transformer([PhaseCode.ABC, PhaseCode.ABCN])  # tx4
+               .to_acls(PhaseCode.ABCN)  # c5
+               .to_breaker(PhaseCode.ABCN)  # b6
+               .to_acls(PhaseCode.ABCN)  # c7
+               .add_feeder("b1", 2)  # fdr8
+               .add_lv_feeder("tx4", 2)  # lvf9
+               ).network
+    if open_switch:
+        network.get(open_switch, Switch).set_open(True)
+
+    name_type = NameType(name="nt", description="the name type")
+    network.add_name_type(name_type)
+    network["c2"].add_name(name_type, "name")
+
+    assert NetworkDatabaseWriter(str(database_file), network).save(), "Database should have been saved"
+
+
+async def _load(database_file: Path, snapshot_file: Path) -> NetworkService:
+    service = NetworkService()
+    with contextlib.closing(sqlite3.connect(database_file)) as connection:
+        assert await NetworkDatabaseReader(connection, service, str(database_file), snapshot_file=str(snapshot_file)).load(), "Database should have loaded"
+    return service
+
+
+def _traced_state(network: NetworkService):
+    def feeder_state(ops: NetworkStateOperators):
+        return (
+            {it.mrid: {eq.mrid for eq in ops.get_equipment(it)} for it in network.objects(Feeder)},
+            {it.mrid: {eq.mrid for eq in ops.get_equipment(it)} for it in network.objects(LvFeeder)},
+            {it.mrid: {c.mrid for c in ops.get_containers(it)} for it in network.objects(Equipment)},
+            {it.mrid: {lvf.mrid for lvf in ops.get_energized_lv_feeders(it)} for it in network.objects(Feeder)},
+            {it.mrid: ops.get_direction(it) for it in network.objects(Terminal)},
+            {it.mrid: ops.phase_status(it)._phase_status_internal for it in network.objects(Terminal)},
+        )
+
+    return feeder_state(NetworkStateOperators.NORMAL), feeder_state(NetworkStateOperators.CURRENT)
+
+
+@pytest.mark.asyncio
+async def test_restores_the_processed_network(tmp_path, caplog):
+    database_file = tmp_path / "network.sqlite"
+    snapshot_file = tmp_path / "network.snapshot"
+    _create_database(database_file, open_switch="b3")
+
+    loaded = await _load(database_file, snapshot_file)
+    assert snapshot_file.is_file(), "Snapshot should have been written"
+
+    caplog.clear()
+    restored = await _load(database_file, snapshot_file)
+    assert "Restored snapshot" in caplog.text
+    assert "Assigning equipment to feeders" not in caplog.text
+
+    differences = NetworkServiceComparator().compare_services(loaded, restored)
+    assert not dict(differences.modifications())
+    assert not list(differences.missing_from_source())
+    assert not list(differences.missing_from_target())
+
+    assert _traced_state(restored) == _traced_state(loaded)
+    assert _traced_state(restored)[0] != _traced_state(restored)[1], "The normal and current state should differ due to the open switch"
+
+    assert restored.get_name_type("nt").description == "the name type"
+    assert [(it.source, it.version) for it in restored.metadata.data_sources] == [(it.source, it.version) for it in loaded.metadata.data_sources]
+
+
+@pytest.mark.asyncio
+async def test_ignores_snapshots_for_other_databases(tmp_path, caplog):
+    database_file = tmp_path / "network.sqlite"
+    snapshot_file = tmp_path / "network.snapshot"
+    _create_database(database_file)
+    await _load(database_file, snapshot_file)
+
+    database_file.unlink()
+    _create_database(database_file, open_switch="b3")
+
+    caplog.clear()
+    reloaded = await _load(database_file, snapshot_file)
+    assert "has changed since it was written" in caplog.text
+    assert "Assigning equipment to feeders" in caplog.text
+    assert reloaded.get("b3", Switch).is_open()
+
+    # The snapshot should have been replaced with one for the new database.
+    assert NetworkSnapshot(snapshot_file).load(NetworkService(), database_file)
+
+
+def test_ignores_snapshots_with_other_format_versions(tmp_path, caplog):
+    database_file = tmp_path / "network.sqlite"
+    snapshot_file = tmp_path / "network.snapshot"
+    _create_database(database_file)
+
+    class NewerSnapshot(NetworkSnapshot):
+        FORMAT_VERSION = NetworkSnapshot.FORMAT_VERSION + 1
+
+    NewerSnapshot(snapshot_file).write(NetworkService(), database_file)
+    service = NetworkService()
+
+    assert not NetworkSnapshot(snapshot_file).load(service, database_file)
+    assert "Found format v2" in caplog.text
+    assert service.len_of() == 0
+
+
+def test_rejects_truncated_snapshots_without_modifying_the_service(tmp_path):
+    database_file = tmp_path / "network.sqlite"
+    snapshot_file = tmp_path / "network.snapshot"
+    _create_database(database_file)
+
+    network = TestNetworkBuilder().from_junction().to_acls().network
+    network.metadata.add(DataSource("source", "1"))
+    NetworkSnapshot(snapshot_file).write(network, database_file)
+    snapshot_file.write_bytes(snapshot_file.read_bytes()[:-3])
+
+    service = NetworkService()
+    with pytest.raises(ValueError, match="truncated"):
+        NetworkSnapshot(snapshot_file).load(service, database_file)
+    assert service.len_of() == 0
+    assert service.metadata.num_sources() == 0
+
+
+def test_rejects_snapshots_with_unresolved_references_without_modifying_the_service(tmp_path):
+    database_file = tmp_path / "network.sqlite"
+    snapshot_file = tmp_path / "network.snapshot"
+    _create_database(database_file)
+
+    network = TestNetworkBuilder().from_junction().to_acls().network
+    network.remove(network["j0-t1"])
+    NetworkSnapshot(snapshot_file).write(network, database_file)
+
+    service = NetworkService()
+    with pytest.raises(ValueError, match="Unresolved references"):
+        NetworkSnapshot(snapshot_file).load(service, database_file)
+    assert service.len_of() == 0
+    assert not list(service.name_types)
+
+
+@pytest.mark.asyncio
+async def test_loads_the_database_if_the_snapshot_is_corrupt(tmp_path, caplog):
+    database_file = tmp_path / "network.sqlite"
+    snapshot_file = tmp_path / "network.snapshot"
+    _create_database(database_file, open_switch="b3")
+    loaded = await _load(database_file, snapshot_file)
+
+    snapshot_file.write_bytes(snapshot_file.read_bytes()[:-3])
+
+    caplog.clear()
+    reloaded = await _load(database_file, snapshot_file)
+    assert "Unable to restore snapshot" in caplog.text
+    assert "Assigning equipment to feeders" in caplog.text
+    assert _traced_state(reloaded) == _traced_state(loaded)
+
+    # The corrupt snapshot should have been replaced.
+    assert NetworkSnapshot(snapshot_file).load(NetworkService(), database_file)
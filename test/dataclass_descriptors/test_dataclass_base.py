@@ -88,3 +88,16 @@ def test_identifiable_mrid():
 
     with pytest.raises(TypeError):
         Cut("it", mrid="it")
+
+
+def test_init_plan_is_reused_across_instances():
+    first = Child("first", y=1)
+    second = Child("second", y=2, dc_default=3)
+
+    # Subsequent instances must still get their own defaults and kwargs from the cached plan.
+    assert (first.y, first.dc_default) == (1, 99)
+    assert (second.y, second.dc_default) == (2, 3)
+    assert first.dc_default_factory is not second.dc_default_factory
+
+    with pytest.raises(TypeError, match="Missing required field 'y'"):
+        Child("third")
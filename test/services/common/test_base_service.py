@@ -16,7 +16,7 @@ from zepben.ewb import Terminal, resolver, UnresolvedReference, NetworkService,
     Circuit, Substation, ConnectivityNodeContainer, Equipment, EnergySourcePhase, ConnectivityNode, BaseVoltage, \
     Control, RemoteControl, RemoteSource, Loop, AssetInfo, \
     OrganisationRole, Document, LvFeeder, EvChargingUnit, TapChangerControl, BatteryControl, PanDemandResponseFunction, \
-    StaticVarCompensator, generate_id
+    StaticVarCompensator, generate_id, TestNetworkBuilder, NetworkServiceComparator
 from zepben.ewb.model.cim.iec61970.base.wires.linear_shunt_compensator import LinearShuntCompensator
 from zepben.ewb.model.cim.iec61970.base.wires.power_electronics_connection_phase import PowerElectronicsConnectionPhase
 from zepben.ewb.model.cim.iec61970.base.wires.per_length_sequence_impedance import PerLengthSequenceImpedance
@@ -94,6 +94,14 @@ def test_remove(service: BaseService):
 
     assert service.get("b1", default=None) is None
     assert service.get("b2", default=None) is b2
+    assert "b1" not in service
+    assert b1 not in service
+    assert service.len_of() == 1
+
+    # Once removed, the mRID is free to be used by an object of another type.
+    j1 = Junction(mrid="b1")
+    assert service.add(j1)
+    assert service.get("b1", Junction) is j1
 
 
 def test_unresolved_bidirectional_references(service: BaseService):
@@ -234,6 +242,37 @@ def test_objects_exclude(service: BaseService):
     assert set(service.objects(exc_types=[AcLineSegment])) == {b1, j1}
 
 
+def test_objects_and_len_of_base_types(service: BaseService):
+    b1 = Breaker(mrid="b1")
+    service.add(b1)
+
+    assert set(service.objects(Equipment)) == {b1}
+    assert service.len_of(Equipment) == 1
+
+    # A concrete type added after the base type has been queried must still be found.
+    j1 = Junction(mrid="j1")
+    f1 = Fuse(mrid="f1")
+    loc = Location(mrid="loc")
+    service.add(j1)
+    service.add(f1)
+    service.add(loc)
+
+    assert set(service.objects(Equipment)) == {b1, j1, f1}
+    assert set(service.objects(Breaker)) == {b1}
+    assert service.len_of(Equipment) == 3
+    assert service.len_of(Breaker) == 1
+    assert service.len_of(IdentifiedObject) == 4
+    assert service.len_of(Feeder) == 0
+    assert service.len_of() == 4
+
+    service.remove(j1)
+
+    assert set(service.objects(Equipment)) == {b1, f1}
+    assert service.len_of(Equipment) == 2
+    assert service.len_of(Junction) == 0
+    assert service.len_of() == 3
+
+
 def test_contains(service: BaseService):
     breaker = Breaker(mrid=generate_id())
     service.add(breaker)
@@ -263,6 +302,85 @@ def test_unresolved_references_by_id(service: BaseService):
     assert service.num_unresolved_references("unknown") == 0
 
 
+def test_batch_references_defers_linking_missing_objects_until_the_batch_finishes(service: BaseService):
+    term = Terminal(mrid="t1")
+    j1 = Junction(mrid="j1")
+
+    with service.batch_references():
+        assert service.resolve_or_defer_reference(resolver.ce_terminals(j1), "t1") is False
+        assert service.add(j1)
+        assert service.resolve_or_defer_reference(resolver.ce_base_voltage(j1), "bv1") is False
+
+        assert not list(j1.terminals)
+        assert not service.has_unresolved_references()
+
+        # References to objects already in the service are still resolved immediately.
+        assert service.resolve_or_defer_reference(resolver.conducting_equipment(term), "j1") is True
+        assert service.add(term)
+
+        assert term.conducting_equipment is j1
+        assert list(j1.terminals) == [term]
+
+    # Only the reference to the object outside the batch is deferred.
+    assert term.conducting_equipment is j1
+    assert list(j1.terminals) == [term]
+    assert [it.to_mrid for it in service.unresolved_references()] == ["bv1"]
+
+
+def test_batch_references_resolves_references_deferred_before_the_batch(service: BaseService):
+    acls1 = AcLineSegment(mrid="acls1")
+    service.add(acls1)
+    service.resolve_or_defer_reference(resolver.ce_terminals(acls1), "t1")
+    service.resolve_or_defer_reference(resolver.per_length_impedance(acls1), "plsi1")
+
+    t1 = Terminal(mrid="t1")
+    plsi1 = PerLengthSequenceImpedance(mrid="plsi1")
+    with service.batch_references():
+        service.resolve_or_defer_reference(resolver.conducting_equipment(t1), "acls1")
+        service.add(t1)
+        service.add(plsi1)
+
+    assert t1.conducting_equipment is acls1
+    assert list(acls1.terminals) == [t1]
+    assert acls1.per_length_impedance is plsi1
+    assert not service.has_unresolved_references()
+
+
+@pytest.mark.asyncio
+async def test_add_all_from_pb_matches_adding_each_object():
+    network = await (TestNetworkBuilder()
+                     .from_source()
+                     .to_acls()
+                     .to_breaker()
+                     .to_power_transformer()
+                     .to_energy_consumer()
+                     .add_feeder("s0")
+                     .build())
+    pbs = [it.to_pb() for it in network.objects()]
+
+    for split in (0, len(pbs) // 2):
+        # noinspection PyArgumentList
+        expected = NetworkService()
+        for pb in pbs[split:]:
+            expected.add_from_pb(pb)
+
+        # noinspection PyArgumentList
+        actual = NetworkService()
+        actual.add_all_from_pb(pbs[split:])
+
+        assert actual.num_unresolved_references() == expected.num_unresolved_references()
+        assert set(actual.unresolved_references()) == set(expected.unresolved_references())
+
+        for pb in pbs[:split]:
+            expected.add_from_pb(pb)
+        actual.add_all_from_pb(pbs[:split])
+
+        assert not actual.has_unresolved_references()
+        differences = NetworkServiceComparator().compare_services(actual, expected)
+        assert not list(differences.modifications())
+        assert not list(differences.missing_from_source()) and not list(differences.missing_from_target())
+
+
 def _add_and_check(service: BaseService, to_add, to_check: Union[IdentifiedObject, List[IdentifiedObject]], to_check_reference):
     service.add(to_add)
     if isinstance(to_check, IdentifiedObject):
@@ -0,0 +1,113 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from zepben.ewb import AcLineSegment, Terminal, Feeder, Substation, PhaseCode, SinglePhaseKind, FeederDirection, Junction, NetworkServiceComparator, \
+    content_key, fingerprint, container_fingerprint
+
+
+def _create_feeder(length: float = 1.0) -> Feeder:
+    feeder = Feeder(mrid="feeder")
+    acls = AcLineSegment(mrid="acls", name="acls", length=length)
+    for i in range(2):
+        terminal = Terminal(mrid=f"acls-t{i + 1}", phases=PhaseCode.ABC)
+        terminal.conducting_equipment = acls
+        acls.add_terminal(terminal)
+    acls.add_container(feeder)
+    feeder.add_equipment(acls)
+    return feeder
+
+
+def test_identical_objects_have_the_same_fingerprint():
+    first = AcLineSegment(mrid="acls", name="acls", length=1.0)
+    second = AcLineSegment(mrid="acls", name="acls", length=1.0)
+
+    assert content_key(first) == content_key(second)
+    assert fingerprint(first) == fingerprint(second)
+    assert fingerprint(first) != fingerprint(AcLineSegment(mrid="acls", name="acls", length=2.0))
+
+
+def test_fingerprint_is_only_cached_when_requested():
+    acls = AcLineSegment(mrid="acls", length=1.0)
+
+    fingerprint(acls)
+    assert acls._content_cache is None
+
+    original = fingerprint(acls, cache=True)
+    assert acls._content_cache is not None
+    assert fingerprint(acls, cache=True) is original
+
+
+def test_fingerprint_is_cached_until_a_field_is_assigned():
+    acls = AcLineSegment(mrid="acls", length=1.0)
+    original = fingerprint(acls, cache=True)
+
+    acls.length = 2.0
+    assert fingerprint(acls, cache=True) != original
+
+    acls.length = 1.0
+    assert fingerprint(acls, cache=True) == original
+
+
+def test_fingerprint_is_updated_by_collection_mutators():
+    acls = AcLineSegment(mrid="acls")
+    original = fingerprint(acls, cache=True)
+
+    terminal = Terminal(mrid="t1")
+    acls.add_terminal(terminal)
+    assert fingerprint(acls, cache=True) != original
+
+    acls.remove_terminal(terminal)
+    assert fingerprint(acls, cache=True) == original
+
+
+def test_unordered_collections_do_not_affect_the_fingerprint():
+    equipment = [Junction(mrid="j1"), Junction(mrid="j2"), Junction(mrid="j3")]
+    feeder = Feeder(mrid="feeder")
+    reversed_feeder = Feeder(mrid="feeder")
+    for it in equipment:
+        feeder.add_equipment(it)
+    for it in reversed(equipment):
+        reversed_feeder.add_equipment(it)
+
+    assert not NetworkServiceComparator().compare_objects(feeder, reversed_feeder).differences
+    assert content_key(feeder) == content_key(reversed_feeder)
+    assert fingerprint(feeder) == fingerprint(reversed_feeder)
+
+    # The order of terminals is compared, so it should still change the fingerprint.
+    acls = AcLineSegment(mrid="acls", terminals=[Terminal(mrid="t1"), Terminal(mrid="t2")])
+    reversed_acls = AcLineSegment(mrid="acls", terminals=[Terminal(mrid="t2"), Terminal(mrid="t1")])
+    assert fingerprint(acls) != fingerprint(reversed_acls)
+
+
+def test_terminal_fingerprint_includes_traced_state():
+    terminal = Terminal(mrid="t1", phases=PhaseCode.AB)
+    original = fingerprint(terminal)
+
+    terminal.normal_phases[SinglePhaseKind.A] = SinglePhaseKind.B
+    traced_phases = fingerprint(terminal)
+    assert traced_phases != original
+
+    terminal.current_feeder_direction = FeederDirection.DOWNSTREAM
+    assert fingerprint(terminal) not in (original, traced_phases)
+
+
+def test_container_fingerprint_includes_contents():
+    assert container_fingerprint(_create_feeder()) == container_fingerprint(_create_feeder())
+    assert container_fingerprint(_create_feeder()) != container_fingerprint(_create_feeder(length=2.0))
+
+    feeder = _create_feeder()
+    original = container_fingerprint(feeder)
+    next(feeder.equipment).get_terminal_by_sn(1).phases = PhaseCode.AB
+    assert container_fingerprint(feeder) != original
+
+
+def test_substation_fingerprint_includes_feeders():
+    substation = Substation(mrid="substation")
+    feeder = _create_feeder()
+    substation.add_feeder(feeder)
+    original = container_fingerprint(substation)
+
+    next(feeder.equipment).length = 2.0
+    assert container_fingerprint(substation) != original
@@ -0,0 +1,40 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import threading
+
+import pytest
+
+from zepben.ewb.services.common.forked_workers import can_fork_workers, forked_worker_pool, worker_state
+
+
+def _read_state(offset: int) -> int:
+    return worker_state() + offset
+
+
+def test_can_only_fork_without_other_threads():
+    assert not can_fork_workers(None)
+    assert not can_fork_workers(1)
+
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        assert not can_fork_workers(2)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_each_pool_has_its_own_state():
+    if not can_fork_workers(2):
+        pytest.skip("Worker processes can't be forked on this platform, or other threads are running.")
+
+    with forked_worker_pool(2, 100) as executor:
+        assert list(executor.map(_read_state, [1, 2])) == [101, 102]
+    with forked_worker_pool(2, 200) as executor:
+        assert list(executor.map(_read_state, [1, 2])) == [201, 202]
+
+    # The state is only set in the workers.
+    assert worker_state() is None
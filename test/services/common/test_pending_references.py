@@ -0,0 +1,81 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import pytest
+
+from zepben.ewb import PendingReferences, Terminal, Junction, UnresolvedReference, resolver
+
+
+def test_indexes_references_by_both_mrids():
+    references = PendingReferences()
+    t1 = Terminal(mrid="t1")
+    j1 = Junction(mrid="j1")
+    term_to_ce = resolver.conducting_equipment(t1)
+    ce_to_bv = resolver.ce_base_voltage(j1)
+
+    assert references.add(t1, "j1", term_to_ce.resolver, term_to_ce.reverse_resolver)
+    assert references.add(j1, "bv1", ce_to_bv.resolver)
+    assert not references.add(t1, "j1", term_to_ce.resolver, term_to_ce.reverse_resolver)
+
+    assert len(references) == 2
+    assert references.has_references_to("j1")
+    assert not references.has_references_to("t1")
+    assert references.count_to("bv1") == 1
+    assert references.count_to("unknown") == 0
+
+    # noinspection PyArgumentList
+    expected = UnresolvedReference(from_ref=t1, to_mrid="j1", resolver=term_to_ce.resolver, reverse_resolver=term_to_ce.reverse_resolver)
+    assert list(references.references_to("j1")) == [expected]
+    assert list(references.references_from("t1")) == [expected]
+    assert list(references.references_from("t1"))[0].reverse_resolver is term_to_ce.reverse_resolver
+    assert {it.to_mrid for it in references} == {"j1", "bv1"}
+
+
+def test_remove_and_pop_references():
+    references = PendingReferences()
+    j1 = Junction(mrid="j1")
+    j2 = Junction(mrid="j2")
+    references.add(j1, "bv1", resolver.ce_base_voltage(j1).resolver)
+    references.add(j2, "bv1", resolver.ce_base_voltage(j2).resolver)
+    references.add(j1, "t1", resolver.ce_terminals(j1).resolver)
+
+    references.remove("j1", "t1", resolver.ce_terminals(j1).resolver)
+    with pytest.raises(KeyError):
+        references.remove("j1", "t1", resolver.ce_terminals(j1).resolver)
+
+    popped = references.pop_references_to("bv1")
+    assert {it[0] for it in popped} == {j1, j2}
+    assert len(references) == 0
+    assert not references.has_references_to("bv1")
+    assert not list(references.references_from("j1"))
+    assert not list(references)
+
+
+def test_slots_are_reused():
+    references = PendingReferences()
+    j1 = Junction(mrid="j1")
+    references.add(j1, "bv1", resolver.ce_base_voltage(j1).resolver)
+    references.add(j1, "t1", resolver.ce_terminals(j1).resolver)
+    size = references.nbytes
+
+    references.pop_references_to("bv1")
+    references.add(j1, "t2", resolver.ce_terminals(j1).resolver)
+
+    assert references.nbytes == size
+    assert {it.to_mrid for it in references.references_from("j1")} == {"t1", "t2"}
+
+
+def test_references_can_be_removed_while_iterating():
+    references = PendingReferences()
+    junctions = [Junction(mrid=f"j{i}") for i in range(5)]
+    for it in junctions:
+        references.add(it, "bv1", resolver.ce_base_voltage(it).resolver)
+
+    seen = []
+    for it in references:
+        seen.append(it.from_ref)
+        references.remove(it.from_ref.mrid, "bv1", it.resolver)
+
+    assert set(seen) == set(junctions)
+    assert len(references) == 0
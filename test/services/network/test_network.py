@@ -2,7 +2,7 @@
 #  This Source Code Form is subject to the terms of the Mozilla Public
 #  License, v. 2.0. If a copy of the MPL was not distributed with this
 #  file, You can obtain one at https://mozilla.org/MPL/2.0/.
-from zepben.ewb import NetworkService, BaseVoltage, generate_id
+from zepben.ewb import NetworkService, BaseVoltage, generate_id, Terminal, ConnectivityNode
 
 
 class TestNetworkService(object):
@@ -15,3 +15,31 @@ class TestNetworkService(object):
 
         for obj in network.objects(BaseVoltage):
             assert obj is bv
+
+    def test_connectivity_nodes_are_indexed_by_mrid(self):
+        network = NetworkService()
+        t1 = Terminal(mrid="t1")
+        t2 = Terminal(mrid="t2")
+
+        assert network.connect_by_mrid(t1, "cn1")
+        assert network.connect_by_mrid(t2, "cn1")
+
+        cn1 = network.get("cn1")
+        assert isinstance(cn1, ConnectivityNode)
+        assert network.get("cn1", ConnectivityNode) is cn1
+        assert "cn1" in network
+        assert not network.add(BaseVoltage(mrid="cn1"))
+
+        assert network.len_of(ConnectivityNode) == 1
+        network.disconnect(t1)
+        assert "cn1" in network
+        assert network.len_of(ConnectivityNode) == 1
+
+        network.disconnect(t2)
+        assert "cn1" not in network
+        assert network.get("cn1", default=None) is None
+        assert network.len_of(ConnectivityNode) == 0
+
+        assert network.connect_by_mrid(t1, "cn2")
+        network.disconnect_by_mrid("cn2")
+        assert "cn2" not in network
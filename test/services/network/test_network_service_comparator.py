@@ -1725,3 +1725,50 @@ class TestNetworkServiceComparator(TestBaseServiceComparator):
             lambda _: Substation(mrid="s1"),
             lambda _: Substation(mrid="s2"),
         )
+
+
+def _create_services_to_compare() -> (NetworkService, NetworkService):
+    source = NetworkService()
+    target = NetworkService()
+    for i in range(50):
+        source.add(Junction(mrid=f"j{i}", name=f"junction {i}"))
+        target.add(Junction(mrid=f"j{i}", name=f"junction {i}" if i % 10 else "renamed"))
+
+    source.add(Breaker(mrid="only-in-source"))
+    target.add(Breaker(mrid="only-in-target"))
+    source.add(Breaker(mrid="different-types"))
+    target.add(Fuse(mrid="different-types"))
+
+    return source, target
+
+
+def test_compare_services_finds_missing_and_modified_objects():
+    source, target = _create_services_to_compare()
+    differences = NetworkServiceComparator().compare_services(source, target)
+
+    assert set(differences.missing_from_source()) == {"only-in-target", "different-types"}
+    assert set(differences.missing_from_target()) == {"only-in-source", "different-types"}
+
+    modifications = dict(differences.modifications())
+    assert set(modifications) == {f"j{i}" for i in range(0, 50, 10)}
+    assert modifications["j0"].source is source.get("j0")
+    assert modifications["j0"].differences == {"name": ValueDifference("junction 0", "renamed")}
+
+
+def test_compare_services_only_skips_objects_with_identical_content():
+    source_terminal = Terminal(mrid="t1", phases=PhaseCode.AB)
+    target_terminal = Terminal(mrid="t1", phases=PhaseCode.AB)
+
+    source = NetworkService()
+    target = NetworkService()
+    source.add(source_terminal)
+    target.add(target_terminal)
+
+    comparator = NetworkServiceComparator()
+    assert not list(comparator.compare_services(source, target).modifications())
+
+    target_terminal.normal_phases[SinglePhaseKind.A] = SinglePhaseKind.A
+    assert dict(comparator.compare_services(source, target).modifications())["t1"].differences.keys() == {"normal_phases"}
+
+    source_terminal.normal_phases[SinglePhaseKind.A] = SinglePhaseKind.A
+    assert not list(comparator.compare_services(source, target).modifications())
@@ -43,3 +43,12 @@ class TestConnectivityResult:
         assert cr1 != cr4
         assert hash(cr1) == hash(cr1Dup)
         assert str(cr1) != ""
+
+    def test_from_sorted_paths_holds_the_paths_without_copying(self):
+        paths = (NominalPhasePath(SinglePhaseKind.A, SinglePhaseKind.A), NominalPhasePath(SinglePhaseKind.B, SinglePhaseKind.X))
+        cr = ConnectivityResult.from_sorted_paths(self.terminal11, self.terminal21, paths)
+
+        assert cr.nominal_phase_paths is paths
+        assert cr.from_terminal is self.terminal11
+        assert cr.to_terminal is self.terminal21
+        assert cr == ConnectivityResult(from_terminal=self.terminal11, to_terminal=self.terminal21, nominal_phase_paths=reversed(paths))
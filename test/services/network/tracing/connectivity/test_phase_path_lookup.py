@@ -0,0 +1,70 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from itertools import combinations
+
+from zepben.ewb import PhaseCode, SinglePhaseKind as SPK, NominalPhasePath, PhasePathLookup, phase_mask, straight_phase_connectivity, \
+    straight_phase_path_lookup, transformer_phase_paths, transformer_phase_path_lookup
+
+
+def _subsets(phases):
+    return [set(it) for n in range(len(phases) + 1) for it in combinations(phases, n)]
+
+
+def test_straight_lookup_matches_filtered_paths():
+    for from_phases, paths_by_to in straight_phase_connectivity.items():
+        for to_phases, paths in paths_by_to.items():
+            for include_phases in _subsets(from_phases.single_phases):
+                found = straight_phase_path_lookup.get(from_phases, to_phases, phase_mask(include_phases))
+                if paths:
+                    assert set(found) == {it for it in paths if it.from_phase in include_phases}
+                else:
+                    assert found is None
+
+
+def test_transformer_lookup_matches_filtered_paths():
+    for from_phases, paths_by_to in transformer_phase_paths.items():
+        for to_phases, paths in paths_by_to.items():
+            for include_phases in _subsets(from_phases.single_phases):
+                found = transformer_phase_path_lookup.get(from_phases, to_phases, phase_mask(include_phases))
+                assert set(found) == {it for it in paths if (it.from_phase in include_phases) or (it.from_phase == SPK.NONE)}
+
+
+def test_pairs_without_paths_return_none():
+    assert straight_phase_path_lookup.get(PhaseCode.A, PhaseCode.B, phase_mask([SPK.A])) is None
+    assert straight_phase_path_lookup.get(PhaseCode.A, PhaseCode.X, phase_mask([SPK.A])) is None
+    assert transformer_phase_path_lookup.get(PhaseCode.ABC, PhaseCode.A, phase_mask([SPK.A])) is None
+
+
+def test_paths_are_sorted_and_shared():
+    mask = phase_mask([SPK.A, SPK.B, SPK.N])
+    paths = straight_phase_path_lookup.get(PhaseCode.ABCN, PhaseCode.ABN, mask)
+
+    assert paths == (NominalPhasePath(SPK.A, SPK.A), NominalPhasePath(SPK.B, SPK.B), NominalPhasePath(SPK.N, SPK.N))
+    assert straight_phase_path_lookup.get(PhaseCode.ABCN, PhaseCode.ABN, mask) is paths
+    assert straight_phase_path_lookup.get(PhaseCode.ABN, PhaseCode.ABCN, mask) is paths
+
+    # Phases that are not on the from phases are ignored.
+    assert straight_phase_path_lookup.get(PhaseCode.ABN, PhaseCode.ABN, mask | phase_mask([SPK.C, SPK.X])) is paths
+
+
+def test_phases_sharing_bit_masks_are_not_aliased():
+    assert SPK.A.bit_mask == SPK.X.bit_mask
+
+    assert transformer_phase_path_lookup.get(PhaseCode.AN, PhaseCode.XN, phase_mask([SPK.X])) == ()
+    assert transformer_phase_path_lookup.get(PhaseCode.AN, PhaseCode.XN, phase_mask([SPK.A])) == (NominalPhasePath(SPK.A, SPK.X),)
+
+
+def test_paths_are_only_found_once_per_pair():
+    calls = []
+
+    def find_paths(from_phases, to_phases):
+        calls.append((from_phases, to_phases))
+        return [NominalPhasePath(SPK.NONE, SPK.N), NominalPhasePath(SPK.A, SPK.A)]
+
+    lookup = PhasePathLookup(find_paths, always_include_none=True)
+
+    assert lookup.get(PhaseCode.A, PhaseCode.AN, 0) == (NominalPhasePath(SPK.NONE, SPK.N),)
+    assert lookup.get(PhaseCode.A, PhaseCode.AN, phase_mask([SPK.A])) == (NominalPhasePath(SPK.NONE, SPK.N), NominalPhasePath(SPK.A, SPK.A))
+    assert calls == [(PhaseCode.A, PhaseCode.AN)]
@@ -6,7 +6,7 @@ from collections import Counter
 from typing import List, Tuple
 
 from zepben.ewb import NetworkService, PhaseCode, SinglePhaseKind as Phase, Terminal, ConnectivityNode, AcLineSegment, NominalPhasePath, \
-    TerminalConnectivityConnected, generate_id
+    TerminalConnectivityConnected, XyCandidatePhasePaths, generate_id
 
 
 class TestTerminalConnectivityConnected:
@@ -175,6 +175,41 @@ class TestTerminalConnectivityConnected:
         self._validate_connection_multi(t2, [(t1, [Phase.X])])
         self._validate_connection_multi(t3, [(t1, [Phase.Y])])
 
+    async def test_xy_phase_paths_are_reused_until_the_node_changes(self, monkeypatch):
+        calculated = []
+        calculate_paths = XyCandidatePhasePaths.calculate_paths
+
+        def counting_calculate_paths(candidate_phases):
+            calculated.append(True)
+            return calculate_paths(candidate_phases)
+
+        monkeypatch.setattr(XyCandidatePhasePaths, "calculate_paths", counting_calculate_paths)
+
+        t1, t2, t3 = self._create_connected_terminals(PhaseCode.XYN, PhaseCode.BCN, PhaseCode.ABCN)
+
+        # The XY terminal hasn't been traced, so the search goes beyond the node and the paths can't be reused.
+        self._validate_connection_multi(t2, [(t1, [Phase.X, Phase.Y, Phase.N]), (t3, [Phase.B, Phase.C, Phase.N])])
+        self._validate_connection_multi(t2, [(t1, [Phase.X, Phase.Y, Phase.N]), (t3, [Phase.B, Phase.C, Phase.N])])
+        assert len(calculated) == 2
+
+        # Once traced, the paths only depend on the node, so are reused for every connection to the node.
+        calculated.clear()
+        await self._replace_normal_phases(t1, PhaseCode.BCN)
+        self._validate_connection_multi(t2, [(t1, [Phase.X, Phase.Y, Phase.N]), (t3, [Phase.B, Phase.C, Phase.N])])
+        self._validate_connection_multi(t3, [(t1, [Phase.NONE, Phase.X, Phase.Y, Phase.N]), (t2, [Phase.NONE, Phase.B, Phase.C, Phase.N])])
+        assert len(calculated) == 1
+
+        # Changing the phases on the node recalculates the paths.
+        await self._replace_normal_phases(t1, PhaseCode.ABN)
+        self._validate_connection_multi(t3, [(t1, [Phase.X, Phase.Y, Phase.NONE, Phase.N]), (t2, [Phase.NONE, Phase.B, Phase.C, Phase.N])])
+        assert len(calculated) == 2
+
+        # As does changing the terminals on the node.
+        t4 = Terminal(mrid=generate_id(), phases=PhaseCode.AN)
+        self._network_service.connect_terminals(t4, t1)
+        self._validate_connection_multi(t4, [(t1, [Phase.X, Phase.N]), (t2, [Phase.NONE, Phase.N]), (t3, [Phase.A, Phase.N])])
+        assert len(calculated) == 3
+
     def test_secondary_phases_are_not_connected(self):
         t1, t2 = self._create_connected_terminals(PhaseCode.s1, PhaseCode.s2)
         self._validate_connection(t1)
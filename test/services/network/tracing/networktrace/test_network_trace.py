@@ -229,6 +229,20 @@ class TestNetworkTrace:
         assert stop_checks == ['c2-t1', 'c2-t2', 'c0-t1', 'c0-t2', 'c1-t1']
         assert steps == ['c1-t2', 'c2-t1', 'c2-t2', 'c0-t1', 'c0-t2']
 
+    def test_can_run_synchronously(self):
+        ns = (TestNetworkBuilder()
+              .from_acls()  # c0
+              .to_acls()  # c1
+              .to_acls()  # c2
+              ).network
+
+        steps: List[str] = []
+        Tracing.network_trace(action_step_type=NetworkTraceActionType.ALL_STEPS) \
+            .add_step_action(lambda item, _: steps.append(item.path.to_terminal.mrid)) \
+            .run_sync(ns.get('c0', ConductingEquipment))
+
+        assert sorted(steps) == ['c0-t1', 'c0-t2', 'c1-t1', 'c1-t2', 'c2-t1', 'c2-t2']
+
     @pytest.mark.asyncio
     async def test_can_provide_a_path_to_force_the_trace_to_traverse_in_a_given_direction(self):
         #
@@ -0,0 +1,125 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from zepben.ewb import NetworkTraceTracker, BranchingNetworkTraceTracker, Terminal, SinglePhaseKind, Junction, generate_id
+
+
+class _Trace:
+    running = True
+
+
+class TestNetworkTraceTracker:
+
+    def test_visits_terminals_without_phases(self):
+        terminals = [Terminal(mrid=generate_id()) for _ in range(100)]
+        tracker = NetworkTraceTracker()
+
+        # Visit out of index order to make sure the tracked range can grow in both directions.
+        for t in terminals[50:] + terminals[:50:3]:
+            assert not tracker.has_visited(t)
+            assert tracker.visit(t)
+            assert not tracker.visit(t)
+
+        for i, t in enumerate(terminals):
+            assert tracker.has_visited(t) == (i >= 50 or i % 3 == 0)
+
+        tracker.clear()
+        assert not any(tracker.has_visited(t) for t in terminals)
+
+    def test_visits_terminals_with_phases(self):
+        t1, t2 = Terminal(mrid=generate_id()), Terminal(mrid=generate_id())
+        tracker = NetworkTraceTracker()
+
+        assert tracker.visit(t1, frozenset({SinglePhaseKind.A, SinglePhaseKind.B}))
+        assert not tracker.visit(t1, frozenset({SinglePhaseKind.B, SinglePhaseKind.A}))
+
+        assert tracker.has_visited(t1, frozenset({SinglePhaseKind.A, SinglePhaseKind.B}))
+        assert not tracker.has_visited(t1, frozenset({SinglePhaseKind.A}))
+        assert not tracker.has_visited(t1, frozenset({SinglePhaseKind.X, SinglePhaseKind.Y}))
+        assert not tracker.has_visited(t1)
+        assert not tracker.has_visited(t2, frozenset({SinglePhaseKind.A, SinglePhaseKind.B}))
+
+        assert tracker.visit(t1)
+        assert tracker.visit(t1, frozenset({SinglePhaseKind.X, SinglePhaseKind.Y}))
+
+        tracker.clear()
+        assert not tracker.has_visited(t1, frozenset({SinglePhaseKind.A, SinglePhaseKind.B}))
+
+    def test_visits_other_objects_by_mrid(self):
+        tracker = NetworkTraceTracker()
+
+        assert tracker.visit(Junction(mrid="j1"))
+        assert not tracker.visit(Junction(mrid="j1"))
+        assert tracker.has_visited(Junction(mrid="j1"))
+        assert not tracker.has_visited(Junction(mrid="j2"))
+
+    def test_tracks_terminals_by_object_rather_than_mrid(self):
+        t1, copy_of_t1 = Terminal(mrid="t1"), Terminal(mrid="t1")
+        tracker = NetworkTraceTracker()
+
+        assert tracker.visit(t1)
+        assert tracker.visit(t1, frozenset({SinglePhaseKind.A}))
+        assert not tracker.has_visited(copy_of_t1)
+        assert not tracker.has_visited(copy_of_t1, frozenset({SinglePhaseKind.A}))
+
+        assert tracker.visit(copy_of_t1)
+        assert tracker.visit(copy_of_t1, frozenset({SinglePhaseKind.A}))
+        assert not tracker.visit(t1)
+
+
+class TestBranchingNetworkTraceTracker:
+
+    def test_branches_see_visits_of_running_ancestors_but_not_finished_siblings(self):
+        t1, t2, t3 = (Terminal(mrid=generate_id()) for _ in range(3))
+        root, sibling, branch, child = _Trace(), _Trace(), _Trace(), _Trace()
+        root_tracker = BranchingNetworkTraceTracker(root)
+        sibling_tracker = BranchingNetworkTraceTracker(sibling, root_tracker)
+        branch_tracker = BranchingNetworkTraceTracker(branch, root_tracker)
+        child_tracker = BranchingNetworkTraceTracker(child, branch_tracker)
+
+        assert root_tracker.visit(t1)
+        assert sibling_tracker.visit(t2)
+        assert not sibling_tracker.visit(t1)
+        sibling.running = False
+
+        assert branch_tracker.has_visited(t1)
+        assert not branch_tracker.has_visited(t2)
+        assert branch_tracker.visit(t2)
+        assert child_tracker.visit(t3, frozenset({SinglePhaseKind.A}))
+        assert not child_tracker.visit(t2)
+
+        # Visits made by a finished branch are still seen by the branch itself, but not by any other branch.
+        child.running = False
+        assert child_tracker.has_visited(t3, frozenset({SinglePhaseKind.A}))
+        assert not branch_tracker.has_visited(t3, frozenset({SinglePhaseKind.A}))
+
+        branch.running = False
+        assert not root_tracker.has_visited(t2)
+
+    def test_clear(self):
+        t1, t2 = Terminal(mrid=generate_id()), Terminal(mrid=generate_id())
+        root, branch = _Trace(), _Trace()
+        root_tracker = BranchingNetworkTraceTracker(root)
+        branch_tracker = BranchingNetworkTraceTracker(branch, root_tracker)
+
+        root_tracker.visit(t1)
+        branch_tracker.visit(t2)
+
+        branch_tracker.clear()
+        assert branch_tracker.has_visited(t1)
+        assert not branch_tracker.has_visited(t2)
+
+        branch_tracker.visit(t2)
+        root_tracker.clear()
+        assert not branch_tracker.has_visited(t1)
+        assert not branch_tracker.has_visited(t2)
+
+    def test_tracks_terminals_by_object_rather_than_mrid(self):
+        t1, copy_of_t1 = Terminal(mrid="t1"), Terminal(mrid="t1")
+        tracker = BranchingNetworkTraceTracker(_Trace())
+
+        assert tracker.visit(t1)
+        assert not tracker.has_visited(copy_of_t1)
+        assert tracker.visit(copy_of_t1)
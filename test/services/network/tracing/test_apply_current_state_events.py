@@ -0,0 +1,184 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from datetime import datetime
+from typing import Dict
+
+import pytest
+
+from zepben.ewb import TestNetworkBuilder, NetworkService, NetworkStateOperators, Tracing, ApplyCurrentStateEvents, SwitchStateEvent, SwitchAction, \
+    Feeder, LvFeeder, Equipment, Terminal, PhaseCode, SinglePhaseKind, Switch, AddCutEvent
+
+_CURRENT = NetworkStateOperators.CURRENT
+
+
+def _create_network(current_open: Dict[str, bool]) -> NetworkService:
+    #
+    # s0 21--b1--21--c2--21 b3 21--c4--21 b5 21--c6--21--b7--21 s8
+    #
+    # s9 21--b10--21--c11--2
+    #
+    # b1 and b7 are feeder heads, b5 is a normally open point, and the second island is unaffected by the changes.
+    #
+    network = (TestNetworkBuilder()
+               .from_source(PhaseCode.ABCN)  # s0
+               .to_breaker(PhaseCode.ABCN)  # b1
+               .to_acls(PhaseCode.ABCN)  # c2
+               .to_breaker(PhaseCode.ABCN)  # b3
+               .to_acls(PhaseCode.ABCN)  # c4
+               .to_breaker(PhaseCode.ABCN, is_normally_open=True)  # b5
+               .to_acls(PhaseCode.ABCN)  # c6
+               .to_breaker(PhaseCode.ABCN)  # b7
+               .to_source(PhaseCode.ABCN)  # s8
+               .from_source(PhaseCode.ABC)  # s9
+               .to_breaker()  # b10
+               .to_acls()  # c11
+               .add_feeder("b1", 2)  # fdr12
+               .add_feeder("b7", 1)  # fdr13
+               .add_feeder("b10", 2)  # fdr14
+               ).network
+
+    for mrid, is_open in current_open.items():
+        network.get(mrid, Switch).set_open(is_open)
+    return network
+
+
+def _create_lv_network(current_open: Dict[str, bool]) -> NetworkService:
+    #
+    # s0 21--b1--21--c2--21--tx3--21--c4--21--b5--21--c6--21 b7 21--c8--21 b9 21--c10--21--tx11--21--c12
+    #
+    # b1 is the feeder head, tx3 and tx11 are the heads of the LV feeders, and b7 and b9 are normally open points between the LV feeders.
+    #
+    network = (TestNetworkBuilder()
+               .from_source(PhaseCode.ABC)  # s0
+               .to_breaker()  # b1
+               .to_acls()  # c2
+               .to_power_transformer([PhaseCode.ABC, PhaseCode.ABCN])  # tx3
+               .to_acls(PhaseCode.ABCN)  # c4
+               .to_breaker(PhaseCode.ABCN)  # b5
+               .to_acls(PhaseCode.ABCN)  # c6
+               .to_breaker(PhaseCode.ABCN, is_normally_open=True)  # b7
+               .to_acls(PhaseCode.ABCN)  # c8
+               .to_breaker(PhaseCode.ABCN, is_normally_open=True)  # b9
+               .to_acls(PhaseCode.ABCN)  # c10
+               .to_power_transformer([PhaseCode.ABCN, PhaseCode.ABCN])  # tx11
+               .to_acls(PhaseCode.ABCN)  # c12
+               .add_feeder("b1", 2)  # fdr13
+               .add_lv_feeder("tx3", 2)  # lvf14
+               .add_lv_feeder("tx11", 1)  # lvf15
+               ).network
+
+    for mrid, is_open in current_open.items():
+        network.get(mrid, Switch).set_open(is_open)
+    return network
+
+
+async def _recompute_current_state(network: NetworkService):
+    await Tracing.assign_equipment_to_feeders().run(network, _CURRENT)
+    await Tracing.assign_equipment_to_lv_feeders().run(network, _CURRENT)
+    await Tracing.set_direction().run(network, _CURRENT)
+    await Tracing.set_phases().run(network, _CURRENT)
+
+
+def _current_state(network: NetworkService):
+    return (
+        {it.mrid: {eq.mrid for eq in _CURRENT.get_equipment(it)} for it in network.objects(Feeder)},
+        {it.mrid: {eq.mrid for eq in _CURRENT.get_equipment(it)} for it in network.objects(LvFeeder)},
+        {it.mrid: {lvf.mrid for lvf in _CURRENT.get_energized_lv_feeders(it)} for it in network.objects(Feeder)},
+        {it.mrid: {c.mrid for c in _CURRENT.get_containers(it)} for it in network.objects(Equipment)},
+        {it.mrid: (_CURRENT.get_direction(it), it.current_phases._phase_status_internal) for it in network.objects(Terminal)},
+    )
+
+
+def _switch_event(mrid: str, action: SwitchAction, phases: PhaseCode = PhaseCode.NONE) -> SwitchStateEvent:
+    return SwitchStateEvent(f"event-{mrid}", datetime.now(), mrid, action, phases)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("events, expected_open", [
+    ([_switch_event("b5", SwitchAction.CLOSE)], {"b5": False}),
+    ([_switch_event("b3", SwitchAction.OPEN)], {"b3": True}),
+    ([_switch_event("b5", SwitchAction.CLOSE), _switch_event("b3", SwitchAction.OPEN)], {"b5": False, "b3": True}),
+    ([_switch_event("b1", SwitchAction.OPEN), _switch_event("b5", SwitchAction.CLOSE)], {"b1": True, "b5": False}),
+])
+async def test_matches_full_recompute(events, expected_open):
+    network = _create_network({})
+    await _recompute_current_state(network)
+    untouched = _current_state(network)
+
+    assert await ApplyCurrentStateEvents().run(network, events) == []
+
+    expected = _create_network(expected_open)
+    await _recompute_current_state(expected)
+
+    assert _current_state(network) == _current_state(expected)
+    assert _current_state(network) != untouched
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("events, expected_open", [
+    ([_switch_event("b7", SwitchAction.CLOSE)], {"b7": False}),
+    ([_switch_event("b5", SwitchAction.OPEN)], {"b5": True}),
+    ([_switch_event("b7", SwitchAction.CLOSE), _switch_event("b9", SwitchAction.CLOSE)], {"b7": False, "b9": False}),
+    ([_switch_event("b1", SwitchAction.OPEN), _switch_event("b7", SwitchAction.CLOSE)], {"b1": True, "b7": False}),
+])
+async def test_matches_full_recompute_with_lv_feeders(events, expected_open):
+    network = _create_lv_network({})
+    await _recompute_current_state(network)
+    untouched = _current_state(network)
+
+    assert await ApplyCurrentStateEvents().run(network, events) == []
+
+    expected = _create_lv_network(expected_open)
+    await _recompute_current_state(expected)
+
+    assert _current_state(network) == _current_state(expected)
+    assert _current_state(network) != untouched
+
+
+@pytest.mark.asyncio
+async def test_matches_full_recompute_when_switching_individual_phases():
+    network = _create_network({})
+    await _recompute_current_state(network)
+
+    await ApplyCurrentStateEvents().run(network, [_switch_event("b5", SwitchAction.CLOSE, PhaseCode.AN)])
+
+    expected = _create_network({})
+    expected.get("b5", Switch).set_open(False, SinglePhaseKind.A).set_open(False, SinglePhaseKind.N)
+    await _recompute_current_state(expected)
+
+    assert _current_state(network) == _current_state(expected)
+
+
+@pytest.mark.asyncio
+async def test_only_updates_the_affected_region():
+    network = _create_network({})
+    await _recompute_current_state(network)
+
+    # Remove the derived state from the unaffected island, so we can see it isn't reapplied.
+    c11 = network["c11"]
+    _CURRENT.disassociate_equipment_and_container(c11, network["fdr14"])
+
+    await ApplyCurrentStateEvents().run(network, [_switch_event("b5", SwitchAction.CLOSE)])
+
+    assert not list(_CURRENT.get_containers(c11))
+    assert {it.mrid for it in _CURRENT.get_containers(network["c4"])} == {"fdr12", "fdr13"}
+
+
+@pytest.mark.asyncio
+async def test_returns_events_that_could_not_be_applied():
+    network = _create_network({})
+    await _recompute_current_state(network)
+
+    unknown_switch = _switch_event("unknown", SwitchAction.OPEN)
+    not_a_switch = _switch_event("c2", SwitchAction.OPEN)
+    unknown_action = _switch_event("b3", SwitchAction.UNKNOWN)
+    unknown_cut = AddCutEvent("cut-event", datetime.now(), "cut", "c2")
+
+    assert await ApplyCurrentStateEvents().run(network, [unknown_switch, not_a_switch, unknown_action, unknown_cut]) == [
+        unknown_switch,
+        not_a_switch,
+        unknown_action,
+        unknown_cut
+    ]
@@ -10,6 +10,7 @@ from zepben.ewb import Equipment, TestNetworkBuilder, BaseVoltage, Tracing, Netw
     ConductingEquipment, generate_id
 from zepben.ewb.model.cim.iec61970.base.auxiliaryequipment.fault_indicator import FaultIndicator
 from zepben.ewb.model.cim.iec61970.base.core.feeder import Feeder
+from zepben.ewb.services.network.tracing.feeder.assign_to_feeders import AssignToFeeders
 
 
 def validate_equipment(equipment: Iterable[Equipment], *expected_mrids: str):
@@ -303,3 +304,65 @@ class TestAssignToFeeders:
 
         feeder = network['fdr2']
         validate_equipment(feeder.equipment, 'b0')
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("state_operators", [NetworkStateOperators.NORMAL, NetworkStateOperators.CURRENT])
+    async def test_assigning_in_workers_matches_assigning_one_feeder_at_a_time(self, state_operators):
+        def create_network():
+            #
+            # 1 b0 21--c1--21 b2 21--c3--21 tx4 21--c5--2
+            #                         1
+            #                         b6 (open, current closed)
+            #                         2
+            # 1 b7 21--c8--21--c9--21 pec10
+            #
+            peu = PhotoVoltaicUnit(mrid='peu')
+
+            def pec_action(this: PowerElectronicsConnection):
+                this.add_unit(peu)
+                peu.power_electronics_connection = this
+
+            network = (TestNetworkBuilder()
+                       .from_breaker(action=self._make_hv)  # b0
+                       .to_acls(action=self._make_hv)  # c1
+                       .to_breaker(action=self._make_hv)  # b2
+                       .to_acls(action=self._make_hv)  # c3
+                       .to_power_transformer(end_actions=[self._make_hv, self._make_lv])  # tx4
+                       .to_acls(action=self._make_lv)  # c5
+                       .from_breaker(is_normally_open=True, is_open=False, action=self._make_hv)  # b6
+                       .from_breaker(action=self._make_hv)  # b7
+                       .to_acls(action=self._make_hv)  # c8
+                       .to_acls(action=self._make_hv)  # c9
+                       .to_power_electronics_connection(action=pec_action)  # pec10
+                       .connect('c3', 'b6', 1, 1)
+                       .connect('b6', 'c8', 2, 2)
+                       .add_feeder('b0')  # fdr11
+                       .add_feeder('b2')  # fdr12
+                       .add_feeder('b7')  # fdr13
+                       .add_lv_feeder('tx4', 2)  # lvf14
+                       ).network
+            network.add(self.bv_hv)
+            network.add(self.bv_lv)
+            # The unit isn't added to the network, so the feeder that reaches it will be traced again rather than using the collected associations.
+            return network
+
+        def assignments(network):
+            return {
+                it.mrid: (
+                    [eq.mrid for eq in state_operators.get_equipment(it)],
+                    [lvf.mrid for lvf in state_operators.get_energized_lv_feeders(it)]
+                )
+                for it in network.objects(Feeder)
+            }, {
+                it.mrid: [c.mrid for c in state_operators.get_containers(it)]
+                for it in network.objects(Equipment)
+            }
+
+        expected_network = create_network()
+        await AssignToFeeders().run(expected_network, state_operators)
+
+        network = create_network()
+        await AssignToFeeders(max_workers=2).run(network, state_operators)
+
+        assert assignments(network) == assignments(expected_network)
+        assert assignments(network)[0]["fdr13"][0]
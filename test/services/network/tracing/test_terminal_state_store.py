@@ -0,0 +1,115 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import copy
+import gc
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+from zepben.ewb import Terminal, TerminalStateStore, terminal_state_store, FeederDirection, SinglePhaseKind, PhaseCode, PhaseStatus, generate_id
+
+
+def test_terminals_only_use_a_slot_once_traced():
+    terminal = Terminal(mrid=generate_id(), phases=PhaseCode.ABCN, normal_feeder_direction=FeederDirection.NONE)
+    terminal.current_feeder_direction = FeederDirection.NONE
+    terminal.normal_phases[SinglePhaseKind.A] = SinglePhaseKind.NONE
+
+    assert terminal._state_index is None
+    assert terminal.normal_feeder_direction == FeederDirection.NONE
+    assert terminal.current_phases._phase_status_internal == 0
+
+    terminal.normal_phases[SinglePhaseKind.A] = SinglePhaseKind.B
+    terminal.current_feeder_direction = FeederDirection.UPSTREAM
+    index = terminal._state_index
+
+    assert index is not None
+    assert terminal_state_store.phases[0][index] == terminal.normal_phases._phase_status_internal
+    assert terminal_state_store.directions[1][index] == FeederDirection.UPSTREAM.value
+
+    assert terminal.normal_phases[SinglePhaseKind.A] == SinglePhaseKind.B
+    assert terminal.current_phases[SinglePhaseKind.A] == SinglePhaseKind.NONE
+    assert terminal.normal_feeder_direction == FeederDirection.NONE
+    assert terminal.current_feeder_direction == FeederDirection.UPSTREAM
+
+
+def test_directions_can_be_set_via_the_constructor():
+    terminal = Terminal(mrid=generate_id(), normal_feeder_direction=FeederDirection.BOTH, current_feeder_direction=FeederDirection.CONNECTOR)
+
+    assert terminal.normal_feeder_direction == FeederDirection.BOTH
+    assert terminal.current_feeder_direction == FeederDirection.CONNECTOR
+
+
+def test_slots_are_released_and_reused():
+    store = TerminalStateStore()
+    first = store.allocate()
+    second = store.allocate()
+    store.phases[0][first] = 0x1234
+    store.directions[1][first] = FeederDirection.BOTH.value
+
+    assert len(store) == 2
+    assert store.nbytes == 2 * (2 + 2 + 1 + 1)
+
+    store.release(first)
+    assert len(store) == 1
+
+    assert store.allocate() == first
+    assert store.phases[0][first] == 0
+    assert store.directions[1][first] == 0
+    assert store.allocate() == second + 1
+
+
+def test_terminals_release_their_slot_when_collected():
+    terminal = Terminal(mrid=generate_id(), normal_feeder_direction=FeederDirection.DOWNSTREAM)
+    index = terminal._state_index
+
+    del terminal
+    gc.collect()
+
+    assert index in terminal_state_store._free
+    assert terminal_state_store.directions[0][index] == 0
+
+
+def test_phase_statuses_without_a_state_are_independent_of_the_store():
+    terminal = Terminal(mrid=generate_id(), phases=PhaseCode.ABCN)
+    phase_status = PhaseStatus(terminal)
+
+    phase_status[SinglePhaseKind.A] = SinglePhaseKind.A
+
+    assert terminal._state_index is None
+    assert terminal.normal_phases[SinglePhaseKind.A] == SinglePhaseKind.NONE
+    assert phase_status[SinglePhaseKind.A] == SinglePhaseKind.A
+
+
+def test_copies_of_terminals_have_their_own_slot():
+    terminal = Terminal(mrid=generate_id(), phases=PhaseCode.AB, normal_feeder_direction=FeederDirection.UPSTREAM)
+    terminal.current_phases[SinglePhaseKind.A] = SinglePhaseKind.B
+
+    for copied in (copy.copy(terminal), copy.deepcopy(terminal), pickle.loads(pickle.dumps(terminal))):
+        assert copied._state_index not in (None, terminal._state_index)
+        assert copied.normal_feeder_direction == FeederDirection.UPSTREAM
+        assert copied.current_phases[SinglePhaseKind.A] == SinglePhaseKind.B
+
+        copied.normal_feeder_direction = FeederDirection.DOWNSTREAM
+        del copied
+        gc.collect()
+
+        assert terminal.normal_feeder_direction == FeederDirection.UPSTREAM
+        assert terminal.current_phases[SinglePhaseKind.A] == SinglePhaseKind.B
+
+    assert copy.copy(Terminal(mrid=generate_id()))._state_index is None
+
+
+def test_slots_can_be_allocated_from_multiple_threads():
+    store = TerminalStateStore()
+
+    def allocate_and_release(_):
+        indexes = [store.allocate() for _ in range(1000)]
+        for it in indexes[::2]:
+            store.release(it)
+        return indexes[1::2]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        kept = [it for indexes in executor.map(allocate_and_release, range(8)) for it in indexes]
+
+    assert len(set(kept)) == len(kept) == len(store)
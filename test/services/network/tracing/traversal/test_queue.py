@@ -76,3 +76,30 @@ class TestQueue:
         assert queue.pop() == 3
         assert queue.pop() == 2
         assert queue.pop() == 3
+
+    def test_weighted_priority_queue_orders_by_weight(self):
+        queue = WeightedPriorityQueue(lambda: TraversalQueue.breadth_first(), lambda t: t[0])
+
+        for item in [(1, "a"), (3, "b"), (2, "c"), (3, "d"), (1, "e")]:
+            queue.append(item)
+        assert len(queue) == 5
+
+        assert queue.pop() == (3, "b")
+        assert queue.pop() == (3, "d")
+
+        # Re-adding to a weight that has been emptied must restore its priority.
+        queue.append((3, "f"))
+        assert len(queue) == 4
+        assert queue.pop() == (3, "f")
+        assert queue.pop() == (2, "c")
+        assert queue.pop() == (1, "a")
+        assert queue.pop() == (1, "e")
+
+        assert len(queue) == 0
+        assert not queue.has_next()
+        assert queue.pop() is None
+
+        queue.append((5, "g"))
+        queue.clear()
+        assert len(queue) == 0
+        assert not queue.has_next()
@@ -546,3 +546,45 @@ class TestTraversal:
         )
         with pytest.raises(TypeError):
             await traversal.run(can_stop_on_start_item=False)
+
+    def test_can_run_synchronously(self):
+        steps = []
+        traversal = (
+            _create_branching_traversal()
+            .add_queue_condition(lambda item, ctx, x, y: (ctx.branch_depth <= 1) and (item != 0))
+            .add_step_action(lambda item, _: steps.append(item))
+            .if_stopping(lambda item, _: steps.append(None))
+        )
+
+        assert not traversal.has_async_step_actions()
+        assert traversal.run_sync(0, can_stop_on_start_item=False) is traversal
+        assert not traversal.running
+        assert sorted(steps) == list(range(-10, 11))
+
+    def test_run_sync_rejects_async_step_actions(self):
+        async def step_action(item, _):
+            pass
+
+        traversal = _create_traversal().add_stop_condition(lambda item, _: True).if_not_stopping(step_action)
+
+        assert traversal.has_async_step_actions()
+        with pytest.raises(ValueError):
+            traversal.run_sync(1)
+
+    @pytest.mark.asyncio
+    async def test_async_and_sync_step_actions_are_applied_in_order(self):
+        steps = []
+
+        async def async_step_action(item, _):
+            steps.append(f"async {item}")
+
+        traversal = (
+            _create_traversal(queue=TraversalQueue.breadth_first())
+            .add_stop_condition(lambda item, _: item >= 2)
+            .add_step_action(lambda item, _: steps.append(f"before {item}"))
+            .if_stopping(async_step_action)
+            .add_step_action(lambda item, _: steps.append(f"after {item}"))
+        )
+        await traversal.run(1)
+
+        assert steps == ["before 1", "after 1", "before 2", "async 2", "after 2"]
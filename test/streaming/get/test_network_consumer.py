@@ -304,6 +304,39 @@ class TestNetworkConsumer:
 
         await self.mock_server.validate(client_test, interactions)
 
+    @pytest.mark.asyncio
+    async def test_retrieve_network_concurrently(self):
+        ns = create_loops_network()
+        containers = ["cir1", "cir2", "cir3", "cir4", "sub1", "sub2", "sub3", "sub4", "fdr1", "fdr2", "fdr3", "fdr4"]
+        assoc_objs = [
+            "cir1-j-t", "cir2-j-t", "cir3-j-t", "cir4-j-t",
+            "sub1-j-t", "sub2-j-t", "sub3-j-t", "sub4-j-t",
+            "fdr1-j-t", "fdr2-j-t", "fdr3-j-t", "fdr4-j-t"
+        ]
+
+        async def client_test():
+            result = (await self.client.retrieve_network(max_concurrent_requests=4)).throw_on_error().value
+
+            assert self.service.len_of() == ns.len_of()
+            for io in self.service.objects():
+                assert io.mrid in ns
+
+            assert result.num_containers == len(list(ns.objects(EquipmentContainer)))
+            assert not result.container_errors
+            assert result.duration > 0
+
+        interactions: List[GrpcInteration] = [UnaryGrpc('getNetworkHierarchy', unary_from_fixed(None, _create_hierarchy_response(ns)))]
+
+        for _ in ns.objects(EquipmentContainer):
+            interactions.extend(
+                [
+                    StreamGrpc('getEquipmentForContainers', [_create_container_equipment_responses(ns, containers)]),
+                    StreamGrpc('getIdentifiables', [_create_object_responses(ns, assoc_objs)]),
+                ],
+            )
+
+        await self.mock_server.validate(client_test, interactions)
+
     @pytest.mark.asyncio
     async def test_get_feeder_as_equipment_container(self, feeder_network: NetworkService):
         feeder_mrid = "f001"
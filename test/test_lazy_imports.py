@@ -0,0 +1,107 @@
+#  Copyright 2026 Zeppelin Bend Pty Ltd
+#  This Source Code Form is subject to the terms of the Mozilla Public
+#  License, v. 2.0. If a copy of the MPL was not distributed with this
+#  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import zepben.ewb
+from zepben.ewb._exports import EXPORTS
+from zepben.ewb._generate_exports import generate_exports
+
+_SRC_DIR = Path(zepben.ewb.__file__).parents[2]
+
+
+def _run(code: str) -> str:
+    return subprocess.run([sys.executable, "-c", code], cwd=_SRC_DIR, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_exports_are_up_to_date():
+    # If this fails, regenerate the exports with `python -m zepben.ewb._generate_exports`.
+    assert generate_exports() == EXPORTS
+
+
+def test_all_exports_are_resolved():
+    assert zepben.ewb.__all__ == list(EXPORTS)
+    for name in zepben.ewb.__all__:
+        assert getattr(zepben.ewb, name) is getattr(__import__(EXPORTS[name], fromlist=[name]), name)
+    assert set(EXPORTS) <= set(dir(zepben.ewb))
+
+
+def test_unknown_names_are_not_resolved():
+    with pytest.raises(AttributeError, match="has no attribute 'NotAnExport'"):
+        getattr(zepben.ewb, "NotAnExport")
+
+
+def test_importing_the_package_does_not_import_the_exports():
+    modules = _run("import sys, zepben.ewb; print(' '.join(sys.modules))").split()
+
+    assert "zepben.ewb.services.network.network_service" not in modules
+    assert "zepben.ewb.database.sqlite.network.network_database_reader" not in modules
+    assert "grpc" not in modules
+    assert "requests" not in modules
+    assert "google.protobuf" not in modules
+
+
+def test_phases_can_be_used_without_protobuf():
+    # SinglePhaseKind and PhaseCode refer to each other, so either can be imported first.
+    for first in ["PhaseCode", "SinglePhaseKind"]:
+        output = _run(
+            "import sys\n"
+            f"from zepben.ewb import {first}\n"
+            "from zepben.ewb import SinglePhaseKind, PhaseCode\n"
+            "print(SinglePhaseKind.A + SinglePhaseKind.B, PhaseCode.AB.single_phases[1], 'google.protobuf' in sys.modules)"
+        )
+
+        assert output.split() == ["PhaseCode.AB", "SinglePhaseKind.B", "False"]
+
+
+def test_translators_are_loaded_when_first_used():
+    output = _run(
+        "from zepben.ewb import Breaker, NetworkService\n"
+        "pb = Breaker(mrid='b1').to_pb()\n"
+        "print(type(NetworkService().add_from_pb(pb)).__name__, pb.mrid())"
+    )
+
+    assert output.split() == ["Breaker", "b1"]
+
+
+def test_protobuf_messages_can_be_converted_once_an_export_is_used():
+    output = _run(
+        "import zepben.ewb\n"
+        "from zepben.protobuf.cim.iec61970.base.core.BaseVoltage_pb2 import BaseVoltage as PBBaseVoltage\n"
+        "service = zepben.ewb.NetworkService()\n"
+        "pb = PBBaseVoltage()\n"
+        "pb.io.mRID = 'bv1'\n"
+        "print(pb.to_cim(service).mrid)"
+    )
+
+    assert output.split() == ["bv1"]
+
+
+def test_translators_are_loaded_for_services_imported_from_their_module():
+    output = _run(
+        "from zepben.ewb.services.network.network_service import NetworkService\n"
+        "from zepben.ewb.model.cim.iec61970.base.wires.breaker import Breaker\n"
+        "print(type(NetworkService().add_from_pb(Breaker(mrid='b1').to_pb())).__name__)"
+    )
+
+    assert output.split() == ["Breaker"]
+
+
+def test_translators_are_loaded_when_used_while_importing_other_zepben_packages(tmp_path):
+    # Other packages in the `zepben` namespace may convert objects when they are imported.
+    (tmp_path / "zepben").mkdir()
+    (tmp_path / "zepben" / "lazy_imports_test.py").write_text("from zepben.ewb import Breaker\nMRID = Breaker(mrid='b1').to_pb().mrid()\n")
+
+    output = _run(
+        "import sys\n"
+        f"sys.path.append({str(tmp_path)!r})\n"
+        "from zepben.lazy_imports_test import MRID\n"
+        "print(MRID)"
+    )
+
+    assert output == "b1"